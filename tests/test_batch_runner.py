@@ -0,0 +1,79 @@
+import os
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from vg.core.batch_runner import run_batch
+from vg.decoder_v2.batch_decode import decode_replay_batch
+
+
+def _square_or_fail(value: int) -> int:
+    if value == 2:
+        raise ValueError("bad replay")
+    if value == 3:
+        time.sleep(30)
+    if value == 4:
+        os._exit(3)
+    # Finish out of order so result ordering is actually exercised
+    time.sleep(0.05 * (6 - value))
+    return value * value
+
+
+class TestBatchRunner(unittest.TestCase):
+    def test_pool_keeps_input_order_and_isolates_failures(self) -> None:
+        progress = []
+
+        results = run_batch(
+            _square_or_fail,
+            range(6),
+            workers=3,
+            timeout=1.0,
+            on_result=lambda result, done, total: progress.append((done, total)),
+        )
+
+        self.assertEqual([result.index for result in results], list(range(6)))
+        self.assertEqual([result.value for result in results if result.ok], [0, 1, 25])
+        self.assertEqual(results[2].error, "ValueError: bad replay")
+        self.assertTrue(results[3].error.startswith("TimeoutError"))
+        self.assertTrue(results[4].error.startswith("WorkerDied"))
+        self.assertEqual(progress[-1], (6, 6))
+
+    def test_sequential_mode_runs_in_process(self) -> None:
+        seen = []
+
+        results = run_batch(lambda value: seen.append(value) or value, ["a", "b"])
+
+        self.assertEqual(seen, ["a", "b"])
+        self.assertTrue(all(result.ok for result in results))
+
+    def test_decode_replay_batch_reports_failed_replays(self) -> None:
+        replays = [Path("one.0.vgr"), Path("two.0.vgr")]
+        payload = {
+            "completeness_status": "complete_confirmed",
+            "accepted_fields": {"hero": "accepted"},
+            "withheld_fields": {},
+        }
+
+        def fake_decode(replay_file: str):
+            if replay_file == "two.0.vgr":
+                raise RuntimeError("truncated frame")
+            decoded = unittest.mock.Mock()
+            decoded.to_dict.return_value = payload
+            return decoded
+
+        with patch("vg.decoder_v2.batch_decode.find_replays", return_value=replays), patch(
+            "vg.decoder_v2.batch_decode.decode_match", side_effect=fake_decode,
+        ):
+            report = decode_replay_batch("unused")
+
+        self.assertEqual(report["total_replays"], 2)
+        self.assertEqual(report["matches"], [payload])
+        self.assertEqual(
+            report["failed_replays"],
+            [{"replay_file": "two.0.vgr", "error": "RuntimeError: truncated frame"}],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from vg.analysis.win_loss_detector import WinLossDetector
+from vg.core.unified_decoder import UnifiedDecoder
+from vg.core.vgr_parser import VGRParser
+from vg.tools.synthetic_replay import SyntheticReplaySpec, generate_replay
+
+
+SPEC = SyntheticReplaySpec(duration_s=300.0, filler_bytes_per_frame=256, seed=5)
+
+
+class TestDecodeMetrics(unittest.TestCase):
+    def test_decode_attaches_per_step_metrics_on_request(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            replay = generate_replay(temp_dir, SPEC)
+            plain = UnifiedDecoder(replay.replay_file).decode()
+            match = UnifiedDecoder(replay.replay_file, collect_metrics=True).decode()
+
+        self.assertIsNone(plain.metrics)
+        self.assertNotIn("metrics", plain.to_dict())
+        self.assertEqual(
+            list(match.metrics.stages),
+            ["parse", "load_frames", "kda_scan", "win_loss", "items_gold",
+             "crystal", "duration", "objectives", "assemble"],
+        )
+        load = match.metrics.stages["load_frames"]
+        self.assertEqual(load.bytes_scanned, replay.total_bytes)
+        self.assertEqual(load.counters["frames"], replay.frame_count)
+        self.assertEqual(load.counters["kill_headers"], sum(p.kills for p in replay.players))
+        self.assertEqual(match.metrics.stages["duration"].counters["kills"], sum(p.kills for p in replay.players))
+        self.assertEqual(match.metrics.stages["win_loss"].bytes_scanned, replay.total_bytes)
+
+        line = json.loads(match.metrics.to_json_line())
+        self.assertEqual(line["stages"]["load_frames"]["counters"]["frames"], replay.frame_count)
+        self.assertEqual(match.to_dict()["metrics"], match.metrics.to_dict())
+
+    def test_metrics_tolerate_players_without_entity_id(self) -> None:
+        parse = VGRParser.parse
+
+        def parse_without_first_eid(parser):
+            parsed = parse(parser)
+            parsed["teams"]["left"][0]["entity_id"] = None
+            return parsed
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            replay = generate_replay(temp_dir, SPEC)
+            with patch.object(VGRParser, "parse", parse_without_first_eid):
+                plain = UnifiedDecoder(replay.replay_file).decode()
+                match = UnifiedDecoder(replay.replay_file, collect_metrics=True).decode()
+
+        self.assertIsNone(match.left_team[0].assists)
+        self.assertEqual(
+            match.metrics.stages["duration"].counters["assists"],
+            sum(p.assists or 0 for p in plain.all_players),
+        )
+
+    def test_quiet_win_loss_detector_keeps_counters(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            replay = generate_replay(temp_dir, SPEC)
+            detector = WinLossDetector(replay.replay_file, verbose=False)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                detector.detect_winner()
+
+        self.assertEqual(output.getvalue(), "")
+        self.assertEqual(detector.stats["frames"], replay.frame_count)
+        self.assertEqual(detector.stats["bytes_scanned"], replay.total_bytes)
+
+
+if __name__ == "__main__":
+    unittest.main()
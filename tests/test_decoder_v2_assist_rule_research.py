@@ -1,6 +1,13 @@
+import contextlib
+import io
 import unittest
 from vg.core.kda_detector import CreditRecord, KillEvent, KDADetector
-from vg.decoder_v2.assist_rule_research import AssistRule, _count_assists_for_rule
+from vg.decoder_v2.assist_rule_research import (
+    AssistRule,
+    _count_assists_for_rule,
+    build_assist_rule_research,
+    main,
+)
 
 
 class TestAssistRuleResearch(unittest.TestCase):
@@ -24,5 +31,39 @@ class TestAssistRuleResearch(unittest.TestCase):
         self.assertEqual(assists[2], 1)
 
 
+    def test_credit_window_sweep_reuses_one_scan(self) -> None:
+        kill = b"\x42\xC8\x00\x00\x00\x00\x00" + b"\x18\x04\x1C\x00\x00\x00\x01" + b"\xFF" * 4 + b"\x3F\x80\x00\x00\x29"
+        gold = b"\x10\x04\x1D\x00\x00\x00\x02\x41\x20\x00\x00\x06"
+        flag = b"\x10\x04\x1D\x00\x00\x00\x02\x3F\x80\x00\x00\x01"
+        # Flag lands ~600 bytes after the kill: outside the default 500-byte window
+        frame = kill + gold + b"\x55" * 580 + flag + b"\x55" * 40
+        detector = KDADetector({1, 2}, credit_window=800)
+        detector.process_frame(0, frame)
+
+        counts = {
+            window: _count_assists_for_rule(
+                detector,
+                {1: "left", 2: "left"},
+                [1, 2],
+                game_duration=100,
+                kill_buffer=3,
+                rule=AssistRule("current", True, 2, None),
+                credit_window=window,
+            )[2]
+            for window in (500, 800)
+        }
+
+        self.assertEqual(counts, {500: 0, 800: 1})
+        self.assertEqual(len(detector.kill_events_for_window(500)[0].credits), 1)
+        with self.assertRaises(ValueError):
+            detector.kill_events_for_window(1000)
+
+    def test_empty_credit_window_list_is_rejected(self) -> None:
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(["--credit-windows", ","])
+        with self.assertRaises(ValueError):
+            build_assist_rule_research("unused.json", credit_windows=[])
+
+
 if __name__ == "__main__":
     unittest.main()
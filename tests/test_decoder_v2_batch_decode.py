@@ -1,9 +1,16 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from vg.decoder_v2.batch_decode import decode_replay_batch, find_replays
+from vg.decoder_v2.batch_decode import (
+    checkpoint_path,
+    decode_replay_batch,
+    decode_replay_batch_jsonl,
+    find_replays,
+    summarize_batch_jsonl,
+)
 
 
 class TestDecoderV2BatchDecode(unittest.TestCase):
@@ -42,6 +49,64 @@ class TestDecoderV2BatchDecode(unittest.TestCase):
         self.assertEqual(report["accepted_field_summary"]["hero"], 2)
         self.assertEqual(report["withheld_field_summary"]["duration_seconds"], 2)
 
+    def test_jsonl_batch_resumes_from_checkpoint_and_rebuilds_summary(self) -> None:
+        payload = {
+            "completeness_status": "complete_confirmed",
+            "accepted_fields": {"hero": "accepted"},
+            "withheld_fields": {},
+        }
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir) / "replays"
+            base.mkdir()
+            (base / "one.0.vgr").write_bytes(b"a")
+            (base / "two.0.vgr").write_bytes(b"b")
+            output = str(Path(temp_dir) / "batch.jsonl")
+
+            with patch("vg.decoder_v2.batch_decode.decode_match") as decode_match_mock:
+                decode_match_mock.return_value.to_dict.side_effect = [payload, RuntimeError("boom")]
+                first = decode_replay_batch_jsonl(str(base), output)
+                # Interrupted run: a torn record line after the checkpointed work
+                with open(output, "a", encoding="utf-8") as f:
+                    f.write('{"replay_file": "torn')
+                decode_match_mock.return_value.to_dict.side_effect = [payload]
+                second = decode_replay_batch_jsonl(str(base), output)
+                calls = decode_match_mock.call_count
+
+            rebuilt = summarize_batch_jsonl(output)
+            checkpoint_lines = checkpoint_path(output).read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(len(first["failed_replays"]), 1)
+        self.assertEqual((second["resumed_replays"], second["decoded_replays"]), (1, 1))
+        self.assertEqual(calls, 3)
+        self.assertEqual(second["failed_replays"], [])
+        self.assertEqual(rebuilt["total_replays"], 2)
+        self.assertEqual(rebuilt["completeness_summary"], {"complete_confirmed": 2})
+        self.assertEqual(rebuilt["accepted_field_summary"], {"hero": 2})
+        self.assertEqual(len(checkpoint_lines), 2)
+
+    def test_jsonl_batch_redecodes_replay_rewritten_with_same_size_and_mtime(self) -> None:
+        payload = {"completeness_status": "complete_confirmed", "accepted_fields": {}, "withheld_fields": {}}
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir) / "replays"
+            base.mkdir()
+            replay = base / "one.0.vgr"
+            replay.write_bytes(b"a")
+            output = str(Path(temp_dir) / "batch.jsonl")
+
+            with patch("vg.decoder_v2.batch_decode.decode_match") as decode_match_mock:
+                decode_match_mock.return_value.to_dict.return_value = payload
+                decode_replay_batch_jsonl(str(base), output)
+                stat = replay.stat()
+                replay.write_bytes(b"b")
+                os.utime(replay, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+                rerun = decode_replay_batch_jsonl(str(base), output)
+                unchanged = decode_replay_batch_jsonl(str(base), output)
+
+        self.assertEqual((rerun["resumed_replays"], rerun["decoded_replays"]), (0, 1))
+        self.assertEqual((unchanged["resumed_replays"], unchanged["decoded_replays"]), (1, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,23 +1,29 @@
 import unittest
 
-from vg.decoder_v2.completeness import _scan_max_timestamp, assess_completeness
+from vg.decoder_v2.completeness import assess_completeness, extract_replay_signals
 from vg.decoder_v2.duration import estimate_duration_from_signals
 from vg.decoder_v2.models import CompletenessStatus, ReplaySignalSummary
+from vg.decoder_v2.replay_context import ReplayContext
+
+
+PARSED = {"replay_name": "match", "replay_file": "match.0.vgr", "teams": {"left": [], "right": []}}
 
 
 class TestDecoderV2Completeness(unittest.TestCase):
-    def test_scan_max_timestamp_does_not_cross_frame_boundaries(self) -> None:
+    def test_death_header_scan_does_not_cross_frame_boundaries(self) -> None:
         frame_a = b"\x00\x08\x04"
         frame_b = b"\x31\x00\x00\x07\xd0\x00\x00\x44\xc5\x40\x00"
 
-        value = _scan_max_timestamp(
-            [(0, frame_a), (1, frame_b)],
-            b"\x08\x04\x31",
-            9,
-            guards=((3, b"\x00\x00"), (7, b"\x00\x00")),
+        split = extract_replay_signals(
+            "match.0.vgr", ReplayContext("match.0.vgr", parsed=PARSED, frames=[(0, frame_a), (1, frame_b)]),
+        )
+        joined = extract_replay_signals(
+            "match.0.vgr", ReplayContext("match.0.vgr", parsed=PARSED, frames=[(0, frame_a + frame_b)]),
         )
 
-        self.assertIsNone(value)
+        self.assertIsNone(split.max_death_header_ts)
+        self.assertIsNone(split.crystal_ts)
+        self.assertEqual((joined.max_death_header_ts, joined.crystal_ts), (1578.0, 1578.0))
 
     def test_complete_confirmed_from_crystal_and_death_alignment(self) -> None:
         signals = ReplaySignalSummary(
@@ -2,7 +2,7 @@ import unittest
 from unittest.mock import patch
 
 from vg.core.kda_detector import CreditRecord, KillEvent
-from vg.decoder_v2.kda_assist_credit_triage import build_kda_assist_credit_triage
+from vg.decoder_v2.kda_assist_credit_triage import build_kda_assist_credit_triage, main
 
 
 class TestKdaAssistCreditTriage(unittest.TestCase):
@@ -68,5 +68,18 @@ class TestKdaAssistCreditTriage(unittest.TestCase):
         self.assertFalse(window["same_team_as_killer"])
 
 
+    @patch("vg.decoder_v2.kda_assist_credit_triage.build_kda_assist_credit_triage")
+    def test_credit_windows_option_accepts_empty_list(self, mock_build) -> None:
+        mock_build.return_value = {}
+        with patch("builtins.print"):
+            main(["--credit-windows", ","])
+            main(["--credit-windows", "300,800"])
+
+        self.assertEqual(
+            [call.kwargs["credit_windows"] for call in mock_build.call_args_list],
+            [[], [300, 800]],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
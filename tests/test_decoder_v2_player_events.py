@@ -1,7 +1,15 @@
 import unittest
 from unittest.mock import patch
 
-from vg.decoder_v2.player_events import collect_player_events_by_entity, iter_player_events
+from vg.decoder_v2.player_events import (
+    collect_player_events_by_entity,
+    iter_player_events,
+    player_event_table,
+)
+from vg.decoder_v2.replay_context import ReplayContext
+
+
+PARSED = {"teams": {"left": [{"name": "player1", "entity_id": 0x1234}], "right": []}}
 
 
 class TestDecoderV2PlayerEvents(unittest.TestCase):
@@ -45,6 +53,24 @@ class TestDecoderV2PlayerEvents(unittest.TestCase):
         self.assertEqual(len(grouped[0x1234]), 2)
         self.assertEqual(len(grouped[0x5678]), 1)
 
+    def test_player_events_decode_payload_fields_lazily(self) -> None:
+        payload = b"\x42\xC8\x00\x00" + b"\x00\x00\x00\x00" + bytes(range(24))
+        # A tracked id inside a skipped payload must not start an event
+        data = b"\x99\x34\x12\x00\x00\x04" + payload[:10] + b"\x34\x12\x00\x00" + payload[14:]
+        context = ReplayContext("sample.0.vgr", parsed=PARSED, frames=[(5, data)])
+
+        table = player_event_table("sample.0.vgr", context=context)
+        events = list(iter_player_events("sample.0.vgr", context=context))
+
+        self.assertIs(player_event_table("sample.0.vgr", context=context), table)
+        self.assertEqual(list(table.column("offset")), [1])
+        event = events[0]
+        self.assertIsInstance(event.payload, memoryview)
+        self.assertEqual(event.f32_be(0), 100.0)
+        self.assertEqual(event.u16_le(10), 0x1234)
+        self.assertEqual(event.to_record().payload_hex, data[6:38].hex())
+        self.assertEqual(event.to_dict()["entity_id_le"], 0x1234)
+
 
 if __name__ == "__main__":
     unittest.main()
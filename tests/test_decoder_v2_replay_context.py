@@ -0,0 +1,72 @@
+import unittest
+from unittest.mock import patch
+
+from vg.decoder_v2.credit_events import iter_credit_events
+from vg.decoder_v2.kda import decode_kda_from_replay
+from vg.decoder_v2.minions import collect_minion_candidates
+from vg.decoder_v2.player_events import iter_player_events
+from vg.decoder_v2.replay_context import ReplayContext
+from vg.decoder_v2.winner import decode_winner_from_replay
+
+
+PARSED = {
+    "replay_name": "sample",
+    "replay_file": "sample.0.vgr",
+    "match_info": {"mode": "GameMode_HF_Ranked", "map_name": "Halcyon Fold", "team_size": 3},
+    "teams": {
+        "left": [{"name": "player1", "team": "left", "entity_id": 0x1234, "hero_name": "Alpha"}],
+        "right": [],
+    },
+}
+
+FRAME = (
+    b"\x10\x04\x1D\x00\x00\x34\x12\x3F\x80\x00\x00\x0E"
+    b"\x34\x12\x00\x00\x04" + bytes(range(32))
+)
+
+
+class TestDecoderV2ReplayContext(unittest.TestCase):
+    def test_entry_points_share_one_parse_and_frame_read(self) -> None:
+        with patch("vg.decoder_v2.replay_context.VGRParser") as parser_cls, patch(
+            "vg.decoder_v2.completeness.load_frames",
+            return_value=[(0, FRAME)],
+        ) as load_frames_mock:
+            parser_cls.return_value.parse.return_value = PARSED
+            context = ReplayContext("sample.0.vgr")
+
+            kda_result = decode_kda_from_replay("sample.0.vgr", context=context)
+            winner_result = decode_winner_from_replay("sample.0.vgr", context=context)
+            candidates = collect_minion_candidates("sample.0.vgr", context=context)
+            credit_events = list(iter_credit_events("sample.0.vgr", context=context))
+            player_events = list(iter_player_events("sample.0.vgr", context=context))
+
+        self.assertEqual(parser_cls.return_value.parse.call_count, 1)
+        self.assertEqual(load_frames_mock.call_count, 1)
+        self.assertIs(winner_result.assessment, kda_result.assessment)
+        self.assertEqual(candidates[0].action_0e_value_1, 1)
+        self.assertEqual(len(credit_events), 1)
+        self.assertEqual(player_events[0].entity_id_le, 0x1234)
+
+    def test_kda_detector_scans_frames_once(self) -> None:
+        context = ReplayContext("sample.0.vgr", parsed=PARSED, frames=[(0, FRAME)])
+
+        detector = context.kda_detector
+
+        self.assertIs(context.kda_detector, detector)
+        self.assertEqual(context.player_entities_be, {0x3412: "player1"})
+        self.assertEqual(detector.get_results()[0x3412].minion_kills, 1)
+
+    def test_memo_computes_each_key_once(self) -> None:
+        context = ReplayContext("sample.0.vgr", parsed=PARSED, frames=[])
+        calls = []
+
+        first = context.memo("value", lambda: calls.append(1) or len(calls))
+        second = context.memo("value", lambda: calls.append(1) or len(calls))
+
+        self.assertEqual(first, 1)
+        self.assertEqual(second, 1)
+        self.assertEqual(len(calls), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
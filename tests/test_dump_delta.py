@@ -0,0 +1,97 @@
+import json
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from vg.tools.dump_delta import build_dump_delta_report, changed_region_strings
+from vg.tools.dump_numeric_token_diff import build_dump_numeric_token_diff
+from vg.tools.dump_string_diff import build_dump_string_diff
+from vg.tools.dump_string_inventory import load_string_inventory, sidecar_path
+from vg.tools.dump_unknown_window_batch_report import build_unknown_window_batch_report
+from vg.tools.minidump_parser import MINIDUMP_SIGNATURE
+
+
+def _build_dump(ranges) -> bytes:
+    # Memory64 dump of (virtual_address, bytes) ranges stored back to back
+    header = struct.pack("<IIIIIIQ", MINIDUMP_SIGNATURE, 0xA793, 1, 32, 0, 0, 0)
+    table = struct.pack("<QQ", len(ranges), 0)  # base rva patched below
+    for va, blob in ranges:
+        table += struct.pack("<QQ", va, len(blob))
+    base = 32 + 12 + len(table)
+    table = struct.pack("<QQ", len(ranges), base) + table[16:]
+    stream = struct.pack("<III", 9, len(table), 44)
+    return header + stream + table + b"".join(blob for _, blob in ranges)
+
+
+class TestDumpDelta(unittest.TestCase):
+    def test_only_changed_pages_are_diffed_by_virtual_address(self) -> None:
+        page = b"\x00" * 4096
+        same = (b"stable_text 11\x00" + page)[:4096]
+        before = _build_dump([(0x10000, same + page), (0x40000, b"gone_text 5".ljust(4096, b"\x00"))])
+        # The after dump gains a range in front, shifting file offsets of the unchanged page
+        after = _build_dump(
+            [
+                (0x8000, b"new_text 7 8".ljust(4096, b"\x00")),
+                (0x10000, same + b"\x00" * 100 + b"fresh_text 12 3/4".ljust(3996, b"\x00")),
+            ]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            before_path = Path(tmp) / "before.dmp"
+            after_path = Path(tmp) / "after.dmp"
+            before_path.write_bytes(before)
+            after_path.write_bytes(after)
+
+            delta = build_dump_delta_report(str(before_path), str(after_path))
+            strings = build_dump_string_diff(str(before_path), str(after_path))
+            numeric = build_dump_numeric_token_diff(str(before_path), str(after_path))
+
+            delta_path = Path(tmp) / "delta.json"
+            delta_path.write_text(json.dumps(delta), encoding="utf-8")
+            numeric_path = Path(tmp) / "numeric.json"
+            numeric_path.write_text(json.dumps(numeric), encoding="utf-8")
+            batch = build_unknown_window_batch_report(str(numeric_path), str(after_path), delta_path=str(delta_path))
+
+        statuses = [(r["status"], r["va_start"], r["page_count"]) for r in delta["regions"]]
+        self.assertEqual(statuses, [("added", 0x8000, 1), ("changed", 0x11000, 1), ("removed", 0x40000, 1)])
+        self.assertEqual(delta["changed_bytes"], 3 * 4096)
+        self.assertEqual(strings["added_sample"], ["fresh_text 12 3/4", "new_text 7 8"])
+        self.assertEqual(strings["removed_sample"], ["gone_text 5"])
+        self.assertNotIn("stable_text 11", strings["added_sample"] + strings["removed_sample"])
+        # Numeric windows are keyed by after-dump file offset; the header shifts pages off 4 KiB file boundaries
+        self.assertEqual(sorted(row["window_start"] for row in numeric["top_windows"]), [0, 8192])
+        self.assertEqual([row["before_count"] for row in numeric["top_windows"]], [0, 0])
+        self.assertEqual([w["changed_bytes"] for w in batch["windows"]], [4004, 4004])
+
+    def test_region_strings_are_whole_and_moved_values_are_not_added(self) -> None:
+        page0 = b"moved_value\x00".ljust(4090, b"\x00") + b"crossi"
+        before = _build_dump([(0x10000, page0 + b"ng_text\x00old_value".ljust(4096, b"\x00"))])
+        after = _build_dump([(0x10000, page0 + b"ng_text\x00moved_value".ljust(4096, b"\x00"))])
+        with tempfile.TemporaryDirectory() as tmp:
+            before_path = Path(tmp) / "before.dmp"
+            after_path = Path(tmp) / "after.dmp"
+            before_path.write_bytes(before)
+            after_path.write_bytes(after)
+
+            _, before_rows, after_rows = changed_region_strings(str(before_path), str(after_path))
+            unchecked = build_dump_string_diff(str(before_path), str(after_path))
+            self.assertFalse(sidecar_path(str(before_path)).exists())
+            load_string_inventory(str(before_path))
+            load_string_inventory(str(after_path))
+            strings = build_dump_string_diff(str(before_path), str(after_path))
+
+        self.assertEqual([row["value"] for row in before_rows], ["crossing_text", "old_value"])
+        self.assertEqual([row["value"] for row in after_rows], ["crossing_text", "moved_value"])
+        self.assertEqual(before_rows[0]["after_offset"], after_rows[0]["offset"] + 6)
+        # Without inventory sidecars the diff stays on the changed pages
+        self.assertFalse(unchecked["moved_checked"])
+        self.assertEqual(unchecked["added_sample"], ["moved_value"])
+        self.assertEqual(unchecked["moved_count"], 0)
+        self.assertTrue(strings["moved_checked"])
+        self.assertEqual(strings["added_sample"], [])
+        self.assertEqual(strings["removed_sample"], ["old_value"])
+        self.assertEqual(strings["moved_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
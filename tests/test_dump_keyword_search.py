@@ -2,7 +2,7 @@ import tempfile
 import unittest
 from pathlib import Path
 
-from vg.tools.dump_keyword_search import search_dump_keywords
+from vg.tools.dump_keyword_search import find_all_needles, search_dump_keywords
 
 
 class TestDumpKeywordSearch(unittest.TestCase):
@@ -17,6 +17,17 @@ class TestDumpKeywordSearch(unittest.TestCase):
         self.assertGreater(keyword_rows["Temporary ashasha"]["ascii"]["count"], 0)
         self.assertGreater(keyword_rows["플레이"]["utf16le"]["count"], 0)
 
+    def test_find_all_needles_reports_overlapping_and_prefix_hits(self) -> None:
+        data = b"xxabababcab\x00ab"
+        needles = [b"ab", b"abab", b"bab", b"ab", b"zz", b""]
+        found = find_all_needles(data, needles)
+
+        for needle in (b"ab", b"abab", b"bab", b"zz"):
+            expected = [i for i in range(len(data)) if data.startswith(needle, i)]
+            self.assertEqual(found[needle], expected)
+        self.assertEqual(found[b"abab"], [2, 4])
+        self.assertNotIn(b"", found)
+
 
 if __name__ == "__main__":
     unittest.main()
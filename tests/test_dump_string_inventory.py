@@ -0,0 +1,39 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from vg.tools import dump_string_inventory
+from vg.tools.dump_string_cluster_report import extract_strings_with_offsets
+from vg.tools.dump_string_inventory import StringInventory, load_string_inventory, sidecar_path
+
+
+class TestDumpStringInventory(unittest.TestCase):
+    def test_inventory_round_trips_through_sidecar_and_answers_queries(self) -> None:
+        payload = b"\x00\x01GameMode_HF\x00\x00" + "8815_DIOR".encode("utf-16-le") + b"\xff" * 8 + b"8815_alt" + b"\x02abc"
+        with tempfile.TemporaryDirectory() as tmp:
+            dump = Path(tmp) / "sample.dmp"
+            dump.write_bytes(payload)
+            built = load_string_inventory(str(dump))
+            self.assertTrue(sidecar_path(str(dump)).exists())
+
+            with patch.dict(dump_string_inventory._loaded, clear=True), patch.object(
+                StringInventory, "build", side_effect=AssertionError("sidecar not used")
+            ):
+                loaded = load_string_inventory(str(dump))
+
+            self.assertEqual(loaded.rows(), built.rows())
+            self.assertEqual(built.rows(), extract_strings_with_offsets(payload))
+            self.assertEqual([row["value"] for row in loaded.window(10, 50)], ["8815_DIOR", "8815_alt"])
+            self.assertEqual([row["encoding"] for row in loaded.with_prefix("8815_")], ["utf16le", "ascii"])
+            self.assertEqual(list(loaded.with_prefix("zzz")), [])
+
+            # A changed dump (size/mtime) invalidates the sidecar
+            dump.write_bytes(payload + b"\x00ExtraText")
+            os.utime(dump, ns=(1, 1))
+            self.assertIn("ExtraText", load_string_inventory(str(dump)).value_set())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import struct
+import unittest
+
+from vg.analysis.win_loss_detector import WinLossDetector
+from vg.core.entity_events import (
+    collect_entity_events,
+    extract_entity_events,
+    iter_entity_event_offsets,
+    scan_entity_lifecycle,
+)
+
+
+def _event(eid: int, action: int = 0x05) -> bytes:
+    return struct.pack("<H", eid) + b"\x00\x00" + bytes([action]) + b"\x11" * 32
+
+
+class TestEntityEvents(unittest.TestCase):
+    def test_walk_skips_whole_events_and_ignores_padding_inside_them(self) -> None:
+        # The second event's payload hides a `00 00` that must not start an event
+        payload_with_padding = struct.pack("<H", 2000) + b"\x00\x00\x05" + b"\x11\x00\x00" + b"\x11" * 29
+        data = b"\x22" * 3 + _event(1500) + payload_with_padding + b"\x33" + _event(3000) + b"\x44" * 6
+
+        self.assertEqual(list(iter_entity_event_offsets(data)), [3, 40, 78])
+
+    def test_extractor_strides_match_each_walk(self) -> None:
+        # Zero run: every offset is a candidate until the stride skips it
+        data = b"\x01\x02" + b"\x00" * 12 + b"\x03\x04\x00\x00\x09" + b"\x55" * 40
+
+        header_walk = extract_entity_events(data, skip=5, tail=4)
+        overlapping = extract_entity_events(data, skip=1, tail=7)
+        tracked = extract_entity_events(data, skip=37, tail=36, tracked=[0x0403])
+
+        self.assertEqual(list(header_walk[0]), [0, 5, 10])
+        self.assertEqual(list(overlapping[0])[:4], [0, 1, 2, 3])
+        self.assertEqual(list(tracked[0]), [14])
+        self.assertEqual((tracked[1][0], tracked[2][0]), (0x0403, 0x09))
+
+        table = collect_entity_events([(4, data), (9, data)], skip=5, tail=4)
+        self.assertEqual(list(table.column("frame_idx")), [4] * 3 + [9] * 3)
+
+    def test_lifecycle_spans_frames_and_filters_range(self) -> None:
+        frames = [
+            (0, _event(5000) + _event(900)),
+            (1, _event(5000) + _event(6000)),
+            (2, _event(6000) + b"\x55" * 8),
+        ]
+        stats = {}
+
+        lifecycle = scan_entity_lifecycle(frames, stats=stats)
+
+        self.assertEqual(sorted(lifecycle), [5000, 6000])
+        self.assertEqual(
+            lifecycle[5000],
+            {"first_frame": 0, "last_frame": 1, "event_count": 2, "frames": {0, 1}},
+        )
+        self.assertEqual(lifecycle[6000]["first_frame"], 1)
+        self.assertEqual(stats["event_headers"], 5)
+        self.assertEqual(stats["entity_events"], 4)
+
+    def test_win_loss_detector_uses_preloaded_frames(self) -> None:
+        frames = [(0, _event(5000)), (1, _event(5000) + _event(6000))]
+        detector = WinLossDetector("does/not/exist.0.vgr", verbose=False, frames=frames)
+
+        entity_data = detector._collect_entity_events()
+
+        self.assertEqual(entity_data[5000]["event_count"], 2)
+        self.assertIsNone(detector.detect_winner())
+        self.assertEqual(detector.stats["bytes_scanned"], 2 * sum(len(data) for _, data in frames))
+
+
+if __name__ == "__main__":
+    unittest.main()
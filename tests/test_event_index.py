@@ -0,0 +1,139 @@
+import os
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from vg.core import event_index
+from vg.core.entity_events import scan_entity_lifecycle
+from vg.core.event_index import index_path, load_entity_lifecycle, load_frame_records
+from vg.core.frame_store import FrameStore
+from vg.core.record_scanner import scan_frames
+
+
+def _frame_bytes() -> bytes:
+    kill = (
+        struct.pack(">f", 42.0) + b"\x00\x00\x00"
+        + b"\x18\x04\x1C\x00\x00\x05\xDC\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+    )
+    credit = b"\x10\x04\x1D\x00\x00\x05\xDC" + struct.pack(">f", 1.0) + b"\x0E\x00"
+    death = b"\x08\x04\x31\x00\x00\x05\xDD\x00\x00" + struct.pack(">f", 43.0)
+    item = (
+        b"\x10\x04\x3D\x00\x00\x05\xDC\x00\x00\x01\xCA\x00"
+        + b"\x00" * 5 + struct.pack(">f", 44.0)
+    )
+    # Truncated death header at the end leaves None fields behind
+    return b"\x00" * 3 + kill + credit + death + item + b"\x08\x04\x31\x00"
+
+
+class TestEventIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.base = Path(self._temp_dir.name)
+        (self.base / "match.0.vgr").write_bytes(_frame_bytes())
+        (self.base / "match.1.vgr").write_bytes(b"")
+        (self.base / "match.2.vgr").write_bytes(_frame_bytes()[::-1] + _frame_bytes())
+        self.index_dir = self.base / "index"
+        env = patch.dict(os.environ, {event_index.INDEX_ENV: str(self.index_dir)})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self) -> None:
+        self._temp_dir.cleanup()
+
+    def _scanned(self):
+        store = FrameStore.open(self.base, "match")
+        records = scan_frames(store.frames)
+        store.close()
+        return records
+
+    def test_warm_load_matches_fresh_scan(self) -> None:
+        cold = load_frame_records(self.base, "match")
+        self.assertTrue(index_path(self.base, "match").exists())
+        self.assertEqual(index_path(self.base, "match").parent, self.index_dir)
+
+        with patch.object(event_index, "scan_frames", side_effect=AssertionError("rescanned")):
+            warm = load_frame_records(self.base, "match")
+
+        self.assertEqual(cold, self._scanned())
+        self.assertEqual(warm, cold)
+        self.assertEqual(warm[0][1].deaths[-1].eid, None)
+        self.assertEqual(warm[0][1].valid_kill_offsets, cold[0][1].valid_kill_offsets)
+
+    def test_warm_entity_lifecycle_matches_fresh_scan(self) -> None:
+        # Two turret-range events and one player-range event
+        events = b"".join(
+            struct.pack("<H", eid) + b"\x00\x00\x05" + b"\x11" * 32 for eid in (2000, 2000, 57000)
+        )
+        (self.base / "match.1.vgr").write_bytes(events)
+        load_frame_records(self.base, "match")  # sidecar written by the record loader
+
+        with FrameStore.open(self.base, "match") as store:
+            fresh_stats = {}
+            fresh = scan_entity_lifecycle(store.frames, stats=fresh_stats)
+        warm_stats = {}
+        with patch.object(event_index, "count_entity_events", side_effect=AssertionError("rescanned")), \
+                patch.object(event_index, "scan_entity_lifecycle", side_effect=AssertionError("rescanned")):
+            warm = load_entity_lifecycle(self.base, "match", stats=warm_stats)
+
+        self.assertEqual(warm, fresh)
+        self.assertEqual(warm[2000]["event_count"], 2)
+        self.assertEqual(warm[2000]["frames"], {1})
+        fresh_stats.pop("bytes_scanned")
+        self.assertEqual(warm_stats, fresh_stats)
+
+    def test_old_format_sidecar_is_rescanned(self) -> None:
+        load_frame_records(self.base, "match")
+        path = index_path(self.base, "match")
+        path.write_bytes(b"VGIDX\x01" + path.read_bytes()[6:])
+
+        with patch.object(event_index, "scan_frames", wraps=scan_frames) as scan_mock:
+            records = load_frame_records(self.base, "match")
+
+        self.assertEqual(scan_mock.call_count, 1)
+        self.assertEqual(records, self._scanned())
+        self.assertTrue(path.read_bytes().startswith(b"VGIDX\x02"))
+
+    def test_changed_frame_or_version_invalidates_index(self) -> None:
+        load_frame_records(self.base, "match")
+        frame_path = self.base / "match.1.vgr"
+        frame_path.write_bytes(_frame_bytes())
+        stat = frame_path.stat()
+        os.utime(frame_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        refreshed = load_frame_records(self.base, "match")
+        self.assertEqual(len(refreshed[1][1].kills), 1)
+
+        with patch.object(event_index, "index_version", return_value="0:stale"), patch.object(
+            event_index, "scan_frames", wraps=scan_frames,
+        ) as scan_mock:
+            load_frame_records(self.base, "match")
+        self.assertEqual(scan_mock.call_count, 1)
+
+    def test_use_index_false_never_touches_sidecar(self) -> None:
+        records = load_frame_records(self.base, "match", use_index=False)
+
+        self.assertEqual(records, self._scanned())
+        self.assertFalse(index_path(self.base, "match").exists())
+
+    def test_index_is_opt_in(self) -> None:
+        with patch.dict(os.environ, {event_index.INDEX_ENV: ""}):
+            records = load_frame_records(self.base, "match")
+            self.assertIsNone(index_path(self.base, "match"))
+
+        self.assertEqual(records, self._scanned())
+        self.assertFalse(self.index_dir.exists())
+        self.assertEqual(list(self.base.glob("*.vgidx")), [])
+
+    def test_caller_frames_bypass_index(self) -> None:
+        load_frame_records(self.base, "match")
+        frames = [(0, b"\x00" * 16)]
+
+        records = load_frame_records(self.base, "match", frames)
+
+        self.assertEqual(records, scan_frames(frames))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import math
+import unittest
+from unittest.mock import patch
+
+from vg.core.kda_detector import KDADetector
+from vg.decoder_v2.credit_events import credit_event_table, iter_credit_events
+
+
+KILL = b"\x18\x04\x1C\x00\x00\x05\xDC\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+CREDIT_1 = b"\x10\x04\x1D\x00\x00\x05\xDD\x3F\x80\x00\x00\x01"
+CREDIT_GOLD = b"\x10\x04\x1D\x00\x00\x05\xDD\x41\x20\x00\x00\x06"
+CREDIT_NAN = b"\x10\x04\x1D\x00\x00\x05\xDD\x7F\xC0\x00\x01\x0E"
+
+
+class TestEventTable(unittest.TestCase):
+    def test_kda_detector_stores_kills_in_columns_and_builds_views(self) -> None:
+        frame = b"\x42\xC8\x00\x00\x00\x00\x00" + KILL + CREDIT_GOLD + CREDIT_1
+        detector = KDADetector({0x05DC, 0x05DD})
+        detector.process_frame(3, frame)
+
+        self.assertEqual(list(detector.kill_table.column("killer_eid")), [0x05DC])
+        self.assertEqual(list(detector.credit_table.column("value")), [10.0, 1.0])
+        kill = detector.kill_events[0]
+        self.assertEqual((kill.timestamp, kill.frame_idx, kill.file_offset), (100.0, 3, 7))
+        self.assertEqual([(c.eid, c.value) for c in kill.credits], [(0x05DD, 10.0), (0x05DD, 1.0)])
+
+        results = detector.get_results(team_map={0x05DC: "left", 0x05DD: "left"})
+        self.assertEqual((results[0x05DC].kills, results[0x05DD].assists), (1, 1))
+
+        # Injected event objects round-trip through the tables
+        detector._kill_events = [kill]
+        self.assertEqual(detector.kill_events, [kill])
+
+    def test_credit_event_table_keeps_raw_records_reconstructible(self) -> None:
+        data = CREDIT_1 + CREDIT_NAN + b"\x10\x04\x1D\x00\x00\x05"
+
+        with patch("vg.decoder_v2.credit_events.load_frames", return_value=[(2, data)]):
+            table = credit_event_table("sample.0.vgr")
+            events = list(iter_credit_events("sample.0.vgr"))
+
+        self.assertEqual(len(table), 2)
+        self.assertEqual(list(table.column("file_offset")), [0, 12])
+        self.assertTrue(math.isnan(table.values()[1]))
+        self.assertEqual([event.raw_record_hex for event in events], [CREDIT_1.hex(), CREDIT_NAN.hex()])
+        self.assertIsNone(events[1].value)
+        self.assertFalse(events[1].value_is_finite)
+        self.assertEqual(table.record(0), events[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,11 @@
 import csv
+import json
 import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import patch
 
-from vg.core.export_matches import decode_batch, export_csv, export_single
+from vg.core.export_matches import decode_batch, export_csv, export_single, stream_batch
 from vg.core.unified_decoder import DecodedMatch, DecodedPlayer
 
 
@@ -82,6 +83,37 @@ class TestExportMatches(unittest.TestCase):
             self.assertFalse((output_dir / "match_1.json").exists())
             self.assertFalse((output_dir / "all_matches.json").exists())
 
+    def test_stream_batch_writes_rows_and_appends_new_replays(self) -> None:
+        def decode(path, **_kwargs):
+            match = make_match()
+            match.replay_name = Path(path).stem.rsplit(".", 1)[0]
+            match.winner = "left"
+            return match
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            replay_dir = Path(temp_dir) / "replays"
+            replay_dir.mkdir()
+            (replay_dir / "a.0.vgr").touch()
+            output_dir = Path(temp_dir) / "out"
+
+            with patch("vg.core.export_matches.decode_single", side_effect=decode):
+                first = stream_batch(str(replay_dir), output_dir=str(output_dir))
+                (replay_dir / "b.0.vgr").touch()
+                second = stream_batch(str(replay_dir), output_dir=str(output_dir), append=True)
+
+            lines = (output_dir / "all_matches.ndjson").read_text(encoding="utf-8").splitlines()
+            with open(output_dir / "match_summary.csv", newline="", encoding="utf-8-sig") as f:
+                summary = list(csv.DictReader(f))
+            with open(output_dir / "all_matches.csv", newline="", encoding="utf-8-sig") as f:
+                players = list(csv.DictReader(f))
+
+        self.assertEqual((first.matches, first.left_wins), (1, 1))
+        self.assertEqual((second.matches, second.skipped), (1, 1))
+        self.assertEqual([json.loads(line)["replay_name"] for line in lines], ["a", "b"])
+        self.assertEqual([(r["match_idx"], r["replay_name"]) for r in summary], [("1", "a"), ("2", "b")])
+        self.assertEqual(len(players), 2)
+        self.assertEqual(players[1]["player_name"], "player1")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from vg.core.frame_store import ConcatenatedFrames, FrameStore
+
+
+class TestFrameStore(unittest.TestCase):
+    def test_open_maps_frames_in_numeric_order_and_tolerates_empty_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            (base / "match.0.vgr").write_bytes(b"abc")
+            (base / "match.1.vgr").write_bytes(b"")
+            (base / "match.10.vgr").write_bytes(b"def")
+            (base / "match.2.vgr").write_bytes(b"xy")
+
+            store = FrameStore.from_replay_file(str(base / "match.0.vgr"))
+            frames = [(frame_idx, bytes(data)) for frame_idx, data in store]
+            view = store.view(3)
+            first_byte = view[0]
+            view.release()
+            total_size = store.total_size
+            store.close()
+
+        self.assertEqual(frames, [(0, b"abc"), (1, b""), (2, b"xy"), (10, b"def")])
+        self.assertEqual(first_byte, ord("d"))
+        self.assertEqual(total_size, 8)
+
+    def test_concatenated_frames_match_joined_bytes(self) -> None:
+        frames = [(0, b"\x00\x08"), (1, b""), (2, b"\x04"), (3, b"\x31\x00\x08\x04\x31")]
+        joined = b"".join(data for _, data in frames)
+        view = ConcatenatedFrames(frames)
+
+        self.assertEqual(len(view), len(joined))
+        for start in range(len(joined) + 1):
+            self.assertEqual(view.find(b"\x08\x04\x31", start), joined.find(b"\x08\x04\x31", start))
+        for start in range(len(joined)):
+            for stop in range(start, len(joined) + 1):
+                self.assertEqual(view[start:stop], joined[start:stop])
+        self.assertEqual(view[-1], joined[-1])
+
+    def test_locate_maps_virtual_offset_to_frame(self) -> None:
+        view = ConcatenatedFrames([(0, b"abc"), (1, b""), (5, b"def")])
+
+        self.assertEqual(view.locate(0), (0, 0))
+        self.assertEqual(view.locate(3), (5, 0))
+        self.assertEqual(view.locate(5), (5, 2))
+        with self.assertRaises(IndexError):
+            view.locate(6)
+
+
+if __name__ == "__main__":
+    unittest.main()
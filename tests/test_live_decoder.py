@@ -0,0 +1,97 @@
+import os
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+
+from vg.core.live_decoder import LiveReplayDecoder
+
+
+PARSED = {
+    "match_info": {"mode": "GameMode_HF_Ranked"},
+    "teams": {
+        "left": [{"name": "alpha", "team": "left", "hero_name": "Ardan", "entity_id": 0xDC05}],
+        "right": [{"name": "bravo", "team": "right", "hero_name": "Skye", "entity_id": 0xDD05}],
+    },
+}
+
+
+def _kill(eid: int, ts: float) -> bytes:
+    return (
+        struct.pack(">f", ts) + b"\x00\x00\x00"
+        + b"\x18\x04\x1C\x00\x00" + struct.pack(">H", eid)
+        + b"\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+    )
+
+
+def _death(eid: int, ts: float) -> bytes:
+    return b"\x08\x04\x31\x00\x00" + struct.pack(">H", eid) + b"\x00\x00" + struct.pack(">f", ts)
+
+
+def _gold(eid: int, value: float) -> bytes:
+    return b"\x10\x04\x1D\x00\x00" + struct.pack(">H", eid) + struct.pack(">f", value) + b"\x06\x00"
+
+
+class TestLiveReplayDecoder(unittest.TestCase):
+    def test_poll_consumes_each_completed_frame_once(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            live = LiveReplayDecoder(temp_dir, "match", parsed=PARSED)
+            (base / "match.0.vgr").write_bytes(b"\x00" * 8)
+            (base / "match.1.vgr").write_bytes(_kill(0x05DC, 61.0) + _death(0x05DD, 61.5))
+
+            first = live.poll()
+            self.assertEqual([board.frame_idx for board in first], [0])
+
+            (base / "match.2.vgr").write_bytes(_gold(0x05DC, 250.0) + _death(61000, 90.0))
+            second = live.poll()
+            self.assertEqual([board.frame_idx for board in second], [1])
+            self.assertEqual(live.poll(), [])
+
+            final = live.finish()
+
+        self.assertEqual([board.frame_idx for board in final], [2])
+        board = final[-1]
+        alpha, bravo = board.left_team[0], board.right_team[0]
+        self.assertEqual((alpha.kills, bravo.deaths), (1, 1))
+        results = live.kda.get_results(team_map=live._team_map)
+        self.assertEqual(
+            [(p.kills, p.deaths, p.assists) for p in board.all_players],
+            [(results[eid].kills, results[eid].deaths, results[eid].assists) for eid in (0x05DC, 0x05DD)],
+        )
+        self.assertEqual(alpha.gold_earned, 850)
+        self.assertEqual(board.game_time, 90.0)
+        self.assertEqual([event.event_type for event in board.objective_events], ["GOLD_MINE_CAPTURE"])
+        # Earlier snapshots keep the state they were taken with
+        self.assertEqual(first[0].left_team[0].kills, 0)
+        self.assertEqual(second[0].left_team[0].gold_earned, 600)
+
+    def test_objective_clusters_close_as_later_frames_arrive(self) -> None:
+        live = LiveReplayDecoder("unused", "match", parsed=PARSED)
+
+        live.feed_frame(0, _death(61000, 100.0) + _death(61001, 102.0))
+        self.assertEqual([event.entity_count for event in live.objectives.events], [2])
+        board = live.feed_frame(1, _death(61002, 103.0) + _kill(0x05DC, 104.0) + _death(61003, 200.0))
+
+        self.assertEqual(
+            [(event.event_type, event.entity_count) for event in board.objective_events],
+            [("KRAKEN_WAVE", 3), ("KRAKEN_DEATH", 1)],
+        )
+
+    def test_from_temp_dir_attaches_to_newest_replay(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            (base / "b-old.0.vgr").write_bytes(b"")
+            (base / "a-new.0.vgr").write_bytes(b"")
+            (base / "._a-new.0.vgr").write_bytes(b"")
+            os.utime(base / "b-old.0.vgr", ns=(0, 1_000_000_000))
+            os.utime(base / "a-new.0.vgr", ns=(0, 2_000_000_000))
+            os.utime(base / "._a-new.0.vgr", ns=(0, 3_000_000_000))
+
+            live = LiveReplayDecoder.from_temp_dir(temp_dir)
+
+        self.assertEqual(live.replay_name, "a-new")
+
+
+if __name__ == "__main__":
+    unittest.main()
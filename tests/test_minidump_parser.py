@@ -5,6 +5,7 @@ from pathlib import Path
 
 from vg.tools.minidump_parser import (
     MINIDUMP_SIGNATURE,
+    MinidumpImage,
     build_minidump_layout_report,
     map_file_offset_to_va,
     parse_memory_ranges,
@@ -29,6 +30,14 @@ def _build_synthetic_memory64_dump() -> bytes:
     return header + stream + memory64 + memory_blob
 
 
+def _build_synthetic_multi_range_dump() -> bytes:
+    # Three Memory64 ranges; the last two are contiguous in VA but listed out of VA order.
+    header = struct.pack("<IIIIIIQ", MINIDUMP_SIGNATURE, 0xA793, 1, 32, 0, 0, 0)
+    stream = struct.pack("<III", 9, 64, 44)
+    memory64 = struct.pack("<QQ", 3, 108) + struct.pack("<QQQQQQ", 0x9000, 4, 0x2000, 4, 0x2004, 4)
+    return header + stream + memory64 + b"WXYZabcdefgh"
+
+
 class TestMinidumpParser(unittest.TestCase):
     def test_parse_memory64_stream(self) -> None:
         data = _build_synthetic_memory64_dump()
@@ -51,6 +60,22 @@ class TestMinidumpParser(unittest.TestCase):
         self.assertEqual(report["memory_range_count"], 1)
         self.assertEqual(report["memory_ranges_sample"][0]["virtual_address"], 0x1000)
 
+    def test_minidump_image_translates_both_directions(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            dump = Path(tmp) / "multi.dmp"
+            dump.write_bytes(_build_synthetic_multi_range_dump())
+            with MinidumpImage.open(str(dump)) as image:
+                self.assertEqual(len(image.ranges), 3)
+                self.assertEqual(image.file_offset_to_va(109), 0x9001)
+                self.assertEqual(image.file_offset_to_va(116), 0x2004)
+                self.assertIsNone(image.file_offset_to_va(120))
+                self.assertIsNone(image.file_offset_to_va(10))
+                self.assertEqual(image.va_to_file_offset(0x2006), 118)
+                self.assertIsNone(image.va_to_file_offset(0x2008))
+                self.assertEqual(image.read_va(0x2002, 4), b"cdef")
+                self.assertIsNone(image.read_va(0x2006, 4))
+                self.assertEqual(list(image.find_all(b"ab")), [112])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,9 +3,11 @@ import struct
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from vg.tools.minidump_parser import MINIDUMP_SIGNATURE
-from vg.tools.minidump_pointer_locator import locate_pointers_in_minidump
+from vg.tools import minidump_pointer_locator
+from vg.tools.minidump_pointer_locator import locate_pointers_in_minidump, locate_pointers_into_range
 
 
 def _build_pointer_dump() -> bytes:
@@ -28,6 +30,34 @@ class TestMinidumpPointerLocator(unittest.TestCase):
         vas = [hit["pointer_va"] for hit in report["targets"][0]["pointer_hits"]]
         self.assertIn(0x3000, vas)
 
+    def test_bulk_scan_matches_targets_and_ranges_with_va_mapping(self) -> None:
+        # Range at VA 0x5004 so VA-aligned qwords start 4 bytes into the blob
+        blob = b"\x00" * 4 + struct.pack("<QQQ", 0x5010, 0x7777, 0x5010) + b"\x00" * 3 + struct.pack("<Q", 0x5010)
+        header = struct.pack("<IIIIIIQ", MINIDUMP_SIGNATURE, 0x0000A793, 1, 32, 0, 0, 0)
+        stream = struct.pack("<III", 9, 32, 44)
+        memory64 = struct.pack("<QQQQ", 1, 76, 0x5004, len(blob))
+        with tempfile.TemporaryDirectory() as tmp:
+            dump = Path(tmp) / "sample.dmp"
+            dump.write_bytes(header + stream + memory64 + blob)
+            targets = [{"label": "a", "virtual_address": 0x5010}, {"label": "b", "virtual_address": 0x7777}]
+            reports = []
+            for has_numpy in sorted({False, minidump_pointer_locator.HAS_NUMPY}):
+                with patch.object(minidump_pointer_locator, "HAS_NUMPY", has_numpy):
+                    reports.append(
+                        (
+                            locate_pointers_in_minidump(str(dump), targets, bulk=True),
+                            locate_pointers_in_minidump(str(dump), targets, bulk=True, unaligned=True),
+                            locate_pointers_into_range(str(dump), 0x5000, 0x6000),
+                        )
+                    )
+
+        aligned, unaligned, into_range = reports[0]
+        self.assertEqual([hit["pointer_va"] for hit in aligned["targets"][0]["pointer_hits"]], [0x5008, 0x5018])
+        self.assertEqual(aligned["targets"][1]["pointer_hits"], [{"file_offset": 88, "pointer_va": 0x5010}])
+        self.assertEqual([hit["pointer_va"] for hit in unaligned["targets"][0]["pointer_hits"]], [0x5008, 0x5018, 0x5023])
+        self.assertEqual([hit["value"] for hit in into_range["pointer_hits"]], [0x5010, 0x5010])
+        self.assertTrue(all(report == reports[0] for report in reports))
+
 
 if __name__ == "__main__":
     unittest.main()
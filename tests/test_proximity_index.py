@@ -0,0 +1,68 @@
+import struct
+import unittest
+
+from vg.core.objective_detector import ObjectiveDetector
+from vg.core.proximity_index import ProximityIndex
+from vg.core.record_scanner import scan_frame
+from vg.core.unified_decoder import _PLAYER_EID_RANGE
+
+
+KILL = b"\x18\x04\x1C\x00\x00\x05\xDC\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+KILL_NON_PLAYER = b"\x18\x04\x1C\x00\x00\x00\x07\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+CREDIT_GOLD = b"\x10\x04\x1D\x00\x00\x05\xDD\x41\x20\x00\x00\x06"
+CREDIT_BAD_PAD = b"\x10\x04\x1D\x01\x00\x05\xDD\x41\x20\x00\x00\x06"
+
+
+def _player_kill_nearby(data: bytes, offsets, window: int = 500) -> bool:
+    """Reference byte walk: any player kill [18 04 1C] within window bytes."""
+    for off in offsets:
+        region = data[max(0, off - window):min(len(data), off + window)]
+        pk = 0
+        while True:
+            kidx = region.find(KILL[:3], pk)
+            if kidx == -1:
+                break
+            pk = kidx + 1
+            if kidx + 7 > len(region):
+                continue
+            if struct.unpack_from(">H", region, kidx + 5)[0] in _PLAYER_EID_RANGE:
+                return True
+    return False
+
+
+class TestProximityIndex(unittest.TestCase):
+    def test_kill_windows_use_global_offsets_and_match_slice_check(self) -> None:
+        frame_a = bytes(100) + KILL_NON_PLAYER
+        frame_b = bytes(40) + KILL + bytes(600)
+        data = frame_a + frame_b
+        index = ProximityIndex.from_frame_records(
+            [(0, scan_frame(frame_a)), (1, scan_frame(frame_b))],
+        )
+
+        self.assertEqual(index.kill_offsets, [100, 156])
+        self.assertEqual(index.killer_eids, [0x0007, 0x05DC])
+        for offset in range(0, len(data), 7):
+            for window in (10, 50, 500):
+                self.assertEqual(
+                    index.has_kill_near(offset, window, _PLAYER_EID_RANGE),
+                    _player_kill_nearby(data, [offset], window),
+                    (offset, window),
+                )
+
+    def test_objective_credit_scan_with_index_matches_byte_scan(self) -> None:
+        data = bytes(30) + CREDIT_GOLD + CREDIT_BAD_PAD + bytes(50) + CREDIT_GOLD + CREDIT_GOLD[:8]
+        detector = ObjectiveDetector({0x05DD})
+        index = ProximityIndex.from_buffer(data)
+
+        for death_offset in (0, 40, 90, len(data)):
+            scanned = detector._scan_credits_near(data, death_offset, scan_range=100)
+            indexed = detector._scan_credits_near(data, death_offset, scan_range=100, index=index)
+            self.assertEqual(dict(indexed), dict(scanned))
+        self.assertEqual(
+            [c["offset"] for c in detector._scan_credits_near(data, 40, 200, index=index)[0x06]],
+            [30, 104],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
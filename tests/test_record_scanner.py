@@ -0,0 +1,160 @@
+import struct
+import unittest
+
+from vg.core.kda_detector import KDADetector
+from vg.core.record_scanner import scan_frame, scan_frames
+
+
+def _kill(eid: int, ts: float) -> bytes:
+    return (
+        struct.pack(">f", ts) + b"\x00\x00\x00"
+        + b"\x18\x04\x1C\x00\x00" + struct.pack(">H", eid)
+        + b"\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+    )
+
+
+def _death(eid: int, ts: float) -> bytes:
+    return b"\x08\x04\x31\x00\x00" + struct.pack(">H", eid) + b"\x00\x00" + struct.pack(">f", ts)
+
+
+def _credit(eid: int, value: float, action: int, sell_flag: int = 0) -> bytes:
+    return b"\x10\x04\x1D\x00\x00" + struct.pack(">H", eid) + struct.pack(">f", value) + bytes([action, sell_flag])
+
+
+def _item(eid: int, qty: int, item_id: int, ts: float) -> bytes:
+    return (
+        b"\x10\x04\x3D\x00\x00" + struct.pack(">H", eid) + b"\x00\x00"
+        + bytes([qty]) + struct.pack("<H", item_id) + b"\x00\x00\x00\x00\x01"
+        + struct.pack(">f", ts)
+    )
+
+
+KILL_TAIL = b"\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+
+
+def _byte_walk(frames, valid_eids):
+    """Kills, deaths and minion kills found by the original per-family byte walk."""
+    kills, deaths, minions = [], [], {}
+    for frame_idx, data in frames:
+        pos = data.find(b"\x18\x04\x1C")
+        while pos != -1:
+            eid = struct.unpack_from(">H", data, pos + 5)[0] if pos + 16 <= len(data) else None
+            if data[pos + 3:pos + 5] != b"\x00\x00" or data[pos + 7:pos + 16] != KILL_TAIL or eid not in valid_eids:
+                pos = data.find(b"\x18\x04\x1C", pos + 1)
+                continue
+            ts = struct.unpack_from(">f", data, pos - 7)[0] if pos >= 7 else None
+            credits, cpos = [], pos + 16
+            while cpos < min(pos + 516, len(data)):
+                if data[cpos:cpos + 3] == b"\x18\x04\x1C" and data[cpos + 7:cpos + 16] == KILL_TAIL \
+                        and data[cpos + 3:cpos + 5] == b"\x00\x00":
+                    break
+                if data[cpos:cpos + 5] == b"\x10\x04\x1D\x00\x00" and cpos + 9 <= len(data):
+                    ceid, value = struct.unpack_from(">Hf", data, cpos + 5)
+                    if ceid in valid_eids and 0 <= value <= 10000:
+                        credits.append((ceid, round(value, 2), cpos))
+                    cpos += 9
+                    continue
+                cpos += 1
+            kills.append((eid, ts if ts is not None and 0 < ts < 1800 else None, frame_idx, pos, credits))
+            pos = data.find(b"\x18\x04\x1C", pos + 16)
+        pos = data.find(b"\x08\x04\x31")
+        while pos != -1:
+            if pos + 13 <= len(data) and data[pos + 3:pos + 5] == data[pos + 7:pos + 9] == b"\x00\x00":
+                eid, ts = struct.unpack_from(">H2xf", data, pos + 5)
+                if eid in valid_eids and 0 < ts < 1800:
+                    deaths.append((eid, ts, frame_idx, pos))
+            pos = data.find(b"\x08\x04\x31", pos + 1)
+        pos = data.find(b"\x10\x04\x1D")
+        while pos != -1:
+            if pos + 12 <= len(data) and data[pos + 3:pos + 5] == b"\x00\x00":
+                eid, value = struct.unpack_from(">Hf", data, pos + 5)
+                if eid in valid_eids and abs(value - 1.0) < 0.01 and data[pos + 11] == 0x0E:
+                    minions[eid] = minions.get(eid, 0) + 1
+                pos = data.find(b"\x10\x04\x1D", pos + 3)
+            else:
+                pos = data.find(b"\x10\x04\x1D", pos + 1)
+    return kills, deaths, minions
+
+
+class TestRecordScanner(unittest.TestCase):
+    def test_scan_frame_decodes_each_family_in_offset_order(self) -> None:
+        data = (
+            b"\x00" * 4
+            + _kill(0x05DC, 120.5)
+            + _credit(0x05DD, 1.0, 0x0E)
+            + _death(0x05DD, 121.0)
+            + _item(0x05DC, 1, 0xCA, 130.0)
+            + _death(2001, 900.0)[:10]
+        )
+
+        records = scan_frame(data)
+
+        self.assertEqual([(k.killer_eid, k.timestamp, k.valid) for k in records.kills], [(0x05DC, 120.5, True)])
+        self.assertEqual(records.valid_kill_offsets, [records.kills[0].offset])
+        self.assertEqual(
+            [(c.eid, c.value, c.action, c.sell_flag, c.padding_ok) for c in records.credits],
+            [(0x05DD, 1.0, 0x0E, 0, True)],
+        )
+        self.assertEqual(records.credit_offsets, [records.credits[0].offset])
+        self.assertEqual(
+            [(d.eid, d.timestamp, d.valid) for d in records.deaths],
+            [(0x05DD, 121.0, True), (None, None, False)],
+        )
+        self.assertEqual(
+            [(i.eid, i.qty, i.item_id, i.timestamp, i.valid) for i in records.item_acquires],
+            [(0x05DC, 1, 0xCA, 130.0, True)],
+        )
+
+    def test_kda_detector_on_scanned_records_matches_byte_walk(self) -> None:
+        eids = {0x05DC, 0x05DD}
+        # A credit header hidden inside a credit prefix, a second kill inside
+        # the first kill's credit window, a broken kill tail, a kill without a
+        # timestamp and out-of-range death timestamps
+        hidden = b"\x10\x04\x1D\x00\x00\x05\xDD\x10\x04\x1D\x00\x00\x05\xDC" + struct.pack(">f", 5.0)
+        frames = [
+            (0, _credit(0x05DC, 1.0, 0x0E) + _kill(0x05DC, 50.0) + _credit(0x05DD, 20.0, 0x06)
+                + hidden + _credit(0x05DD, 1.0, 0x0E) + _kill(0x05DD, 52.0) + _credit(0x05DC, 1.0, 0x0E)),
+            (1, _death(0x05DD, 51.0) + _death(0x05DC, 2000.0) + _kill(0x05DC, 60.0)[:-1] + b"\x28"
+                + _credit(0x05DD, 1.0, 0x0E) + _kill(0x05DD, -1.0) + _death(0x05DC, 61.0)),
+            (2, b"\x00" * 600 + _credit(0x05DC, 1.0, 0x0E, 1) + _death(0x05DD, 0.0)),
+        ]
+        detector = KDADetector(eids)
+        for (frame_idx, data), (_, records) in zip(frames, scan_frames(frames)):
+            detector.process_frame(frame_idx, data, records)
+
+        kills, deaths, minions = _byte_walk(frames, eids)
+        self.assertEqual(
+            [
+                (k.killer_eid, k.timestamp, k.frame_idx, k.file_offset,
+                 [(c.eid, c.value, c.offset) for c in k.credits])
+                for k in detector.kill_events
+            ],
+            kills,
+        )
+        self.assertEqual(
+            [(d.victim_eid, d.timestamp, d.frame_idx, d.file_offset) for d in detector.death_events],
+            deaths,
+        )
+        self.assertEqual(dict(detector.minion_kill_counts), minions)
+        self.assertEqual((len(kills), len(deaths)), (3, 2))
+
+    def test_event_views_are_built_once_per_frame_batch(self) -> None:
+        detector = KDADetector({0x05DC, 0x05DD})
+        detector.process_frame(0, _kill(0x05DC, 50.0) + _death(0x05DD, 51.0))
+        kills = detector.kill_events
+
+        self.assertIs(detector.kill_events[0], kills[0])
+        self.assertIs(detector.death_events[0], detector.death_events[0])
+        # Callers get their own lists
+        kills.clear()
+        detector.death_events.clear()
+        self.assertEqual((len(detector.kill_events), len(detector.death_events)), (1, 1))
+
+        detector.process_frame(1, _kill(0x05DD, 60.0))
+        self.assertEqual([k.killer_eid for k in detector.kill_events], [0x05DC, 0x05DD])
+        detector._death_events = []
+        self.assertEqual(detector.death_events, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from vg.core.result_cache import ResultCache, cached_payload, decoder_sources, decoder_version
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.root = Path(self.temp_dir.name)
+
+    def write_replay(self, name: str, *frames: bytes) -> str:
+        for idx, data in enumerate(frames):
+            (self.root / f"{name}.{idx}.vgr").write_bytes(data)
+        return str(self.root / f"{name}.0.vgr")
+
+    def test_payloads_are_keyed_by_frame_content_and_version(self) -> None:
+        cache = ResultCache(str(self.root / "cache"), version="v1")
+        replay = self.write_replay("a", b"frame0", b"frame1")
+        copy = self.write_replay("b", b"frame0", b"frame1")
+        calls = []
+
+        def decode():
+            calls.append(1)
+            return {"replay": len(calls)}
+
+        def decode_unified():
+            return dict(decode(), replay_path=replay, replay_name="a")
+
+        self.assertEqual(cache.get_or_decode("unified", replay, decode_unified)["replay"], 1)
+        # Same frame contents under another name hit the same entry, reported under the copy's location
+        self.assertEqual(
+            cache.get_or_decode("unified", copy, decode_unified),
+            {"replay": 1, "replay_path": copy, "replay_name": "b"},
+        )
+        self.assertEqual(cache.get_or_decode("decoder_v2", replay, decode), {"replay": 2})
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        (self.root / "a.1.vgr").write_bytes(b"edited")
+        self.assertEqual(cache.get_or_decode("unified", replay, decode_unified)["replay"], 3)
+        other_version = ResultCache(str(self.root / "cache"), version="v2")
+        self.assertIsNone(other_version.get("unified", other_version.content_hash(copy)))
+        # Missing replays bypass the cache
+        self.assertEqual(cache.get_or_decode("unified", str(self.root / "none.0.vgr"), decode), {"replay": 4})
+        self.assertRegex(decoder_version(), r"^[0-9a-f]{12}:[0-9a-f]{12}$")
+        sources = {path.as_posix().split("/vg/", 1)[1] for path in decoder_sources()}
+        self.assertIn("analysis/win_loss_detector.py", sources)
+        self.assertIn("decoder_v2/kda.py", sources)
+        self.assertNotIn("core/export_matches.py", sources)
+
+    def test_eviction_drops_least_recently_used_entries(self) -> None:
+        cache = ResultCache(str(self.root / "cache"), version="v1")
+        blob = {"data": os.urandom(3000).hex()}
+        for key in ("old", "used", "new"):
+            cache.put("unified", key, blob)
+            past = time.time() - {"old": 300, "used": 200, "new": 100}[key]
+            os.utime(cache.entry_path("unified", key), (past, past))
+        entry_size = cache.entry_path("unified", "old").stat().st_size
+
+        self.assertIsNotNone(cache.get("unified", "old"))  # refreshes "old"
+        cache.max_bytes = entry_size * 2
+        self.assertEqual(cache.evict(), 1)
+        self.assertFalse(cache.entry_path("unified", "used").exists())
+        self.assertTrue(cache.entry_path("unified", "old").exists())
+
+    def test_cached_payload_is_a_plain_call_without_cache_dir(self) -> None:
+        replay = self.write_replay("a", b"frame0")
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("VG_DECODE_CACHE", None)
+            self.assertEqual(cached_payload("unified", replay, lambda: {"x": 1}), {"x": 1})
+        self.assertFalse((self.root / "cache").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from vg.core.unified_decoder import UnifiedDecoder
+from vg.core.vgr_parser import VGRParser
+from vg.tools.decoder_benchmark import run_benchmark
+from vg.tools.synthetic_replay import SyntheticReplaySpec, generate_corpus, generate_replay
+
+
+class TestSyntheticReplay(unittest.TestCase):
+    def test_decoders_recover_generated_stats(self) -> None:
+        spec = SyntheticReplaySpec(team_size=5, duration_s=600.0, filler_bytes_per_frame=512, seed=3)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            replay = generate_replay(temp_dir, spec)
+            parsed = VGRParser(replay.replay_file, auto_truth=False).parse()
+            match = UnifiedDecoder(replay.replay_file).decode()
+
+        self.assertEqual(parsed["game_mode"], "GameMode_5v5_Ranked")
+        self.assertEqual(parsed["frame_count"], replay.frame_count)
+        self.assertEqual(
+            [(p["name"], p["team"], p["hero_name"]) for team in ("left", "right") for p in parsed["teams"][team]],
+            [(p.name, p.team, p.hero_name) for p in replay.players],
+        )
+        decoded = {player.name: player for player in match.all_players}
+        self.assertEqual(
+            [(p.kills, p.deaths, p.assists, p.minion_kills) for p in replay.players],
+            [
+                (decoded[p.name].kills, decoded[p.name].deaths, decoded[p.name].assists, decoded[p.name].minion_kills)
+                for p in replay.players
+            ],
+        )
+        self.assertEqual(match.duration_seconds, 600)
+
+    def test_benchmark_reports_throughput_per_stage(self) -> None:
+        spec = SyntheticReplaySpec(duration_s=120.0, filler_bytes_per_frame=256)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            replays = generate_corpus(temp_dir, 2, spec)
+            report = run_benchmark(temp_dir, stages=["vgr_parser", "kda_detector"], repeat=1)
+
+        self.assertEqual(report["corpus"]["replays"], 2)
+        self.assertEqual(report["corpus"]["bytes"], sum(replay.total_bytes for replay in replays))
+        self.assertEqual(sorted(report["stages"]), ["kda_detector", "vgr_parser"])
+        for stage in report["stages"].values():
+            self.assertGreater(stage["replays_per_s"], 0)
+            self.assertGreater(stage["mb_per_s"], 0)
+            self.assertIsNotNone(stage["peak_traced_mb"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -44,6 +44,37 @@ def make_parsed_replay(replay_name: str) -> dict:
     }
 
 
+def make_decoded_match(replay_name: str) -> dict:
+    player = {
+        "name": "left_player",
+        "team": "left",
+        "hero_name": "Ringo",
+        "hero_id": None,
+        "kills": 5,
+        "deaths": 1,
+        "assists": 3,
+        "minion_kills": 80,
+        "jungle_kills": 4,
+        "gold_spent": 9000,
+        "gold_earned": 10500,
+        "items": ["Sorrowblade"],
+        "items_all_purchased": ["Sorrowblade", "Weapon Blade"],
+    }
+    return {
+        "replay_name": replay_name,
+        "replay_path": f"{replay_name}.0.vgr",
+        "game_mode": "GameMode_HF_Ranked",
+        "total_frames": 42,
+        "duration_seconds": 1200,
+        "winner": "left",
+        "left_team": [player],
+        "right_team": [],
+        "objective_events": [
+            {"timestamp": 600.5, "event_type": "KRAKEN_DEATH", "entity_count": 1, "entity_ids": [65000]},
+        ],
+    }
+
+
 class TestVGDatabase(unittest.TestCase):
     def setUp(self) -> None:
         self.temp_dir = tempfile.TemporaryDirectory()
@@ -76,6 +107,120 @@ class TestVGDatabase(unittest.TestCase):
         ).fetchone()[0]
         self.assertEqual(player_count, 2)
 
+    def test_bulk_import_writes_decoded_stats_and_skips_known_content(self) -> None:
+        self.db.populate_heroes()
+        self.db.populate_items()
+        hashes = {"a.0.vgr": "hash-a", "b.0.vgr": "hash-b", "a-copy.0.vgr": "hash-a"}
+
+        with patch(
+            "vg.core.vgr_database.replay_content_hash", side_effect=hashes.get,
+        ), patch(
+            "vg.core.vgr_database.decode_replay_for_import",
+            side_effect=lambda path: make_decoded_match(path.split(".")[0]),
+        ) as decode:
+            counts = self.db.bulk_import(["a.0.vgr", "a-copy.0.vgr"], batch_size=1)
+            again = self.db.bulk_import(["a.0.vgr", "b.0.vgr"])
+            # Known replay names are skipped before hashing or decoding
+            renamed = self.db.bulk_import(["elsewhere/b.0.vgr"])
+
+        self.assertEqual(counts, {"imported": 1, "skipped": 1, "failed": 0})
+        self.assertEqual(again, {"imported": 1, "skipped": 1, "failed": 0})
+        self.assertEqual(renamed, {"imported": 0, "skipped": 1, "failed": 0})
+        self.assertEqual(decode.call_count, 2)
+
+        cursor = self.db.conn.cursor()
+        self.assertEqual(cursor.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        player = cursor.execute(
+            "SELECT p.kills, p.assists, p.gold, p.gold_spent, h.name AS hero "
+            "FROM match_players p JOIN heroes h ON h.id = p.hero_id "
+            "JOIN matches m ON m.id = p.match_id WHERE m.content_hash = 'hash-a'"
+        ).fetchone()
+        self.assertEqual(tuple(player), (5, 3, 10500, 9000, "Ringo"))
+        items = cursor.execute(
+            "SELECT item_name, final_build, item_id IS NOT NULL FROM match_items ORDER BY id LIMIT 2"
+        ).fetchall()
+        self.assertEqual([tuple(row) for row in items], [("Sorrowblade", 1, 1), ("Weapon Blade", 0, 1)])
+        self.assertEqual(cursor.execute("SELECT COUNT(*) FROM match_objectives").fetchone()[0], 2)
+
+    def test_import_paths_aggregate_under_heroes_table_ids(self) -> None:
+        self.db.populate_heroes()
+        parsed = make_parsed_replay("parsed")
+        # Binary hero code from the replay, not a heroes.id
+        parsed["teams"]["left"][0].update(hero_name="Ringo", hero_id=257)
+        parsed["teams"]["right"] = []
+        decoded = make_decoded_match("decoded")
+
+        with patch("vg.core.vgr_database.VGRParser") as parser_cls, patch(
+            "vg.core.vgr_database.replay_content_hash", return_value="h",
+        ), patch(
+            "vg.core.vgr_database.decode_replay_for_import", return_value=decoded,
+        ):
+            parser_cls.return_value.parse.return_value = parsed
+            self.db.import_replay("parsed.0.vgr")
+            self.db.bulk_import(["decoded.0.vgr"])
+
+        rates = self.db.hero_win_rates()
+        self.assertEqual([(row["hero_name"], row["games"]) for row in rates], [("Ringo", 2)])
+
+    def test_bulk_import_resolves_hero_ids_by_name(self) -> None:
+        self.db.populate_heroes()
+        decoded = make_decoded_match("binary-hero")
+        # Binary hero code from the replay, not a heroes.id
+        decoded["left_team"][0].update(hero_name="Unknown", hero_id=3)
+
+        with patch(
+            "vg.core.vgr_database.replay_content_hash", return_value="h",
+        ), patch(
+            "vg.core.vgr_database.decode_replay_for_import", return_value=decoded,
+        ):
+            self.db.bulk_import(["binary-hero.0.vgr"])
+
+        hero_id = self.db.conn.execute("SELECT hero_id FROM match_players").fetchone()[0]
+        self.assertIsNone(hero_id)
+
+    def test_aggregates_follow_imports_and_serve_queries(self) -> None:
+        self.db.populate_heroes()
+        self.db.populate_items()
+        ringo = self.db.search_hero("Ringo")[0]["id"]
+        first = make_decoded_match("first")
+        second = make_decoded_match("second")
+        second["winner"] = "right"
+        second["left_team"][0]["kills"] = 1
+
+        with patch(
+            "vg.core.vgr_database.replay_content_hash", side_effect=["h1", "h2"],
+        ), patch(
+            "vg.core.vgr_database.decode_replay_for_import", side_effect=[first, second],
+        ):
+            self.db.bulk_import(["first.0.vgr"])
+            self.db.bulk_import(["second.0.vgr"])
+
+        rates = self.db.hero_win_rates()
+        self.assertEqual(len(rates), 1)
+        self.assertEqual((rates[0]["hero_name"], rates[0]["games"], rates[0]["win_rate"]), ("Ringo", 2, 0.5))
+        self.assertEqual(rates[0]["avg_kills"], 3.0)
+        self.assertEqual(self.db.hero_win_rates(game_mode="GameMode_5v5_Ranked"), [])
+
+        summary = self.db.player_summary("left_player")
+        self.assertEqual((summary["games"], summary["wins"], summary["kills"]), (2, 1, 6))
+        history = self.db.player_history("left_player")
+        self.assertEqual([row["replay_name"] for row in history], ["second", "first"])
+        self.assertEqual([row["won"] for row in history], [0, 1])
+        self.assertEqual(
+            self.db.item_popularity(ringo)[0],
+            {"item_name": "Sorrowblade", "purchases": 2, "final_builds": 2},
+        )
+
+        before = [dict(row) for row in self.db.conn.execute("SELECT * FROM player_stats")]
+        self.db.rebuild_aggregates()
+        after = [dict(row) for row in self.db.conn.execute("SELECT * FROM player_stats")]
+        self.assertEqual(after, before)
+
+        plan = " ".join(row[3] for row in self.db.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM match_players WHERE player_name = ?", ("x",)
+        ))
+        self.assertIn("idx_match_players_name", plan)
+
     def test_module_cli_init_runs(self) -> None:
         cli_db_path = Path(self.temp_dir.name) / "cli.db"
         repo_root = Path(__file__).resolve().parents[1]
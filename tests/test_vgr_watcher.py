@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from vg.core.fs_watch import FileEvent, InotifyWatcher, PollingWatcher
+from vg.core.vgr_watcher import ReplayActivityTracker
+
+
+def _inotify_available() -> bool:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            InotifyWatcher(temp_dir).close()
+        except OSError:
+            return False
+    return True
+
+
+class TestReplayActivityTracker(unittest.TestCase):
+    def test_replay_completes_after_write_quiescence(self) -> None:
+        tracker = ReplayActivityTracker(quiet_period=2.0, min_frames=2, track_close=True)
+
+        for idx in range(3):
+            tracker.observe(FileEvent(f"match.{idx}.vgr", "created"), 0.0)
+            tracker.observe(FileEvent(f"match.{idx}.vgr", "closed"), 0.5)
+        tracker.observe(FileEvent("replayManifest-match.txt", "created"), 0.5)
+        self.assertEqual(tracker.next_deadline(), 2.5)
+        self.assertEqual(tracker.complete(2.0), [])
+
+        # A frame being written holds completion back until it is closed
+        tracker.observe(FileEvent("match.3.vgr", "created"), 2.4)
+        self.assertEqual(tracker.complete(4.5), [])
+        tracker.observe(FileEvent("match.3.vgr", "closed"), 5.0)
+        self.assertEqual(tracker.complete(7.0), ["match"])
+        self.assertEqual(tracker.complete(9.0), [])
+        self.assertIsNone(tracker.next_deadline())
+
+    def test_short_replays_are_ignored(self) -> None:
+        tracker = ReplayActivityTracker(quiet_period=1.0, min_frames=10)
+        tracker.seed([f"short.{idx}.vgr" for idx in range(5)], 0.0)
+
+        self.assertEqual(tracker.complete(10.0), [])
+        self.assertIsNone(tracker.next_deadline())
+
+
+class TestDirectoryWatchers(unittest.TestCase):
+    def test_polling_watcher_reports_new_and_changed_files(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            base = Path(temp_dir)
+            (base / "match.0.vgr").write_bytes(b"\x00")
+            watcher = PollingWatcher(temp_dir, interval=0.01)
+            self.assertEqual(watcher.wait(timeout=0.02), [])
+
+            (base / "match.0.vgr").write_bytes(b"\x00\x01")
+            (base / "match.1.vgr").write_bytes(b"\x00")
+            events = watcher.wait(timeout=1.0)
+
+        self.assertEqual(
+            sorted((event.name, event.kind) for event in events),
+            [("match.0.vgr", "modified"), ("match.1.vgr", "created")],
+        )
+
+    @unittest.skipUnless(_inotify_available(), "inotify not available")
+    def test_inotify_watcher_reports_close_write(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with InotifyWatcher(temp_dir) as watcher:
+                self.assertEqual(watcher.wait(timeout=0.01), [])
+                (Path(temp_dir) / "match.0.vgr").write_bytes(b"\x00" * 16)
+                events = watcher.wait(timeout=1.0)
+
+        kinds = [event.kind for event in events if event.name == "match.0.vgr"]
+        self.assertEqual(kinds[0], "created")
+        self.assertEqual(kinds[-1], "closed")
+
+
+if __name__ == "__main__":
+    unittest.main()
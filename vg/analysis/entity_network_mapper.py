@@ -31,6 +31,14 @@ except ImportError:
     except ImportError:
         VGRParser = None
 
+try:
+    from vg.core.entity_events import extract_entity_events
+    from vg.core.frame_store import read_frames
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / "core"))
+    from entity_events import extract_entity_events
+    from frame_store import read_frames
+
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -170,22 +178,12 @@ def read_frame_files(frame_dir: Path, replay_name: str) -> List[Tuple[int, bytes
     Returns:
         List of (frame_index, frame_data) sorted by index.
     """
-    frames = list(frame_dir.glob(f"{replay_name}.*.vgr"))
-    result = []
-    for f in frames:
-        try:
-            idx = int(f.stem.split('.')[-1])
-        except ValueError:
-            idx = 0
-        result.append((idx, f.read_bytes()))
-    result.sort(key=lambda x: x[0])
-    return result
+    return read_frames(frame_dir, replay_name)
 
 
 def read_all_frame_data(frame_dir: Path, replay_name: str) -> bytes:
-    """Concatenate all frame data in order."""
-    frames = read_frame_files(frame_dir, replay_name)
-    return b"".join(data for _, data in frames)
+    """All frame data in order as one buffer."""
+    return b"".join(data for _, data in read_frames(frame_dir, replay_name))
 
 
 # ---------------------------------------------------------------------------
@@ -265,75 +263,63 @@ def scan_events_in_frame(
     Event pattern: [EntityID(2B LE)][00 00][ActionCode(1B)][Payload...]
     """
     length = len(data)
-    # We need at least 5 bytes: 2 entity + 2 zero + 1 action
-    if length < 5:
-        return
-
-    idx = 0
-    while idx <= length - 5:
-        # Check for the [XX XX][00 00] pattern
-        if data[idx + 2] == 0x00 and data[idx + 3] == 0x00:
-            entity_id = int.from_bytes(data[idx:idx + 2], 'little')
-
-            # Skip entity 0 initial scan for speed -- but track it
-            action_code = data[idx + 4]
-
-            # Record this entity's event
-            if entity_id not in entity_events:
-                entity_events[entity_id] = {
-                    "first_frame": frame_index,
-                    "last_frame": frame_index,
-                    "total_events": 0,
-                    "action_counts": Counter(),
-                    "frames_seen": set(),
-                    "movement_events": 0,
-                    "attack_events": 0,
-                }
-
-            info = entity_events[entity_id]
-            info["last_frame"] = frame_index
-            info["total_events"] += 1
-            info["action_counts"][action_code] += 1
-            info["frames_seen"].add(frame_index)
-
-            if action_code in MOVEMENT_ACTIONS:
-                info["movement_events"] += 1
-            if action_code in ATTACK_ACTIONS:
-                info["attack_events"] += 1
-
-            all_entity_ids.add(entity_id)
-
-            # Check for target entity IDs in payload (interaction events)
-            if action_code in INTERACTION_ACTIONS:
-                for offset in TARGET_ENTITY_OFFSETS:
-                    abs_offset = idx + 5 + offset  # +5 = past the header
-                    if abs_offset + 2 <= length:
-                        target_id = int.from_bytes(
-                            data[abs_offset:abs_offset + 2], 'little'
-                        )
-                        # Validate: target should be a reasonable entity ID
-                        # and not zero-padding noise
-                        if target_id > 0 and target_id != entity_id:
-                            # Check if followed by 00 00 to validate entity pattern
-                            # Or if the target_id has been seen as a source entity
-                            # For initial scan we record all, filter later
-                            key = (entity_id, target_id, action_code)
-                            if key not in interaction_map:
-                                interaction_map[key] = Interaction(
-                                    source_id=entity_id,
-                                    target_id=target_id,
-                                    action_code=action_code,
-                                    first_frame=frame_index,
-                                    last_frame=frame_index,
-                                )
-                            inter = interaction_map[key]
-                            inter.count += 1
-                            inter.last_frame = frame_index
-                            inter.frames.append(frame_index)
-
-            idx += 5  # Skip past this event header
-        else:
-            idx += 1
+    # We need at least 5 bytes: 2 entity + 2 zero + 1 action; the walk only
+    # steps past the 5-byte header, so payload bytes are scanned as well.
+    offsets, entity_ids, actions = extract_entity_events(data, skip=5, tail=4)
+
+    for idx, entity_id, action_code in zip(offsets.tolist(), entity_ids.tolist(), actions.tolist()):
+        # Record this entity's event
+        if entity_id not in entity_events:
+            entity_events[entity_id] = {
+                "first_frame": frame_index,
+                "last_frame": frame_index,
+                "total_events": 0,
+                "action_counts": Counter(),
+                "frames_seen": set(),
+                "movement_events": 0,
+                "attack_events": 0,
+            }
+
+        info = entity_events[entity_id]
+        info["last_frame"] = frame_index
+        info["total_events"] += 1
+        info["action_counts"][action_code] += 1
+        info["frames_seen"].add(frame_index)
+
+        if action_code in MOVEMENT_ACTIONS:
+            info["movement_events"] += 1
+        if action_code in ATTACK_ACTIONS:
+            info["attack_events"] += 1
+
+        all_entity_ids.add(entity_id)
+
+        # Check for target entity IDs in payload (interaction events)
+        if action_code in INTERACTION_ACTIONS:
+            for offset in TARGET_ENTITY_OFFSETS:
+                abs_offset = idx + 5 + offset  # +5 = past the header
+                if abs_offset + 2 <= length:
+                    target_id = int.from_bytes(
+                        data[abs_offset:abs_offset + 2], 'little'
+                    )
+                    # Validate: target should be a reasonable entity ID
+                    # and not zero-padding noise
+                    if target_id > 0 and target_id != entity_id:
+                        # Check if followed by 00 00 to validate entity pattern
+                        # Or if the target_id has been seen as a source entity
+                        # For initial scan we record all, filter later
+                        key = (entity_id, target_id, action_code)
+                        if key not in interaction_map:
+                            interaction_map[key] = Interaction(
+                                source_id=entity_id,
+                                target_id=target_id,
+                                action_code=action_code,
+                                first_frame=frame_index,
+                                last_frame=frame_index,
+                            )
+                        inter = interaction_map[key]
+                        inter.count += 1
+                        inter.last_frame = frame_index
+                        inter.frames.append(frame_index)
 
 
 def scan_all_frames(
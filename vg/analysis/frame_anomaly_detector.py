@@ -7,7 +7,6 @@ without relying on specific action codes.
 
 import sys
 import json
-import struct
 from pathlib import Path
 from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Any, Optional
@@ -17,6 +16,7 @@ import statistics
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from vg.core.vgr_parser import VGRParser
+from vg.core.entity_events import extract_entity_events
 
 
 @dataclass
@@ -98,23 +98,16 @@ class FrameAnomalyDetector:
         Parse events from frame data.
         Returns: List of (entity_id, action_code) tuples
         """
-        events = []
-
         # Scan for event patterns: [EntityID 2B LE][00 00][ActionCode 1B]
-        # We look for the [00 00] marker and extract entity_id before and action_code after
-        for i in range(len(data) - 5):
-            # Check for [00 00] pattern
-            if data[i:i+2] == b'\x00\x00':
-                # Entity ID is 2 bytes before [00 00]
-                if i >= 2:
-                    entity_id = struct.unpack('<H', data[i-2:i])[0]
-                    action_code = data[i+2]
-
-                    # Only count if entity_id is reasonable (not 0x0000)
-                    if entity_id > 0:
-                        events.append((entity_id, action_code))
-
-        return events
+        # at every offset (overlapping candidates are all counted)
+        _, entity_ids, actions = extract_entity_events(data, skip=1, tail=7)
+
+        # Only count if entity_id is reasonable (not 0x0000)
+        return [
+            (entity_id, action_code)
+            for entity_id, action_code in zip(entity_ids.tolist(), actions.tolist())
+            if entity_id > 0
+        ]
 
     def _compute_frame_metrics(self, frame_num: int, data: bytes) -> FrameMetrics:
         """Compute statistical metrics for a frame"""
@@ -7,13 +7,14 @@ Analyzes entity event timelines to detect deaths based on increasing respawn gap
 import sys
 import json
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass, asdict
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from vg.core.vgr_parser import VGRParser
+from vg.core.entity_events import extract_entity_events
 
 
 @dataclass
@@ -102,24 +103,12 @@ class RespawnTimerAnalyzer:
         Returns: {entity_id: event_count}
         """
         data = frame_path.read_bytes()
-        entity_counts = defaultdict(int)
 
         # Event format: [EntityID 2B LE][00 00][ActionCode 1B][Payload ~32B]
-        # Scan for entity IDs at start of 37-byte patterns
-        idx = 0
-        while idx + 5 < len(data):
-            # Read potential entity ID (2 bytes LE)
-            entity_id = int.from_bytes(data[idx:idx+2], 'little')
-
-            # Check for [00 00] marker after entity ID
-            if data[idx+2:idx+4] == b'\x00\x00':
-                # Valid event pattern detected
-                entity_counts[entity_id] += 1
-                idx += 37  # Skip to next potential event
-            else:
-                idx += 1
-
-        return dict(entity_counts)
+        # Each event start skips to the next potential 37-byte event
+        _, entity_ids, _ = extract_entity_events(data)
+
+        return dict(Counter(entity_ids.tolist()))
 
     def _build_timelines(self, player_map: Dict[int, Dict]) -> None:
         """Build event presence timelines for all players"""
@@ -10,12 +10,22 @@ Algorithm:
 4. Determine winner based on which team's crystal was destroyed first
 """
 
-import struct
+import sys
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional, Set
+from typing import Iterable, List, Dict, Tuple, Optional, Set
 from dataclasses import dataclass
 from collections import defaultdict
 
+try:
+    from vg.core.entity_events import scan_entity_lifecycle
+    from vg.core.event_index import load_entity_lifecycle
+    from vg.core.frame_store import Buffer, find_frame_files
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+    from vg.core.entity_events import scan_entity_lifecycle
+    from vg.core.event_index import load_entity_lifecycle
+    from vg.core.frame_store import Buffer, find_frame_files
+
 
 @dataclass
 class TurretDestruction:
@@ -44,20 +54,41 @@ class WinLossDetector:
     # Vain Crystal destruction signature: 5+ turrets destroyed in same frame
     CRYSTAL_DESTRUCTION_THRESHOLD = 5
 
-    def __init__(self, replay_path: str, debug: bool = False):
+    def __init__(
+        self,
+        replay_path: str,
+        debug: bool = False,
+        verbose: bool = True,
+        frames: Optional[Iterable[Tuple[int, Buffer]]] = None,
+        entity_data: Optional[Dict[int, Dict]] = None,
+    ):
         """
         Initialize detector with path to replay folder.
 
         Args:
             replay_path: Path to replay cache folder or .0.vgr file
             debug: Enable debug output
+            verbose: Print the [STAGE]/[DATA]/[FINDING] progress lines.
+                     Counters are kept in `self.stats` either way.
+            frames: Optional already loaded `(frame_index, buffer)` tuples or a
+                    FrameStore; the frame files are not read again.
+            entity_data: Optional precomputed `scan_entity_lifecycle(frames)`
+                         result (e.g. `ReplayContext.entity_lifecycle`).
         """
         self.replay_path = Path(replay_path)
         self.debug = debug
+        self.verbose = verbose
+        self._frames: Optional[List[Tuple[int, Buffer]]] = list(frames) if frames is not None else None
+        self._entity_data = entity_data
         self.turret_destructions: List[TurretDestruction] = []
+        self.stats: Dict[str, int] = defaultdict(int)
+
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(message)
 
-    def _find_replay_files(self) -> List[Path]:
-        """Find all frame files for the replay"""
+    def _replay_location(self) -> Tuple[Path, str]:
+        """Frame directory and replay name (without the `.N.vgr` suffix)"""
         if self.replay_path.is_file() and str(self.replay_path).endswith('.0.vgr'):
             frame_dir = self.replay_path.parent
             replay_name = self.replay_path.stem.rsplit('.', 1)[0]
@@ -73,63 +104,35 @@ class WinLossDetector:
             replay_name = first_frame.stem.rsplit('.', 1)[0]
         else:
             raise FileNotFoundError(f"Invalid replay path: {self.replay_path}")
+        return frame_dir, replay_name
 
-        # Collect all frame files
-        frames = list(frame_dir.glob(f"{replay_name}.*.vgr"))
-        frames.sort(key=lambda p: self._frame_index(p))
-        return frames
-
-    def _frame_index(self, path: Path) -> int:
-        """Extract frame number from filename"""
-        try:
-            return int(path.stem.split('.')[-1])
-        except ValueError:
-            return 0
+    def _first_frame_data(self) -> Optional[bytes]:
+        """Bytes of the first frame, without loading the others when not preloaded"""
+        if self._frames is not None:
+            return bytes(self._frames[0][1]) if self._frames else None
+        frame_paths = find_frame_files(*self._replay_location())
+        return frame_paths[0].read_bytes() if frame_paths else None
 
     def _collect_entity_events(self) -> Dict[int, Dict]:
         """
         Collect entity lifecycle data across all frames.
 
+        Without preloaded frames the counts come from `load_entity_lifecycle`,
+        i.e. from the `.vgidx` sidecar when VG_EVENT_INDEX is set.
+
         Returns:
             Dictionary mapping entity_id to {first_frame, last_frame, event_count, frames}
         """
-        frames = self._find_replay_files()
-        if not frames:
+        if self._entity_data is not None:
+            return self._entity_data
+        if self._frames is None:
+            frame_dir, replay_name = self._replay_location()
+            if not find_frame_files(frame_dir, replay_name):
+                return {}
+            return load_entity_lifecycle(frame_dir, replay_name, stats=self.stats)
+        if not self._frames:
             return {}
-
-        entity_data = defaultdict(lambda: {
-            'first_frame': None,
-            'last_frame': None,
-            'event_count': 0,
-            'frames': set()
-        })
-
-        for frame_path in frames:
-            frame_num = self._frame_index(frame_path)
-            data = frame_path.read_bytes()
-
-            # Parse entity events: [EntityID 2B LE][00 00][ActionCode 1B][Payload ~32B]
-            idx = 0
-            while idx < len(data) - 5:
-                # Check for entity event pattern
-                if data[idx+2:idx+4] == b'\x00\x00':
-                    entity_id = struct.unpack('<H', data[idx:idx+2])[0]
-
-                    # Filter to infrastructure/objective range (1024-19970)
-                    if 1024 <= entity_id <= 19970:
-                        entity = entity_data[entity_id]
-                        if entity['first_frame'] is None:
-                            entity['first_frame'] = frame_num
-                        entity['last_frame'] = frame_num
-                        entity['event_count'] += 1
-                        entity['frames'].add(frame_num)
-
-                    # Skip to next potential event
-                    idx += 37
-                else:
-                    idx += 1
-
-        return dict(entity_data)
+        return scan_entity_lifecycle(self._frames, stats=self.stats)
 
     def _parse_player_team_mapping(self, first_frame_data: bytes) -> Dict[int, str]:
         """
@@ -394,53 +397,54 @@ class WinLossDetector:
         Returns:
             MatchOutcome if winner can be determined, None otherwise
         """
-        print("[STAGE:begin:data_loading]")
+        self._log("[STAGE:begin:data_loading]")
 
         # Collect entity lifecycle data
         entity_data = self._collect_entity_events()
 
         if not entity_data:
-            print("[LIMITATION] No entity data collected")
-            print("[STAGE:status:fail]")
-            print("[STAGE:end:data_loading]")
+            self._log("[LIMITATION] No entity data collected")
+            self._log("[STAGE:status:fail]")
+            self._log("[STAGE:end:data_loading]")
             return None
 
-        print(f"[DATA] Collected {len(entity_data)} entities in range 1024-19970")
+        self._log(f"[DATA] Collected {len(entity_data)} entities in range 1024-19970")
+        self.stats['entities'] = len(entity_data)
 
         # Read first frame for player team mapping (for reference)
-        frames = self._find_replay_files()
-        if frames:
-            first_frame_data = frames[0].read_bytes()
+        first_frame_data = self._first_frame_data()
+        if first_frame_data is not None:
             player_team_map = self._parse_player_team_mapping(first_frame_data)
             if self.debug and player_team_map:
                 print(f"[DEBUG] Player teams: {player_team_map}")
 
-        print("[STAGE:status:success]")
-        print("[STAGE:end:data_loading]")
+        self._log("[STAGE:status:success]")
+        self._log("[STAGE:end:data_loading]")
 
-        print("[STAGE:begin:analysis]")
+        self._log("[STAGE:begin:analysis]")
 
         # Cluster turrets into two teams
         team1_ids, team2_ids = self._cluster_turrets_by_team(entity_data)
 
         if not team1_ids or not team2_ids:
-            print("[LIMITATION] Could not cluster turrets into two teams")
-            print("[STAGE:status:fail]")
-            print("[STAGE:end:analysis]")
+            self._log("[LIMITATION] Could not cluster turrets into two teams")
+            self._log("[STAGE:status:fail]")
+            self._log("[STAGE:end:analysis]")
             return None
 
-        print(f"[DATA] Team1: {len(team1_ids)} turrets, Team2: {len(team2_ids)} turrets")
+        self._log(f"[DATA] Team1: {len(team1_ids)} turrets, Team2: {len(team2_ids)} turrets")
+        self.stats['turret_candidates'] = len(team1_ids) + len(team2_ids)
 
         # Identify Vain Crystals
         team1_crystal, team2_crystal = self._identify_vain_crystals(team1_ids, team2_ids, entity_data)
 
         if not team1_crystal or not team2_crystal:
-            print("[LIMITATION] Could not identify Vain Crystals")
-            print("[STAGE:status:fail]")
-            print("[STAGE:end:analysis]")
+            self._log("[LIMITATION] Could not identify Vain Crystals")
+            self._log("[STAGE:status:fail]")
+            self._log("[STAGE:end:analysis]")
             return None
 
-        print(f"[FINDING] Vain Crystals identified: Team1={team1_crystal}, Team2={team2_crystal}")
+        self._log(f"[FINDING] Vain Crystals identified: Team1={team1_crystal}, Team2={team2_crystal}")
 
         # Build turret destruction timeline
         max_frame = max(e['last_frame'] for e in entity_data.values() if e['last_frame'] is not None)
@@ -458,8 +462,9 @@ class WinLossDetector:
             if last_frame and last_frame < max_frame - 1:
                 team2_destructions.append((tid, last_frame))
 
-        print(f"[DATA] Team1 turrets destroyed: {len(team1_destructions)}")
-        print(f"[DATA] Team2 turrets destroyed: {len(team2_destructions)}")
+        self._log(f"[DATA] Team1 turrets destroyed: {len(team1_destructions)}")
+        self._log(f"[DATA] Team2 turrets destroyed: {len(team2_destructions)}")
+        self.stats['turrets_destroyed'] = len(team1_destructions) + len(team2_destructions)
 
         # Look for crystal destruction pattern: 6+ turrets in 5-frame window
         all_destructions = [(tid, frame, 1) for tid, frame in team1_destructions]
@@ -483,21 +488,21 @@ class WinLossDetector:
                 loser = "team1"
                 crystal_frame = frame
                 confidence = 0.90 + min(team1_in_window / 20.0, 0.09)  # 0.90-0.99 based on turret count
-                print(f"[FINDING] Crystal destruction pattern detected: {team1_in_window} Team1 turrets destroyed in frames {frame}-{frame+5}")
+                self._log(f"[FINDING] Crystal destruction pattern detected: {team1_in_window} Team1 turrets destroyed in frames {frame}-{frame+5}")
                 break
             elif team2_in_window >= 6:
                 winner = "team1"
                 loser = "team2"
                 crystal_frame = frame
                 confidence = 0.90 + min(team2_in_window / 20.0, 0.09)
-                print(f"[FINDING] Crystal destruction pattern detected: {team2_in_window} Team2 turrets destroyed in frames {frame}-{frame+5}")
+                self._log(f"[FINDING] Crystal destruction pattern detected: {team2_in_window} Team2 turrets destroyed in frames {frame}-{frame+5}")
                 break
 
         if not winner:
-            print("[LIMITATION] Could not detect crystal destruction pattern")
-            print("[LIMITATION] Match may have ended by surrender or time limit")
-            print("[STAGE:status:fail]")
-            print("[STAGE:end:analysis]")
+            self._log("[LIMITATION] Could not detect crystal destruction pattern")
+            self._log("[LIMITATION] Match may have ended by surrender or time limit")
+            self._log("[STAGE:status:fail]")
+            self._log("[STAGE:end:analysis]")
             return None
 
         # Map team1/team2 to left/right based on player team mappings
@@ -530,8 +535,8 @@ class WinLossDetector:
                     winner_label = "right" if team1_is_left else "left"
                     loser_label = "left" if team1_is_left else "right"
 
-        print(f"[FINDING] Winner: {winner_label} ({winner})")
-        print(f"[FINDING] Loser: {loser_label} ({loser})")
+        self._log(f"[FINDING] Winner: {winner_label} ({winner})")
+        self._log(f"[FINDING] Loser: {loser_label} ({loser})")
 
         outcome = MatchOutcome(
             winner=winner_label,
@@ -544,12 +549,12 @@ class WinLossDetector:
             method="crystal_destruction_windowed"
         )
 
-        print(f"[STAT:team1_turrets_destroyed] {len(team1_destructions)}")
-        print(f"[STAT:team2_turrets_destroyed] {len(team2_destructions)}")
-        print(f"[STAT:confidence] {confidence:.2f}")
+        self._log(f"[STAT:team1_turrets_destroyed] {len(team1_destructions)}")
+        self._log(f"[STAT:team2_turrets_destroyed] {len(team2_destructions)}")
+        self._log(f"[STAT:confidence] {confidence:.2f}")
 
-        print("[STAGE:status:success]")
-        print("[STAGE:end:analysis]")
+        self._log("[STAGE:status:success]")
+        self._log("[STAGE:end:analysis]")
 
         return outcome
 
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Batch Runner - process-pool execution for per-replay batch jobs.
+
+`run_batch(func, items, workers=N)` applies a picklable, module-level
+function to every item and returns one `BatchResult` per item in input
+order, whatever order the workers finish in. Exceptions are captured per
+item instead of aborting the batch.
+
+Each worker is a dedicated process fed one item at a time, so a stuck or
+runaway replay can be handled without losing the rest of the batch:
+  - timeout: a worker exceeding `timeout` seconds on one item is killed,
+    the item is recorded as a TimeoutError and a fresh worker takes over.
+  - memory_limit_mb: each worker caps its address space (RLIMIT_AS, where
+    the `resource` module exists). Allocation failures surface as a
+    MemoryError for that item; a worker killed outright is replaced.
+
+With `workers <= 1` and neither limit set, items run in-process, exactly
+like the original sequential loops.
+
+Usage:
+    from vg.core.batch_runner import run_batch
+
+    results = run_batch(decode_one, replay_paths, workers=8, timeout=120)
+    for result in results:
+        if result.ok:
+            ...
+"""
+
+import argparse
+import multiprocessing
+import time
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing.connection import wait
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch item."""
+    index: int
+    item: Any
+    ok: bool
+    value: Any = None
+    error: Optional[str] = None
+    elapsed_s: float = 0.0
+
+
+ResultCallback = Callable[[BatchResult, int, int], None]
+
+
+def add_batch_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared --workers / --timeout / --memory-limit-mb CLI options."""
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Number of worker processes (default: 1, sequential)'
+    )
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=None,
+        help='Per-replay timeout in seconds; a stuck worker is killed and replaced'
+    )
+    parser.add_argument(
+        '--memory-limit-mb',
+        type=int,
+        default=None,
+        help='Per-worker address space ceiling in MB'
+    )
+
+
+def _format_error(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _apply_memory_limit(memory_limit_mb: Optional[int]) -> None:
+    if memory_limit_mb is None or resource is None:
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError):
+        pass
+
+
+def _worker_main(func: Callable[[Any], Any], conn, memory_limit_mb: Optional[int]) -> None:
+    """Worker loop: receive `(index, item)`, reply `(index, ok, value, error)`."""
+    _apply_memory_limit(memory_limit_mb)
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            return
+        if task is None:
+            return
+        index, item = task
+        try:
+            reply = (index, True, func(item), None)
+        except BaseException as exc:  # noqa: BLE001 - reported per item
+            reply = (index, False, None, _format_error(exc))
+        try:
+            conn.send(reply)
+        except Exception as exc:  # unpicklable result
+            conn.send((index, False, None, _format_error(exc)))
+
+
+class _Worker:
+    def __init__(self, ctx, func: Callable[[Any], Any], memory_limit_mb: Optional[int]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(
+            target=_worker_main,
+            args=(func, child_conn, memory_limit_mb),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.task: Optional[Tuple[int, Any]] = None
+        self.started = 0.0
+
+    def submit(self, index: int, item: Any) -> None:
+        self.task = (index, item)
+        self.started = time.monotonic()
+        self.conn.send(self.task)
+
+    def kill(self) -> None:
+        self.process.terminate()
+        self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(1.0)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.conn.close()
+
+
+def _run_sequential(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    on_result: Optional[ResultCallback],
+) -> List[BatchResult]:
+    results = []
+    for index, item in enumerate(items):
+        started = time.monotonic()
+        try:
+            result = BatchResult(index, item, True, value=func(item))
+        except Exception as exc:
+            result = BatchResult(index, item, False, error=_format_error(exc))
+        result.elapsed_s = time.monotonic() - started
+        results.append(result)
+        if on_result is not None:
+            on_result(result, len(results), len(items))
+    return results
+
+
+def run_batch(
+    func: Callable[[Any], Any],
+    items: Sequence[Any],
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+    on_result: Optional[ResultCallback] = None,
+) -> List[BatchResult]:
+    """
+    Apply `func` to every item, returning results in input order.
+
+    Args:
+        func: Picklable (module-level) callable taking one item.
+        items: Batch items, e.g. replay paths.
+        workers: Worker process count. <= 1 without limits runs in-process.
+        timeout: Per-item wall clock limit in seconds (worker mode only).
+        memory_limit_mb: Per-worker address space ceiling (worker mode only).
+        on_result: Optional callback `(result, done_count, total)` invoked as
+                   items finish (completion order), e.g. for progress output.
+    """
+    items = list(items)
+    if workers <= 1 and timeout is None and memory_limit_mb is None:
+        return _run_sequential(func, items, on_result)
+
+    ctx = multiprocessing.get_context()
+    pending: Deque[Tuple[int, Any]] = deque(enumerate(items))
+    results: List[Optional[BatchResult]] = [None] * len(items)
+    pool: List[_Worker] = []
+    done = 0
+
+    def finish(worker: _Worker, ok: bool, value: Any, error: Optional[str]) -> None:
+        nonlocal done
+        index, item = worker.task
+        results[index] = BatchResult(
+            index, item, ok, value=value, error=error,
+            elapsed_s=time.monotonic() - worker.started,
+        )
+        worker.task = None
+        done += 1
+        if on_result is not None:
+            on_result(results[index], done, len(items))
+
+    def retire(worker: _Worker) -> None:
+        worker.kill()
+        pool.remove(worker)
+
+    try:
+        while pending or any(worker.task is not None for worker in pool):
+            # Hand out work, spawning workers lazily up to the pool size
+            for worker in pool:
+                if worker.task is None and pending:
+                    worker.submit(*pending.popleft())
+            while pending and len(pool) < max(workers, 1):
+                worker = _Worker(ctx, func, memory_limit_mb)
+                pool.append(worker)
+                worker.submit(*pending.popleft())
+
+            busy = [worker for worker in pool if worker.task is not None]
+            wait_timeout = None
+            if timeout is not None:
+                now = time.monotonic()
+                wait_timeout = max(0.0, min(worker.started + timeout - now for worker in busy))
+            handles: Dict[Any, _Worker] = {}
+            for worker in busy:
+                handles[worker.conn] = worker
+                handles[worker.process.sentinel] = worker
+            ready = wait(list(handles), timeout=wait_timeout)
+
+            handled = set()
+            for handle in ready:
+                worker = handles[handle]
+                if id(worker) in handled:
+                    continue
+                handled.add(id(worker))
+                try:
+                    if not worker.conn.poll():
+                        raise EOFError
+                    index, ok, value, error = worker.conn.recv()
+                except (EOFError, OSError):
+                    worker.process.join(1.0)
+                    finish(worker, False, None, f"WorkerDied: exit code {worker.process.exitcode}")
+                    retire(worker)
+                    continue
+                finish(worker, ok, value, error)
+
+            if timeout is not None:
+                now = time.monotonic()
+                for worker in list(pool):
+                    if worker.task is not None and now - worker.started >= timeout:
+                        finish(worker, False, None, f"TimeoutError: exceeded {timeout:g}s")
+                        retire(worker)
+    finally:
+        for worker in pool:
+            if worker.task is None:
+                worker.stop()
+            else:
+                worker.kill()
+
+    return results
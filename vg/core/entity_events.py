@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Entity Events - shared extractor for the 37-byte entity event stream.
+
+Entity events look like:
+    [EntityID 2B LE][00 00][ActionCode 1B][Payload ~32B]
+
+Every analysis that walks this stream uses the same rule with a different
+stride: a position whose bytes +2..+3 are `00 00` is an event start, the walk
+then jumps `skip` bytes (37 for a whole event, 5 for just the header, 1 to
+report overlapping candidates), otherwise it advances one byte. Only starts
+with at least `tail` bytes after them are considered.
+
+`extract_entity_events(data, skip, tail)` returns the walk's offsets,
+entity ids and action codes as columns. With NumPy installed candidates are
+located with one vectorized comparison and the skip-ahead is applied by
+chaining `searchsorted` successors; without it `find(b"\x00\x00")` jumps
+between candidates. Both give exactly the positions of the byte walk.
+`collect_entity_events(frames, ...)` builds an `EntityEventTable` with a
+frame column for whole replays.
+
+`scan_entity_lifecycle(frames)` turns the stream into per-entity lifecycle
+data (first/last frame, event count, frames seen) for any `(frame_index,
+buffer)` sequence, e.g. `FrameStore` frames or `ReplayContext.frames`, so the
+detectors that need it share one pass over bytes already in memory. It is
+`lifecycle_from_counts` over the per-frame `count_entity_events` output,
+which the event index (`vg.core.event_index.load_entity_lifecycle`) stores
+so a warm decode skips the walk entirely.
+
+With `tracked=` the walk is restricted to a known set of entities (the
+player walk): only an event of a tracked entity is a start, every other
+position advances one byte. The pure-Python path searches for the
+`[eid LE][00 00]` heads with the regex from `compile_entity_pattern(eids)`.
+"""
+
+import re
+import struct
+from array import array
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+try:
+    from vg.core.event_table import HAS_NUMPY, EventTable, np
+    from vg.core.frame_store import Buffer
+except ImportError:
+    from event_table import HAS_NUMPY, EventTable, np
+    from frame_store import Buffer
+
+
+ENTITY_EVENT_SIZE = 37
+# Bytes a start needs after it in the lifecycle walk (eid + padding + action + 1)
+EVENT_TAIL = 5
+# Infrastructure/objective entity range (turrets, crystals, ...)
+INFRASTRUCTURE_EID_MIN = 1024
+INFRASTRUCTURE_EID_MAX = 19970
+
+_EVENT_PADDING = b"\x00\x00"
+
+# (frame_index, event headers, [(entity_id, count), ...]) of one frame
+FrameEntityCounts = Tuple[int, int, List[Tuple[int, int]]]
+
+
+class EntityEventTable(EventTable):
+    """Entity events of several frames as columns."""
+    COLUMNS = (
+        ("frame_idx", "I"),
+        ("offset", "I"),
+        ("entity_id", "H"),
+        ("action", "B"),
+    )
+
+
+def _walk_offsets(data: Buffer, skip: int, end: int) -> array:
+    offsets = array("I")
+    append = offsets.append
+    find = data.find
+    idx = 0
+    while idx < end:
+        pad = find(_EVENT_PADDING, idx + 2)
+        if pad == -1 or pad - 2 >= end:
+            break
+        idx = pad - 2
+        append(idx)
+        idx += skip
+    return offsets
+
+
+def _vector_offsets(raw: "np.ndarray", skip: int, end: int,
+                    tracked: Optional[Sequence[int]] = None) -> "np.ndarray":
+    is_zero = raw == 0
+    starts = np.flatnonzero(is_zero[2:end + 2] & is_zero[3:end + 3])
+    if tracked is not None:
+        entity_ids = raw[starts] | (raw[starts + 1].astype(np.uint16) << 8)
+        starts = starts[np.isin(entity_ids, np.fromiter(tracked, dtype=np.uint16))]
+    if skip <= 1 or starts.size < 2:
+        return starts
+    # Successor of each candidate once it is accepted; the walk is the
+    # chain of successors starting at the first candidate.
+    successor = np.searchsorted(starts, starts + skip).tolist()
+    chain = []
+    k = 0
+    count = len(successor)
+    while k < count:
+        chain.append(k)
+        k = successor[k]
+    return starts[chain]
+
+
+def extract_entity_events(
+    data: Buffer,
+    skip: int = ENTITY_EVENT_SIZE,
+    tail: int = EVENT_TAIL,
+    tracked: Optional[Sequence[int]] = None,
+) -> Tuple[Sequence[int], Sequence[int], Sequence[int]]:
+    """
+    Walk one frame and return `(offsets, entity_ids, actions)` columns.
+
+    Args:
+        data: Frame bytes (bytes, mmap or any buffer).
+        skip: Bytes to jump after an event start (37, 5 or 1).
+        tail: Minimum bytes after a start (4..len); starts at
+              `len(data) - tail` or later are not considered.
+        tracked: Optional entity ids; only their events are starts and
+                 every other position advances one byte (the player walk).
+
+    Returns:
+        NumPy arrays when NumPy is installed, `array` columns otherwise.
+    """
+    end = min(len(data) - tail, len(data) - 4)
+    if HAS_NUMPY:
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if end <= 0:
+            empty = raw[:0]
+            return empty.astype(np.intp), empty.astype(np.uint16), empty
+        offsets = _vector_offsets(raw, skip, end, tracked)
+        entity_ids = raw[offsets] | (raw[offsets + 1].astype(np.uint16) << 8)
+        return offsets, entity_ids, raw[offsets + 4]
+
+    if end <= 0:
+        return array("I"), array("H"), array("B")
+    if tracked is not None:
+        offsets = array("I", _walk_tracked_offsets(data, compile_entity_pattern(tracked), skip, end))
+    else:
+        offsets = _walk_offsets(data, skip, end)
+    entity_ids = array("H", [data[idx] | (data[idx + 1] << 8) for idx in offsets])
+    actions = array("B", [data[idx + 4] for idx in offsets])
+    return offsets, entity_ids, actions
+
+
+def collect_entity_events(
+    frames: Iterable[Tuple[int, Buffer]],
+    skip: int = ENTITY_EVENT_SIZE,
+    tail: int = EVENT_TAIL,
+) -> EntityEventTable:
+    """`extract_entity_events` over every frame, with a frame column."""
+    table = EntityEventTable()
+    for frame_idx, data in frames:
+        offsets, entity_ids, actions = extract_entity_events(data, skip, tail)
+        table.extend(array("I", [frame_idx]) * len(offsets), offsets, entity_ids, actions)
+    return table
+
+
+def iter_entity_event_offsets(data: Buffer) -> Iterable[int]:
+    """Offsets of entity events in one frame, in walk order."""
+    return iter(extract_entity_events(data)[0])
+
+
+def compile_entity_pattern(entity_ids: Iterable[int]) -> Pattern[bytes]:
+    """Regex matching `[eid LE][00 00]` for any of `entity_ids`."""
+    heads = sorted(struct.pack("<H", eid) + _EVENT_PADDING for eid in set(entity_ids))
+    if not heads:
+        return re.compile(b"(?!)")
+    return re.compile(b"|".join(re.escape(head) for head in heads))
+
+
+def _walk_tracked_offsets(data: Buffer, pattern: Pattern[bytes], skip: int,
+                          end: int) -> Iterable[int]:
+    search = pattern.search
+    match = search(data, 0)
+    while match is not None:
+        idx = match.start()
+        if idx >= end:
+            return
+        yield idx
+        match = search(data, idx + skip)
+
+
+def _count_in_range(entity_ids: Sequence[int], eid_min: int,
+                    eid_max: int) -> Iterable[Tuple[int, int]]:
+    """(entity_id, count) of the ids within [eid_min, eid_max]."""
+    if HAS_NUMPY and hasattr(entity_ids, "dtype"):
+        selected = entity_ids[(entity_ids >= eid_min) & (entity_ids <= eid_max)]
+        unique, first, counts = np.unique(selected, return_index=True, return_counts=True)
+        order = np.argsort(first)  # first-seen order, like the walk
+        return zip(unique[order].tolist(), counts[order].tolist())
+    return Counter(eid for eid in entity_ids if eid_min <= eid <= eid_max).items()
+
+
+def count_entity_events(
+    data: Buffer,
+    eid_min: int = INFRASTRUCTURE_EID_MIN,
+    eid_max: int = INFRASTRUCTURE_EID_MAX,
+) -> Tuple[int, List[Tuple[int, int]]]:
+    """Event headers in one frame and `(entity_id, count)` of the in-range ids, first seen first."""
+    _, entity_ids, _ = extract_entity_events(data)
+    return len(entity_ids), [
+        (int(entity_id), int(count)) for entity_id, count in _count_in_range(entity_ids, eid_min, eid_max)
+    ]
+
+
+def lifecycle_from_counts(
+    frame_counts: Iterable[FrameEntityCounts],
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[int, Dict]:
+    """
+    Entity lifecycle data from per-frame `(frame_index, headers, counts)`.
+
+    `counts` are `count_entity_events` pairs; the event index stores them so
+    a warm decode rebuilds the lifecycle without walking the frames.
+    """
+    entity_data = defaultdict(lambda: {
+        'first_frame': None,
+        'last_frame': None,
+        'event_count': 0,
+        'frames': set()
+    })
+
+    for frame_num, headers, counts in frame_counts:
+        in_range = 0
+        for entity_id, count in counts:
+            in_range += count
+            entity = entity_data[entity_id]
+            if entity['first_frame'] is None:
+                entity['first_frame'] = frame_num
+            entity['last_frame'] = frame_num
+            entity['event_count'] += count
+            entity['frames'].add(frame_num)
+
+        if stats is not None:
+            stats['frames'] = stats.get('frames', 0) + 1
+            stats['event_headers'] = stats.get('event_headers', 0) + headers
+            stats['entity_events'] = stats.get('entity_events', 0) + in_range
+
+    return dict(entity_data)
+
+
+def scan_entity_lifecycle(
+    frames: Iterable[Tuple[int, Buffer]],
+    eid_min: int = INFRASTRUCTURE_EID_MIN,
+    eid_max: int = INFRASTRUCTURE_EID_MAX,
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[int, Dict]:
+    """
+    Collect entity lifecycle data across frames.
+
+    Args:
+        frames: `(frame_index, buffer)` tuples in frame order.
+        eid_min, eid_max: Inclusive entity id range to keep.
+        stats: Optional counter dict; receives frames, bytes_scanned,
+               event_headers and entity_events.
+
+    Returns:
+        Dictionary mapping entity_id to {first_frame, last_frame, event_count, frames}
+    """
+    def frame_counts() -> Iterator[FrameEntityCounts]:
+        for frame_num, data in frames:
+            if stats is not None:
+                stats['bytes_scanned'] = stats.get('bytes_scanned', 0) + len(data)
+            yield (frame_num, *count_entity_events(data, eid_min, eid_max))
+
+    return lifecycle_from_counts(frame_counts(), stats)
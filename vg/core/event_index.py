@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+Event Index - persistent per-replay cache of the scanned record streams.
+
+Replay frames never change once a match ends, so the kill/death/credit/
+item-acquire records found by `record_scanner.scan_frames`, plus the per-frame
+infrastructure entity event counts behind `entity_events.scan_entity_lifecycle`,
+can be stored in a `<replay_name>-<dir hash>.vgidx` sidecar. A warm decode
+loads both from the sidecar instead of walking every frame again.
+
+Sidecars never go into the replay directories. The index is opt-in through
+the environment:
+    VG_EVENT_INDEX       sidecar directory (unset: index disabled)
+
+The sidecar is keyed by every frame file's index, size and mtime plus the
+event index version from `vg.decoder_v2.registry`; any mismatch is a miss
+and the frames are rescanned (and the sidecar rewritten).
+
+File layout (little endian):
+  magic "VGIDX" + format byte
+  u32 header length + JSON header {"version", "frames": [[index, size, mtime_ns], ...]}
+  per record family: u32 record count, then one packed array per field,
+  a per-record null mask (bit i = field i is None) and a per-frame count column.
+  entity events: u32 row count, per-frame header and row count columns,
+  then entity id and event count columns.
+
+Usage:
+    from vg.core.event_index import load_frame_records
+
+    frame_records = load_frame_records(frame_dir, replay_name)
+    for frame_idx, records in frame_records:
+        ...
+    entity_data = load_entity_lifecycle(frame_dir, replay_name)
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from vg.core.entity_events import (
+        FrameEntityCounts,
+        count_entity_events,
+        lifecycle_from_counts,
+        scan_entity_lifecycle,
+    )
+    from vg.core.frame_store import Buffer, FrameStore, find_frame_files, frame_file_index
+    from vg.core.record_scanner import (
+        FrameRecords,
+        ScannedCredit,
+        ScannedDeath,
+        ScannedItemAcquire,
+        ScannedKill,
+        scan_frames,
+    )
+except ImportError:
+    from entity_events import (
+        FrameEntityCounts,
+        count_entity_events,
+        lifecycle_from_counts,
+        scan_entity_lifecycle,
+    )
+    from frame_store import Buffer, FrameStore, find_frame_files, frame_file_index
+    from record_scanner import (
+        FrameRecords,
+        ScannedCredit,
+        ScannedDeath,
+        ScannedItemAcquire,
+        ScannedKill,
+        scan_frames,
+    )
+
+INDEX_ENV = "VG_EVENT_INDEX"
+INDEX_SUFFIX = ".vgidx"
+_MAGIC = b"VGIDX\x02"
+_U32 = struct.Struct("<I")
+
+# (FrameRecords attribute, record class, ((field, array typecode), ...))
+_FAMILIES = (
+    ("kills", ScannedKill, (
+        ("offset", "I"), ("killer_eid", "H"), ("timestamp", "f"), ("valid", "B"),
+    )),
+    ("deaths", ScannedDeath, (
+        ("offset", "I"), ("eid", "H"), ("timestamp", "f"), ("valid", "B"),
+    )),
+    ("credits", ScannedCredit, (
+        ("offset", "I"), ("eid", "H"), ("value", "f"),
+        ("action", "B"), ("sell_flag", "B"), ("padding_ok", "B"),
+    )),
+    ("item_acquires", ScannedItemAcquire, (
+        ("offset", "I"), ("eid", "H"), ("qty", "B"),
+        ("item_id", "H"), ("timestamp", "f"), ("valid", "B"),
+    )),
+)
+_BOOL_FIELDS = {"valid", "padding_ok"}
+
+
+def default_index_dir() -> Optional[Path]:
+    """The sidecar directory configured by VG_EVENT_INDEX, or None when unset."""
+    index_dir = os.environ.get(INDEX_ENV)
+    return Path(index_dir) if index_dir else None
+
+
+def index_path(frame_dir: Path, replay_name: str, index_dir: Optional[Path] = None) -> Optional[Path]:
+    """Sidecar path for a replay, or None when no index directory is configured."""
+    index_dir = index_dir if index_dir is not None else default_index_dir()
+    if index_dir is None:
+        return None
+    # Replays in different directories often share a name
+    dir_key = hashlib.sha1(str(Path(frame_dir).resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(index_dir) / f"{replay_name}-{dir_key}{INDEX_SUFFIX}"
+
+
+def index_version() -> str:
+    """Current event index version key."""
+    # Imported lazily: vg.decoder_v2 imports the core decoder modules itself.
+    from vg.decoder_v2.registry import event_index_version
+
+    return event_index_version()
+
+
+def frame_signature(frame_paths: Sequence[Path]) -> List[List[int]]:
+    """`[frame_index, size, mtime_ns]` for each frame file."""
+    signature = []
+    for path in frame_paths:
+        stat = path.stat()
+        signature.append([frame_file_index(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def _pack_array(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(typecode: str, data: bytes, pos: int, count: int) -> Tuple[array, int]:
+    values = array(typecode)
+    end = pos + values.itemsize * count
+    values.frombytes(data[pos:end])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values, end
+
+
+def _encode(frame_records: Sequence[Tuple[int, FrameRecords]]) -> bytes:
+    parts = []
+    for attr, _, fields in _FAMILIES:
+        per_frame = array("I", [len(getattr(records, attr)) for _, records in frame_records])
+        rows = [row for _, records in frame_records for row in getattr(records, attr)]
+        masks = array("B", [0] * len(rows))
+        columns = []
+        for bit, (name, typecode) in enumerate(fields):
+            column = array(typecode)
+            for i, row in enumerate(rows):
+                value = getattr(row, name)
+                if value is None:
+                    masks[i] |= 1 << bit
+                    value = 0
+                column.append(value)
+            columns.append(column)
+        parts.append(_U32.pack(len(rows)))
+        parts.append(_pack_array(per_frame))
+        parts.append(_pack_array(masks))
+        parts.extend(_pack_array(column) for column in columns)
+    return b"".join(parts)
+
+
+def _decode(data: bytes, pos: int, signature: List[List[int]]) -> Tuple[List[Tuple[int, FrameRecords]], int]:
+    frame_records = [(frame_idx, FrameRecords(size=size)) for frame_idx, size, _ in signature]
+    for attr, record_cls, fields in _FAMILIES:
+        count = _U32.unpack_from(data, pos)[0]
+        pos += _U32.size
+        per_frame, pos = _unpack_array("I", data, pos, len(signature))
+        masks, pos = _unpack_array("B", data, pos, count)
+        columns = []
+        for name, typecode in fields:
+            column, pos = _unpack_array(typecode, data, pos, count)
+            columns.append((name, column))
+
+        row = 0
+        for (_, records), frame_count in zip(frame_records, per_frame):
+            target = getattr(records, attr)
+            for i in range(row, row + frame_count):
+                mask = masks[i]
+                kwargs = {}
+                for bit, (name, column) in enumerate(columns):
+                    if mask & (1 << bit):
+                        kwargs[name] = None
+                    elif name in _BOOL_FIELDS:
+                        kwargs[name] = bool(column[i])
+                    else:
+                        kwargs[name] = column[i]
+                target.append(record_cls(**kwargs))
+            row += frame_count
+
+    for _, records in frame_records:
+        records.credit_offsets = [credit.offset for credit in records.credits]
+        records.valid_kill_offsets = [kill.offset for kill in records.kills if kill.valid]
+    return frame_records, pos
+
+
+def _encode_entities(entity_counts: Sequence[FrameEntityCounts]) -> bytes:
+    rows = [row for _, _, counts in entity_counts for row in counts]
+    return b"".join((
+        _U32.pack(len(rows)),
+        _pack_array(array("I", [headers for _, headers, _ in entity_counts])),
+        _pack_array(array("I", [len(counts) for _, _, counts in entity_counts])),
+        _pack_array(array("H", [entity_id for entity_id, _ in rows])),
+        _pack_array(array("I", [count for _, count in rows])),
+    ))
+
+
+def _decode_entities(data: bytes, pos: int, signature: List[List[int]]) -> List[FrameEntityCounts]:
+    count = _U32.unpack_from(data, pos)[0]
+    pos += _U32.size
+    headers, pos = _unpack_array("I", data, pos, len(signature))
+    per_frame, pos = _unpack_array("I", data, pos, len(signature))
+    entity_ids, pos = _unpack_array("H", data, pos, count)
+    counts, pos = _unpack_array("I", data, pos, count)
+    if pos != len(data):
+        raise ValueError("trailing bytes in event index")
+    entity_counts = []
+    row = 0
+    for (frame_idx, _, _), frame_headers, frame_rows in zip(signature, headers, per_frame):
+        entity_counts.append((
+            frame_idx, frame_headers, list(zip(entity_ids[row:row + frame_rows], counts[row:row + frame_rows])),
+        ))
+        row += frame_rows
+    return entity_counts
+
+
+def _read_sections(
+    path: Path,
+    signature: List[List[int]],
+    version: str,
+) -> Optional[Tuple[List[Tuple[int, FrameRecords]], List[FrameEntityCounts]]]:
+    """Cached records and entity counts, or None when the sidecar is missing, stale or unreadable."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    if not data.startswith(_MAGIC):
+        return None
+    try:
+        pos = len(_MAGIC)
+        header_len = _U32.unpack_from(data, pos)[0]
+        pos += _U32.size
+        header = json.loads(data[pos:pos + header_len].decode("utf-8"))
+        pos += header_len
+        if header.get("version") != version or header.get("frames") != signature:
+            return None
+        frame_records, pos = _decode(data, pos, signature)
+        return frame_records, _decode_entities(data, pos, signature)
+    except (struct.error, ValueError, TypeError, IndexError):
+        return None
+
+
+def read_index(
+    path: Path,
+    signature: List[List[int]],
+    version: str,
+) -> Optional[List[Tuple[int, FrameRecords]]]:
+    """Load cached records, or None when the sidecar is missing, stale or unreadable."""
+    sections = _read_sections(path, signature, version)
+    return None if sections is None else sections[0]
+
+
+def read_entity_counts(
+    path: Path,
+    signature: List[List[int]],
+    version: str,
+) -> Optional[List[FrameEntityCounts]]:
+    """Load cached entity event counts, or None when the sidecar is missing, stale or unreadable."""
+    sections = _read_sections(path, signature, version)
+    return None if sections is None else sections[1]
+
+
+def write_index(
+    path: Path,
+    signature: List[List[int]],
+    version: str,
+    frame_records: Sequence[Tuple[int, FrameRecords]],
+    entity_counts: Sequence[FrameEntityCounts],
+) -> bool:
+    """Write the sidecar atomically. Returns False when the directory is not writable."""
+    header = json.dumps({"version": version, "frames": signature}).encode("utf-8")
+    payload = (
+        _MAGIC + _U32.pack(len(header)) + header
+        + _encode(frame_records) + _encode_entities(entity_counts)
+    )
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def load_frame_records(
+    frame_dir: Path,
+    replay_name: str,
+    frames: Optional[Sequence[Tuple[int, Buffer]]] = None,
+    use_index: bool = True,
+    index_dir: Optional[Path] = None,
+) -> List[Tuple[int, FrameRecords]]:
+    """
+    Scanned record streams for a replay, served from the sidecar when fresh.
+
+    Args:
+        frame_dir: Directory containing the `<replay_name>.N.vgr` frames.
+        replay_name: Replay name without the frame suffix.
+        frames: Optional frames supplied by the caller. These are always
+            scanned directly; the index only describes the files on disk.
+        use_index: False to always rescan and leave the sidecar untouched.
+        index_dir: Sidecar directory; defaults to VG_EVENT_INDEX.
+    """
+    if frames is not None:
+        return scan_frames(frames)
+
+    path = index_path(frame_dir, replay_name, index_dir) if use_index else None
+    frame_paths = find_frame_files(Path(frame_dir), replay_name) if path is not None else []
+    if not frame_paths:
+        with FrameStore.open(frame_dir, replay_name) as store:
+            return scan_frames(store.frames)
+
+    signature = frame_signature(frame_paths)
+    version = index_version()
+    cached = read_index(path, signature, version)
+    if cached is not None:
+        return cached
+    return _scan_into_index(frame_dir, replay_name, path, signature, version)[0]
+
+
+def load_entity_lifecycle(
+    frame_dir: Path,
+    replay_name: str,
+    use_index: bool = True,
+    index_dir: Optional[Path] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> Dict[int, Dict]:
+    """
+    `scan_entity_lifecycle` of a replay's frame files, served from the sidecar when fresh.
+
+    Covers the default infrastructure entity range. On a sidecar hit `stats`
+    receives frames, event_headers and entity_events but no bytes_scanned.
+    """
+    path = index_path(frame_dir, replay_name, index_dir) if use_index else None
+    frame_paths = find_frame_files(Path(frame_dir), replay_name) if path is not None else []
+    if not frame_paths:
+        with FrameStore.open(frame_dir, replay_name) as store:
+            return scan_entity_lifecycle(store.frames, stats=stats)
+
+    signature = frame_signature(frame_paths)
+    version = index_version()
+    entity_counts = read_entity_counts(path, signature, version)
+    if entity_counts is None:
+        entity_counts = _scan_into_index(frame_dir, replay_name, path, signature, version)[1]
+    return lifecycle_from_counts(entity_counts, stats)
+
+
+def _scan_into_index(
+    frame_dir: Path,
+    replay_name: str,
+    path: Path,
+    signature: List[List[int]],
+    version: str,
+) -> Tuple[List[Tuple[int, FrameRecords]], List[FrameEntityCounts]]:
+    """Walk the frame files once for every indexed family and write the sidecar."""
+    with FrameStore.open(frame_dir, replay_name) as store:
+        frame_records = scan_frames(store.frames)
+        entity_counts = [(frame_idx, *count_entity_events(data)) for frame_idx, data in store.frames]
+        scanned = [(frame_idx, len(data)) for frame_idx, data in store.frames]
+    # Only persist when the scanned frames are the files the key describes
+    if scanned == [(frame_idx, size) for frame_idx, size, _ in signature]:
+        write_index(path, signature, version, frame_records, entity_counts)
+    return frame_records, entity_counts
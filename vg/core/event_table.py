@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Event Table - struct-of-arrays storage for high-volume decoded records.
+
+A replay yields tens of thousands of credit records and hundreds of
+kills/deaths. Keeping each as a dataclass instance costs an object, a
+`__dict__` and boxed field values per record; an `EventTable` keeps one
+typed `array` per column instead, so a record costs a few bytes and
+appending never allocates per-record objects.
+
+Subclasses declare their columns; consumers read whole columns (or use
+`to_numpy()` for vectorized work when NumPy is installed) and build
+dataclass views only for the few rows that need them.
+
+Usage:
+    class DeathTable(EventTable):
+        COLUMNS = (("frame_idx", "I"), ("eid", "H"), ("timestamp", "d"))
+
+    deaths = DeathTable()
+    deaths.append(12, 1500, 98.5)
+    deaths.column("timestamp")      # array('d', [98.5])
+    deaths.to_numpy()["eid"]        # ndarray([1500], dtype=uint16)
+"""
+
+from array import array
+from typing import Dict, Iterator, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+# Missing float fields (e.g. a kill without a timestamp) are stored as NaN
+MISSING = float("nan")
+
+
+class EventTable:
+    """Typed column arrays sharing one row index."""
+
+    # (name, array typecode) per column, in row order
+    COLUMNS: Tuple[Tuple[str, str], ...] = ()
+
+    def __init__(self):
+        self._columns: Dict[str, array] = {
+            name: array(typecode) for name, typecode in self.COLUMNS
+        }
+        self._appenders = tuple(column.append for column in self._columns.values())
+
+    def append(self, *row) -> int:
+        """Append one row (values in `COLUMNS` order) and return its index."""
+        for append, value in zip(self._appenders, row):
+            append(value)
+        return len(self) - 1
+
+    def extend(self, *columns) -> None:
+        """Append whole columns (sequences or NumPy arrays, in `COLUMNS` order)."""
+        for column, values in zip(self._columns.values(), columns):
+            if hasattr(values, "dtype"):
+                column.frombytes(values.astype(column.typecode, copy=False).tobytes())
+            else:
+                column.extend(values)
+
+    def __len__(self) -> int:
+        if not self.COLUMNS:
+            return 0
+        return len(self._columns[self.COLUMNS[0][0]])
+
+    def column(self, name: str) -> array:
+        """The live column array (do not resize it)."""
+        return self._columns[name]
+
+    def row(self, index: int) -> Tuple:
+        return tuple(column[index] for column in self._columns.values())
+
+    def rows(self) -> Iterator[Tuple]:
+        return zip(*self._columns.values())
+
+    def clear(self) -> None:
+        for column in self._columns.values():
+            del column[:]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.itemsize * len(column) for column in self._columns.values())
+
+    def to_numpy(self) -> Dict[str, "np.ndarray"]:
+        """Zero-copy NumPy views of every column (requires NumPy)."""
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for EventTable.to_numpy()")
+        return {
+            name: np.frombuffer(column, dtype=column.typecode)
+            for name, column in self._columns.items()
+        }
@@ -19,16 +19,29 @@ Usage:
 
     # Output to specific directory
     python -m vg.core.export_matches /path/to/replays/ --batch -o /output/dir/
+
+    # Decode on 8 worker processes, giving up on any replay after 120s
+    python -m vg.core.export_matches /path/to/replays/ --batch --workers 8 --timeout 120
+
+    # Log per-step decode timings and record counters, one JSON line per replay
+    python -m vg.core.export_matches /path/to/replays/ --batch --metrics-log decode_metrics.jsonl
+
+    # Stream NDJSON/CSV rows as matches finish (flat memory), adding to an earlier run
+    python -m vg.core.export_matches /path/to/replays/ --batch --stream --append -o /output/dir/
 """
 
 import csv
 import json
 import sys
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
+from vg.core.batch_runner import BatchResult, add_batch_arguments, run_batch
+from vg.core.result_cache import cached_payload
 from vg.core.unified_decoder import UnifiedDecoder, DecodedMatch
 
 
@@ -38,6 +51,53 @@ def export_match_json(match: DecodedMatch, output_path: Path) -> None:
         f.write(match.to_json(indent=2))
 
 
+# Column order of the streamed CSVs (batch CSVs derive theirs from the rows)
+PLAYER_CSV_FIELDS = [
+    'match_idx', 'replay_name', 'game_mode', 'map', 'team_size', 'duration_s',
+    'winner', 'player_name', 'team', 'is_winner', 'hero', 'kills', 'deaths',
+    'assists', 'kda_ratio', 'minion_kills', 'jungle_kills', 'gold_spent',
+    'gold_earned', 'items', 'item_count',
+]
+TRUTH_CSV_FIELDS = ['truth_kills', 'kill_match', 'truth_deaths', 'death_match']
+SUMMARY_CSV_FIELDS = [
+    'match_idx', 'replay_name', 'game_mode', 'map', 'team_size', 'duration_s',
+    'winner', 'left_kills', 'right_kills', 'left_deaths', 'right_deaths',
+    'left_gold', 'right_gold', 'gold_mine_captures', 'kraken_deaths',
+    'kraken_waves', 'crystal_death_ts', 'total_frames',
+]
+
+
+@dataclass
+class ExportStats:
+    """Batch summary counters, updated one match at a time."""
+    matches: int = 0
+    players: int = 0
+    kills: int = 0
+    deaths: int = 0
+    left_wins: int = 0
+    right_wins: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+    def add(self, match: DecodedMatch) -> None:
+        self.matches += 1
+        self.players += len(match.all_players)
+        self.kills += sum(p.kills for p in match.all_players)
+        self.deaths += sum(p.deaths for p in match.all_players)
+        if match.winner == 'left':
+            self.left_wins += 1
+        elif match.winner == 'right':
+            self.right_wins += 1
+
+    def print_summary(self) -> None:
+        if not self.matches:
+            return
+        print(f"\nSummary: {self.matches} matches, {self.players} players")
+        print(f"  Total K/D: {self.kills}/{self.deaths}")
+        unknown = self.matches - self.left_wins - self.right_wins
+        print(f"  Winners: left={self.left_wins}, right={self.right_wins}, unknown={unknown}")
+
+
 def match_to_csv_rows(match: DecodedMatch, match_idx: int = 0) -> List[Dict]:
     """Convert a decoded match to flat CSV rows (one row per player)."""
     rows = []
@@ -130,6 +190,52 @@ def export_csv(rows: List[Dict], output_path: Path) -> None:
         writer.writerows(rows)
 
 
+class CsvAppender:
+    """
+    CSV writer with a fixed header that can continue an existing file.
+
+    With `append=True` and a non-empty file, rows are added under the
+    file's own header (missing columns left blank); otherwise the file is
+    (re)created with `fieldnames`.
+    """
+
+    def __init__(self, output_path: Path, fieldnames: List[str], append: bool = False):
+        self.path = output_path
+        resume = append and output_path.exists() and output_path.stat().st_size > 0
+        if resume:
+            with open(output_path, encoding='utf-8-sig', newline='') as f:
+                fieldnames = next(csv.reader(f))
+        self._file = open(output_path, 'a' if resume else 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.DictWriter(
+            self._file, fieldnames=fieldnames, restval='', extrasaction='ignore',
+        )
+        if not resume:
+            self._writer.writeheader()
+
+    def write_rows(self, rows: Iterable[Dict]) -> None:
+        self._writer.writerows(rows)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_exported_replays(summary_path: Path) -> Tuple[Set[str], int]:
+    """Replay names in an existing match summary CSV, and its highest match_idx."""
+    names: Set[str] = set()
+    last_idx = 0
+    if not summary_path.exists():
+        return names, last_idx
+    with open(summary_path, encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            names.add(row.get('replay_name', ''))
+            try:
+                last_idx = max(last_idx, int(row.get('match_idx') or 0))
+            except ValueError:
+                pass
+    return names, last_idx
+
+
 def find_replays(directory: Path) -> List[Path]:
     """Find all .0.vgr replay files in a directory (recursive, skip macOS ._)."""
     replays = []
@@ -140,12 +246,20 @@ def find_replays(directory: Path) -> List[Path]:
     return replays
 
 
-def decode_single(replay_path: str, truth_path: Optional[str] = None) -> DecodedMatch:
-    """Decode a single replay file."""
-    decoder = UnifiedDecoder(replay_path)
+def decode_single(
+    replay_path: str,
+    truth_path: Optional[str] = None,
+    collect_metrics: bool = False,
+) -> DecodedMatch:
+    """Decode a single replay file (through the shared result cache when enabled)."""
+    decoder = UnifiedDecoder(replay_path, collect_metrics=collect_metrics)
     if truth_path:
         return decoder.decode_with_truth(truth_path)
-    return decoder.decode()
+    if collect_metrics:
+        return decoder.decode()
+    return DecodedMatch.from_dict(
+        cached_payload('unified', replay_path, lambda: decoder.decode().to_dict())
+    )
 
 
 def decode_batch(
@@ -153,8 +267,20 @@ def decode_batch(
     truth_path: Optional[str] = None,
     output_dir: Optional[str] = None,
     csv_only: bool = False,
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+    metrics_log: Optional[str] = None,
 ) -> List[DecodedMatch]:
-    """Decode all replays in a directory."""
+    """
+    Decode all replays in a directory.
+
+    With `workers > 1` replays are decoded on a process pool (see
+    `batch_runner.run_batch`); outputs keep the sorted replay order and a
+    failing or timed-out replay is reported without stopping the batch.
+    `metrics_log` appends one JSON line of per-step decode metrics per
+    replay as it finishes.
+    """
     dir_path = Path(directory)
     replays = find_replays(dir_path)
 
@@ -169,25 +295,46 @@ def decode_batch(
     matches = []
     all_csv_rows = []
 
-    for i, replay in enumerate(replays):
-        print(f"  [{i+1}/{len(replays)}] {replay.stem}...", end=' ')
-        try:
-            match = decode_single(str(replay), truth_path)
-            matches.append(match)
-
-            if not csv_only:
-                json_path = out / f"match_{i+1}.json"
-                export_match_json(match, json_path)
+    metrics_file = open(metrics_log, 'a', encoding='utf-8') if metrics_log else None
+
+    def report(result: BatchResult, done: int, total: int) -> None:
+        line = f"  [{done}/{total}] {result.item.stem}..."
+        if result.ok:
+            match = result.value
+            print(f"{line} OK ({len(match.all_players)} players, winner={match.winner})")
+            if metrics_file is not None and match.metrics is not None:
+                match.metrics.write_json_line(metrics_file)
+                metrics_file.flush()
+        else:
+            print(f"{line} ERROR: {result.error}")
+
+    try:
+        results = run_batch(
+            partial(decode_single, truth_path=truth_path, collect_metrics=metrics_file is not None),
+            replays,
+            workers=workers,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            on_result=report,
+        )
+    finally:
+        if metrics_file is not None:
+            metrics_file.close()
 
-            # Collect CSV rows
-            csv_rows = match_to_csv_rows(match, match_idx=i+1)
-            all_csv_rows.extend(csv_rows)
+    for result in results:
+        if not result.ok:
+            continue
+        i = result.index
+        match = result.value
+        matches.append(match)
 
-            n_players = len(match.all_players)
-            print(f"OK ({n_players} players, winner={match.winner})")
+        if not csv_only:
+            json_path = out / f"match_{i+1}.json"
+            export_match_json(match, json_path)
 
-        except Exception as e:
-            print(f"ERROR: {e}")
+        # Collect CSV rows
+        csv_rows = match_to_csv_rows(match, match_idx=i+1)
+        all_csv_rows.extend(csv_rows)
 
     # Combined JSON
     if matches and not csv_only:
@@ -214,20 +361,118 @@ def decode_batch(
         print(f"Summary CSV:   {summary_path}")
 
     # Summary
-    if matches:
-        total_players = sum(len(m.all_players) for m in matches)
-        total_kills = sum(p.kills for m in matches for p in m.all_players)
-        total_deaths = sum(p.deaths for m in matches for p in m.all_players)
-        print(f"\nSummary: {len(matches)} matches, {total_players} players")
-        print(f"  Total K/D: {total_kills}/{total_deaths}")
-        winners = [m.winner for m in matches if m.winner]
-        left_wins = sum(1 for w in winners if w == 'left')
-        right_wins = sum(1 for w in winners if w == 'right')
-        print(f"  Winners: left={left_wins}, right={right_wins}, unknown={len(matches)-left_wins-right_wins}")
+    stats = ExportStats()
+    for match in matches:
+        stats.add(match)
+    stats.print_summary()
 
     return matches
 
 
+def stream_batch(
+    directory: str,
+    truth_path: Optional[str] = None,
+    output_dir: Optional[str] = None,
+    csv_only: bool = False,
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+    metrics_log: Optional[str] = None,
+    append: bool = False,
+) -> ExportStats:
+    """
+    Decode all replays in a directory, writing each match as it finishes.
+
+    Every finished match is written straight away, then dropped:
+      - `all_matches.ndjson`: one `DecodedMatch.to_dict()` per line
+        (and `match_N.json`), unless `csv_only`.
+      - `all_matches.csv` and `match_summary.csv` rows.
+    Summary counters are kept incrementally, so memory stays flat however
+    large the batch is. Rows follow completion order; `match_idx` still
+    identifies the replay's position in the sorted replay list.
+
+    With `append=True` an existing output set is continued: replays whose
+    name is already in `match_summary.csv` are skipped, new matches are
+    numbered after the highest existing `match_idx`, and rows are added
+    under the existing CSV headers.
+    """
+    dir_path = Path(directory)
+    replays = find_replays(dir_path)
+    stats = ExportStats()
+
+    if not replays:
+        print(f"No .0.vgr files found in {directory}")
+        return stats
+
+    out = Path(output_dir) if output_dir else dir_path
+    out.mkdir(parents=True, exist_ok=True)
+    summary_path = out / 'match_summary.csv'
+
+    first_idx = 1
+    if append:
+        exported, last_idx = read_exported_replays(summary_path)
+        first_idx = last_idx + 1
+        pending = [r for r in replays if r.stem.rsplit('.', 1)[0] not in exported]
+        stats.skipped = len(replays) - len(pending)
+        replays = pending
+    print(f"Found {len(replays)} replay files" + (f" ({stats.skipped} already exported)" if append else ""))
+
+    player_fields = PLAYER_CSV_FIELDS + (TRUTH_CSV_FIELDS if truth_path else [])
+    csv_writer = CsvAppender(out / 'all_matches.csv', player_fields, append=append)
+    summary_writer = CsvAppender(summary_path, SUMMARY_CSV_FIELDS, append=append)
+    ndjson_path = out / 'all_matches.ndjson'
+    ndjson_file = None if csv_only else open(ndjson_path, 'a' if append else 'w', encoding='utf-8')
+    metrics_file = open(metrics_log, 'a', encoding='utf-8') if metrics_log else None
+
+    def write(result: BatchResult, done: int, total: int) -> None:
+        line = f"  [{done}/{total}] {result.item.stem}..."
+        if not result.ok:
+            stats.failed += 1
+            print(f"{line} ERROR: {result.error}")
+            return
+
+        match = result.value
+        # Drop the batch's reference so only this match is ever held
+        result.value = None
+        match_idx = first_idx + result.index
+        print(f"{line} OK ({len(match.all_players)} players, winner={match.winner})")
+        if metrics_file is not None and match.metrics is not None:
+            match.metrics.write_json_line(metrics_file)
+            metrics_file.flush()
+
+        if ndjson_file is not None:
+            export_match_json(match, out / f"match_{match_idx}.json")
+            ndjson_file.write(json.dumps(match.to_dict(), ensure_ascii=False) + '\n')
+            ndjson_file.flush()
+        csv_writer.write_rows(match_to_csv_rows(match, match_idx=match_idx))
+        summary_writer.write_rows([match_to_summary_row(match, match_idx)])
+        stats.add(match)
+
+    try:
+        run_batch(
+            partial(decode_single, truth_path=truth_path, collect_metrics=metrics_file is not None),
+            replays,
+            workers=workers,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            on_result=write,
+        )
+    finally:
+        csv_writer.close()
+        summary_writer.close()
+        if ndjson_file is not None:
+            ndjson_file.close()
+        if metrics_file is not None:
+            metrics_file.close()
+
+    if ndjson_file is not None:
+        print(f"\nNDJSON:        {ndjson_path}")
+    print(f"Combined CSV:  {csv_writer.path}")
+    print(f"Summary CSV:   {summary_writer.path}")
+    stats.print_summary()
+    return stats
+
+
 def resolve_single_output_paths(
     replay_path: Path,
     output: Optional[str] = None,
@@ -290,12 +535,48 @@ def main(argv: Optional[List[str]] = None) -> int:
         action='store_true',
         help='Only output CSV (skip per-match JSON files)'
     )
+    parser.add_argument(
+        '--metrics-log',
+        help='Append per-step decode timings/counters as JSON lines to this file (batch mode)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Batch mode: write NDJSON/CSV rows as each match finishes (constant memory)'
+    )
+    parser.add_argument(
+        '--append',
+        action='store_true',
+        help='With --stream: continue an existing output set, skipping exported replays'
+    )
+    add_batch_arguments(parser)
 
     args = parser.parse_args(argv)
     path = Path(args.path)
 
-    if args.batch or path.is_dir():
-        decode_batch(str(path), args.truth, args.output, csv_only=args.csv_only)
+    if (args.batch or path.is_dir()) and (args.stream or args.append):
+        stream_batch(
+            str(path),
+            args.truth,
+            args.output,
+            csv_only=args.csv_only,
+            workers=args.workers,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit_mb,
+            metrics_log=args.metrics_log,
+            append=args.append,
+        )
+    elif args.batch or path.is_dir():
+        decode_batch(
+            str(path),
+            args.truth,
+            args.output,
+            csv_only=args.csv_only,
+            workers=args.workers,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit_mb,
+            metrics_log=args.metrics_log,
+        )
     else:
         match = decode_single(str(path), args.truth)
         json_path, csv_path = export_single(
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Frame Store - memory-mapped access to the `<name>.N.vgr` frame files of a replay.
+
+Every frame file is mapped read-only with `mmap` instead of being copied into
+Python `bytes`. The mapped frames support the same operations the scanners
+already rely on (`find`, slicing, indexing, `struct.unpack_from`), so they can
+be handed to `KDADetector.process_frame` and friends unchanged.
+
+`ConcatenatedFrames` presents all frames as one virtual buffer without the
+`b"".join(...)` copy. Searches and slices work across frame boundaries exactly
+like they did on the joined bytes, and `locate()` maps a virtual offset back
+to `(frame_index, local_offset)`.
+
+Usage:
+    from vg.core.frame_store import FrameStore
+
+    with FrameStore.from_replay_file("/path/to/replay.0.vgr") as store:
+        for frame_idx, data in store:
+            ...
+        all_data = store.concat()
+        pos = all_data.find(b"\\x08\\x04\\x31")
+        frame_idx, local_offset = all_data.locate(pos)
+
+Every mapping holds a file descriptor until the store is closed, so owners
+close it (or use it as a context manager) once the frames are consumed.
+Loaders whose callers keep the frames for an unknown time use
+`read_frames()`, which copies the bytes out and unmaps immediately.
+"""
+
+import hashlib
+import mmap
+from bisect import bisect_right
+from pathlib import Path
+from typing import Iterator, List, Sequence, Tuple, Union
+
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+def frame_file_index(path: Path) -> int:
+    """Frame index from a `<name>.N.vgr` path (0 when the suffix is not numeric)."""
+    try:
+        return int(path.stem.split('.')[-1])
+    except ValueError:
+        return 0
+
+
+def find_frame_files(frame_dir: Path, replay_name: str) -> List[Path]:
+    """All frame files of a replay sorted by frame index."""
+    return sorted(frame_dir.glob(f"{replay_name}.*.vgr"), key=frame_file_index)
+
+
+def map_file(path: Path) -> Buffer:
+    """Map a file read-only. Empty files (which mmap rejects) become `b""`."""
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""
+
+
+class ConcatenatedFrames:
+    """
+    Read-only virtual concatenation of frame buffers.
+
+    Behaves like the joined `bytes` for `len`, `find`, integer indexing and
+    slicing. Slices are the only operation that copies, and only the bytes
+    requested.
+    """
+
+    def __init__(self, frames: Sequence[Tuple[int, Buffer]]):
+        self._frame_indices = [frame_idx for frame_idx, _ in frames]
+        self._buffers = [data for _, data in frames]
+        self._starts: List[int] = []
+        total = 0
+        for data in self._buffers:
+            self._starts.append(total)
+            total += len(data)
+        self._length = total
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _position(self, offset: int) -> int:
+        """Position (list index) of the frame containing a virtual offset."""
+        return bisect_right(self._starts, offset) - 1
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """Map a virtual offset to `(frame_index, local_offset)`."""
+        if not 0 <= offset < self._length:
+            raise IndexError("offset out of range")
+        position = self._position(offset)
+        return self._frame_indices[position], offset - self._starts[position]
+
+    def frame_start(self, position: int) -> int:
+        """Virtual offset where the frame at list position `position` starts."""
+        return self._starts[position]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                return self[start:stop][::step] if start < stop else b""
+            if start >= stop:
+                return b""
+            position = self._position(start)
+            first = self._buffers[position]
+            local = start - self._starts[position]
+            if stop - self._starts[position] <= len(first):
+                return bytes(first[local:stop - self._starts[position]])
+            pieces = []
+            while start < stop and position < len(self._buffers):
+                data = self._buffers[position]
+                local_start = start - self._starts[position]
+                local_stop = min(len(data), stop - self._starts[position])
+                pieces.append(data[local_start:local_stop])
+                start = self._starts[position] + local_stop
+                position += 1
+            return b"".join(pieces)
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("index out of range")
+        position = self._position(key)
+        return self._buffers[position][key - self._starts[position]]
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        """Lowest virtual offset of `sub` at or after `start`, or -1."""
+        size = len(sub)
+        if start < 0:
+            start = max(0, start + self._length)
+        if size == 0:
+            return start if start <= self._length else -1
+        if start >= self._length:
+            return -1
+
+        position = self._position(start)
+        while position < len(self._buffers):
+            base = self._starts[position]
+            data = self._buffers[position]
+            end = base + len(data)
+            local = max(start - base, 0)
+
+            idx = data.find(sub, local)
+            if idx != -1:
+                return base + idx
+
+            # Matches straddling the boundary into the following frame(s)
+            if size > 1 and end < self._length:
+                seam_start = max(start, end - (size - 1))
+                seam = self[seam_start:end + size - 1]
+                idx = seam.find(sub)
+                if idx != -1 and seam_start + idx < end:
+                    return seam_start + idx
+
+            position += 1
+        return -1
+
+
+class FrameStore:
+    """
+    Memory-mapped frames of one replay.
+
+    Iterating yields `(frame_index, buffer)` tuples in frame order, the same
+    shape every frame loader in the repo has always returned.
+    """
+
+    def __init__(self, frames: Sequence[Tuple[int, Buffer]]):
+        self.frames: List[Tuple[int, Buffer]] = list(frames)
+
+    @classmethod
+    def open(cls, frame_dir: Path, replay_name: str) -> "FrameStore":
+        """Map every `<replay_name>.N.vgr` frame in `frame_dir`."""
+        return cls([
+            (frame_file_index(path), map_file(path))
+            for path in find_frame_files(Path(frame_dir), replay_name)
+        ])
+
+    @classmethod
+    def from_replay_file(cls, replay_file: str) -> "FrameStore":
+        """Map every frame belonging to a `<name>.0.vgr` replay path."""
+        replay_path = Path(replay_file)
+        return cls.open(replay_path.parent, replay_path.stem.rsplit('.', 1)[0])
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def __iter__(self) -> Iterator[Tuple[int, Buffer]]:
+        return iter(self.frames)
+
+    @property
+    def total_size(self) -> int:
+        return sum(len(data) for _, data in self.frames)
+
+    def view(self, position: int) -> memoryview:
+        """
+        Zero-copy `memoryview` of the frame at list position `position`.
+
+        Release the view before calling `close()`; mmap refuses to unmap
+        while views are exported.
+        """
+        return memoryview(self.frames[position][1])
+
+    def concat(self) -> ConcatenatedFrames:
+        """Virtual concatenation of all frames (no copy)."""
+        return ConcatenatedFrames(self.frames)
+
+    def close(self) -> None:
+        """Unmap all frames. Buffers handed out earlier become invalid."""
+        for _, data in self.frames:
+            if isinstance(data, mmap.mmap):
+                data.close()
+        self.frames = []
+
+    def __enter__(self) -> "FrameStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_frames(frame_dir: Path, replay_name: str) -> List[Tuple[int, bytes]]:
+    """`(frame_index, bytes)` copies of every frame; no mapping outlives the call."""
+    with FrameStore.open(frame_dir, replay_name) as store:
+        return [(frame_idx, bytes(data)) for frame_idx, data in store]
+
+
+def replay_content_hash(replay_file: str) -> str:
+    """SHA-256 of a replay's frame files, in frame order."""
+    digest = hashlib.sha256()
+    with FrameStore.from_replay_file(replay_file) as store:
+        for frame_idx, data in store:
+            digest.update(f"{frame_idx}:{len(data)}:".encode('ascii'))
+            digest.update(data)
+    return digest.hexdigest()
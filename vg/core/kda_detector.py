@@ -19,15 +19,38 @@ Record structures (Big Endian protocol):
 
 Assist detection: After each kill, scan credit records within 500 bytes.
 An assist = non-killer player with value==1.0 flag AND same team as killer.
+
+Credits are found by bisecting the frame's sorted credit and kill offsets.
+A shorter window only truncates a kill's credit list, so a detector built
+with a wide `credit_window` answers any smaller window without rescanning
+(`kill_events_for_window`, `get_results(assist_window=...)`).
+
+All record families are found by one `record_scanner.scan_frame` pass per
+frame; callers that already scanned a frame can pass the records in.
+
+Detected events are stored in struct-of-arrays tables (`KillTable`,
+`DeathTable`, `CreditTable`); `KillEvent`/`DeathEvent` objects are built
+only for the events handed out by `get_results()` and the event properties.
 """
-import struct
+import math
+from bisect import bisect_left
 from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Tuple
+from typing import Iterable, List, Dict, Optional, Set, Tuple
+
+try:
+    from vg.core.event_table import MISSING, EventTable
+    from vg.core.record_scanner import (
+        CREDIT_HEADER, DEATH_HEADER, KILL_HEADER, FrameRecords, scan_frame,
+    )
+except ImportError:
+    from event_table import MISSING, EventTable
+    from record_scanner import (
+        CREDIT_HEADER, DEATH_HEADER, KILL_HEADER, FrameRecords, scan_frame,
+    )
 
-KILL_HEADER = bytes([0x18, 0x04, 0x1C])
-DEATH_HEADER = bytes([0x08, 0x04, 0x31])
-CREDIT_HEADER = bytes([0x10, 0x04, 0x1D])
+# Bytes after a kill record searched for its credit records
+ASSIST_CREDIT_WINDOW = 500
 
 
 @dataclass
@@ -57,6 +80,37 @@ class DeathEvent:
     file_offset: int = 0
 
 
+class KillTable(EventTable):
+    """Kill events; credits are rows [credit_start, credit_end) of a CreditTable."""
+    COLUMNS = (
+        ("killer_eid", "H"),
+        ("timestamp", "d"),  # NaN when the kill has no usable timestamp
+        ("frame_idx", "I"),
+        ("file_offset", "I"),
+        ("credit_start", "I"),
+        ("credit_end", "I"),
+    )
+
+
+class DeathTable(EventTable):
+    """Death events."""
+    COLUMNS = (
+        ("victim_eid", "H"),
+        ("timestamp", "d"),
+        ("frame_idx", "I"),
+        ("file_offset", "I"),
+    )
+
+
+class CreditTable(EventTable):
+    """Credit records following kills."""
+    COLUMNS = (
+        ("eid", "H"),
+        ("value", "d"),
+        ("offset", "I"),
+    )
+
+
 @dataclass
 class KDAResult:
     """Per-player KDA counts."""
@@ -81,159 +135,186 @@ class KDADetector:
         results = detector.get_results(game_duration=1028)
     """
 
-    def __init__(self, valid_entity_ids: Set[int]):
+    def __init__(self, valid_entity_ids: Set[int],
+                 credit_window: int = ASSIST_CREDIT_WINDOW):
         """
         Args:
             valid_entity_ids: Set of valid player entity IDs (Big Endian).
+            credit_window: Bytes after each kill to collect credits from; the
+                           widest window later queries can use.
         """
         self.valid_eids = valid_entity_ids
-        self._kill_events: List[KillEvent] = []
-        self._death_events: List[DeathEvent] = []
+        self.credit_window = credit_window
+        self._kills = KillTable()
+        self._deaths = DeathTable()
+        self._credits = CreditTable()
         self._minion_kills: Dict[int, int] = defaultdict(int)  # eid -> count
+        # Event views built on first access, dropped when the tables change
+        self._kill_view_cache: Optional[List[KillEvent]] = None
+        self._death_view_cache: Optional[List[DeathEvent]] = None
 
-    def process_frame(self, frame_idx: int, data: bytes) -> None:
-        """Process a single frame, extracting kill, death, and minion kill events."""
-        self._scan_kills(frame_idx, data)
-        self._scan_deaths(frame_idx, data)
-        self._scan_minion_kills(data)
-
-    def _scan_kills(self, frame_idx: int, data: bytes) -> None:
-        """Scan for kill records: [18 04 1C] [00 00] [eid BE] [FF FF FF FF] [3F 80 00 00] [29]"""
-        pos = 0
-        while True:
-            pos = data.find(KILL_HEADER, pos)
-            if pos == -1:
-                break
-            if pos + 16 > len(data):
-                pos += 1
-                continue
+    def process_frame(self, frame_idx: int, data: bytes,
+                      records: Optional[FrameRecords] = None) -> None:
+        """Process a single frame, extracting kill, death, and minion kill events.
 
+        Args:
+            frame_idx: Frame index.
+            data: Frame bytes (only needed when `records` is not given).
+            records: Optional pre-scanned `scan_frame(data)` output, so callers
+                     that share one scan across detectors avoid rescanning.
+        """
+        if records is None:
+            records = scan_frame(data)
+        self._kill_view_cache = None
+        self._death_view_cache = None
+        self._scan_kills(frame_idx, records)
+        self._scan_deaths(frame_idx, records)
+        self._scan_minion_kills(records)
+
+    def _scan_kills(self, frame_idx: int, records: FrameRecords) -> None:
+        """Collect kill records: [18 04 1C] [00 00] [eid BE] [FF FF FF FF] [3F 80 00 00] [29]"""
+        for kill in records.kills:
             # Structural validation
-            if (data[pos+3:pos+5] != b'\x00\x00' or
-                data[pos+7:pos+11] != b'\xFF\xFF\xFF\xFF' or
-                data[pos+11:pos+15] != b'\x3F\x80\x00\x00' or
-                data[pos+15] != 0x29):
-                pos += 1
-                continue
-
-            eid = struct.unpack_from(">H", data, pos + 5)[0]
-            if eid not in self.valid_eids:
-                pos += 1
+            if not kill.valid or kill.killer_eid not in self.valid_eids:
                 continue
 
-            # Extract timestamp from 7 bytes before header
-            ts = None
-            if pos >= 7:
-                ts = struct.unpack_from(">f", data, pos - 7)[0]
-                if not (0 < ts < 1800):
-                    ts = None
-
-            # Scan credit records following this kill
-            credits = self._scan_credits(data, pos + 16)
-
-            self._kill_events.append(KillEvent(
-                killer_eid=eid,
-                timestamp=ts,
-                frame_idx=frame_idx,
-                file_offset=pos,
-                credits=credits,
-            ))
-            pos += 16  # Skip past this record
-
-    def _scan_credits(self, data: bytes, start_pos: int) -> List[CreditRecord]:
-        """Scan credit records [10 04 1D] after a kill, up to 500 bytes or next kill."""
-        credits = []
-        pos = start_pos
-        max_scan = min(start_pos + 500, len(data))
-
-        while pos < max_scan:
-            # Stop at next validated kill header
-            if (data[pos:pos + 3] == KILL_HEADER and pos + 16 <= len(data)
-                    and data[pos+3:pos+5] == b'\x00\x00'
-                    and data[pos+7:pos+11] == b'\xFF\xFF\xFF\xFF'
-                    and data[pos+11:pos+15] == b'\x3F\x80\x00\x00'
-                    and data[pos+15] == 0x29):
-                break
+            # Timestamp from 7 bytes before header
+            ts = kill.timestamp
+            if ts is not None and not (0 < ts < 1800):
+                ts = None
 
-            if data[pos:pos + 3] == CREDIT_HEADER:
-                if pos + 9 <= len(data) and data[pos+3:pos+5] == b'\x00\x00':
-                    eid = struct.unpack_from(">H", data, pos + 5)[0]
-                    value = struct.unpack_from(">f", data, pos + 7)[0]
-                    if eid in self.valid_eids and 0 <= value <= 10000:
-                        credits.append(CreditRecord(
-                            eid=eid, value=round(value, 2), offset=pos,
-                        ))
-                    pos += 9
-                    continue
+            # Credit records following this kill
+            credit_start = len(self._credits)
+            self._scan_credits(records, kill.offset + 16, self.credit_window)
 
-            pos += 1
+            self._kills.append(
+                kill.killer_eid, MISSING if ts is None else ts, frame_idx,
+                kill.offset, credit_start, len(self._credits),
+            )
 
-        return credits
+    def _scan_credits(self, records: FrameRecords, start_pos: int,
+                      window: int = 500) -> None:
+        """Append credit records [10 04 1D] after a kill, up to `window` bytes or next kill.
 
-    def _scan_minion_kills(self, data: bytes) -> None:
-        """Scan for minion kill records: [10 04 1D] [00 00] [eid BE] [1.0 f32 BE] [0E]"""
-        pos = 0
-        while True:
-            pos = data.find(CREDIT_HEADER, pos)
-            if pos == -1:
+        Reproduces the byte walk over the window: a validated kill header
+        ends the scan, and each accepted 9-byte credit prefix is skipped as
+        a whole so headers inside it are ignored.
+        """
+        append_credit = self._credits.append
+        max_scan = min(start_pos + window, records.size)
+        kill_offsets = records.valid_kill_offsets
+        next_pos = start_pos
+
+        first = bisect_left(records.credit_offsets, start_pos)
+        for credit in records.credits[first:]:
+            pos = credit.offset
+            if pos >= max_scan:
                 break
-            if pos + 12 > len(data):
-                pos += 1
+            # Stop at next validated kill header
+            kill_idx = bisect_left(kill_offsets, next_pos)
+            if kill_idx < len(kill_offsets) and kill_offsets[kill_idx] < pos:
+                break
+            if pos < next_pos:
                 continue
-
-            if data[pos+3:pos+5] != b'\x00\x00':
-                pos += 1
+            if pos + 9 <= records.size and credit.padding_ok:
+                value = credit.value
+                if (credit.eid in self.valid_eids and value is not None
+                        and 0 <= value <= 10000):
+                    append_credit(credit.eid, round(value, 2), pos)
+                next_pos = pos + 9
+
+    def _scan_minion_kills(self, records: FrameRecords) -> None:
+        """Count minion kill records: [10 04 1D] [00 00] [eid BE] [1.0 f32 BE] [0E]"""
+        for credit in records.credits:
+            if credit.action is None or not credit.padding_ok:
                 continue
-
-            eid = struct.unpack_from(">H", data, pos + 5)[0]
-            if eid not in self.valid_eids:
-                pos += 1
+            if credit.eid not in self.valid_eids:
                 continue
-
             # Check value = 1.0 and action byte = 0x0E
-            value = struct.unpack_from(">f", data, pos + 7)[0]
-            action = data[pos + 11]
-
-            if abs(value - 1.0) < 0.01 and action == 0x0E:
-                self._minion_kills[eid] += 1
-
-            pos += 3  # Skip past header to avoid re-matching
-
-    def _scan_deaths(self, frame_idx: int, data: bytes) -> None:
-        """Scan for death records: [08 04 31] [00 00] [eid BE] [00 00] [ts f32 BE]"""
-        pos = 0
-        while True:
-            pos = data.find(DEATH_HEADER, pos)
-            if pos == -1:
-                break
-            if pos + 13 > len(data):
-                pos += 1
-                continue
+            if abs(credit.value - 1.0) < 0.01 and credit.action == 0x0E:
+                self._minion_kills[credit.eid] += 1
 
+    def _scan_deaths(self, frame_idx: int, records: FrameRecords) -> None:
+        """Collect death records: [08 04 31] [00 00] [eid BE] [00 00] [ts f32 BE]"""
+        for death in records.deaths:
             # Structural validation
-            if data[pos+3:pos+5] != b'\x00\x00' or data[pos+7:pos+9] != b'\x00\x00':
-                pos += 1
+            if not death.valid:
                 continue
-
-            eid = struct.unpack_from(">H", data, pos + 5)[0]
-            ts = struct.unpack_from(">f", data, pos + 9)[0]
-
-            if eid not in self.valid_eids or not (0 < ts < 1800):
-                pos += 1
+            if death.eid not in self.valid_eids or not (0 < death.timestamp < 1800):
                 continue
 
-            self._death_events.append(DeathEvent(
-                victim_eid=eid,
-                timestamp=ts,
-                frame_idx=frame_idx,
-                file_offset=pos,
-            ))
-            pos += 1
+            self._deaths.append(death.eid, death.timestamp, frame_idx, death.offset)
+
+    def _credit_range(self, index: int, window: Optional[int] = None) -> Tuple[int, int]:
+        """Credit rows of kill `index` that lie within `window` bytes after it."""
+        start = self._kills.column("credit_start")[index]
+        end = self._kills.column("credit_end")[index]
+        if window is None or window >= self.credit_window:
+            return start, end
+        limit = self._kills.column("file_offset")[index] + 16 + window
+        return start, bisect_left(self._credits.column("offset"), limit, start, end)
+
+    def _kill_view(self, index: int, window: Optional[int] = None) -> KillEvent:
+        killer_eid, ts, frame_idx, file_offset, _, _ = self._kills.row(index)
+        start, end = self._credit_range(index, window)
+        credits = self._credits
+        return KillEvent(
+            killer_eid=killer_eid,
+            timestamp=None if math.isnan(ts) else ts,
+            frame_idx=frame_idx,
+            file_offset=file_offset,
+            credits=[
+                CreditRecord(eid=eid, value=value, offset=offset)
+                for eid, value, offset in (credits.row(i) for i in range(start, end))
+            ],
+        )
+
+    def _death_view(self, index: int) -> DeathEvent:
+        victim_eid, ts, frame_idx, file_offset = self._deaths.row(index)
+        return DeathEvent(victim_eid=victim_eid, timestamp=ts,
+                          frame_idx=frame_idx, file_offset=file_offset)
+
+    # Object views over the tables, built once per batch of process_frame
+    # calls. Assigning a list of events replaces the table contents (used by
+    # research code and tests that inject events).
+    @property
+    def _kill_events(self) -> List[KillEvent]:
+        if self._kill_view_cache is None:
+            self._kill_view_cache = [self._kill_view(i) for i in range(len(self._kills))]
+        return self._kill_view_cache
+
+    @_kill_events.setter
+    def _kill_events(self, events: Iterable[KillEvent]) -> None:
+        self._kill_view_cache = None
+        self._kills.clear()
+        self._credits.clear()
+        for kev in events:
+            start = len(self._credits)
+            for cr in kev.credits:
+                self._credits.append(cr.eid, cr.value, cr.offset)
+            self._kills.append(
+                kev.killer_eid, MISSING if kev.timestamp is None else kev.timestamp,
+                kev.frame_idx, kev.file_offset, start, len(self._credits),
+            )
+
+    @property
+    def _death_events(self) -> List[DeathEvent]:
+        if self._death_view_cache is None:
+            self._death_view_cache = [self._death_view(i) for i in range(len(self._deaths))]
+        return self._death_view_cache
+
+    @_death_events.setter
+    def _death_events(self, events: Iterable[DeathEvent]) -> None:
+        self._death_view_cache = None
+        self._deaths.clear()
+        for dev in events:
+            self._deaths.append(dev.victim_eid, dev.timestamp, dev.frame_idx, dev.file_offset)
 
     def get_results(self, game_duration: Optional[float] = None,
                     death_buffer: float = 3.0,
                     kill_buffer: float = 20.0,
-                    team_map: Optional[Dict[int, str]] = None) -> Dict[int, KDAResult]:
+                    team_map: Optional[Dict[int, str]] = None,
+                    assist_window: int = ASSIST_CREDIT_WINDOW) -> Dict[int, KDAResult]:
         """
         Get per-player KDA results.
 
@@ -251,10 +332,13 @@ class KDADetector:
                         agreement on complete matches.
             team_map: Dict mapping entity ID (BE) -> team name ("left"/"right").
                      Required for assist detection. If None, assists remain 0.
+            assist_window: Bytes after each kill whose credits count
+                           (at most the detector's `credit_window`).
 
         Returns:
             Dict mapping entity ID (BE) to KDAResult.
         """
+        self._check_window(assist_window)
         results: Dict[int, KDAResult] = {}
         for eid in self.valid_eids:
             results[eid] = KDAResult()
@@ -262,40 +346,43 @@ class KDADetector:
         # Count kills with a wider post-game buffer; current truth fixtures
         # still score several late-tail kills on the final board.
         max_kill_ts = (game_duration + kill_buffer) if game_duration else 9999
-        for kev in self._kill_events:
-            if kev.killer_eid in results:
-                if kev.timestamp is not None and kev.timestamp > max_kill_ts:
+        kill_eids = self._kills.column("killer_eid")
+        kill_ts = self._kills.column("timestamp")
+        for i, (killer_eid, ts) in enumerate(zip(kill_eids, kill_ts)):
+            if killer_eid in results:
+                if ts > max_kill_ts:  # NaN (no timestamp) never compares greater
                     continue  # Post-game ceremony kill
-                results[kev.killer_eid].kills += 1
-                results[kev.killer_eid].kill_events.append(kev)
+                results[killer_eid].kills += 1
+                results[killer_eid].kill_events.append(self._kill_view(i, assist_window))
 
         # Count deaths with a short post-game tail. A narrow rescue path keeps
         # some scoreboard-counted late deaths when they align with a nearby
         # opposing late kill, while still excluding most ceremony noise.
         max_death_ts = (game_duration + death_buffer) if game_duration else 9999
         late_kill_events = [
-            kev for kev in self._kill_events
-            if kev.timestamp is not None and game_duration is not None and kev.timestamp > game_duration
+            (killer_eid, ts) for killer_eid, ts in zip(kill_eids, kill_ts)
+            if game_duration is not None and ts > game_duration
         ]
-        for dev in self._death_events:
-            keep_death = dev.timestamp <= max_death_ts
+        for i, (victim_eid, ts) in enumerate(zip(self._deaths.column("victim_eid"),
+                                                  self._deaths.column("timestamp"))):
+            keep_death = ts <= max_death_ts
             if (
                 not keep_death
                 and game_duration is not None
                 and team_map
-                and dev.timestamp <= game_duration + 25.0
+                and ts <= game_duration + 25.0
             ):
-                victim_team = team_map.get(dev.victim_eid)
+                victim_team = team_map.get(victim_eid)
                 if victim_team:
                     keep_death = any(
-                        team_map.get(kev.killer_eid) != victim_team
-                        and abs((kev.timestamp or 0.0) - dev.timestamp) <= 2.0
-                        for kev in late_kill_events
+                        team_map.get(killer_eid) != victim_team
+                        and abs(kill_time - ts) <= 2.0
+                        for killer_eid, kill_time in late_kill_events
                     )
 
-            if dev.victim_eid in results and keep_death:
-                results[dev.victim_eid].deaths += 1
-                results[dev.victim_eid].death_events.append(dev)
+            if victim_eid in results and keep_death:
+                results[victim_eid].deaths += 1
+                results[victim_eid].death_events.append(self._death_view(i))
 
         # Count minion kills
         for eid, count in self._minion_kills.items():
@@ -304,14 +391,15 @@ class KDADetector:
 
         # Count assists (requires team_map, uses kill_buffer since assists derive from kills)
         if team_map:
-            self._count_assists(results, team_map, game_duration, kill_buffer)
+            self._count_assists(results, team_map, game_duration, kill_buffer, assist_window)
 
         return results
 
     def _count_assists(self, results: Dict[int, KDAResult],
                        team_map: Dict[int, str],
                        game_duration: Optional[float] = None,
-                       death_buffer: float = 10.0) -> None:
+                       death_buffer: float = 10.0,
+                       window: Optional[int] = None) -> None:
         """Count assists from credit records after each kill.
 
         An assist = non-killer, same-team player with:
@@ -321,45 +409,83 @@ class KDADetector:
         (e.g., Blackfeather passive triggering credit records).
         """
         max_ts = (game_duration + death_buffer) if game_duration else 9999
-        for kev in self._kill_events:
+        for i, ts in enumerate(self._kills.column("timestamp")):
             # Skip post-game kills for assist counting
-            if kev.timestamp is not None and kev.timestamp > max_ts:
-                continue
-
-            killer_eid = kev.killer_eid
-            killer_team = team_map.get(killer_eid)
-            if not killer_team:
+            if ts > max_ts:
                 continue
-
-            # Group credits by entity ID
-            credits_by_eid: Dict[int, List[float]] = defaultdict(list)
-            for cr in kev.credits:
-                credits_by_eid[cr.eid].append(cr.value)
-
-            for eid, values in credits_by_eid.items():
-                if eid == killer_eid:
-                    continue
-                # Must have 1.0 participation flag
-                if not any(abs(v - 1.0) < 0.01 for v in values):
-                    continue
-                # Must have at least 2 credit records (1.0 flag + gold share).
-                # A lone [1.0] is a false positive from hero passives.
-                if len(values) < 2:
-                    continue
-                # Must be same team as killer
-                if team_map.get(eid) != killer_team:
-                    continue
+            for eid in self.kill_assist_eids(i, team_map, window):
                 if eid in results:
                     results[eid].assists += 1
 
+    def kill_assist_eids(self, index: int, team_map: Dict[int, str],
+                         window: Optional[int] = None) -> List[int]:
+        """Entity IDs credited with an assist on kill `index` (see `_count_assists`)."""
+        killer_eid = self._kills.column("killer_eid")[index]
+        killer_team = team_map.get(killer_eid)
+        if not killer_team:
+            return []
+
+        # Group credits by entity ID
+        start, end = self._credit_range(index, window)
+        credit_eids = self._credits.column("eid")
+        credit_values = self._credits.column("value")
+        credits_by_eid: Dict[int, List[float]] = defaultdict(list)
+        for i in range(start, end):
+            credits_by_eid[credit_eids[i]].append(credit_values[i])
+
+        assists = []
+        for eid, values in credits_by_eid.items():
+            if eid == killer_eid:
+                continue
+            # Must have 1.0 participation flag
+            if not any(abs(v - 1.0) < 0.01 for v in values):
+                continue
+            # Must have at least 2 credit records (1.0 flag + gold share).
+            # A lone [1.0] is a false positive from hero passives.
+            if len(values) < 2:
+                continue
+            # Must be same team as killer
+            if team_map.get(eid) != killer_team:
+                continue
+            assists.append(eid)
+        return assists
+
     @property
     def kill_events(self) -> List[KillEvent]:
         return list(self._kill_events)
 
+    def kill_events_for_window(self, window: int) -> List[KillEvent]:
+        """Kill events whose credits are cut to `window` bytes after the kill."""
+        self._check_window(window)
+        return [self._kill_view(i, window) for i in range(len(self._kills))]
+
+    def _check_window(self, window: int) -> None:
+        if window > self.credit_window:
+            raise ValueError(
+                f"credit window {window} exceeds the scanned window {self.credit_window}; "
+                f"build the detector with credit_window={window} or more"
+            )
+
     @property
     def death_events(self) -> List[DeathEvent]:
         return list(self._death_events)
 
+    @property
+    def kill_table(self) -> KillTable:
+        return self._kills
+
+    @property
+    def death_table(self) -> DeathTable:
+        return self._deaths
+
+    @property
+    def credit_table(self) -> CreditTable:
+        return self._credits
+
+    @property
+    def minion_kill_counts(self) -> Dict[int, int]:
+        return self._minion_kills
+
     def get_kill_death_pairs(self, team_map: Dict[int, str],
                              game_duration: Optional[float] = None,
                              death_buffer: float = 10.0,
@@ -379,11 +505,21 @@ class KDADetector:
         max_death_ts = (game_duration + death_buffer) if game_duration else 9999
 
         # Filter deaths
-        valid_deaths = [d for d in self._death_events if d.timestamp <= max_death_ts]
+        valid_deaths = [
+            DeathEvent(victim_eid=eid, timestamp=ts)
+            for eid, ts in zip(self._deaths.column("victim_eid"), self._deaths.column("timestamp"))
+            if ts <= max_death_ts
+        ]
         valid_deaths.sort(key=lambda d: d.timestamp)
 
         # Sort kills by timestamp
-        kills_with_ts = [k for k in self._kill_events if k.timestamp is not None]
+        kills_with_ts = [
+            KillEvent(killer_eid=eid, timestamp=ts, frame_idx=frame_idx)
+            for eid, ts, frame_idx in zip(self._kills.column("killer_eid"),
+                                          self._kills.column("timestamp"),
+                                          self._kills.column("frame_idx"))
+            if not math.isnan(ts)
+        ]
         kills_with_ts.sort(key=lambda k: k.timestamp)
 
         # Greedy 1:1 matching
@@ -0,0 +1,444 @@
+#!/usr/bin/env python3
+"""
+Live Decoder - incremental decoding of a replay while it is being written.
+
+The game writes `<name>.N.vgr` frames into its Temp directory one after
+another during a match. `LiveReplayDecoder` tails that directory and feeds
+every newly completed frame exactly once into incremental detectors:
+
+  - KDADetector      kills / deaths / assists / minion kills
+  - GoldTracker      gold earned / spent, jungle credits
+  - ItemTracker      purchases and the estimated current build
+  - ObjectiveTracker Gold Mine / Kraken (Ghostwing / Blackclaw) clusters
+
+Earlier frames are never re-read, so the cost per frame is O(frame size).
+After each frame a `LiveScoreboard` snapshot of the running per-player
+state is available, long before the match has finished.
+
+A frame counts as complete once a later frame exists; the newest frame is
+only consumed by `finish()` (or `follow()` once the replay stops growing).
+Post-game ceremony filtering needs the final duration, so live K/D/A is the
+unfiltered running count; use UnifiedDecoder on the finished replay for the
+final numbers.
+
+Usage:
+    from vg.core.live_decoder import LiveReplayDecoder
+
+    live = LiveReplayDecoder.from_temp_dir("C:/Users/me/AppData/Local/Temp")
+    for board in live.poll():
+        print(board.format_table())
+
+CLI:
+    python -m vg.core.live_decoder --temp /path/to/Temp
+"""
+
+import argparse
+import copy
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Local imports with fallback for both package and direct execution
+try:
+    from vg.core.frame_store import find_frame_files, frame_file_index
+    from vg.core.kda_detector import KDADetector
+    from vg.core.proximity_index import ProximityIndex
+    from vg.core.record_scanner import FrameRecords, scan_frame
+    from vg.core.unified_decoder import (
+        OBJECTIVE_KILL_WINDOW,
+        DecodedPlayer,
+        GoldTracker,
+        ItemTracker,
+        ObjectiveEvent,
+        UnifiedDecoder,
+        _PLAYER_EID_RANGE,
+        _classify_objective_cluster,
+        _le_to_be,
+    )
+    from vg.core.vgr_parser import VGRParser
+except ImportError:
+    from frame_store import find_frame_files, frame_file_index
+    from kda_detector import KDADetector
+    from proximity_index import ProximityIndex
+    from record_scanner import FrameRecords, scan_frame
+    from unified_decoder import (
+        OBJECTIVE_KILL_WINDOW,
+        DecodedPlayer,
+        GoldTracker,
+        ItemTracker,
+        ObjectiveEvent,
+        UnifiedDecoder,
+        _PLAYER_EID_RANGE,
+        _classify_objective_cluster,
+        _le_to_be,
+    )
+    from vgr_parser import VGRParser
+
+
+class ObjectiveTracker:
+    """
+    Incremental objective clustering (same rules as UnifiedDecoder).
+
+    Objective deaths (eid > 60000) are clustered by timestamp as frames
+    arrive. The player-kill proximity check only looks inside the frame
+    that holds the death. Clustering assumes timestamps grow from frame to
+    frame, as they do in the replays the game writes.
+    """
+
+    def __init__(
+        self,
+        is_5v5: bool = False,
+        eid_threshold: int = 60000,
+        cluster_window: float = 5.0,
+    ):
+        self.is_5v5 = is_5v5
+        self.eid_threshold = eid_threshold
+        self.cluster_window = cluster_window
+        self.closed: List[ObjectiveEvent] = []
+        self._cluster: List[tuple] = []
+        self._cluster_kill = False
+        self.crystal_deaths: List[tuple] = []  # (ts, eid) for eid 2000-2005
+
+    def add_frame(self, records: FrameRecords) -> None:
+        deaths = []
+        for death in records.deaths:
+            if not death.valid:
+                continue
+            if death.eid > self.eid_threshold and 0 < death.timestamp < 5000:
+                deaths.append((death.timestamp, death.eid, death.offset))
+            elif 2000 <= death.eid <= 2005 and 60 < death.timestamp < 2400:
+                self.crystal_deaths.append((death.timestamp, death.eid))
+
+        kill_index = None
+        for death in sorted(deaths, key=lambda d: d[0]):
+            if self._cluster and death[0] - self._cluster[-1][0] > self.cluster_window:
+                self.closed.append(_classify_objective_cluster(
+                    self._cluster, self._cluster_kill, self.is_5v5,
+                ))
+                self._cluster = []
+                self._cluster_kill = False
+            self._cluster.append(death)
+            if not self._cluster_kill:
+                if kill_index is None:
+                    kill_index = ProximityIndex.from_frame_records([(0, records)])
+                self._cluster_kill = kill_index.has_kill_near(
+                    death[2], OBJECTIVE_KILL_WINDOW, _PLAYER_EID_RANGE,
+                )
+
+    @property
+    def events(self) -> List[ObjectiveEvent]:
+        """Closed clusters plus the still-open one (which may still grow)."""
+        events = list(self.closed)
+        if self._cluster:
+            events.append(_classify_objective_cluster(
+                self._cluster, self._cluster_kill, self.is_5v5,
+            ))
+        return events
+
+
+@dataclass
+class LiveScoreboard:
+    """Snapshot of the running match state after one frame."""
+    replay_name: str
+    frame_idx: int                     # Last frame consumed
+    frames_processed: int
+    game_time: Optional[float] = None  # Latest kill/death timestamp seen
+    game_mode: str = "Unknown"
+    left_team: List[DecodedPlayer] = field(default_factory=list)
+    right_team: List[DecodedPlayer] = field(default_factory=list)
+    objective_events: List[ObjectiveEvent] = field(default_factory=list)
+    crystal_death_ts: Optional[float] = None
+
+    @property
+    def all_players(self) -> List[DecodedPlayer]:
+        return self.left_team + self.right_team
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
+
+    def format_table(self) -> str:
+        """Plain-text scoreboard for terminal output."""
+        clock = f"{int(self.game_time) // 60}:{int(self.game_time) % 60:02d}" if self.game_time else "--:--"
+        lines = [f"{self.replay_name[:40]}  frame {self.frame_idx}  t={clock}"]
+        for label, team in (("LEFT", self.left_team), ("RIGHT", self.right_team)):
+            lines.append(f"  {label}")
+            for p in team:
+                assists = p.assists if p.assists is not None else 0
+                lines.append(
+                    f"    {p.name[:16]:<16} {p.hero_name[:12]:<12} "
+                    f"{p.kills:>2}/{p.deaths:>2}/{assists:>2}  "
+                    f"CS {p.minion_kills:>3}  gold {p.gold_earned:>6}  "
+                    f"items {len(p.items)}"
+                )
+        return "\n".join(lines)
+
+
+class LiveReplayDecoder:
+    """
+    Incremental decoder for one replay in a directory that is still growing.
+
+    Frames are consumed in index order, each exactly once. Frame files are
+    read with a plain read rather than mmap because the game may still hold
+    them open for writing.
+    """
+
+    def __init__(self, frame_dir: str, replay_name: str, parsed: Optional[Dict] = None):
+        """
+        Args:
+            frame_dir: Directory the frames are written to (e.g. Temp).
+            replay_name: Replay name without the `.N.vgr` suffix.
+            parsed: Optional preloaded `VGRParser.parse()` output; otherwise
+                    frame 0 is parsed when it becomes available.
+        """
+        self.frame_dir = Path(frame_dir)
+        self.replay_name = replay_name
+        self.last_frame_idx: Optional[int] = None
+        self.frames_processed = 0
+        self.bytes_processed = 0
+        self.game_time: Optional[float] = None
+        self.game_mode = "Unknown"
+        self.left_team: List[DecodedPlayer] = []
+        self.right_team: List[DecodedPlayer] = []
+        self._eid_map: Dict[int, DecodedPlayer] = {}  # BE -> player
+        self._team_map: Dict[int, str] = {}           # BE -> team
+        self.kda: Optional[KDADetector] = None
+        self.gold: Optional[GoldTracker] = None
+        self.items: Optional[ItemTracker] = None
+        self.objectives = ObjectiveTracker()
+        if parsed is not None:
+            self._init_players(parsed)
+
+    @classmethod
+    def from_temp_dir(cls, temp_path: str) -> Optional["LiveReplayDecoder"]:
+        """Attach to the replay currently being written in `temp_path`, if any.
+
+        Temp can still hold earlier replays, so the newest first frame wins.
+        """
+        newest = None
+        newest_mtime = None
+        for first_frame in Path(temp_path).glob('*.0.vgr'):
+            if first_frame.name.startswith('._'):
+                continue
+            try:
+                mtime = first_frame.stat().st_mtime_ns
+            except OSError:
+                continue  # Removed between glob and stat
+            if newest_mtime is None or mtime > newest_mtime:
+                newest, newest_mtime = first_frame, mtime
+        if newest is None:
+            return None
+        return cls(str(newest.parent), newest.stem.rsplit('.', 1)[0])
+
+    @property
+    def started(self) -> bool:
+        return self.kda is not None
+
+    def _init_players(self, parsed: Dict) -> None:
+        teams = parsed.get("teams", {})
+        self.left_team = [UnifiedDecoder._make_player(p) for p in teams.get("left", [])]
+        self.right_team = [UnifiedDecoder._make_player(p) for p in teams.get("right", [])]
+        self.game_mode = parsed.get("match_info", {}).get("mode", "Unknown")
+        self.objectives.is_5v5 = "5v5" in self.game_mode
+
+        for player in self.left_team + self.right_team:
+            if player.entity_id:
+                eid_be = _le_to_be(player.entity_id)
+                self._eid_map[eid_be] = player
+                self._team_map[eid_be] = player.team
+                player.assists = 0
+        valid_eids = set(self._eid_map)
+        self.kda = KDADetector(valid_eids)
+        self.gold = GoldTracker(valid_eids)
+        self.items = ItemTracker(valid_eids)
+
+    def _parse_first_frame(self) -> None:
+        first_frame = self.frame_dir / f"{self.replay_name}.0.vgr"
+        parsed = VGRParser(str(first_frame), auto_truth=False).parse()
+        self._init_players(parsed)
+
+    def feed_frame(self, frame_idx: int, data: bytes) -> LiveScoreboard:
+        """Consume one complete frame and return the updated scoreboard."""
+        if not self.started:
+            self._parse_first_frame()
+
+        records = scan_frame(data)
+        kills_before = len(self.kda.kill_table)
+        deaths_before = len(self.kda.death_table)
+        self.kda.process_frame(frame_idx, data, records)
+        self._tally_kda(kills_before, deaths_before)
+        self.gold.add_frame(records)
+        self.items.add_frame(records)
+        self.objectives.add_frame(records)
+
+        timestamps = [kill.timestamp for kill in records.kills
+                      if kill.valid and kill.timestamp is not None and 0 < kill.timestamp < 5000]
+        timestamps.extend(death.timestamp for death in records.deaths
+                          if death.valid and 0 < death.timestamp < 5000)
+        if timestamps:
+            self.game_time = max(self.game_time or 0.0, max(timestamps))
+
+        self.last_frame_idx = frame_idx
+        self.frames_processed += 1
+        self.bytes_processed += len(data)
+        return self.scoreboard()
+
+    def _tally_kda(self, kills_before: int, deaths_before: int) -> None:
+        """Add the kills, deaths and assists of the rows the last frame appended.
+
+        Counts match `KDADetector.get_results(team_map=...)` without a game
+        duration, without recounting earlier frames.
+        """
+        killer_eids = self.kda.kill_table.column("killer_eid")
+        for index in range(kills_before, len(killer_eids)):
+            self._eid_map[killer_eids[index]].kills += 1
+            for eid in self.kda.kill_assist_eids(index, self._team_map):
+                self._eid_map[eid].assists += 1
+        victim_eids = self.kda.death_table.column("victim_eid")
+        for index in range(deaths_before, len(victim_eids)):
+            self._eid_map[victim_eids[index]].deaths += 1
+
+    def scoreboard(self) -> LiveScoreboard:
+        """Current running state (players are copies, safe to keep)."""
+        if self.started:
+            minion_kills = self.kda.minion_kill_counts
+            for eid_be, player in self._eid_map.items():
+                player.minion_kills = minion_kills.get(eid_be, 0)
+                self.gold.apply(eid_be, player)
+                self.items.apply(eid_be, player)
+
+        crystal_ts = max((ts for ts, _ in self.objectives.crystal_deaths), default=None)
+        return LiveScoreboard(
+            replay_name=self.replay_name,
+            frame_idx=self.last_frame_idx if self.last_frame_idx is not None else -1,
+            frames_processed=self.frames_processed,
+            game_time=self.game_time,
+            game_mode=self.game_mode,
+            # Trackers replace the item lists rather than mutate them, so a
+            # shallow copy per player is enough
+            left_team=[copy.copy(player) for player in self.left_team],
+            right_team=[copy.copy(player) for player in self.right_team],
+            objective_events=self.objectives.events,
+            crystal_death_ts=crystal_ts,
+        )
+
+    def poll(self, final: bool = False) -> List[LiveScoreboard]:
+        """
+        Consume every newly completed frame.
+
+        Args:
+            final: Also consume the newest frame (the replay is finished).
+
+        Returns:
+            One scoreboard per consumed frame (empty when nothing is new).
+        """
+        new_frames = [
+            path for path in find_frame_files(self.frame_dir, self.replay_name)
+            if self.last_frame_idx is None or frame_file_index(path) > self.last_frame_idx
+        ]
+        if not final:
+            # The newest frame may still be being written
+            new_frames = new_frames[:-1]
+
+        boards = []
+        for path in new_frames:
+            try:
+                data = path.read_bytes()
+            except OSError:
+                break  # Removed or locked mid-match; retry on the next poll
+            boards.append(self.feed_frame(frame_file_index(path), data))
+        return boards
+
+    def finish(self) -> List[LiveScoreboard]:
+        """Consume the remaining frames once the replay has stopped growing."""
+        return self.poll(final=True)
+
+    def follow(
+        self,
+        interval: float = 1.0,
+        idle_timeout: float = 30.0,
+        on_update: Optional[Callable[[LiveScoreboard], None]] = None,
+    ) -> LiveScoreboard:
+        """
+        Poll until no new frame appears for `idle_timeout` seconds.
+
+        Args:
+            interval: Seconds between directory polls.
+            idle_timeout: Seconds without a new frame that end the match.
+            on_update: Called with each new scoreboard.
+
+        Returns:
+            The final scoreboard.
+        """
+        last_change = time.monotonic()
+        while True:
+            boards = self.poll()
+            idle = not boards and time.monotonic() - last_change >= idle_timeout
+            if boards:
+                last_change = time.monotonic()
+            if idle:
+                boards = self.finish()
+            if on_update is not None:
+                for board in boards:
+                    on_update(board)
+            if idle:
+                return self.scoreboard()
+            time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Live VGR decoder - running scoreboard for an in-progress replay'
+    )
+    parser.add_argument(
+        '-t', '--temp',
+        help='Temp directory the game writes replays to (default: system TEMP)'
+    )
+    parser.add_argument(
+        '-i', '--interval',
+        type=float,
+        default=1.0,
+        help='Poll interval in seconds (default: 1)'
+    )
+    parser.add_argument(
+        '--idle-timeout',
+        type=float,
+        default=30.0,
+        help='Seconds without a new frame before the match is considered over (default: 30)'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print one JSON scoreboard per line instead of a table'
+    )
+    args = parser.parse_args()
+
+    temp_path = args.temp or os.environ.get('TEMP', os.environ.get('TMP', 'C:\\Temp'))
+    live = None
+    while live is None:
+        live = LiveReplayDecoder.from_temp_dir(temp_path)
+        if live is None:
+            time.sleep(args.interval)
+
+    def show(board: LiveScoreboard) -> None:
+        if args.json:
+            print(json.dumps(board.to_dict(), ensure_ascii=False))
+        else:
+            print(board.format_table())
+            print()
+        sys.stdout.flush()
+
+    try:
+        live.follow(interval=args.interval, idle_timeout=args.idle_timeout, on_update=show)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
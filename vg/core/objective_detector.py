@@ -17,6 +17,11 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import List, Dict, Set, Optional
 
+try:
+    from vg.core.proximity_index import ProximityIndex
+except ImportError:
+    from proximity_index import ProximityIndex
+
 DEATH_HEADER = bytes([0x08, 0x04, 0x31])
 CREDIT_HEADER = bytes([0x10, 0x04, 0x1D])
 
@@ -107,7 +112,8 @@ class ObjectiveDetector:
     def get_captures(self,
                      team_map: Dict[int, str],
                      all_frame_data: bytes,
-                     confidence_threshold: float = 0.0) -> List[ObjectiveCapture]:
+                     confidence_threshold: float = 0.0,
+                     scan_range: int = 2000) -> List[ObjectiveCapture]:
         """
         Get detected objective captures with team identification.
 
@@ -115,18 +121,22 @@ class ObjectiveDetector:
             team_map: Dict mapping player entity ID (BE) -> team name ("left"/"right").
             all_frame_data: Concatenated replay frame data for credit scanning.
             confidence_threshold: Minimum confidence (0.0-1.0). Default 0.0 returns all.
+            scan_range: Bytes scanned around each death (see `_scan_credits_near`).
 
         Returns:
             List of ObjectiveCapture events.
         """
         captures = []
+        # One indexed scan of the replay serves every death's credit window
+        index = ProximityIndex.from_buffer(all_frame_data) if self._objective_deaths else None
 
         for obj_death in self._objective_deaths:
             # Scan credits near this objective death
             credits_by_action = self._scan_credits_near(
                 all_frame_data,
                 obj_death.file_offset,
-                scan_range=2000,
+                scan_range=scan_range,
+                index=index,
             )
 
             # Calculate team totals for action 0x06 and 0x08
@@ -171,7 +181,8 @@ class ObjectiveDetector:
     def _scan_credits_near(self,
                           data: bytes,
                           death_offset: int,
-                          scan_range: int = 2000) -> Dict[int, List[dict]]:
+                          scan_range: int = 2000,
+                          index: Optional[ProximityIndex] = None) -> Dict[int, List[dict]]:
         """
         Scan credit records near objective death, grouped by action byte.
 
@@ -179,6 +190,8 @@ class ObjectiveDetector:
             data: Full replay frame data.
             death_offset: Byte offset of objective death event.
             scan_range: Bytes to scan around death (default ±2000).
+            index: ProximityIndex of `data`; when given, credits are looked
+                   up instead of re-scanning the window.
 
         Returns:
             Dict mapping action byte -> list of credit records.
@@ -187,6 +200,21 @@ class ObjectiveDetector:
         start = max(0, death_offset - scan_range // 2)
         end = min(death_offset + scan_range, len(data))
 
+        if index is not None:
+            for pos, credit in index.credits_between(start, end):
+                # action is None when the record runs past the end of data
+                if credit.action is None or not credit.padding_ok:
+                    continue
+                value = credit.value
+                if credit.eid in self.valid_player_eids and not (value != value):  # not NaN
+                    credits_by_action[credit.action].append({
+                        "eid": credit.eid,
+                        "value": round(value, 2),
+                        "offset": pos,
+                        "dt_bytes": pos - death_offset,
+                    })
+            return credits_by_action
+
         pos = start
         while pos < end:
             if data[pos:pos+3] == CREDIT_HEADER and pos + 12 <= len(data):
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Proximity Index - sorted kill/credit offsets for byte-window queries.
+
+Objective classification asks "is there a player kill within ±500 bytes of
+this death?" and capture attribution asks "which credits lie around this
+death?". Answering that by slicing the replay around every death and
+re-running `find` costs a copy and a scan per query. A `ProximityIndex`
+holds every kill header hit (with its killer eid) and every credit record
+at replay-global offsets in sorted order, built once per replay from the
+already-scanned record streams, so each query is a bisect plus the few hits
+inside the window.
+
+Offsets follow the concatenated replay (`FrameStore.concat()`): a frame's
+records are shifted by the frame's start. Records are taken from their own
+frame, so a header split across two frame files is not indexed.
+
+Usage:
+    index = ProximityIndex.from_frame_records(frame_records, all_data)
+    if index.has_kill_near(death_offset, window=500, killer_eids=players):
+        ...
+    for offset, credit in index.credits_between(start, end):
+        ...
+"""
+
+from bisect import bisect_left
+from typing import Container, List, Optional, Sequence, Tuple
+
+try:
+    from vg.core.frame_store import Buffer
+    from vg.core.record_scanner import FrameRecords, ScannedCredit, scan_frame
+except ImportError:
+    from frame_store import Buffer
+    from record_scanner import FrameRecords, ScannedCredit, scan_frame
+
+# Bytes of a kill record needed to read its killer eid
+_KILL_EID_END = 7
+
+
+class ProximityIndex:
+    """Kill and credit records of a replay, sorted by global offset."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.kill_offsets: List[int] = []
+        self.killer_eids: List[int] = []
+        self.credit_offsets: List[int] = []
+        self.credits: List[ScannedCredit] = []
+
+    @classmethod
+    def from_frame_records(
+        cls,
+        frame_records: Sequence[Tuple[int, FrameRecords]],
+        data: Optional[Buffer] = None,
+    ) -> "ProximityIndex":
+        """
+        Index scanned frames.
+
+        Args:
+            frame_records: `(frame_idx, FrameRecords)` in frame order.
+            data: The concatenated replay (anything with `frame_start` and
+                  `len`); when omitted the frames are laid end to end by
+                  their record sizes.
+        """
+        starts = []
+        position_start = 0
+        for position, (_, records) in enumerate(frame_records):
+            if data is not None and hasattr(data, "frame_start"):
+                position_start = data.frame_start(position)
+            starts.append(position_start)
+            position_start += records.size
+        size = len(data) if data is not None else position_start
+
+        index = cls(size)
+        for base, (_, records) in zip(starts, frame_records):
+            index._add(records, base)
+        return index
+
+    @classmethod
+    def from_buffer(cls, data: Buffer) -> "ProximityIndex":
+        """Index one contiguous buffer (a frame or a joined replay)."""
+        index = cls(len(data))
+        index._add(scan_frame(data), 0)
+        return index
+
+    def _add(self, records: FrameRecords, base: int) -> None:
+        for kill in records.kills:
+            if kill.killer_eid is not None:
+                self.kill_offsets.append(base + kill.offset)
+                self.killer_eids.append(kill.killer_eid)
+        for credit in records.credits:
+            self.credit_offsets.append(base + credit.offset)
+            self.credits.append(credit)
+
+    def kills_near(self, offset: int, window: int) -> List[Tuple[int, int]]:
+        """(offset, killer_eid) of kill records inside `offset ± window`."""
+        lo = max(0, offset - window)
+        hi = min(self.size, offset + window) - _KILL_EID_END
+        kills = []
+        i = bisect_left(self.kill_offsets, lo)
+        while i < len(self.kill_offsets) and self.kill_offsets[i] <= hi:
+            kills.append((self.kill_offsets[i], self.killer_eids[i]))
+            i += 1
+        return kills
+
+    def has_kill_near(self, offset: int, window: int,
+                      killer_eids: Container[int]) -> bool:
+        """Whether a kill by one of `killer_eids` lies inside `offset ± window`."""
+        return any(eid in killer_eids for _, eid in self.kills_near(offset, window))
+
+    def credits_between(self, start: int, end: int) -> List[Tuple[int, ScannedCredit]]:
+        """(offset, credit) of credit records starting in [start, end)."""
+        i = bisect_left(self.credit_offsets, max(0, start))
+        j = bisect_left(self.credit_offsets, end, i)
+        return list(zip(self.credit_offsets[i:j], self.credits[i:j]))
@@ -0,0 +1,179 @@
+"""
+Record Scanner - single-pass extraction of the fixed-layout BE record families.
+
+Every detector used to run its own `bytes.find` loop over the same frames
+(kills, deaths and minion credits in KDADetector; items, gold, crystal and
+objectives in UnifiedDecoder; timestamp tails in decoder_v2 completeness).
+`scan_frame` finds all four header families with one compiled-regex pass
+per frame, decodes the fixed fields once and hands each family to the
+detectors as a typed, offset-sorted record stream.
+
+Record structures (Big Endian protocol):
+  Kill:         [18 04 1C] [00 00] [killer_eid BE] [FF FF FF FF] [3F 80 00 00] [29]
+                Timestamp: f32 BE at 7 bytes before header
+  Death:        [08 04 31] [00 00] [eid BE] [00 00] [timestamp f32 BE]
+  Credit:       [10 04 1D] [00 00] [eid BE] [value f32 BE] [action] [sell_flag]
+  Item acquire: [10 04 3D] [00 00] [eid BE] [00 00] [qty] [item_id LE] [00 00] [counter BE] [ts f32 BE @+17]
+
+The four headers cannot overlap each other, so a non-overlapping regex scan
+visits exactly the positions the per-family `find` loops visited. Fields a
+truncated record does not contain are `None`; the `valid` / `padding_ok`
+flags carry the structural checks the detectors applied before.
+
+Usage:
+    from vg.core.record_scanner import scan_frames
+
+    for frame_idx, records in scan_frames(frames):
+        for death in records.deaths:
+            if death.valid:
+                ...
+"""
+import re
+import struct
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+KILL_HEADER = bytes([0x18, 0x04, 0x1C])
+DEATH_HEADER = bytes([0x08, 0x04, 0x31])
+CREDIT_HEADER = bytes([0x10, 0x04, 0x1D])
+ITEM_ACQUIRE_HEADER = bytes([0x10, 0x04, 0x3D])
+
+_KILL, _DEATH, _CREDIT, _ITEM_ACQUIRE = 1, 2, 3, 4
+_RECORD_PATTERN = re.compile(b"|".join(
+    b"(" + re.escape(header) + b")"
+    for header in (KILL_HEADER, DEATH_HEADER, CREDIT_HEADER, ITEM_ACQUIRE_HEADER)
+))
+
+_PADDING = b'\x00\x00'
+_KILL_MARKER = b'\xFF\xFF\xFF\xFF'
+_KILL_FLAG = b'\x3F\x80\x00\x00'
+
+_BE_U16 = struct.Struct(">H")
+_LE_U16 = struct.Struct("<H")
+_BE_F32 = struct.Struct(">f")
+
+
+@dataclass
+class ScannedKill:
+    """Kill header hit. `valid` = full 16-byte kill structure (any eid)."""
+    offset: int
+    killer_eid: Optional[int]
+    timestamp: Optional[float]  # Raw f32 before the header, None when pos < 7
+    valid: bool
+
+
+@dataclass
+class ScannedDeath:
+    """Death header hit. `valid` = complete record with both padding pairs."""
+    offset: int
+    eid: Optional[int]
+    timestamp: Optional[float]
+    valid: bool
+
+
+@dataclass
+class ScannedCredit:
+    """Credit header hit. Fields are None when the frame ends first."""
+    offset: int
+    eid: Optional[int]
+    value: Optional[float]
+    action: Optional[int]
+    sell_flag: Optional[int]
+    padding_ok: bool
+
+
+@dataclass
+class ScannedItemAcquire:
+    """Item acquire header hit. `valid` = 20-byte record with padding."""
+    offset: int
+    eid: Optional[int]
+    qty: Optional[int]
+    item_id: Optional[int]
+    timestamp: Optional[float]
+    valid: bool
+
+
+@dataclass
+class FrameRecords:
+    """All record streams of one frame, each sorted by offset."""
+    size: int
+    kills: List[ScannedKill] = field(default_factory=list)
+    deaths: List[ScannedDeath] = field(default_factory=list)
+    credits: List[ScannedCredit] = field(default_factory=list)
+    item_acquires: List[ScannedItemAcquire] = field(default_factory=list)
+    credit_offsets: List[int] = field(default_factory=list)
+    valid_kill_offsets: List[int] = field(default_factory=list)
+
+
+def scan_frame(data: bytes) -> FrameRecords:
+    """Find and decode every kill/death/credit/item-acquire record in one pass."""
+    size = len(data)
+    records = FrameRecords(size=size)
+    kills = records.kills
+    deaths = records.deaths
+    credits = records.credits
+    items = records.item_acquires
+
+    for match in _RECORD_PATTERN.finditer(data):
+        pos = match.start()
+        family = match.lastindex
+
+        if family == _CREDIT:
+            padding_ok = data[pos + 3:pos + 5] == _PADDING
+            credits.append(ScannedCredit(
+                offset=pos,
+                eid=_BE_U16.unpack_from(data, pos + 5)[0] if pos + 7 <= size else None,
+                value=_BE_F32.unpack_from(data, pos + 7)[0] if pos + 11 <= size else None,
+                action=data[pos + 11] if pos + 12 <= size else None,
+                sell_flag=data[pos + 12] if pos + 13 <= size else None,
+                padding_ok=padding_ok,
+            ))
+            records.credit_offsets.append(pos)
+
+        elif family == _DEATH:
+            valid = (
+                pos + 13 <= size
+                and data[pos + 3:pos + 5] == _PADDING
+                and data[pos + 7:pos + 9] == _PADDING
+            )
+            deaths.append(ScannedDeath(
+                offset=pos,
+                eid=_BE_U16.unpack_from(data, pos + 5)[0] if valid else None,
+                timestamp=_BE_F32.unpack_from(data, pos + 9)[0] if valid else None,
+                valid=valid,
+            ))
+
+        elif family == _KILL:
+            valid = (
+                pos + 16 <= size
+                and data[pos + 3:pos + 5] == _PADDING
+                and data[pos + 7:pos + 11] == _KILL_MARKER
+                and data[pos + 11:pos + 15] == _KILL_FLAG
+                and data[pos + 15] == 0x29
+            )
+            kills.append(ScannedKill(
+                offset=pos,
+                killer_eid=_BE_U16.unpack_from(data, pos + 5)[0] if pos + 7 <= size else None,
+                timestamp=_BE_F32.unpack_from(data, pos - 7)[0] if pos >= 7 else None,
+                valid=valid,
+            ))
+            if valid:
+                records.valid_kill_offsets.append(pos)
+
+        else:
+            valid = pos + 20 <= size and data[pos + 3:pos + 5] == _PADDING
+            items.append(ScannedItemAcquire(
+                offset=pos,
+                eid=_BE_U16.unpack_from(data, pos + 5)[0] if valid else None,
+                qty=data[pos + 9] if valid else None,
+                item_id=_LE_U16.unpack_from(data, pos + 10)[0] if valid else None,
+                timestamp=_BE_F32.unpack_from(data, pos + 17)[0] if valid and pos + 21 <= size else None,
+                valid=valid,
+            ))
+
+    return records
+
+
+def scan_frames(frames: Sequence[Tuple[int, bytes]]) -> List[Tuple[int, FrameRecords]]:
+    """Scan every `(frame_idx, data)` frame once."""
+    return [(frame_idx, scan_frame(data)) for frame_idx, data in frames]
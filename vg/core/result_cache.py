@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Result Cache - content-addressed, size-bounded cache of decode payloads.
+
+Research reports decode the same fixtures again every time they are
+regenerated. `ResultCache` stores the JSON payload of a decode
+(`DecodedMatch.to_dict()`, `DecoderV2MatchOutput.to_dict()`) under a key
+made of:
+  - the payload kind ("unified", "decoder_v2"),
+  - a SHA-256 of the replay's frame contents (`replay_content_hash`),
+  - `decoder_version()`: a digest of the decoder sources (every vg module
+    the decoder entry points import, directly or transitively) and of the
+    claim registry.
+Renaming or moving a replay keeps its entries; editing a frame, the decoder
+or a registry claim misses. Because a hit may come from a copy stored under
+another name, the location fields (`LOCATION_FIELDS`) of a returned payload
+are rewritten for the replay the caller asked for.
+
+Entries are gzip'd JSON files in one directory, so every tool and worker
+process shares them. Reads refresh an entry's mtime and writes evict the
+least recently used entries once the directory exceeds its size budget.
+
+The shared cache is opt-in through the environment:
+    VG_DECODE_CACHE      cache directory (unset: caching disabled)
+    VG_DECODE_CACHE_MB   size budget in MB (default 512)
+
+Usage:
+    from vg.core.result_cache import cached_payload
+
+    payload = cached_payload(
+        "decoder_v2", replay_file, lambda: decode_match(replay_file).to_dict(),
+    )
+"""
+
+import ast
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from vg.core.event_index import frame_signature
+    from vg.core.frame_store import find_frame_files, replay_content_hash
+except ImportError:
+    from event_index import frame_signature
+    from frame_store import find_frame_files, replay_content_hash
+
+CACHE_ENV = 'VG_DECODE_CACHE'
+CACHE_SIZE_ENV = 'VG_DECODE_CACHE_MB'
+DEFAULT_MAX_MB = 512
+ENTRY_SUFFIX = '.json.gz'
+
+# Payload fields naming the replay's location rather than its content
+LOCATION_FIELDS = ('replay_file', 'replay_path', 'replay_name')
+
+# Entry points of the cached decoders, relative to the vg package
+_DECODER_ENTRY_POINTS = ('core/unified_decoder.py', 'decoder_v2/decode_match.py')
+
+
+def _module_file(vg_root: Path, parts: List[str]) -> Optional[Path]:
+    """Source file of vg module `parts` (package __init__ for packages)."""
+    base = vg_root.joinpath(*parts) if parts else vg_root
+    for candidate in (base.with_suffix('.py'), base / '__init__.py'):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_sources(vg_root: Path, path: Path) -> Set[Path]:
+    """vg source files imported anywhere in `path` (including lazy imports)."""
+    package = list(path.relative_to(vg_root).parent.parts)
+    found = set()
+
+    def add(parts: List[str]) -> None:
+        # Imported packages run their __init__ as well
+        for depth in range(1, len(parts) + 1):
+            module = _module_file(vg_root, parts[:depth])
+            if module is not None:
+                found.add(module)
+
+    for node in ast.walk(ast.parse(path.read_bytes())):
+        if isinstance(node, ast.Import):
+            targets = [alias.name.split('.') for alias in node.names]
+            targets = [parts[1:] for parts in targets if parts[0] == 'vg']
+        elif isinstance(node, ast.ImportFrom):
+            module = node.module.split('.') if node.module else []
+            if node.level:
+                module = package[:len(package) - node.level + 1] + module
+            elif module[:1] == ['vg']:
+                module = module[1:]
+            else:
+                module = package + module  # script-mode fallback: `from event_index import ...`
+            # `from pkg import name` may import submodule `name`
+            targets = [module] + [module + [alias.name] for alias in node.names]
+        else:
+            continue
+        for parts in targets:
+            if parts and _module_file(vg_root, parts) is not None:
+                add(parts)
+    return found
+
+
+def decoder_sources() -> List[Path]:
+    """Every vg source file the cached decoders import, sorted."""
+    vg_root = Path(__file__).resolve().parent.parent
+    pending = [vg_root / entry for entry in _DECODER_ENTRY_POINTS]
+    seen: Set[Path] = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        pending.extend(_imported_sources(vg_root, path) - seen)
+    return sorted(seen)
+
+
+@lru_cache(maxsize=None)
+def decoder_version() -> str:
+    """Digest of the decoder source files plus the claim registry state."""
+    # Imported lazily: vg.decoder_v2 imports the core decoder modules itself.
+    from vg.decoder_v2.registry import registry_version
+
+    digest = hashlib.sha1()
+    vg_root = Path(__file__).resolve().parent.parent
+    for path in decoder_sources():
+        digest.update(path.relative_to(vg_root).as_posix().encode('utf-8'))
+        digest.update(path.read_bytes())
+    return f"{registry_version()}:{digest.hexdigest()[:12]}"
+
+
+class ResultCache:
+    """LRU, size-bounded directory of decode payloads keyed by content."""
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+                 version: Optional[str] = None):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.version = version if version is not None else decoder_version()
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None  # running estimate, rescanned on eviction
+        self._hashes: Dict[Tuple[str, str], str] = {}
+
+    def entry_path(self, kind: str, content_hash: str) -> Path:
+        key = hashlib.sha256(f"{kind}:{self.version}:{content_hash}".encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{kind}-{key}{ENTRY_SUFFIX}"
+
+    def get(self, kind: str, content_hash: str) -> Optional[Dict[str, Any]]:
+        path = self.entry_path(kind, content_hash)
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                payload = json.load(f)
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return payload
+
+    def put(self, kind: str, content_hash: str, payload: Dict[str, Any]) -> None:
+        path = self.entry_path(kind, content_hash)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with gzip.open(os.fdopen(fd, 'wb'), 'wt', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_name, path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        if self._size is None:
+            self._size = self._scan_size()
+        else:
+            self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self.evict()
+
+    def content_hash(self, replay_file: str) -> Optional[str]:
+        """Frame content hash, or None when the replay has no frame files."""
+        replay_path = Path(replay_file)
+        frame_paths = find_frame_files(replay_path.parent, replay_path.stem.rsplit('.', 1)[0])
+        if not frame_paths:
+            return None
+        # Rehash only when a frame file's size or mtime moved
+        memo_key = (str(replay_path.resolve()), json.dumps(frame_signature(frame_paths)))
+        if memo_key not in self._hashes:
+            self._hashes[memo_key] = replay_content_hash(replay_file)
+        return self._hashes[memo_key]
+
+    def get_or_decode(self, kind: str, replay_file: str,
+                      decode: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Cached payload for a replay, running `decode()` on a miss."""
+        content_hash = self.content_hash(replay_file)
+        if content_hash is None:
+            return decode()
+        payload = self.get(kind, content_hash)
+        if payload is not None:
+            self.hits += 1
+            return relocate_payload(payload, replay_file)
+        self.misses += 1
+        payload = decode()
+        self.put(kind, content_hash, payload)
+        return payload
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # evicted by another process
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def evict(self) -> int:
+        """Delete least recently used entries until within budget; returns count removed."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            total -= size
+            removed += 1
+        self._size = total
+        return removed
+
+    def clear(self) -> None:
+        for _, _, path in self._entries():
+            path.unlink()
+        self._size = 0
+
+
+def relocate_payload(payload: Dict[str, Any], replay_file: str) -> Dict[str, Any]:
+    """Point a payload's location fields at `replay_file` (as the decoders report it)."""
+    replay_path = Path(replay_file)
+    location = {
+        'replay_file': str(replay_path),
+        'replay_path': str(replay_path),
+        'replay_name': replay_path.stem.rsplit('.', 1)[0],
+    }
+    for field in LOCATION_FIELDS:
+        if field in payload:
+            payload[field] = location[field]
+    return payload
+
+
+_shared: Dict[Tuple[str, int], ResultCache] = {}
+
+
+def default_cache() -> Optional[ResultCache]:
+    """The shared cache configured by VG_DECODE_CACHE, or None when unset."""
+    cache_dir = os.environ.get(CACHE_ENV)
+    if not cache_dir:
+        return None
+    max_bytes = int(float(os.environ.get(CACHE_SIZE_ENV, DEFAULT_MAX_MB)) * 1024 * 1024)
+    key = (cache_dir, max_bytes)
+    if key not in _shared:
+        _shared[key] = ResultCache(cache_dir, max_bytes=max_bytes)
+    return _shared[key]
+
+
+def cached_payload(kind: str, replay_file: str,
+                   decode: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """`decode()` through the shared cache (a plain call when caching is off)."""
+    cache = default_cache()
+    if cache is None:
+        return decode()
+    return cache.get_or_decode(kind, str(replay_file), decode)
@@ -46,13 +46,23 @@ from typing import Dict, List, Optional, Set, Tuple
 # Local imports with fallback for both package and direct execution
 try:
     from vg.core.vgr_parser import VGRParser
+    from vg.core.decode_metrics import DecodeMetrics, frame_record_counters
+    from vg.core.event_index import default_index_dir, load_entity_lifecycle, load_frame_records
+    from vg.core.frame_store import FrameStore
     from vg.core.kda_detector import KDADetector
+    from vg.core.proximity_index import ProximityIndex
+    from vg.core.record_scanner import FrameRecords, scan_frames
     from vg.core.vgr_mapping import ITEM_ID_MAP
     from vg.analysis.win_loss_detector import WinLossDetector
 except ImportError:
     try:
         from vgr_parser import VGRParser
+        from decode_metrics import DecodeMetrics, frame_record_counters
+        from event_index import default_index_dir, load_entity_lifecycle, load_frame_records
+        from frame_store import FrameStore
         from kda_detector import KDADetector
+        from proximity_index import ProximityIndex
+        from record_scanner import FrameRecords, scan_frames
         from vgr_mapping import ITEM_ID_MAP
         _root = Path(__file__).resolve().parent.parent
         sys.path.insert(0, str(_root.parent))
@@ -67,6 +77,8 @@ _CREDIT_HEADER = bytes([0x10, 0x04, 0x1D])
 _DEATH_HEADER = bytes([0x08, 0x04, 0x31])
 _KILL_HEADER = bytes([0x18, 0x04, 0x1C])
 _PLAYER_EID_RANGE = set(range(1500, 1510))  # BE entity IDs for players
+# ±bytes around an objective death searched for a player kill
+OBJECTIVE_KILL_WINDOW = 500
 
 # ===== ITEM BUILD ESTIMATION =====
 # Upgrade tree using BINARY REPLAY IDs (from ITEM_ID_MAP)
@@ -273,17 +285,163 @@ class DecodedMatch:
     win_detection_used: bool = False
     item_detection_used: bool = False
     team_labels_reliable: bool = False  # left/right labels may not match API convention
+    # Per-stage timings/counters, only with UnifiedDecoder(collect_metrics=True)
+    metrics: Optional[DecodeMetrics] = field(default=None, repr=False, compare=False)
 
     @property
     def all_players(self) -> List[DecodedPlayer]:
         return self.left_team + self.right_team
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        data = asdict(self)
+        if self.metrics is None:
+            del data["metrics"]
+        else:
+            data["metrics"] = self.metrics.to_dict()
+        return data
 
     def to_json(self, indent: int = 2) -> str:
         return json.dumps(self.to_dict(), indent=indent, ensure_ascii=False)
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DecodedMatch':
+        """Rebuild a match from `to_dict()` output (metrics are not restored)."""
+        fields = {key: value for key, value in data.items() if key != "metrics"}
+        fields["left_team"] = [DecodedPlayer(**p) for p in data.get("left_team", [])]
+        fields["right_team"] = [DecodedPlayer(**p) for p in data.get("right_team", [])]
+        fields["objective_events"] = [ObjectiveEvent(**e) for e in data.get("objective_events", [])]
+        return cls(**fields)
+
+
+class GoldTracker:
+    """
+    Running per-player gold from [10 04 1D] credit records, fed frame by frame.
+
+    action 0x06: negative value = gold spent, positive = gold earned
+                 (sell_flag 0x01 marks item sell-back refunds, excluded)
+    action 0x0D: jungle kill credit
+    """
+
+    def __init__(self, valid_eids: Set[int]):
+        self.valid_eids = valid_eids
+        self.spent: Dict[int, float] = defaultdict(float)
+        self.earned: Dict[int, float] = defaultdict(float)
+        self.jungle_kills: Dict[int, int] = defaultdict(int)
+
+    def add_frame(self, records: FrameRecords) -> None:
+        for credit in records.credits:
+            if credit.sell_flag is None or not credit.padding_ok:
+                continue
+            eid = credit.eid
+            if eid not in self.valid_eids:
+                continue
+
+            value = credit.value
+            if not math.isnan(value) and not math.isinf(value):
+                if credit.action == 0x06:
+                    if value < 0:
+                        self.spent[eid] += abs(value)
+                    elif value > 0 and credit.sell_flag != 0x01:
+                        self.earned[eid] += value
+                elif credit.action == 0x0D:
+                    self.jungle_kills[eid] += 1
+
+    def apply(self, eid: int, player: 'DecodedPlayer') -> None:
+        """Write the running totals for `eid` onto a player."""
+        if eid in self.spent:
+            player.gold_spent = round(self.spent[eid])
+        player.gold_earned = 600 + round(self.earned.get(eid, 0))
+        if eid in self.jungle_kills:
+            player.jungle_kills = self.jungle_kills[eid]
+
+
+class ItemTracker:
+    """
+    Running per-player item purchases from [10 04 3D] acquire records.
+
+    Item acquire: [10 04 3D][00 00][eid BE][00 00][qty][item_id LE][00 00][counter BE][ts f32 BE]
+    """
+
+    def __init__(self, valid_eids: Set[int]):
+        self.valid_eids = valid_eids
+        self.items: Dict[int, Set[int]] = defaultdict(set)  # eid -> set of item_ids
+        self.last_ts: Dict[int, Dict[int, float]] = defaultdict(dict)  # eid -> {item_id: last_ts}
+
+    def add_frame(self, records: FrameRecords) -> None:
+        for item in records.item_acquires:
+            if not item.valid or item.eid not in self.valid_eids:
+                continue
+
+            # qty=1 + IDs 200-255 = standard item purchase
+            # qty=2 + IDs 0-27 = T3/special item completion (NOT ability upgrades)
+            #   Per-player analysis: only 2-5 qty=2 events (too few for abilities)
+            #   Hero distribution matches item buyers perfectly
+            # ID 14 is universal (system event, not an item) - filtered below
+            if item.qty not in (1, 2):
+                continue
+
+            item_id = item.item_id
+            # Normalize encoding artifacts (e.g., 65505=0xFFE1 → 225=0xE1)
+            if item_id > 255:
+                item_id = item_id & 0xFF
+            item_info = ITEM_ID_MAP.get(item_id)
+            if item_info:
+                self.items[item.eid].add(item_id)
+                # Track last acquire timestamp per item
+                ts = item.timestamp
+                if ts is not None and 0 < ts < 5000:
+                    self.last_ts[item.eid][item_id] = ts
+
+    def apply(self, eid: int, player: 'DecodedPlayer') -> None:
+        """Write purchases and the estimated final build for `eid` onto a player."""
+        item_ids = self.items.get(eid)
+        if not item_ids:
+            return
+        # Store all purchased items (raw)
+        all_purchased = []
+        for iid in sorted(item_ids):
+            info = ITEM_ID_MAP.get(iid)
+            if info:
+                all_purchased.append(info['name'])
+        player.items_all_purchased = all_purchased
+
+        # Apply upgrade tree to get final build (max 6 slots)
+        # Pass timestamps for sell-back resolution
+        player.items = _estimate_final_build(
+            item_ids, last_acquire_ts=self.last_ts.get(eid),
+        )
+
+
+def _classify_objective_cluster(
+    cluster: List[tuple],
+    player_kill: bool,
+    is_5v5: bool = False,
+) -> ObjectiveEvent:
+    """
+    Classify a time cluster of (timestamp, eid, offset) objective deaths.
+
+      - n=1, no player kill nearby → GOLD_MINE_CAPTURE (5v5: GHOSTWING_CAPTURE)
+      - n=1, player kill nearby    → KRAKEN_DEATH (5v5: BLACKCLAW_DEATH)
+      - n>1, player kill nearby    → KRAKEN_WAVE (5v5: BLACKCLAW_WAVE)
+      - n>1 otherwise              → MINION_WAVE
+    """
+    n = len(cluster)
+    if n == 1 and not player_kill:
+        event_type = "GHOSTWING_CAPTURE" if is_5v5 else "GOLD_MINE_CAPTURE"
+    elif n == 1 and player_kill:
+        event_type = "BLACKCLAW_DEATH" if is_5v5 else "KRAKEN_DEATH"
+    elif n > 1 and player_kill:
+        event_type = "BLACKCLAW_WAVE" if is_5v5 else "KRAKEN_WAVE"
+    else:
+        event_type = "MINION_WAVE"
+
+    return ObjectiveEvent(
+        timestamp=round(cluster[0][0], 2),
+        event_type=event_type,
+        entity_count=n,
+        entity_ids=[d[1] for d in cluster],
+    )
+
 
 class UnifiedDecoder:
     """
@@ -293,12 +451,19 @@ class UnifiedDecoder:
     to produce a fully decoded match result.
     """
 
-    def __init__(self, replay_path: str):
+    def __init__(self, replay_path: str, use_index: bool = True, collect_metrics: bool = False):
         """
         Args:
             replay_path: Path to .0.vgr file or replay cache folder.
+            use_index: Load scanned records from the `.vgidx` sidecar when
+                       VG_EVENT_INDEX is set and the sidecar is fresh (and
+                       write it on a miss). False always rescans.
+            collect_metrics: Attach per-step wall time, bytes scanned and
+                             record counters as `DecodedMatch.metrics`.
         """
         self.replay_path = Path(replay_path)
+        self.use_index = use_index
+        self.collect_metrics = collect_metrics
 
     def decode(self, detect_items: bool = False) -> DecodedMatch:
         """
@@ -310,6 +475,19 @@ class UnifiedDecoder:
         Returns:
             DecodedMatch with all detected fields populated.
         """
+        # The frames stay mapped for the whole pipeline and are unmapped here
+        self._frame_store: Optional[FrameStore] = None
+        try:
+            return self._decode(detect_items)
+        finally:
+            if self._frame_store is not None:
+                self._frame_store.close()
+                self._frame_store = None
+
+    def _decode(self, detect_items: bool) -> DecodedMatch:
+        metrics = DecodeMetrics(replay=str(self.replay_path))
+        collect = self.collect_metrics
+
         # --- Step 1: Basic parsing (frame 0) ---
         parser = VGRParser(
             str(self.replay_path),
@@ -334,9 +512,22 @@ class UnifiedDecoder:
         left_team = [self._make_player(p) for p in left_parsed]
         right_team = [self._make_player(p) for p in right_parsed]
         all_players = left_team + right_team
+        stage = metrics.lap("parse")
+        if collect:
+            stage.bytes_scanned = parsed.get("file_size_bytes", 0)
+            stage.count("players", len(all_players))
 
-        # --- Step 2: Load all frames ---
+        # --- Step 2: Load all frames, scan all record families once ---
         frames = self._load_frames(frame_dir, frame_name)
+        # The index keys the files on disk, so let it read them itself
+        indexed = self.use_index and default_index_dir() is not None
+        frame_records = load_frame_records(
+            frame_dir, frame_name, None if indexed else frames, use_index=self.use_index,
+        )
+        stage = metrics.lap("load_frames")
+        if collect:
+            stage.bytes_scanned = sum(len(data) for _, data in frames)
+            stage.update(frame_record_counters(frame_records))
 
         # --- Step 3: KDA Scanning (event collection only, no filtering yet) ---
         kda_used = False
@@ -346,8 +537,12 @@ class UnifiedDecoder:
         team_map_kda = {}    # BE -> team name
         if frames and all_players:
             kda_detector, eid_map_be_kda, team_map_kda, duration_est = \
-                self._scan_kda_events(frames, all_players)
+                self._scan_kda_events(frames, all_players, frame_records)
             kda_used = kda_detector is not None
+        stage = metrics.lap("kda_scan")
+        if collect and kda_detector is not None:
+            stage.count("kill_events", len(kda_detector.kill_events))
+            stage.count("death_events", len(kda_detector.death_events))
 
         # --- Step 4: Win/Loss Detection ---
         # Strategy: WinLossDetector for crystal destruction detection,
@@ -357,24 +552,35 @@ class UnifiedDecoder:
         win_used = False
         winner = None
         crystal_detected = False
+        detector = None
         try:
-            import io
-            detector = WinLossDetector(str(self.replay_path))
-            old_stdout = sys.stdout
-            sys.stdout = io.StringIO()
-            try:
-                outcome = detector.detect_winner()
-            finally:
-                sys.stdout = old_stdout
+            # Indexed decodes take the entity lifecycle from the sidecar as well
+            entity_stats: Dict[str, int] = {}
+            entity_data = (
+                load_entity_lifecycle(frame_dir, frame_name, stats=entity_stats)
+                if indexed and frames else None
+            )
+            detector = WinLossDetector(
+                str(self.replay_path), verbose=False, frames=frames, entity_data=entity_data,
+            )
+            detector.stats.update(entity_stats)
+            outcome = detector.detect_winner()
             if outcome:
                 crystal_detected = True
                 win_used = True
         except Exception:
             pass
+        stage = metrics.lap("win_loss")
+        if collect and detector is not None:
+            stats = dict(detector.stats)
+            stage.bytes_scanned = stats.pop("bytes_scanned", 0)
+            stage.update(stats)
+            stage.count("crystal_detected", int(crystal_detected))
 
         # --- Step 5: Per-player Item Detection via [10 04 3D] ---
+        # Virtual concatenation over the mapped frames (no joined copy)
         item_used = False
-        all_data = b"".join(data for _, data in frames) if frames else b""
+        all_data = FrameStore(frames).concat()
         if all_data and all_players:
             eid_map_be = {}
             for player in all_players:
@@ -382,17 +588,23 @@ class UnifiedDecoder:
                     eid_be = _le_to_be(player.entity_id)
                     eid_map_be[eid_be] = player
             if eid_map_be:
-                self._detect_items_per_player(all_data, eid_map_be)
-                self._detect_gold_per_player(frames, eid_map_be)
+                self._detect_items_per_player(frame_records, eid_map_be)
+                self._detect_gold_per_player(frame_records, eid_map_be)
                 item_used = True
+        stage = metrics.lap("items_gold")
+        if collect:
+            stage.count("players_with_items", sum(1 for p in all_players if p.items))
 
         # --- Step 6: Crystal Death Detection ---
         crystal_ts = None
         crystal_eid = None
         if all_data:
             crystal_ts, crystal_eid = self._detect_crystal_death(
-                all_data, duration_est
+                frame_records, duration_est
             )
+        stage = metrics.lap("crystal")
+        if collect:
+            stage.count("crystal_found", int(crystal_ts is not None))
 
         # --- Step 7: Duration estimation ---
         # Crystal death is preferred but eid 2000-2005 can be turrets.
@@ -424,6 +636,11 @@ class UnifiedDecoder:
                     player.deaths = kda.deaths
                     player.assists = kda.assists
                     player.minion_kills = kda.minion_kills
+        stage = metrics.lap("duration")
+        if collect:
+            stage.count("kills", sum(p.kills for p in all_players))
+            stage.count("deaths", sum(p.deaths for p in all_players))
+            stage.count("assists", sum(p.assists or 0 for p in all_players))
 
         # KDA-based winner: team with more kills wins (consistent
         # with VGRParser's team label convention).
@@ -445,11 +662,14 @@ class UnifiedDecoder:
         objective_events = []
         if all_data:
             objective_events = self._detect_objective_events(
-                all_data, is_5v5=is_5v5,
+                all_data, frame_records, is_5v5=is_5v5,
             )
+        stage = metrics.lap("objectives")
+        if collect:
+            stage.count("objective_events", len(objective_events))
 
         # --- Step 9: Assemble result ---
-        return DecodedMatch(
+        match = DecodedMatch(
             replay_name=replay_name,
             replay_path=str(replay_file),
             game_mode=match_info.get("mode", "Unknown"),
@@ -467,6 +687,10 @@ class UnifiedDecoder:
             win_detection_used=win_used,
             item_detection_used=item_used,
         )
+        metrics.lap("assemble")
+        if collect:
+            match.metrics = metrics
+        return match
 
     def decode_with_truth(self, truth_path: str) -> DecodedMatch:
         """
@@ -506,7 +730,8 @@ class UnifiedDecoder:
 
         return match
 
-    def _make_player(self, p: Dict) -> DecodedPlayer:
+    @staticmethod
+    def _make_player(p: Dict) -> DecodedPlayer:
         """Convert parser player dict to DecodedPlayer."""
         return DecodedPlayer(
             name=p.get("name", "Unknown"),
@@ -517,28 +742,22 @@ class UnifiedDecoder:
         )
 
     def _load_frames(self, frame_dir: Path, replay_name: str) -> List[tuple]:
-        """Load all frame files as (frame_idx, data) tuples."""
-        frame_files = list(frame_dir.glob(f"{replay_name}.*.vgr"))
-        if not frame_files:
-            return []
-
-        def _idx(p: Path) -> int:
-            try:
-                return int(p.stem.split('.')[-1])
-            except ValueError:
-                return 0
-
-        frame_files.sort(key=_idx)
-        return [(_idx(f), f.read_bytes()) for f in frame_files]
+        """Load all frame files as memory-mapped (frame_idx, data) tuples, closed by decode()."""
+        self._frame_store = FrameStore.open(frame_dir, replay_name)
+        return self._frame_store.frames
 
     def _scan_kda_events(
         self,
         frames: List[tuple],
         all_players: List[DecodedPlayer],
+        frame_records: Optional[List[tuple]] = None,
     ) -> tuple:
         """
         Scan all frames for KDA events (no filtering applied yet).
 
+        `frame_records` is the shared `scan_frames(frames)` output; when
+        omitted the frames are scanned here.
+
         Returns:
             (detector, eid_map, team_map, duration_estimate)
             detector is None if no valid entity IDs found.
@@ -557,9 +776,11 @@ class UnifiedDecoder:
         if not valid_eids:
             return None, {}, {}, None
 
+        if frame_records is None:
+            frame_records = scan_frames(frames)
         detector = KDADetector(valid_eids)
-        for frame_idx, data in frames:
-            detector.process_frame(frame_idx, data)
+        for (frame_idx, data), (_, records) in zip(frames, frame_records):
+            detector.process_frame(frame_idx, data, records)
 
         # Estimate duration from max death timestamp
         duration_est = None
@@ -570,87 +791,34 @@ class UnifiedDecoder:
 
     def _detect_items_per_player(
         self,
-        all_data: bytes,
+        frame_records: List[tuple],
         eid_map: Dict[int, 'DecodedPlayer'],
     ) -> None:
         """
-        Scan [10 04 3D] item acquire events and [10 04 1D] action=0x06
-        purchase costs. Assigns per-player items (final build after upgrade tree)
-        and gold_spent.
+        Collect [10 04 3D] item acquire events from the scanned record streams
+        and assign per-player items (final build after upgrade tree).
 
         Item acquire: [10 04 3D][00 00][eid BE][00 00][qty][item_id LE][00 00][counter BE][ts f32 BE]
-        Purchase cost: [10 04 1D][00 00][eid BE][cost f32 BE (negative)][06]
-        """
-        valid_eids = set(eid_map.keys())
-
-        # --- Scan item acquire events ---
-        player_items: Dict[int, Set[int]] = defaultdict(set)  # eid -> set of item_ids
-        player_item_ts: Dict[int, Dict[int, float]] = defaultdict(dict)  # eid -> {item_id: last_ts}
-        pos = 0
-        while True:
-            pos = all_data.find(_ITEM_ACQUIRE_HEADER, pos)
-            if pos == -1:
-                break
-            if pos + 20 > len(all_data):
-                pos += 1
-                continue
-            if all_data[pos + 3:pos + 5] != b'\x00\x00':
-                pos += 1
-                continue
-
-            eid = struct.unpack_from(">H", all_data, pos + 5)[0]
-            if eid not in valid_eids:
-                pos += 1
-                continue
 
-            # qty=1 + IDs 200-255 = standard item purchase
-            # qty=2 + IDs 0-27 = T3/special item completion (NOT ability upgrades)
-            #   Per-player analysis: only 2-5 qty=2 events (too few for abilities)
-            #   Hero distribution matches item buyers perfectly
-            # ID 14 is universal (system event, not an item) - filtered below
-            qty = all_data[pos + 9]
-            if qty not in (1, 2):
-                pos += 3
-                continue
-
-            item_id = struct.unpack_from("<H", all_data, pos + 10)[0]
-            # Normalize encoding artifacts (e.g., 65505=0xFFE1 → 225=0xE1)
-            if item_id > 255:
-                item_id = item_id & 0xFF
-            item_info = ITEM_ID_MAP.get(item_id)
-            if item_info:
-                player_items[eid].add(item_id)
-                # Track last acquire timestamp per item
-                if pos + 21 <= len(all_data):
-                    ts = struct.unpack_from(">f", all_data, pos + 17)[0]
-                    if 0 < ts < 5000:
-                        player_item_ts[eid][item_id] = ts
-
-            pos += 3
+        Args:
+            frame_records: List of (frame_idx, FrameRecords) from scan_frames.
+            eid_map: {BE entity ID: DecodedPlayer} mapping.
+        """
+        tracker = ItemTracker(set(eid_map.keys()))
+        for _, records in frame_records:
+            tracker.add_frame(records)
 
         # Apply upgrade tree filtering to get final builds
-        for eid, item_ids in player_items.items():
+        for eid in tracker.items:
             player = eid_map.get(eid)
             if player:
-                # Store all purchased items (raw)
-                all_purchased = []
-                for iid in sorted(item_ids):
-                    info = ITEM_ID_MAP.get(iid)
-                    if info:
-                        all_purchased.append(info['name'])
-                player.items_all_purchased = all_purchased
-
-                # Apply upgrade tree to get final build (max 6 slots)
-                # Pass timestamps for sell-back resolution
-                player.items = _estimate_final_build(
-                    item_ids, last_acquire_ts=player_item_ts.get(eid),
-                )
+                tracker.apply(eid, player)
 
         # Gold detection moved to _detect_gold_per_player (frame-by-frame dedup)
 
     def _detect_gold_per_player(
         self,
-        frames: List[tuple],
+        frame_records: List[tuple],
         eid_map: Dict[int, 'DecodedPlayer'],
     ) -> None:
         """
@@ -662,88 +830,49 @@ class UnifiedDecoder:
         Excluding 0x01 records eliminates sell-back gold overcounting.
 
         Args:
-            frames: List of (frame_idx, data) tuples, sorted by frame index.
+            frame_records: List of (frame_idx, FrameRecords) from scan_frames.
             eid_map: {BE entity ID: DecodedPlayer} mapping.
         """
         valid_eids = set(eid_map.keys())
-        gold_spent: Dict[int, float] = defaultdict(float)
-        gold_earned: Dict[int, float] = defaultdict(float)
-        jungle_kills: Dict[int, int] = defaultdict(int)
-
-        for frame_idx, data in frames:
-            pos = 0
-            while True:
-                pos = data.find(_CREDIT_HEADER, pos)
-                if pos == -1:
-                    break
-                if pos + 13 > len(data):
-                    pos += 1
-                    continue
-                if data[pos + 3:pos + 5] != b'\x00\x00':
-                    pos += 1
-                    continue
-
-                eid = struct.unpack_from(">H", data, pos + 5)[0]
-                if eid not in valid_eids:
-                    pos += 3
-                    continue
-
-                value = struct.unpack_from(">f", data, pos + 7)[0]
-                action = data[pos + 11]
-                sell_flag = data[pos + 12]
-
-                if not math.isnan(value) and not math.isinf(value):
-                    if action == 0x06:
-                        if value < 0:
-                            gold_spent[eid] += abs(value)
-                        elif value > 0 and sell_flag != 0x01:
-                            gold_earned[eid] += value
-                    elif action == 0x0D:
-                        jungle_kills[eid] += 1
-
-                pos += 3
+        tracker = GoldTracker(valid_eids)
+        for _, records in frame_records:
+            tracker.add_frame(records)
 
         for eid in valid_eids:
             player = eid_map.get(eid)
             if player:
-                if eid in gold_spent:
-                    player.gold_spent = round(gold_spent[eid])
-                player.gold_earned = 600 + round(gold_earned.get(eid, 0))
-                if eid in jungle_kills:
-                    player.jungle_kills = jungle_kills[eid]
+                tracker.apply(eid, player)
 
     def _detect_objective_events(
         self,
         all_data: bytes,
+        frame_records: List[tuple],
         eid_threshold: int = 60000,
         cluster_window: float = 5.0,
         is_5v5: bool = False,
+        kill_window: int = OBJECTIVE_KILL_WINDOW,
     ) -> List[ObjectiveEvent]:
         """
         Detect objective events (Gold Mine captures and Kraken deaths).
 
         Classification rule for single-entity deaths (n=1, eid > 60000):
-          - Player kill [18 04 1C] within ±500B → KRAKEN_DEATH
+          - Player kill [18 04 1C] within ±kill_window bytes (500) → KRAKEN_DEATH
           - No player kill nearby → GOLD_MINE_CAPTURE
         Multi-entity clusters (n>1) are KRAKEN_WAVE or MINION_WAVE.
+
+        Deaths come from the scanned record streams; their frame-local
+        offsets are mapped to `all_data` offsets and checked against a
+        `ProximityIndex` of the same streams.
         """
         # Collect all objective deaths
         deaths = []
-        pos = 0
-        while True:
-            idx = all_data.find(_DEATH_HEADER, pos)
-            if idx == -1:
-                break
-            pos = idx + 1
-            if idx + 13 > len(all_data):
-                continue
-            if (all_data[idx + 3:idx + 5] != b'\x00\x00' or
-                    all_data[idx + 7:idx + 9] != b'\x00\x00'):
-                continue
-            eid = struct.unpack_from(">H", all_data, idx + 5)[0]
-            ts = struct.unpack_from(">f", all_data, idx + 9)[0]
-            if eid > eid_threshold and 0 < ts < 5000:
-                deaths.append((ts, eid, idx))
+        for position, (_, records) in enumerate(frame_records):
+            base = all_data.frame_start(position)
+            for death in records.deaths:
+                if not death.valid:
+                    continue
+                if death.eid > eid_threshold and 0 < death.timestamp < 5000:
+                    deaths.append((death.timestamp, death.eid, base + death.offset))
 
         if not deaths:
             return []
@@ -763,58 +892,20 @@ class UnifiedDecoder:
             clusters.append(cur)
 
         # Classify each cluster
+        kill_index = ProximityIndex.from_frame_records(frame_records, all_data)
         events = []
         for cluster in clusters:
-            ts = cluster[0][0]
-            eids = [d[1] for d in cluster]
-            offsets = [d[2] for d in cluster]
-            n = len(cluster)
-
-            player_kill = self._has_player_kill_nearby(all_data, offsets)
-
-            if n == 1 and not player_kill:
-                event_type = "GHOSTWING_CAPTURE" if is_5v5 else "GOLD_MINE_CAPTURE"
-            elif n == 1 and player_kill:
-                event_type = "BLACKCLAW_DEATH" if is_5v5 else "KRAKEN_DEATH"
-            elif n > 1 and player_kill:
-                event_type = "BLACKCLAW_WAVE" if is_5v5 else "KRAKEN_WAVE"
-            else:
-                event_type = "MINION_WAVE"
-
-            events.append(ObjectiveEvent(
-                timestamp=round(ts, 2),
-                event_type=event_type,
-                entity_count=n,
-                entity_ids=eids,
-            ))
+            player_kill = any(
+                kill_index.has_kill_near(d[2], kill_window, _PLAYER_EID_RANGE)
+                for d in cluster
+            )
+            events.append(_classify_objective_cluster(cluster, player_kill, is_5v5))
 
         return events
 
-    @staticmethod
-    def _has_player_kill_nearby(
-        data: bytes, offsets: List[int], window: int = 500
-    ) -> bool:
-        """Check if any player kill [18 04 1C] exists within window bytes."""
-        for off in offsets:
-            s = max(0, off - window)
-            e = min(len(data), off + window)
-            region = data[s:e]
-            pk = 0
-            while True:
-                kidx = region.find(_KILL_HEADER, pk)
-                if kidx == -1:
-                    break
-                pk = kidx + 1
-                if kidx + 7 > len(region):
-                    continue
-                killer = struct.unpack_from(">H", region, kidx + 5)[0]
-                if killer in _PLAYER_EID_RANGE:
-                    return True
-        return False
-
     def _detect_crystal_death(
         self,
-        all_data: bytes,
+        frame_records: List[tuple],
         duration_est: Optional[float],
     ) -> Tuple[Optional[float], Optional[int]]:
         """
@@ -825,26 +916,12 @@ class UnifiedDecoder:
             (crystal_death_ts, crystal_death_eid) or (None, None).
         """
         crystal_deaths = []
-        pos = 0
-        while True:
-            pos = all_data.find(_DEATH_HEADER, pos)
-            if pos == -1:
-                break
-            if pos + 13 > len(all_data):
-                pos += 1
-                continue
-            if (all_data[pos + 3:pos + 5] != b'\x00\x00' or
-                    all_data[pos + 7:pos + 9] != b'\x00\x00'):
-                pos += 1
-                continue
-
-            eid = struct.unpack_from(">H", all_data, pos + 5)[0]
-            ts = struct.unpack_from(">f", all_data, pos + 9)[0]
-
-            if 2000 <= eid <= 2005 and 60 < ts < 2400:
-                crystal_deaths.append((ts, eid))
-
-            pos += 1
+        for _, records in frame_records:
+            for death in records.deaths:
+                if not death.valid:
+                    continue
+                if 2000 <= death.eid <= 2005 and 60 < death.timestamp < 2400:
+                    crystal_deaths.append((death.timestamp, death.eid))
 
         if not crystal_deaths:
             return None, None
@@ -898,10 +975,15 @@ def main():
         '-o', '--output',
         help='Output JSON file path (default: stdout)'
     )
+    arg_parser.add_argument(
+        '--metrics',
+        action='store_true',
+        help='Include per-step timings and record counters in the output'
+    )
 
     args = arg_parser.parse_args()
 
-    decoder = UnifiedDecoder(args.path)
+    decoder = UnifiedDecoder(args.path, collect_metrics=args.metrics)
     if args.truth:
         match = decoder.decode_with_truth(args.truth)
     else:
@@ -1,18 +1,31 @@
 #!/usr/bin/env python3
 """
 VGR Database Builder - Build hero/item database for Vainglory
+
+`import_replay` stores parser-level fields for one replay. `bulk_import`
+decodes many replays through UnifiedDecoder on a process pool and writes
+K/D/A, gold, items and objective events in batched WAL transactions,
+skipping replays whose frame content is already in the database.
 """
 
 import sqlite3
 import json
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional, Sequence
 from datetime import datetime
 
 try:
     from vgr_parser import VGRParser
+    from batch_runner import add_batch_arguments, run_batch
+    from frame_store import replay_content_hash
+    from result_cache import cached_payload
+    from unified_decoder import UnifiedDecoder
 except ImportError:
     from .vgr_parser import VGRParser
+    from .batch_runner import add_batch_arguments, run_batch
+    from .frame_store import replay_content_hash
+    from .result_cache import cached_payload
+    from .unified_decoder import UnifiedDecoder
 
 # All heroes from VaingloryFire wiki
 HEROES_DATA = [
@@ -214,6 +227,13 @@ ITEMS_DATA = [
 ]
 
 
+def decode_replay_for_import(file_path: str) -> Dict[str, Any]:
+    """Decode one replay for bulk import (runs inside batch workers)"""
+    return cached_payload(
+        'unified', file_path, lambda: UnifiedDecoder(file_path).decode().to_dict(),
+    )
+
+
 class VGDatabase:
     """Vainglory SQLite database manager"""
     
@@ -308,8 +328,104 @@ class VGDatabase:
                 FOREIGN KEY (hero_id) REFERENCES heroes(id)
             )
         ''')
-        
+
+        # Item purchases per player (bulk import)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS match_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                match_id INTEGER,
+                match_player_id INTEGER,
+                item_id INTEGER,
+                item_name TEXT,
+                final_build INTEGER DEFAULT 0, -- 1: part of the estimated final build
+                FOREIGN KEY (match_id) REFERENCES matches(id),
+                FOREIGN KEY (match_player_id) REFERENCES match_players(id),
+                FOREIGN KEY (item_id) REFERENCES items(id)
+            )
+        ''')
+
+        # Objective events (bulk import)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS match_objectives (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                match_id INTEGER,
+                timestamp REAL,
+                event_type TEXT,
+                entity_count INTEGER,
+                entity_ids TEXT, -- JSON array of entity IDs
+                FOREIGN KEY (match_id) REFERENCES matches(id)
+            )
+        ''')
+
+        # Secondary indexes for player / hero / date lookups
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_players_name ON match_players(player_name)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_players_uuid ON match_players(player_uuid)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_players_hero ON match_players(hero_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_players_match ON match_players(match_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_matches_date ON matches(match_date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_items_player ON match_items(match_player_id)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_match_items_match ON match_items(match_id)')
+
+        # Columns added after the first schema; older databases gain them here
+        self._ensure_columns('matches', {'content_hash': 'TEXT'})
+        self._ensure_columns('match_players', {
+            'gold_spent': 'INTEGER DEFAULT 0',
+            'jungle_kills': 'INTEGER DEFAULT 0',
+        })
+        cursor.execute(
+            'CREATE UNIQUE INDEX IF NOT EXISTS idx_matches_content_hash ON matches(content_hash)'
+        )
+
+        # Aggregate tables, maintained by _update_aggregates on every import
+        has_aggregates = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='hero_stats'"
+        ).fetchone()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS hero_stats (
+                hero_id INTEGER,
+                game_mode TEXT,
+                games INTEGER DEFAULT 0,
+                wins INTEGER DEFAULT 0,
+                kills INTEGER DEFAULT 0,
+                deaths INTEGER DEFAULT 0,
+                assists INTEGER DEFAULT 0,
+                PRIMARY KEY (hero_id, game_mode)
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS player_stats (
+                player_name TEXT PRIMARY KEY,
+                games INTEGER DEFAULT 0,
+                wins INTEGER DEFAULT 0,
+                kills INTEGER DEFAULT 0,
+                deaths INTEGER DEFAULT 0,
+                assists INTEGER DEFAULT 0,
+                minion_kills INTEGER DEFAULT 0,
+                gold INTEGER DEFAULT 0,
+                last_match_date TIMESTAMP
+            )
+        ''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS hero_item_stats (
+                hero_id INTEGER,
+                item_name TEXT,
+                purchases INTEGER DEFAULT 0,
+                final_builds INTEGER DEFAULT 0,
+                PRIMARY KEY (hero_id, item_name)
+            )
+        ''')
+        if not has_aggregates:
+            # Databases built before the aggregates existed
+            self.rebuild_aggregates(commit=False)
+
         self.conn.commit()
+
+    def _ensure_columns(self, table: str, columns: Dict[str, str]):
+        """Add missing columns to an existing table"""
+        existing = {row[1] for row in self.conn.execute(f'PRAGMA table_info({table})')}
+        for name, decl in columns.items():
+            if name not in existing:
+                self.conn.execute(f'ALTER TABLE {table} ADD COLUMN {name} {decl}')
         
     def populate_heroes(self):
         """Insert hero data"""
@@ -434,10 +550,10 @@ class VGDatabase:
                     else:
                         team_value = 0
 
-                # Find Hero ID if not set (fallback)
-                hero_id = p.get('hero_id')
-                if not hero_id and p.get('hero_name') != 'Unknown':
-                    # Look up by name
+                # match_players.hero_id references heroes.id; the parsed
+                # hero_id is the replay's binary hero code, so look up by name
+                hero_id = None
+                if p.get('hero_name') not in (None, 'Unknown'):
                     h_res = cursor.execute("SELECT id FROM heroes WHERE name=?", (p['hero_name'],)).fetchone()
                     if h_res:
                         hero_id = h_res[0]
@@ -459,7 +575,12 @@ class VGDatabase:
                     p.get('gold', 0),
                     json.dumps(p.get('items', []))
                 ))
-            
+                cursor.executemany('''
+                    INSERT INTO match_items (match_id, match_player_id, item_id, item_name, final_build)
+                    VALUES (?, ?, (SELECT id FROM items WHERE name=?), ?, 1)
+                ''', [(match_id, cursor.lastrowid, name, name) for name in p.get('items', [])])
+
+            self._update_aggregates(match_id, match_id)
             self.conn.commit()
             return True
             
@@ -471,17 +592,328 @@ class VGDatabase:
             traceback.print_exc()
             return False
 
+    def enable_bulk_mode(self):
+        """WAL journal with relaxed syncing for large batched writes"""
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+
+    def _name_id_map(self, table: str) -> Dict[str, int]:
+        return {row[1]: row[0] for row in self.conn.execute(f'SELECT id, name FROM {table}')}
+
+    def _next_id(self, table: str) -> int:
+        return self.conn.execute(f'SELECT COALESCE(MAX(id), 0) + 1 FROM {table}').fetchone()[0]
+
+    def bulk_import(self,
+                    file_paths: Sequence[str],
+                    workers: int = 1,
+                    batch_size: int = 50,
+                    timeout: Optional[float] = None,
+                    memory_limit_mb: Optional[int] = None,
+                    on_progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, int]:
+        """
+        Decode replays with UnifiedDecoder and import them in batches.
+
+        Replays are identified by `replay_content_hash`; paths whose content
+        (or replay name) is already stored are skipped before decoding.
+        Decoded matches are written `batch_size` at a time, one transaction
+        per batch, as workers finish.
+
+        Returns:
+            Counts of imported, skipped and failed replays.
+        """
+        self.enable_bulk_mode()
+        self.create_tables()
+
+        known_hashes = {
+            row[0] for row in self.conn.execute(
+                'SELECT content_hash FROM matches WHERE content_hash IS NOT NULL'
+            )
+        }
+        known_names = {row[0] for row in self.conn.execute('SELECT replay_name FROM matches')}
+
+        pending = []
+        pending_names = set()
+        skipped = 0
+        for file_path in file_paths:
+            # Same name as UnifiedDecoder gives the decoded match
+            replay_name = Path(file_path).stem.rsplit('.', 1)[0]
+            if replay_name in known_names or replay_name in pending_names:
+                skipped += 1
+                continue
+            content_hash = replay_content_hash(str(file_path))
+            if content_hash in known_hashes:
+                skipped += 1
+                continue
+            known_hashes.add(content_hash)
+            pending_names.add(replay_name)
+            pending.append((str(file_path), content_hash))
+        hash_by_path = dict(pending)
+
+        hero_ids = self._name_id_map('heroes')
+        item_ids = self._name_id_map('items')
+        counts = {'imported': 0, 'skipped': skipped, 'failed': 0}
+        batch: List[Dict[str, Any]] = []
+
+        def flush():
+            imported = self._write_decoded_batch(batch, hero_ids, item_ids, known_names)
+            counts['imported'] += imported
+            counts['skipped'] += len(batch) - imported
+            batch.clear()
+
+        def collect(result, done: int, total: int):
+            if result.ok:
+                decoded = dict(result.value)
+                decoded['content_hash'] = hash_by_path[result.item]
+                batch.append(decoded)
+                if len(batch) >= batch_size:
+                    flush()
+            else:
+                counts['failed'] += 1
+                print(f"Error importing {result.item}: {result.error}")
+            if on_progress is not None:
+                on_progress(done, total)
+
+        run_batch(
+            decode_replay_for_import,
+            list(hash_by_path),
+            workers=workers,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            on_result=collect,
+        )
+        if batch:
+            flush()
+        return counts
+
+    def _write_decoded_batch(self,
+                             decoded_matches: List[Dict[str, Any]],
+                             hero_ids: Dict[str, int],
+                             item_ids: Dict[str, int],
+                             known_names: set) -> int:
+        """Insert decoded matches in one transaction; returns the number written"""
+        match_rows, player_rows, item_rows, objective_rows = [], [], [], []
+        imported_at = datetime.now().isoformat()
+
+        with self.conn:
+            first_match_id = match_id = self._next_id('matches')
+            player_id = self._next_id('match_players')
+            for decoded in decoded_matches:
+                replay_name = decoded['replay_name']
+                if replay_name in known_names:
+                    continue
+                known_names.add(replay_name)
+
+                match_rows.append((
+                    match_id,
+                    replay_name,
+                    decoded['game_mode'],
+                    decoded['total_frames'],
+                    decoded.get('duration_seconds') or 0,
+                    self._winner_to_team_value(decoded.get('winner')),
+                    imported_at,
+                    decoded['replay_path'],
+                    decoded['content_hash'],
+                ))
+
+                for p in decoded['left_team'] + decoded['right_team']:
+                    # match_players.hero_id references heroes.id; the decoded
+                    # hero_id is the replay's binary hero code, so never store it
+                    hero_id = hero_ids.get(p.get('hero_name'))
+                    player_rows.append((
+                        player_id,
+                        match_id,
+                        p['name'],
+                        None,  # decoded players carry no UUID
+                        self._winner_to_team_value(p.get('team')),
+                        hero_id,
+                        p.get('kills', 0),
+                        p.get('deaths', 0),
+                        p.get('assists') or 0,
+                        p.get('minion_kills', 0),
+                        p.get('gold_earned', 0),
+                        json.dumps(p.get('items', [])),
+                        p.get('gold_spent', 0),
+                        p.get('jungle_kills', 0),
+                    ))
+                    final_build = set(p.get('items', []))
+                    for name in p.get('items_all_purchased') or p.get('items', []):
+                        item_rows.append((
+                            match_id, player_id, item_ids.get(name), name,
+                            1 if name in final_build else 0,
+                        ))
+                    player_id += 1
+
+                for event in decoded.get('objective_events', []):
+                    objective_rows.append((
+                        match_id,
+                        event['timestamp'],
+                        event['event_type'],
+                        event['entity_count'],
+                        json.dumps(event['entity_ids']),
+                    ))
+                match_id += 1
+
+            self.conn.executemany('''
+                INSERT INTO matches
+                (id, replay_name, game_mode, frame_count, duration, winning_team, match_date,
+                 file_path, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', match_rows)
+            self.conn.executemany('''
+                INSERT INTO match_players
+                (id, match_id, player_name, player_uuid, team, hero_id, kills, deaths, assists,
+                 minion_kills, gold, items, gold_spent, jungle_kills)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', player_rows)
+            self.conn.executemany('''
+                INSERT INTO match_items (match_id, match_player_id, item_id, item_name, final_build)
+                VALUES (?, ?, ?, ?, ?)
+            ''', item_rows)
+            self.conn.executemany('''
+                INSERT INTO match_objectives (match_id, timestamp, event_type, entity_count, entity_ids)
+                VALUES (?, ?, ?, ?, ?)
+            ''', objective_rows)
+            if match_rows:
+                self._update_aggregates(first_match_id, match_id - 1)
+
+        return len(match_rows)
+
+    # ------------------------------------------------------------------
+    # Aggregates
+    # ------------------------------------------------------------------
+
+    def _update_aggregates(self, first_match_id: int, last_match_id: int):
+        """Fold matches first_match_id..last_match_id into the aggregate tables"""
+        match_range = (first_match_id, last_match_id)
+        self.conn.execute('''
+            INSERT INTO hero_stats (hero_id, game_mode, games, wins, kills, deaths, assists)
+            SELECT p.hero_id, COALESCE(m.game_mode, 'Unknown'), COUNT(*),
+                   SUM(m.winning_team != 0 AND p.team = m.winning_team),
+                   SUM(p.kills), SUM(p.deaths), SUM(COALESCE(p.assists, 0))
+            FROM match_players p JOIN matches m ON m.id = p.match_id
+            WHERE p.match_id BETWEEN ? AND ? AND p.hero_id IS NOT NULL
+            GROUP BY p.hero_id, COALESCE(m.game_mode, 'Unknown')
+            ON CONFLICT (hero_id, game_mode) DO UPDATE SET
+                games = games + excluded.games,
+                wins = wins + excluded.wins,
+                kills = kills + excluded.kills,
+                deaths = deaths + excluded.deaths,
+                assists = assists + excluded.assists
+        ''', match_range)
+        self.conn.execute('''
+            INSERT INTO player_stats
+            (player_name, games, wins, kills, deaths, assists, minion_kills, gold, last_match_date)
+            SELECT p.player_name, COUNT(*),
+                   SUM(m.winning_team != 0 AND p.team = m.winning_team),
+                   SUM(p.kills), SUM(p.deaths), SUM(COALESCE(p.assists, 0)),
+                   SUM(p.minion_kills), SUM(p.gold), MAX(m.match_date)
+            FROM match_players p JOIN matches m ON m.id = p.match_id
+            WHERE p.match_id BETWEEN ? AND ? AND p.player_name IS NOT NULL
+            GROUP BY p.player_name
+            ON CONFLICT (player_name) DO UPDATE SET
+                games = games + excluded.games,
+                wins = wins + excluded.wins,
+                kills = kills + excluded.kills,
+                deaths = deaths + excluded.deaths,
+                assists = assists + excluded.assists,
+                minion_kills = minion_kills + excluded.minion_kills,
+                gold = gold + excluded.gold,
+                last_match_date = CASE
+                    WHEN excluded.last_match_date > COALESCE(last_match_date, '')
+                    THEN excluded.last_match_date ELSE last_match_date END
+        ''', match_range)
+        self.conn.execute('''
+            INSERT INTO hero_item_stats (hero_id, item_name, purchases, final_builds)
+            SELECT p.hero_id, i.item_name, COUNT(*), SUM(i.final_build)
+            FROM match_items i JOIN match_players p ON p.id = i.match_player_id
+            WHERE p.match_id BETWEEN ? AND ? AND p.hero_id IS NOT NULL
+            GROUP BY p.hero_id, i.item_name
+            ON CONFLICT (hero_id, item_name) DO UPDATE SET
+                purchases = purchases + excluded.purchases,
+                final_builds = final_builds + excluded.final_builds
+        ''', match_range)
+
+    def rebuild_aggregates(self, commit: bool = True):
+        """Recompute every aggregate table from the match tables"""
+        for table in ('hero_stats', 'player_stats', 'hero_item_stats'):
+            self.conn.execute(f'DELETE FROM {table}')
+        first, last = self.conn.execute('SELECT MIN(id), MAX(id) FROM matches').fetchone()
+        if first is not None:
+            self._update_aggregates(first, last)
+        if commit:
+            self.conn.commit()
+
+    # ------------------------------------------------------------------
+    # Query API (served from indexes and aggregate tables)
+    # ------------------------------------------------------------------
+
+    def hero_win_rates(self, game_mode: Optional[str] = None, min_games: int = 1) -> List[Dict]:
+        """Per-hero games, win rate and average K/D/A, best win rate first"""
+        where = 'WHERE s.game_mode = ?' if game_mode else ''
+        params = (game_mode, min_games) if game_mode else (min_games,)
+        cursor = self.conn.execute(f'''
+            SELECT s.hero_id, h.name AS hero_name, SUM(s.games) AS games, SUM(s.wins) AS wins,
+                   ROUND(1.0 * SUM(s.wins) / SUM(s.games), 4) AS win_rate,
+                   ROUND(1.0 * SUM(s.kills) / SUM(s.games), 2) AS avg_kills,
+                   ROUND(1.0 * SUM(s.deaths) / SUM(s.games), 2) AS avg_deaths,
+                   ROUND(1.0 * SUM(s.assists) / SUM(s.games), 2) AS avg_assists
+            FROM hero_stats s LEFT JOIN heroes h ON h.id = s.hero_id
+            {where}
+            GROUP BY s.hero_id
+            HAVING SUM(s.games) >= ?
+            ORDER BY win_rate DESC, games DESC
+        ''', params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def player_summary(self, player_name: str) -> Optional[Dict]:
+        """Career totals for one player, or None if never seen"""
+        row = self.conn.execute(
+            'SELECT * FROM player_stats WHERE player_name = ?', (player_name,)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def player_history(self, player_name: str, limit: int = 20) -> List[Dict]:
+        """A player's most recent matches, newest first"""
+        cursor = self.conn.execute('''
+            SELECT m.id AS match_id, m.replay_name, m.game_mode, m.match_date, m.duration,
+                   p.team, (m.winning_team != 0 AND p.team = m.winning_team) AS won, p.hero_id, h.name AS hero_name,
+                   p.kills, p.deaths, p.assists, p.minion_kills, p.gold
+            FROM match_players p
+            JOIN matches m ON m.id = p.match_id
+            LEFT JOIN heroes h ON h.id = p.hero_id
+            WHERE p.player_name = ?
+            ORDER BY m.match_date DESC, m.id DESC
+            LIMIT ?
+        ''', (player_name, limit))
+        return [dict(row) for row in cursor.fetchall()]
+
+    def item_popularity(self, hero_id: int, limit: int = 10) -> List[Dict]:
+        """Most purchased items on a hero, with final-build counts"""
+        cursor = self.conn.execute('''
+            SELECT item_name, purchases, final_builds
+            FROM hero_item_stats
+            WHERE hero_id = ?
+            ORDER BY purchases DESC, item_name
+            LIMIT ?
+        ''', (hero_id, limit))
+        return [dict(row) for row in cursor.fetchall()]
+
+
 
 def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='VGR Database Builder')
-    parser.add_argument('command', choices=['init', 'heroes', 'items', 'search', 'export', 'import'],
+    parser.add_argument('command', choices=['init', 'heroes', 'items', 'search', 'export', 'import',
+                                            'bulk-import'],
                         help='Command to run')
     parser.add_argument('-q', '--query', help='Search query')
     parser.add_argument('-i', '--input', help='Input directory or file for import')
     parser.add_argument('-o', '--output', default='vg_data.json', help='Output file for export')
     parser.add_argument('--db', default='vainglory.db', help='Database file path')
+    parser.add_argument('--batch-size', type=int, default=50,
+                        help='Decoded replays written per transaction (bulk-import)')
+    add_batch_arguments(parser)
     
     args = parser.parse_args()
     
@@ -549,6 +981,29 @@ def main():
                     success_count += 1
             
             print(f"Import complete: {success_count}/{len(files)} succeeded")
+
+    elif args.command == 'bulk-import':
+        if not args.input:
+            print("Specify an input path with --input <path>.")
+        else:
+            path = Path(args.input)
+            files = [path] if path.is_file() else sorted(path.rglob('*.0.vgr'))
+            print(f"Found {len(files)} replays to import...")
+
+            def report(done: int, total: int):
+                if done % 50 == 0 or done == total:
+                    print(f"  Decoded {done}/{total}...")
+
+            counts = db.bulk_import(
+                [str(f) for f in files],
+                workers=args.workers,
+                batch_size=args.batch_size,
+                timeout=args.timeout,
+                memory_limit_mb=args.memory_limit_mb,
+                on_progress=report,
+            )
+            print(f"Bulk import complete: {counts['imported']} imported, "
+                  f"{counts['skipped']} skipped, {counts['failed']} failed")
     
     db.close()
 
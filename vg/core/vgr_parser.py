@@ -14,6 +14,7 @@ from collections import Counter
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, asdict, field
+from functools import partial
 from typing import List, Dict, Any, Optional, Tuple
 
 # Import mapping module
@@ -39,6 +40,13 @@ except ImportError:
     except ImportError:
         TRUTH_AVAILABLE = False
 
+try:
+    from frame_store import FrameStore
+    from batch_runner import BatchResult, add_batch_arguments, run_batch
+except ImportError:
+    from .frame_store import FrameStore
+    from .batch_runner import BatchResult, add_batch_arguments, run_batch
+
 # Hero matching imports
 try:
     from hero_matcher import HeroMatcher, HeroCandidate
@@ -444,16 +452,10 @@ class VGRParser:
             player.team = "right"
         return left_team, right_team
 
-    def _read_all_frames(self, frame_dir: Path, replay_name: str) -> bytes:
-        """Read all frames for a replay in order."""
-        frames = list(frame_dir.glob(f"{replay_name}.*.vgr"))
-        def _frame_index(path: Path) -> int:
-            try:
-                return int(path.stem.split('.')[-1])
-            except ValueError:
-                return 0
-        frames.sort(key=_frame_index)
-        return b"".join(frame.read_bytes() for frame in frames)
+    def _read_all_frames(self, frame_dir: Path, replay_name: str):
+        """Memory-map all frames for a replay in order as one virtual buffer (closed by parse())."""
+        self._frame_store = FrameStore.open(frame_dir, replay_name)
+        return self._frame_store.concat()
 
     def _scan_entity_actions(self, data: bytes, entity_id: int) -> Dict[str, int]:
         """Count action types for a given entity id using [id][00 00][action]."""
@@ -593,6 +595,16 @@ class VGRParser:
         Returns:
             Dictionary containing extracted data
         """
+        # Frames mapped by _read_all_frames are unmapped once parsing is done
+        self._frame_store: Optional[FrameStore] = None
+        try:
+            return self._parse()
+        finally:
+            if self._frame_store is not None:
+                self._frame_store.close()
+                self._frame_store = None
+
+    def _parse(self) -> Dict[str, Any]:
         first_frame = self._find_first_frame()
         if not first_frame:
             raise FileNotFoundError(f"No .0.vgr file found in {self.replay_path}")
@@ -715,44 +727,76 @@ class VGRParser:
         return json.dumps(self.data, indent=indent, ensure_ascii=False)
 
 
+def _parse_replay_file(
+    vgr_file: Path,
+    detect_heroes: bool = False,
+    debug_events: bool = False,
+    truth_path: Optional[str] = None,
+    auto_truth: bool = True,
+) -> Dict[str, Any]:
+    """Parse one replay for `scan_replay_folders` (runs inside batch workers)."""
+    parser = VGRParser(
+        str(vgr_file),
+        detect_heroes=detect_heroes,
+        debug_events=debug_events,
+        truth_path=truth_path,
+        auto_truth=auto_truth,
+    )
+    return parser.parse()
+
+
 def scan_replay_folders(
     base_path: str,
     detect_heroes: bool = False,
     debug_events: bool = False,
     truth_path: Optional[str] = None,
     auto_truth: bool = True,
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
 ) -> List[Dict[str, Any]]:
     """
     Scan all replay folders and extract data from each.
     
     Args:
         base_path: Base path containing replay date folders
+        workers: Worker processes for parsing (1 = sequential)
+        timeout: Per-replay timeout in seconds (worker mode)
+        memory_limit_mb: Per-worker memory ceiling (worker mode)
         
     Returns:
-        List of parsed replay data dictionaries
+        List of parsed replay data dictionaries, in sorted path order
     """
     base = Path(base_path)
-    results = []
     
     # Find all .0.vgr files
-    for vgr_file in base.rglob('*.0.vgr'):
-        if vgr_file.name.startswith("._") or "__MACOSX" in vgr_file.parts:
-            continue
-        try:
-            parser = VGRParser(
-                str(vgr_file),
-                detect_heroes=detect_heroes,
-                debug_events=debug_events,
-                truth_path=truth_path,
-                auto_truth=auto_truth,
-            )
-            data = parser.parse()
-            results.append(data)
+    vgr_files = [
+        vgr_file for vgr_file in sorted(base.rglob('*.0.vgr'))
+        if not (vgr_file.name.startswith("._") or "__MACOSX" in vgr_file.parts)
+    ]
+
+    def report(result: BatchResult, done: int, total: int) -> None:
+        vgr_file = result.item
+        if result.ok:
             print(f"[OK] Parsed: {vgr_file.parent.name}/{vgr_file.name}")
-        except Exception as e:
-            print(f"[ERR] Error parsing {vgr_file}: {e}")
-    
-    return results
+        else:
+            print(f"[ERR] Error parsing {vgr_file}: {result.error}")
+
+    batch = run_batch(
+        partial(
+            _parse_replay_file,
+            detect_heroes=detect_heroes,
+            debug_events=debug_events,
+            truth_path=truth_path,
+            auto_truth=auto_truth,
+        ),
+        vgr_files,
+        workers=workers,
+        timeout=timeout,
+        memory_limit_mb=memory_limit_mb,
+        on_result=report,
+    )
+    return [result.value for result in batch if result.ok]
 
 
 def main():
@@ -797,6 +841,7 @@ def main():
         action='store_true',
         help='Disable automatic MATCH_DATA_*.md lookup'
     )
+    add_batch_arguments(parser)
     
     args = parser.parse_args()
     
@@ -807,6 +852,9 @@ def main():
             debug_events=args.debug_events,
             truth_path=args.truth,
             auto_truth=not args.no_auto_truth,
+            workers=args.workers,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit_mb,
         )
         output = json.dumps(results, indent=2 if args.pretty else None, ensure_ascii=False)
     else:
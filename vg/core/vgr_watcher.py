@@ -2,18 +2,122 @@
 """
 VGR Auto Watcher - Automatically backup Vainglory replays when detected
 Monitors the Temp folder and saves new replays to a backup directory.
+
+`watch()` is event driven: on Linux it sleeps on inotify until frames are
+created or closed, elsewhere it falls back to one directory listing per
+interval. Frame arrivals and close-writes are tracked per replay, and a
+replay counts as complete once no frame has been written for `quiet_period`
+seconds (and every frame seen being written has been closed).
 """
 
 import os
+import re
 import sys
 import time
 import shutil
 import hashlib
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 import argparse
 
+try:
+    from vg.core.fs_watch import FileEvent, open_directory_watcher
+except ImportError:
+    from fs_watch import FileEvent, open_directory_watcher
+
+
+_FRAME_NAME = re.compile(r"^(?P<name>.+)\.(?P<idx>\d+)\.vgr$")
+
+# A frame left open this many quiet periods is treated as abandoned
+_STALL_FACTOR = 10
+
+
+@dataclass
+class ReplayActivity:
+    """Write activity observed for one replay's frames."""
+    name: str
+    frames: Set[int] = field(default_factory=set)
+    open_frames: Set[int] = field(default_factory=set)
+    last_write: float = 0.0
+
+    def ready_at(self, quiet_period: float) -> float:
+        """Monotonic time at which the replay counts as complete."""
+        if self.open_frames:
+            return self.last_write + quiet_period * _STALL_FACTOR
+        return self.last_write + quiet_period
+
+
+class ReplayActivityTracker:
+    """
+    Turns directory events into per-replay completion.
+
+    Args:
+        quiet_period: Seconds without frame writes before a replay is complete.
+        min_frames: A replay needs more than this many frames to be reported.
+        track_close: The event source reports close-writes (inotify), so a
+                     frame written but not yet closed holds completion back.
+    """
+
+    def __init__(self, quiet_period: float = 2.0, min_frames: int = 10, track_close: bool = False):
+        self.quiet_period = quiet_period
+        self.min_frames = min_frames
+        self.track_close = track_close
+        self.replays: Dict[str, ReplayActivity] = {}
+        self.completed: Set[str] = set()
+
+    def seed(self, filenames: Iterable[str], now: float) -> None:
+        """Register frames already on disk (closed) as if just written."""
+        for filename in filenames:
+            self.observe(FileEvent(filename, "closed"), now)
+
+    def observe(self, event: FileEvent, now: float) -> Optional[str]:
+        """Record one event; returns the replay name it belongs to, if any."""
+        match = _FRAME_NAME.match(event.name)
+        if not match:
+            return None
+        name, idx = match.group("name"), int(match.group("idx"))
+
+        if event.kind == "deleted":
+            activity = self.replays.get(name)
+            if activity is not None:
+                activity.frames.discard(idx)
+                activity.open_frames.discard(idx)
+                if not activity.frames:
+                    del self.replays[name]
+                    self.completed.discard(name)
+            return name
+
+        activity = self.replays.setdefault(name, ReplayActivity(name))
+        activity.frames.add(idx)
+        activity.last_write = now
+        if event.kind in ("closed", "moved"):
+            activity.open_frames.discard(idx)
+        elif event.kind in ("created", "modified") and self.track_close:
+            activity.open_frames.add(idx)
+        return name
+
+    def complete(self, now: float) -> List[str]:
+        """Replays that just became complete (each is reported once)."""
+        ready = []
+        for name, activity in self.replays.items():
+            if name in self.completed or len(activity.frames) <= self.min_frames:
+                continue
+            if now >= activity.ready_at(self.quiet_period):
+                self.completed.add(name)
+                ready.append(name)
+        return sorted(ready)
+
+    def next_deadline(self) -> Optional[float]:
+        """Earliest time a pending replay could complete (None when idle)."""
+        deadlines = [
+            activity.ready_at(self.quiet_period)
+            for name, activity in self.replays.items()
+            if name not in self.completed and len(activity.frames) > self.min_frames
+        ]
+        return min(deadlines) if deadlines else None
+
 
 class VGRWatcher:
     """Watches for new Vainglory replays and backs them up automatically"""
@@ -110,41 +214,61 @@ class VGRWatcher:
         self.last_backup_hash = replay_hash
         return True
     
-    def watch(self, interval: int = 5):
+    def _list_temp(self) -> List[str]:
+        try:
+            return os.listdir(self.temp_path)
+        except OSError:
+            return []
+
+    def _backup_completed(self, replay_name: str, frame_count: int) -> bool:
+        replay_hash = self._get_replay_hash(replay_name)
+        if replay_hash == self.last_backup_hash:
+            return False
+        print(f"\n🎮 새 리플레이 감지! ({frame_count} frames)")
+        self.backup_replay(replay_name)
+        self.last_backup_hash = replay_hash
+        return True
+
+    def watch(self, interval: int = 5, backend: str = "auto", quiet_period: float = 2.0):
         """
         Continuously watch for new replays.
-        
+
         Args:
-            interval: Seconds between checks
+            interval: Seconds between directory listings (polling backend only)
+            backend: "auto", "inotify" or "poll"
+            quiet_period: Seconds without frame writes before a replay is complete
         """
-        print(f"🔍 VGR Auto Watcher 시작")
-        print(f"   감시 폴더: {self.temp_path}")
-        print(f"   백업 폴더: {self.backup_dir}")
-        print(f"   체크 간격: {interval}초")
-        print(f"   종료: Ctrl+C")
-        print()
-        
-        try:
-            while True:
-                replay_name = self._get_current_replay()
-                if replay_name:
-                    replay_hash = self._get_replay_hash(replay_name)
-                    frame_count = self._count_frames(replay_name)
-                    
-                    if replay_hash != self.last_backup_hash and frame_count > 10:
-                        # Wait a bit to ensure replay is fully written
-                        time.sleep(2)
-                        new_frame_count = self._count_frames(replay_name)
-                        
-                        if new_frame_count == frame_count:  # Stable
-                            print(f"\n🎮 새 리플레이 감지! ({frame_count} frames)")
-                            self.backup_replay(replay_name)
-                            self.last_backup_hash = replay_hash
-                
-                time.sleep(interval)
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Watcher 종료")
+        with open_directory_watcher(str(self.temp_path), interval, backend) as source:
+            tracker = ReplayActivityTracker(quiet_period, min_frames=10, track_close=source.reports_close)
+            tracker.seed(self._list_temp(), time.monotonic())
+
+            print(f"🔍 VGR Auto Watcher 시작")
+            print(f"   감시 폴더: {self.temp_path}")
+            print(f"   백업 폴더: {self.backup_dir}")
+            print(f"   감시 방식: {source.backend}")
+            if source.backend == "poll":
+                print(f"   체크 간격: {interval}초")
+            print(f"   종료: Ctrl+C")
+            print()
+
+            try:
+                while True:
+                    deadline = tracker.next_deadline()
+                    timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                    events = source.wait(timeout)
+
+                    now = time.monotonic()
+                    for event in events:
+                        if event.kind == "rescan":
+                            tracker.seed(self._list_temp(), now)
+                        else:
+                            tracker.observe(event, now)
+
+                    for replay_name in tracker.complete(now):
+                        self._backup_completed(replay_name, len(tracker.replays[replay_name].frames))
+
+            except KeyboardInterrupt:
+                print("\n\n👋 Watcher 종료")
 
 
 def main():
@@ -165,7 +289,19 @@ def main():
         '-i', '--interval',
         type=int,
         default=5,
-        help='Check interval in seconds (default: 5)'
+        help='Check interval in seconds for the polling backend (default: 5)'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=['auto', 'inotify', 'poll'],
+        default='auto',
+        help='File event source (default: auto, inotify when available)'
+    )
+    parser.add_argument(
+        '--quiet',
+        type=float,
+        default=2.0,
+        help='Seconds without frame writes before a replay is complete (default: 2)'
     )
     parser.add_argument(
         '--once',
@@ -183,7 +319,7 @@ def main():
         else:
             print("새로운 리플레이가 없습니다.")
     else:
-        watcher.watch(args.interval)
+        watcher.watch(args.interval, backend=args.backend, quiet_period=args.quiet)
 
 
 if __name__ == '__main__':
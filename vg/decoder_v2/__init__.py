@@ -19,8 +19,15 @@ from .manifest import parse_replay_manifest
 from .minions import collect_minion_candidates, compare_minion_candidates_to_truth
 from .kda import decode_kda_from_replay
 from .credit_events import collect_credit_events_by_entity, iter_credit_events
-from .player_events import collect_player_events_by_entity, iter_player_events
+from .player_events import (
+    PlayerEvent,
+    PlayerEventTable,
+    collect_player_events_by_entity,
+    iter_player_events,
+    player_event_table,
+)
 from .player_blocks import iter_player_blocks, parse_player_blocks
+from .replay_context import ReplayContext
 from .registry import DECODER_FIELD_STATUSES, EVENT_HEADER_CLAIMS, OFFSET_CLAIMS
 from .winner import decode_winner_from_replay
 
@@ -34,6 +41,7 @@ __all__ = [
     "MinionCandidateSummary",
     "OffsetClaim",
     "PlayerBlockRecord",
+    "ReplayContext",
     "ReplaySignalSummary",
     "ValidationEvidence",
     "assess_completeness",
@@ -49,6 +57,9 @@ __all__ = [
     "decode_kda_from_replay",
     "decode_winner_from_replay",
     "iter_player_events",
+    "player_event_table",
+    "PlayerEvent",
+    "PlayerEventTable",
     "collect_player_events_by_entity",
     "iter_player_blocks",
     "parse_player_blocks",
@@ -7,10 +7,10 @@ import json
 from collections import defaultdict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
 
 from vg.analysis.decode_tournament import _resolve_truth_player_name
-from vg.core.kda_detector import KDADetector
+from vg.core.kda_detector import ASSIST_CREDIT_WINDOW, KDADetector
 from vg.core.unified_decoder import _le_to_be
 from vg.core.vgr_parser import VGRParser
 
@@ -55,11 +55,16 @@ def _count_assists_for_rule(
     game_duration: int,
     kill_buffer: int,
     rule: AssistRule,
+    credit_window: Optional[int] = None,
 ) -> Dict[int, int]:
     assists = {eid: 0 for eid in valid_eids}
     max_ts = game_duration + kill_buffer
+    kill_events = (
+        detector.kill_events if credit_window is None
+        else detector.kill_events_for_window(credit_window)
+    )
 
-    for kill_event in detector.kill_events:
+    for kill_event in kill_events:
         if kill_event.timestamp is not None and kill_event.timestamp > max_ts:
             continue
         killer_eid = kill_event.killer_eid
@@ -94,98 +99,128 @@ def build_assist_rule_research(
     *,
     kill_buffer: int = 3,
     complete_only: bool = True,
+    credit_windows: Sequence[int] = (ASSIST_CREDIT_WINDOW,),
 ) -> Dict[str, object]:
+    """
+    Score every rule at every credit window size against truth assists.
+
+    Each replay is parsed and scanned once, with the widest window; smaller
+    windows are cut from the same detector.
+    """
+    if not credit_windows:
+        raise ValueError("credit_windows must name at least one window size")
     matches = _load_truth_matches(truth_path)
-    rule_rows = []
+    scan_window = max(credit_windows)
+    scanned = []
 
-    for rule in RULES:
-        correct = total = 0
-        mismatch_rows = []
+    for match in matches:
+        fixture_directory = str(Path(match["replay_file"]).parent.name)
+        if complete_only and "Incomplete" in fixture_directory:
+            continue
 
-        for match in matches:
-            fixture_directory = str(Path(match["replay_file"]).parent.name)
-            if complete_only and "Incomplete" in fixture_directory:
-                continue
+        replay_file = str(match["replay_file"])
+        parsed = VGRParser(replay_file, auto_truth=False).parse()
+        player_map: Dict[int, Dict[str, object]] = {}
+        team_map: Dict[int, str] = {}
+        ordered_players = []
+        for team_label in ("left", "right"):
+            for player in parsed["teams"][team_label]:
+                entity_id = player.get("entity_id")
+                if not entity_id:
+                    continue
+                entity_be = _le_to_be(entity_id)
+                player_map[entity_be] = player
+                team_map[entity_be] = team_label
+                ordered_players.append((entity_be, player))
+
+        detector = KDADetector(set(player_map), credit_window=scan_window)
+        for frame_idx, data in load_frames(replay_file):
+            detector.process_frame(frame_idx, data)
+        scanned.append((match, team_map, ordered_players, detector))
 
-            replay_file = str(match["replay_file"])
-            parsed = VGRParser(replay_file, auto_truth=False).parse()
-            duration = int(match["match_info"]["duration_seconds"])
-            player_map: Dict[int, Dict[str, object]] = {}
-            team_map: Dict[int, str] = {}
-            ordered_players = []
-            for team_label in ("left", "right"):
-                for player in parsed["teams"][team_label]:
-                    entity_id = player.get("entity_id")
-                    if not entity_id:
+    rule_rows = []
+    for credit_window in credit_windows:
+        for rule in RULES:
+            correct = total = 0
+            mismatch_rows = []
+
+            for match, team_map, ordered_players, detector in scanned:
+                assists = _count_assists_for_rule(
+                    detector,
+                    team_map,
+                    [entity_be for entity_be, _ in ordered_players],
+                    game_duration=int(match["match_info"]["duration_seconds"]),
+                    kill_buffer=kill_buffer,
+                    rule=rule,
+                    credit_window=credit_window,
+                )
+
+                for entity_be, player in ordered_players:
+                    truth_name = _resolve_truth_player_name(player["name"], match["players"])
+                    if not truth_name:
                         continue
-                    entity_be = _le_to_be(entity_id)
-                    player_map[entity_be] = player
-                    team_map[entity_be] = team_label
-                    ordered_players.append((entity_be, player))
-
-            detector = KDADetector(set(player_map))
-            for frame_idx, data in load_frames(replay_file):
-                detector.process_frame(frame_idx, data)
-
-            assists = _count_assists_for_rule(
-                detector,
-                team_map,
-                [entity_be for entity_be, _ in ordered_players],
-                game_duration=duration,
-                kill_buffer=kill_buffer,
-                rule=rule,
+                    truth_player = match["players"][truth_name]
+                    if truth_player.get("assists") is None:
+                        continue
+                    total += 1
+                    predicted = assists[entity_be]
+                    expected = int(truth_player["assists"])
+                    if predicted == expected:
+                        correct += 1
+                    else:
+                        mismatch_rows.append(
+                            {
+                                "replay_name": match["replay_name"],
+                                "player_name": player["name"],
+                                "hero_name": player.get("hero_name"),
+                                "truth_assists": expected,
+                                "predicted_assists": predicted,
+                                "diff": predicted - expected,
+                            }
+                        )
+
+            pct = round((correct / total) * 100, 4) if total else 0.0
+            rule_rows.append(
+                {
+                    "rule": rule.to_dict(),
+                    "credit_window": credit_window,
+                    "correct": correct,
+                    "total": total,
+                    "pct": pct,
+                    "mismatch_count": len(mismatch_rows),
+                    "mismatch_rows": mismatch_rows[:100],
+                }
             )
 
-            for entity_be, player in ordered_players:
-                truth_name = _resolve_truth_player_name(player["name"], match["players"])
-                if not truth_name:
-                    continue
-                truth_player = match["players"][truth_name]
-                if truth_player.get("assists") is None:
-                    continue
-                total += 1
-                predicted = assists[entity_be]
-                expected = int(truth_player["assists"])
-                if predicted == expected:
-                    correct += 1
-                else:
-                    mismatch_rows.append(
-                        {
-                            "replay_name": match["replay_name"],
-                            "player_name": player["name"],
-                            "hero_name": player.get("hero_name"),
-                            "truth_assists": expected,
-                            "predicted_assists": predicted,
-                            "diff": predicted - expected,
-                        }
-                    )
-
-        pct = round((correct / total) * 100, 4) if total else 0.0
-        rule_rows.append(
-            {
-                "rule": rule.to_dict(),
-                "correct": correct,
-                "total": total,
-                "pct": pct,
-                "mismatch_count": len(mismatch_rows),
-                "mismatch_rows": mismatch_rows[:100],
-            }
-        )
-
     rule_rows.sort(key=lambda row: (row["correct"], -row["mismatch_count"]), reverse=True)
     return {
         "truth_path": str(Path(truth_path).resolve()),
         "kill_buffer": kill_buffer,
         "complete_only": complete_only,
+        "credit_windows": list(credit_windows),
         "rules": rule_rows,
     }
 
 
+def _credit_window_list(value: str, allow_empty: bool = False) -> List[int]:
+    """Parse a comma-separated `--credit-windows` value."""
+    windows = [int(item) for item in value.split(",") if item]
+    if not windows and not allow_empty:
+        raise argparse.ArgumentTypeError("expected at least one credit window size")
+    return windows
+
+
 def main(argv: Optional[Iterable[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Evaluate alternative assist counting rules.")
     parser.add_argument("--truth", default="vg/output/tournament_truth.json", help="Truth JSON path")
     parser.add_argument("--kill-buffer", type=int, default=3, help="Kill buffer seconds")
     parser.add_argument("--all-fixtures", action="store_true", help="Include incomplete fixtures")
+    parser.add_argument(
+        "--credit-windows",
+        type=_credit_window_list,
+        default=[ASSIST_CREDIT_WINDOW],
+        help="Comma-separated credit window sizes to sweep, e.g. 300,500,800",
+    )
     parser.add_argument("-o", "--output", help="Optional output JSON path")
     args = parser.parse_args(list(argv) if argv is not None else None)
 
@@ -193,6 +228,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         args.truth,
         kill_buffer=args.kill_buffer,
         complete_only=not args.all_fixtures,
+        credit_windows=args.credit_windows,
     )
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
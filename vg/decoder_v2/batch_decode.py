@@ -1,14 +1,28 @@
-"""Batch decode replays conservatively with decoder_v2."""
+"""Batch decode replays conservatively with decoder_v2.
+
+`decode_replay_batch` returns the whole report in memory. For long runs
+`decode_replay_batch_jsonl` appends one JSONL record per replay as it
+finishes, checkpoints each completed replay with its frame content hash and,
+when rerun, skips replays whose frames are unchanged. `summarize_batch_jsonl`
+rebuilds the report counters from the JSONL without decoding anything.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from vg.core.batch_runner import BatchResult, add_batch_arguments, run_batch
+from vg.core.frame_store import find_frame_files, replay_content_hash
+from vg.core.result_cache import cached_payload, default_cache
 
 from .decode_match import decode_match
 
+CHECKPOINT_SUFFIX = ".checkpoint"
+
 
 def find_replays(base_path: str) -> List[Path]:
     """Find all `.0.vgr` replay files under a directory tree."""
@@ -21,45 +35,265 @@ def find_replays(base_path: str) -> List[Path]:
     return replays
 
 
-def decode_replay_batch(base_path: str) -> Dict[str, object]:
-    """Decode a replay tree using conservative v2 policy."""
+def _decode_replay_payload(replay: Path) -> Dict[str, object]:
+    """Decode one replay to its JSON payload (runs inside batch workers)."""
+    return cached_payload("decoder_v2", str(replay), lambda: decode_match(str(replay)).to_dict())
+
+
+def replay_fingerprint(replay: Path) -> Optional[str]:
+    """
+    `replay_content_hash` of a replay's frame files, or None without frames.
+
+    Size and mtime alone miss a replay rewritten in place within the mtime
+    resolution. With VG_DECODE_CACHE set the shared result cache's hash memo
+    is reused, so the decode that follows does not hash the frames again.
+    """
+    cache = default_cache()
+    if cache is not None:
+        return cache.content_hash(str(replay))
+    if not find_frame_files(replay.parent, replay.stem.rsplit(".", 1)[0]):
+        return None
+    return replay_content_hash(str(replay))
+
+
+def _new_summary() -> Dict[str, Dict[str, int]]:
+    return {
+        "completeness_summary": {},
+        "accepted_field_summary": {},
+        "withheld_field_summary": {},
+    }
+
+
+def _count_payload(summary: Dict[str, Dict[str, int]], payload: Dict[str, object]) -> None:
+    completeness = summary["completeness_summary"]
+    status = payload["completeness_status"]
+    completeness[status] = completeness.get(status, 0) + 1
+    for field_name, counter in (
+        ("accepted_fields", summary["accepted_field_summary"]),
+        ("withheld_fields", summary["withheld_field_summary"]),
+    ):
+        for key in payload[field_name]:
+            counter[key] = counter.get(key, 0) + 1
+
+
+def decode_replay_batch(
+    base_path: str,
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+) -> Dict[str, object]:
+    """Decode a replay tree using conservative v2 policy.
+
+    `workers > 1` decodes on a process pool; matches keep replay order and
+    replays that fail, time out or exceed the memory ceiling are listed under
+    `failed_replays` instead of aborting the batch.
+    """
     replays = find_replays(base_path)
     matches = []
-    completeness_counter: Dict[str, int] = {}
-    accepted_field_counter: Dict[str, int] = {}
-    withheld_field_counter: Dict[str, int] = {}
+    failed_replays = []
+    summary = _new_summary()
 
-    for replay in replays:
-        decoded = decode_match(str(replay))
-        payload = decoded.to_dict()
+    results = run_batch(
+        _decode_replay_payload,
+        replays,
+        workers=workers,
+        timeout=timeout,
+        memory_limit_mb=memory_limit_mb,
+    )
+    for result in results:
+        if not result.ok:
+            failed_replays.append({"replay_file": str(result.item), "error": result.error})
+            continue
+        payload = result.value
         matches.append(payload)
-
-        completeness_status = payload["completeness_status"]
-        completeness_counter[completeness_status] = completeness_counter.get(completeness_status, 0) + 1
-
-        for key in payload["accepted_fields"]:
-            accepted_field_counter[key] = accepted_field_counter.get(key, 0) + 1
-        for key in payload["withheld_fields"]:
-            withheld_field_counter[key] = withheld_field_counter.get(key, 0) + 1
+        _count_payload(summary, payload)
 
     return {
         "schema_version": "decoder_v2.batch.v1",
         "base_path": str(Path(base_path).resolve()),
         "total_replays": len(replays),
-        "completeness_summary": completeness_counter,
-        "accepted_field_summary": accepted_field_counter,
-        "withheld_field_summary": withheld_field_counter,
+        **summary,
         "matches": matches,
+        "failed_replays": failed_replays,
     }
 
 
+def checkpoint_path(output_path: str) -> Path:
+    """Checkpoint manifest stored next to a batch JSONL file."""
+    return Path(output_path + CHECKPOINT_SUFFIX)
+
+
+def load_checkpoint(output_path: str) -> Dict[str, Optional[str]]:
+    """Completed replay paths mapped to the fingerprint they were decoded at."""
+    completed: Dict[str, Optional[str]] = {}
+    path = checkpoint_path(output_path)
+    if not path.exists():
+        return completed
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn last line from an interrupted run
+            completed[entry["replay_file"]] = entry["fingerprint"]
+    return completed
+
+
+def _open_for_append(path: Path):
+    """Open a JSONL file for appending, fencing off a torn last line."""
+    torn = False
+    if path.exists() and path.stat().st_size:
+        with open(path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            torn = f.read(1) != b"\n"
+    handle = open(path, "a", encoding="utf-8")
+    if torn:
+        handle.write("\n")
+    return handle
+
+
+def iter_batch_jsonl(output_path: str) -> Iterator[Dict[str, object]]:
+    """
+    Yield the latest record per replay from a batch JSONL file.
+
+    A replay decoded again (after a failure, a changed fingerprint or an
+    interrupted checkpoint write) appends a newer record; only the last one
+    is yielded, in file order.
+    """
+    path = Path(output_path)
+    if not path.exists():
+        return
+    latest: Dict[str, int] = {}
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f):
+            try:
+                latest[json.loads(line)["replay_file"]] = line_no
+            except (json.JSONDecodeError, KeyError):
+                continue
+    keep = set(latest.values())
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f):
+            if line_no in keep:
+                yield json.loads(line)
+
+
+def summarize_batch_jsonl(output_path: str, base_path: Optional[str] = None) -> Dict[str, object]:
+    """Rebuild the batch report counters from a JSONL file (no decoding)."""
+    summary = _new_summary()
+    total = 0
+    failed_replays = []
+    for record in iter_batch_jsonl(output_path):
+        total += 1
+        if record.get("ok"):
+            _count_payload(summary, record["match"])
+        else:
+            failed_replays.append({"replay_file": record["replay_file"], "error": record.get("error")})
+    report: Dict[str, object] = {"schema_version": "decoder_v2.batch.v1"}
+    if base_path is not None:
+        report["base_path"] = str(Path(base_path).resolve())
+    report.update({
+        "total_replays": total,
+        **summary,
+        "failed_replays": failed_replays,
+        "output_jsonl": str(Path(output_path).resolve()),
+    })
+    return report
+
+
+def decode_replay_batch_jsonl(
+    base_path: str,
+    output_path: str,
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+) -> Dict[str, object]:
+    """Decode a replay tree into a resumable JSONL file.
+
+    Each finished replay appends `{"replay_file", "fingerprint", "ok", "match"}`
+    (or `"error"` on failure) to `output_path`; once that line is on disk,
+    successful replays are appended to the `<output>.checkpoint` manifest.
+    A rerun skips checkpointed replays whose frame fingerprint is unchanged
+    and retries failures, so an interrupted run loses at most the replays
+    in flight. Returns `summarize_batch_jsonl` of the finished file plus
+    `resumed_replays` / `decoded_replays` counts.
+    """
+    replays = find_replays(base_path)
+    completed = load_checkpoint(output_path)
+    fingerprints: Dict[Path, Optional[str]] = {}
+    pending = []
+    for replay in replays:
+        fingerprint = replay_fingerprint(replay)
+        if completed.get(str(replay.resolve())) == fingerprint:
+            continue
+        fingerprints[replay] = fingerprint
+        pending.append(replay)
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with _open_for_append(Path(output_path)) as records, \
+            _open_for_append(checkpoint_path(output_path)) as checkpoint:
+
+        def write(result: BatchResult, done: int, total: int) -> None:
+            replay_file = str(result.item.resolve())
+            fingerprint = fingerprints[result.item]
+            record: Dict[str, object] = {
+                "replay_file": replay_file,
+                "fingerprint": fingerprint,
+                "ok": result.ok,
+            }
+            if result.ok:
+                record["match"] = result.value
+                result.value = None
+            else:
+                record["error"] = result.error
+            records.write(json.dumps(record, ensure_ascii=False) + "\n")
+            records.flush()
+            os.fsync(records.fileno())
+            if result.ok:
+                checkpoint.write(json.dumps({"replay_file": replay_file, "fingerprint": fingerprint}) + "\n")
+                checkpoint.flush()
+
+        run_batch(
+            _decode_replay_payload,
+            pending,
+            workers=workers,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            on_result=write,
+        )
+
+    report = summarize_batch_jsonl(output_path, base_path)
+    report["resumed_replays"] = len(replays) - len(pending)
+    report["decoded_replays"] = len(pending)
+    return report
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Batch decode replays conservatively with decoder_v2.")
     parser.add_argument("base_path", help="Replay root directory")
     parser.add_argument("-o", "--output", help="Optional output JSON path")
+    parser.add_argument(
+        "--jsonl",
+        help="Append one record per replay to this JSONL file and resume from its checkpoint; "
+             "the summary report is printed or written to --output",
+    )
+    add_batch_arguments(parser)
     args = parser.parse_args(argv)
 
-    report = decode_replay_batch(args.base_path)
+    if args.jsonl:
+        report = decode_replay_batch_jsonl(
+            args.base_path,
+            args.jsonl,
+            workers=args.workers,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit_mb,
+        )
+    else:
+        report = decode_replay_batch(
+            args.base_path,
+            workers=args.workers,
+            timeout=args.timeout,
+            memory_limit_mb=args.memory_limit_mb,
+        )
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
         output_path = Path(args.output)
@@ -2,124 +2,56 @@
 
 from __future__ import annotations
 
-import struct
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence, Tuple
+from typing import List, Optional, Tuple
 
-from vg.core.kda_detector import KDADetector
-from vg.core.unified_decoder import _DEATH_HEADER, _ITEM_ACQUIRE_HEADER, _le_to_be
-from vg.core.vgr_parser import VGRParser
+from vg.core.frame_store import Buffer, read_frames
 
 from .models import CompletenessAssessment, CompletenessStatus, ReplaySignalSummary
+from .replay_context import ReplayContext
 
 
-def load_frames(replay_file: str) -> List[Tuple[int, bytes]]:
-    """Load replay frames as `(frame_index, bytes)` tuples."""
+def load_frames(replay_file: str) -> List[Tuple[int, Buffer]]:
+    """Load replay frames as `(frame_index, bytes)` tuples (files are unmapped again)."""
     replay_path = Path(replay_file)
-    frame_dir = replay_path.parent
-    replay_name = replay_path.stem.rsplit(".", 1)[0]
-    return [
-        (int(frame.stem.split(".")[-1]), frame.read_bytes())
-        for frame in sorted(frame_dir.glob(f"{replay_name}.*.vgr"), key=lambda p: int(p.stem.split(".")[-1]))
-    ]
+    return read_frames(replay_path.parent, replay_path.stem.rsplit(".", 1)[0])
 
 
-def _scan_max_timestamp_in_bytes(
-    data: bytes,
-    header: bytes,
-    timestamp_offset: int,
-    guards: Sequence[Tuple[int, bytes]] = (),
-) -> Optional[float]:
-    values = []
-    pos = 0
-    while True:
-        idx = data.find(header, pos)
-        if idx == -1:
-            break
-        pos = idx + 1
-        if idx + timestamp_offset + 4 > len(data):
-            continue
-        if any(data[idx + rel:idx + rel + len(expected)] != expected for rel, expected in guards):
-            continue
-        try:
-            ts = struct.unpack_from(">f", data, idx + timestamp_offset)[0]
-        except struct.error:
-            continue
-        if 0 < ts < 5000:
-            values.append(ts)
-    return max(values) if values else None
-
-
-def _scan_max_timestamp(
-    frames: Sequence[Tuple[int, bytes]],
-    header: bytes,
-    timestamp_offset: int,
-    guards: Sequence[Tuple[int, bytes]] = (),
-) -> Optional[float]:
-    """Scan the largest valid float timestamp for a header family frame-by-frame."""
-    values = []
-    for _, data in frames:
-        value = _scan_max_timestamp_in_bytes(data, header, timestamp_offset, guards)
-        if value is not None:
-            values.append(value)
-    return max(values) if values else None
-
-
-def extract_replay_signals(replay_file: str) -> ReplaySignalSummary:
+def extract_replay_signals(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> ReplaySignalSummary:
     """Extract timing/completeness signals from a replay."""
-    parser = VGRParser(replay_file, auto_truth=False)
-    parsed = parser.parse()
-    frames = load_frames(replay_file)
+    if context is None:
+        context = ReplayContext(replay_file)
+    return context.memo("signals", lambda: _extract_replay_signals(context))
 
-    valid_eids = {
-        _le_to_be(player["entity_id"])
-        for team in ("left", "right")
-        for player in parsed["teams"][team]
-        if player.get("entity_id")
-    }
 
-    detector = KDADetector(valid_eids)
-    for frame_idx, data in frames:
-        detector.process_frame(frame_idx, data)
+def _extract_replay_signals(context: ReplayContext) -> ReplaySignalSummary:
+    parsed = context.parsed
+    frames = context.frames
+    detector = context.kda_detector
 
     max_kill_ts = max((event.timestamp for event in detector.kill_events if event.timestamp is not None), default=None)
     max_player_death_ts = max((event.timestamp for event in detector.death_events), default=None)
-    max_death_header_ts = _scan_max_timestamp(
-        frames,
-        _DEATH_HEADER,
-        9,
-        guards=((3, b"\x00\x00"), (7, b"\x00\x00")),
-    )
-    max_item_ts = _scan_max_timestamp(
-        frames,
-        _ITEM_ACQUIRE_HEADER,
-        17,
-        guards=((3, b"\x00\x00"),),
-    )
-
-    crystal_ts = None
-    if frames:
-        crystal_events = []
-        for _, data in frames:
-            pos = 0
-            while True:
-                idx = data.find(_DEATH_HEADER, pos)
-                if idx == -1:
-                    break
-                pos = idx + 1
-                if idx + 13 > len(data):
-                    continue
-                if (
-                    data[idx + 3:idx + 5] != b"\x00\x00"
-                    or data[idx + 7:idx + 9] != b"\x00\x00"
-                ):
-                    continue
-                eid = struct.unpack_from(">H", data, idx + 5)[0]
-                ts = struct.unpack_from(">f", data, idx + 9)[0]
-                if 2000 <= eid <= 2005 and 60 < ts < 2400:
-                    crystal_events.append(ts)
-        if crystal_events:
-            crystal_ts = max(crystal_events)
+    death_header_ts = []
+    item_ts = []
+    crystal_events = []
+    for _, records in context.frame_records:
+        for death in records.deaths:
+            if not death.valid:
+                continue
+            if 0 < death.timestamp < 5000:
+                death_header_ts.append(death.timestamp)
+            if 2000 <= death.eid <= 2005 and 60 < death.timestamp < 2400:
+                crystal_events.append(death.timestamp)
+        for item in records.item_acquires:
+            if item.timestamp is not None and 0 < item.timestamp < 5000:
+                item_ts.append(item.timestamp)
+
+    max_death_header_ts = max(death_header_ts, default=None)
+    max_item_ts = max(item_ts, default=None)
+    crystal_ts = max(crystal_events, default=None)
 
     return ReplaySignalSummary(
         replay_name=parsed["replay_name"],
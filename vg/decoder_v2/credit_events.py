@@ -1,55 +1,114 @@
-"""Generic credit-event parsing for decoder_v2."""
+"""Generic credit-event parsing for decoder_v2.
+
+Credit events are kept in a `CreditEventTable` (one typed array per field)
+and `CreditEventRecord` objects are only built when iterated, so whole-corpus
+scans do not allocate a dataclass and a hex string per `10 04 1D` hit.
+"""
 
 from __future__ import annotations
 
-import math
 import struct
+from array import array
 from collections import defaultdict
-from typing import Dict, Iterable, List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+from vg.core.event_table import EventTable
 from vg.core.unified_decoder import _CREDIT_HEADER
 
 from .completeness import load_frames
 from .models import CreditEventRecord
+from .replay_context import ReplayContext
+
+_CREDIT_FIELDS = struct.Struct(">HIB")  # eid, raw f32 bits, action
+_F32_BITS = struct.Struct(">I")
+_F32 = struct.Struct(">f")
+_EXPONENT_MASK = 0x7F800000
+
+
+class CreditEventTable(EventTable):
+    """Raw credit events, one row per `10 04 1D` record with a full 12-byte body."""
+
+    COLUMNS = (
+        ("frame_idx", "I"),
+        ("file_offset", "I"),
+        ("entity_id_be", "H"),
+        ("value_bits", "I"),  # Raw f32 bits, so NaN payloads survive
+        ("action", "B"),
+    )
+
+    def values(self) -> array:
+        """f32 values column (NaN/inf kept as-is)."""
+        return array("f", self.column("value_bits").tobytes())
+
+    def record(self, index: int) -> CreditEventRecord:
+        frame_idx, file_offset, entity_id_be, bits, action = self.row(index)
+        return _make_record(frame_idx, file_offset, entity_id_be, bits, action)
+
+    def __iter__(self) -> Iterator[CreditEventRecord]:
+        for row in self.rows():
+            yield _make_record(*row)
 
 
-def iter_credit_events(replay_file: str) -> Iterable[CreditEventRecord]:
+def _make_record(frame_idx: int, file_offset: int, entity_id_be: int,
+                 bits: int, action: int) -> CreditEventRecord:
+    value_is_finite = (bits & _EXPONENT_MASK) != _EXPONENT_MASK
+    raw_bits = _F32_BITS.pack(bits)
+    return CreditEventRecord(
+        frame_idx=frame_idx,
+        entity_id_be=entity_id_be,
+        action=action,
+        value=_F32.unpack(raw_bits)[0] if value_is_finite else None,
+        file_offset=file_offset,
+        raw_record_hex=(_CREDIT_HEADER + b"\x00\x00" + _CREDIT_FIELDS.pack(entity_id_be, bits, action)).hex(),
+        padding_ok=True,
+        value_is_finite=value_is_finite,
+    )
+
+
+def credit_event_table(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> CreditEventTable:
+    """Columnar credit events for a replay."""
+    if context is None:
+        return _scan_credit_events(load_frames(replay_file))
+    return context.memo(
+        "credit_event_table",
+        lambda: _scan_credit_events(context.frames),
+    )
+
+
+def iter_credit_events(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> Iterable[CreditEventRecord]:
     """Yield raw credit events for a replay."""
-    for frame_idx, data in load_frames(replay_file):
-        pos = 0
-        while True:
-            pos = data.find(_CREDIT_HEADER, pos)
-            if pos == -1:
-                break
-            if pos + 12 > len(data):
-                pos += 1
-                continue
-            if data[pos + 3:pos + 5] != b"\x00\x00":
-                pos += 1
-                continue
-
-            entity_id_be = struct.unpack_from(">H", data, pos + 5)[0]
-            raw_value = struct.unpack_from(">f", data, pos + 7)[0]
-            action = data[pos + 11]
-            value_is_finite = not (math.isnan(raw_value) or math.isinf(raw_value))
-            value = raw_value if value_is_finite else None
-
-            yield CreditEventRecord(
-                frame_idx=frame_idx,
-                entity_id_be=entity_id_be,
-                action=action,
-                value=value,
-                file_offset=pos,
-                raw_record_hex=data[pos:pos + 12].hex(),
-                padding_ok=True,
-                value_is_finite=value_is_finite,
-            )
-            pos += 1
-
-
-def collect_credit_events_by_entity(replay_file: str) -> Dict[int, List[CreditEventRecord]]:
+    return iter(credit_event_table(replay_file, context=context))
+
+
+def _scan_credit_events(
+    frames: Sequence[Tuple[int, bytes]],
+) -> CreditEventTable:
+    table = CreditEventTable()
+    append = table.append
+    unpack_fields = _CREDIT_FIELDS.unpack_from
+    for frame_idx, data in frames:
+        limit = len(data) - 12
+        pos = data.find(_CREDIT_HEADER)
+        while pos != -1:
+            if pos <= limit and data[pos + 3] == 0 and data[pos + 4] == 0:
+                entity_id_be, bits, action = unpack_fields(data, pos + 5)
+                append(frame_idx, pos, entity_id_be, bits, action)
+            pos = data.find(_CREDIT_HEADER, pos + 1)
+    return table
+
+
+def collect_credit_events_by_entity(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> Dict[int, List[CreditEventRecord]]:
     """Collect credit events grouped by BE entity id."""
     grouped: Dict[int, List[CreditEventRecord]] = defaultdict(list)
-    for event in iter_credit_events(replay_file):
+    for event in iter_credit_events(replay_file, context=context):
         grouped[event.entity_id_be].append(event)
     return grouped
@@ -12,17 +12,22 @@ from vg.core.vgr_parser import VGRParser
 from .kda import decode_kda_from_replay
 from .minions import collect_minion_candidates
 from .models import AcceptedPlayerFields, DecoderV2MatchOutput, FieldDecision
+from .replay_context import ReplayContext
 from .winner import decode_winner_from_replay
 
 
-def decode_match(replay_file: str) -> DecoderV2MatchOutput:
+def decode_match(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> DecoderV2MatchOutput:
     """Decode a replay conservatively, only exporting accepted fields."""
-    parser = VGRParser(replay_file, auto_truth=False)
-    parsed = parser.parse()
+    if context is None:
+        context = ReplayContext(replay_file, parsed=VGRParser(replay_file, auto_truth=False).parse())
+    parsed = context.parsed
     match_info = parsed["match_info"]
 
-    winner_result = decode_winner_from_replay(replay_file)
-    kda_result = decode_kda_from_replay(replay_file)
+    winner_result = decode_winner_from_replay(replay_file, context=context)
+    kda_result = decode_kda_from_replay(replay_file, context=context)
     assessment = winner_result.assessment
 
     players: List[AcceptedPlayerFields] = []
@@ -154,12 +159,17 @@ def decode_match(replay_file: str) -> DecoderV2MatchOutput:
     )
 
 
-def decode_match_debug(replay_file: str) -> Dict[str, object]:
+def decode_match_debug(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> Dict[str, object]:
     """Decode a replay with research/debug details included."""
-    safe_output = decode_match(replay_file)
-    winner_result = decode_winner_from_replay(replay_file)
-    kda_result = decode_kda_from_replay(replay_file)
-    minion_candidates = collect_minion_candidates(replay_file)
+    if context is None:
+        context = ReplayContext(replay_file)
+    safe_output = decode_match(replay_file, context=context)
+    winner_result = decode_winner_from_replay(replay_file, context=context)
+    kda_result = decode_kda_from_replay(replay_file, context=context)
+    minion_candidates = collect_minion_candidates(replay_file, context=context)
 
     return {
         "schema_version": "decoder_v2.debug_match.v1",
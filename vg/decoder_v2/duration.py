@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from .completeness import assess_completeness, extract_replay_signals
 from .models import CompletenessStatus, DurationEstimate, ReplaySignalSummary
+from .replay_context import ReplayContext
 
 
 def estimate_duration_from_signals(signals: ReplaySignalSummary) -> DurationEstimate:
@@ -42,6 +45,9 @@ def estimate_duration_from_signals(signals: ReplaySignalSummary) -> DurationEsti
     )
 
 
-def estimate_duration(replay_file: str) -> DurationEstimate:
+def estimate_duration(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> DurationEstimate:
     """Convenience entrypoint to estimate duration directly from a replay path."""
-    return estimate_duration_from_signals(extract_replay_signals(replay_file))
+    return estimate_duration_from_signals(extract_replay_signals(replay_file, context=context))
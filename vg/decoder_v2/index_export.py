@@ -7,7 +7,7 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .batch_decode import decode_replay_batch
+from .batch_decode import decode_replay_batch, decode_replay_batch_jsonl, iter_batch_jsonl
 from .minion_policy import (
     MINION_POLICY_CHOICES,
     MINION_POLICY_NONE,
@@ -76,9 +76,20 @@ def build_index_ready_export(
     minion_policy: str = MINION_POLICY_NONE,
     *,
     kda_correction_path: Optional[str] = None,
+    batch_jsonl: Optional[str] = None,
 ) -> Dict[str, object]:
-    """Build an export containing only currently accepted fields."""
-    batch = decode_replay_batch(base_path)
+    """Build an export containing only currently accepted fields.
+
+    With `batch_jsonl` the decode runs through the resumable
+    `decode_replay_batch_jsonl` (finished replays are reused) and matches are
+    read back from that file one at a time.
+    """
+    if batch_jsonl:
+        batch = decode_replay_batch_jsonl(base_path, batch_jsonl)
+        batch_matches = (record["match"] for record in iter_batch_jsonl(batch_jsonl) if record.get("ok"))
+    else:
+        batch = decode_replay_batch(base_path)
+        batch_matches = batch["matches"]
     kda_corrections = _load_kda_correction_map(kda_correction_path)
     matches = []
     minion_policy_summary = {
@@ -91,7 +102,7 @@ def build_index_ready_export(
         "corrected_matches": 0,
         "corrected_rows": 0,
     }
-    for match in batch["matches"]:
+    for match in batch_matches:
         accepted = match["accepted_fields"]
         correction_payload = (
             kda_corrections.get(f"file:{Path(match['replay_file']).resolve()}")
@@ -209,6 +220,10 @@ def main(argv: Optional[List[str]] = None) -> int:
         "--kda-correction-path",
         help="Optional result-screen KDA correction JSON file or directory",
     )
+    parser.add_argument(
+        "--batch-jsonl",
+        help="Resumable decode: per-replay JSONL file (with checkpoint) reused across runs",
+    )
     parser.add_argument("-o", "--output", help="Optional output path")
     args = parser.parse_args(argv)
 
@@ -216,6 +231,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         args.base_path,
         minion_policy=args.minion_policy,
         kda_correction_path=args.kda_correction_path,
+        batch_jsonl=args.batch_jsonl,
     )
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional
 
-from vg.core.kda_detector import KDADetector
-from vg.core.vgr_parser import VGRParser
 from vg.core.unified_decoder import _le_to_be
 
 from .completeness import extract_replay_signals
 from .duration import estimate_duration_from_signals
 from .models import CompletenessStatus, KDAExtractionResult, KDAPlayerSummary
+from .replay_context import ReplayContext
 
 
-def decode_kda_from_replay(replay_file: str) -> KDAExtractionResult:
+def decode_kda_from_replay(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> KDAExtractionResult:
     """Decode K/D/A conservatively. Reject incomplete replays by default."""
-    signals = extract_replay_signals(replay_file)
+    if context is None:
+        context = ReplayContext(replay_file)
+    return context.memo("kda", lambda: _decode_kda(replay_file, context))
+
+
+def _decode_kda(replay_file: str, context: ReplayContext) -> KDAExtractionResult:
+    signals = extract_replay_signals(replay_file, context=context)
     duration_estimate = estimate_duration_from_signals(signals)
     assessment = duration_estimate.assessment
 
@@ -28,8 +36,7 @@ def decode_kda_from_replay(replay_file: str) -> KDAExtractionResult:
             players=(),
         )
 
-    parser = VGRParser(replay_file, auto_truth=False)
-    parsed = parser.parse()
+    parsed = context.parsed
 
     player_map: Dict[int, Dict[str, object]] = {}
     team_map: Dict[int, str] = {}
@@ -44,13 +51,7 @@ def decode_kda_from_replay(replay_file: str) -> KDAExtractionResult:
             team_map[entity_be] = team_label
             ordered_players.append((entity_be, player))
 
-    detector = KDADetector(set(player_map))
-    from .completeness import load_frames
-
-    for frame_idx, data in load_frames(replay_file):
-        detector.process_frame(frame_idx, data)
-
-    results = detector.get_results(
+    results = context.kda_detector.get_results(
         game_duration=duration_estimate.estimate_seconds,
         team_map=team_map,
     )
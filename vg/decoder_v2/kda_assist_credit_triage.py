@@ -4,15 +4,15 @@ from __future__ import annotations
 
 import argparse
 import json
-from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from vg.analysis.decode_tournament import _resolve_truth_player_name
-from vg.core.kda_detector import KDADetector
+from vg.core.kda_detector import ASSIST_CREDIT_WINDOW, KDADetector
 from vg.core.unified_decoder import _le_to_be
 from vg.core.vgr_parser import VGRParser
 
+from .assist_rule_research import _credit_window_list
 from .completeness import load_frames
 from .kda_mismatch_triage import build_kda_mismatch_triage
 from .kda_postgame_audit import _load_truth_matches
@@ -24,7 +24,16 @@ def build_kda_assist_credit_triage(
     kill_buffer: int = 3,
     death_buffer: int = 10,
     complete_only: bool = True,
+    credit_windows: Sequence[int] = (),
 ) -> Dict[str, object]:
+    """
+    Collect each mismatched player's credit records after every kill.
+
+    `credit_windows` adds a per-window view of the same kills (credit values
+    and current-rule verdict for each window size). Each replay is scanned
+    once with the widest window and the smaller ones are cut from it.
+    """
+    scan_window = max((ASSIST_CREDIT_WINDOW, *credit_windows))
     mismatch_report = build_kda_mismatch_triage(
         truth_path,
         kill_buffer=kill_buffer,
@@ -57,7 +66,7 @@ def build_kda_assist_credit_triage(
                     team_map[entity_be] = team_label
                     ordered_players.append((entity_be, player))
 
-            detector = KDADetector(set(player_map))
+            detector = KDADetector(set(player_map), credit_window=scan_window)
             for frame_idx, data in load_frames(replay_file):
                 detector.process_frame(frame_idx, data)
 
@@ -81,40 +90,48 @@ def build_kda_assist_credit_triage(
         max_ts = duration + kill_buffer
 
         kill_windows = []
-        for kill_event in detector.kill_events:
+        kill_events = (
+            detector.kill_events_for_window(ASSIST_CREDIT_WINDOW)
+            if credit_windows else detector.kill_events
+        )
+        swept = {window: detector.kill_events_for_window(window) for window in credit_windows}
+        for kill_idx, kill_event in enumerate(kill_events):
             if kill_event.timestamp is not None and kill_event.timestamp > max_ts:
                 continue
             killer_name = player_map.get(kill_event.killer_eid, {}).get("name")
             killer_team = team_map.get(kill_event.killer_eid)
-            credits_by_eid: Dict[int, List[float]] = defaultdict(list)
-            for credit in kill_event.credits:
-                credits_by_eid[credit.eid].append(credit.value)
+            values = _player_credit_values(kill_event, player_eid)
+            by_window = {
+                str(window): swept[window][kill_idx] for window in credit_windows
+            }
 
-            if player_eid not in credits_by_eid:
+            if not values and not any(
+                _player_credit_values(event, player_eid) for event in by_window.values()
+            ):
                 continue
 
-            values = credits_by_eid[player_eid]
-            has_flag = any(abs(value - 1.0) < 0.01 for value in values)
-            counted_current = (
-                player_eid != kill_event.killer_eid
-                and killer_team == player_team
-                and has_flag
-                and len(values) >= 2
-            )
-            kill_windows.append(
-                {
-                    "killer_name": killer_name,
-                    "killer_team": killer_team,
-                    "timestamp": kill_event.timestamp,
-                    "frame_idx": kill_event.frame_idx,
-                    "file_offset": kill_event.file_offset,
-                    "player_credit_values": values,
-                    "credit_count": len(values),
-                    "has_flag_1_0": has_flag,
-                    "same_team_as_killer": killer_team == player_team,
-                    "counted_current_rule": counted_current,
+            verdict = _credit_verdict(values, player_eid, kill_event.killer_eid, killer_team, player_team)
+            kill_window = {
+                "killer_name": killer_name,
+                "killer_team": killer_team,
+                "timestamp": kill_event.timestamp,
+                "frame_idx": kill_event.frame_idx,
+                "file_offset": kill_event.file_offset,
+                "player_credit_values": verdict["player_credit_values"],
+                "credit_count": verdict["credit_count"],
+                "has_flag_1_0": verdict["has_flag_1_0"],
+                "same_team_as_killer": killer_team == player_team,
+                "counted_current_rule": verdict["counted_current_rule"],
+            }
+            if by_window:
+                kill_window["window_sweep"] = {
+                    window: _credit_verdict(
+                        _player_credit_values(event, player_eid),
+                        player_eid, kill_event.killer_eid, killer_team, player_team,
+                    )
+                    for window, event in by_window.items()
                 }
-            )
+            kill_windows.append(kill_window)
 
         triage_rows.append(
             {
@@ -129,17 +146,54 @@ def build_kda_assist_credit_triage(
             "kill_buffer": kill_buffer,
             "death_buffer": death_buffer,
             "complete_only": complete_only,
+            "credit_windows": list(credit_windows),
         },
         "rows": triage_rows,
     }
 
 
+def _player_credit_values(kill_event, player_eid: int) -> List[float]:
+    return [credit.value for credit in kill_event.credits if credit.eid == player_eid]
+
+
+def _credit_verdict(
+    values: List[float],
+    player_eid: int,
+    killer_eid: int,
+    killer_team: Optional[str],
+    player_team: str,
+) -> Dict[str, object]:
+    has_flag = any(abs(value - 1.0) < 0.01 for value in values)
+    return {
+        "player_credit_values": values,
+        "credit_count": len(values),
+        "has_flag_1_0": has_flag,
+        "counted_current_rule": (
+            player_eid != killer_eid
+            and killer_team == player_team
+            and has_flag
+            and len(values) >= 2
+        ),
+    }
+
+
+def _sweep_window_list(value: str) -> List[int]:
+    # An empty list disables the sweep here
+    return _credit_window_list(value, allow_empty=True)
+
+
 def main(argv: Optional[Iterable[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Inspect raw assist-credit windows for player assist mismatches.")
     parser.add_argument("--truth", default="vg/output/tournament_truth.json", help="Truth JSON path")
     parser.add_argument("--kill-buffer", type=int, default=3, help="Kill buffer seconds")
     parser.add_argument("--death-buffer", type=int, default=10, help="Death buffer seconds")
     parser.add_argument("--all-fixtures", action="store_true", help="Include incomplete fixtures")
+    parser.add_argument(
+        "--credit-windows",
+        type=_sweep_window_list,
+        default=[],
+        help="Comma-separated credit window sizes to sweep, e.g. 300,500,800",
+    )
     parser.add_argument("-o", "--output", help="Optional output JSON path")
     args = parser.parse_args(list(argv) if argv is not None else None)
 
@@ -148,6 +202,7 @@ def main(argv: Optional[Iterable[str]] = None) -> int:
         kill_buffer=args.kill_buffer,
         death_buffer=args.death_buffer,
         complete_only=not args.all_fixtures,
+        credit_windows=args.credit_windows,
     )
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
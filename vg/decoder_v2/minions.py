@@ -7,30 +7,28 @@ from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from vg.core.unified_decoder import _le_to_be
 from vg.core.vgr_parser import VGRParser
 
-from .completeness import assess_completeness, extract_replay_signals, load_frames
+from .completeness import assess_completeness, extract_replay_signals
 from .credit_events import iter_credit_events
 from .models import MinionCandidateSummary
+from .replay_context import ReplayContext
 
 
-def collect_minion_candidates(replay_file: str) -> List[MinionCandidateSummary]:
+def collect_minion_candidates(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> List[MinionCandidateSummary]:
     """Collect per-player minion-related candidate counts from credit events."""
-    parser = VGRParser(replay_file, auto_truth=False)
-    parsed = parser.parse()
-    player_map = {
-        _le_to_be(player["entity_id"]): player["name"]
-        for team in ("left", "right")
-        for player in parsed["teams"][team]
-        if player.get("entity_id")
-    }
+    if context is None:
+        context = ReplayContext(replay_file, parsed=VGRParser(replay_file, auto_truth=False).parse())
+    player_map = context.player_entities_be
     counters: Dict[int, Counter] = {eid: Counter() for eid in player_map}
     last_frames: Dict[int, Dict[str, Optional[int]]] = {
         eid: {"0e": None, "0f": None, "0d": None} for eid in player_map
     }
 
-    for event in iter_credit_events(replay_file):
+    for event in iter_credit_events(replay_file, context=context):
         eid = event.entity_id_be
         if eid not in counters:
             continue
@@ -60,22 +58,20 @@ def collect_minion_candidates(replay_file: str) -> List[MinionCandidateSummary]:
     ]
 
 
-def collect_minion_event_log(replay_file: str) -> Dict[str, List[Dict[str, int]]]:
+def collect_minion_event_log(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> Dict[str, List[Dict[str, int]]]:
     """Collect per-player frame-level minion-related credit counts."""
-    parser = VGRParser(replay_file, auto_truth=False)
-    parsed = parser.parse()
-    player_map = {
-        _le_to_be(player["entity_id"]): player["name"]
-        for team in ("left", "right")
-        for player in parsed["teams"][team]
-        if player.get("entity_id")
-    }
+    if context is None:
+        context = ReplayContext(replay_file, parsed=VGRParser(replay_file, auto_truth=False).parse())
+    player_map = context.player_entities_be
     per_player: Dict[str, List[Dict[str, int]]] = {name: [] for name in player_map.values()}
 
     frame_counters: Dict[int, Dict[int, Counter]] = {
         eid: {} for eid in player_map
     }
-    for event in iter_credit_events(replay_file):
+    for event in iter_credit_events(replay_file, context=context):
         eid = event.entity_id_be
         if eid not in player_map:
             continue
@@ -87,7 +83,7 @@ def collect_minion_event_log(replay_file: str) -> Dict[str, List[Dict[str, int]]
         elif event.action == 0x0D:
             by_frame["0d_total"] += 1
 
-    for frame_idx, _ in load_frames(replay_file):
+    for frame_idx, _ in context.frames:
         for eid in player_map:
             counter = frame_counters[eid].get(frame_idx, Counter())
             per_player[player_map[eid]].append(
@@ -116,10 +112,11 @@ def compare_minion_candidates_to_truth(
     if truth_match is None:
         raise ValueError(f"Replay not found in truth: {replay_name}")
 
-    signals = extract_replay_signals(replay_file)
+    context = ReplayContext(replay_file)
+    signals = extract_replay_signals(replay_file, context=context)
     assessment = assess_completeness(signals)
-    candidates = collect_minion_candidates(replay_file)
-    event_log = collect_minion_event_log(replay_file)
+    candidates = collect_minion_candidates(replay_file, context=context)
+    event_log = collect_minion_event_log(replay_file, context=context)
     rows = []
     max_frame_index = signals.max_frame_index
     for candidate in candidates:
@@ -7,6 +7,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from vg.core.result_cache import cached_payload
+
 from .decode_match import decode_match
 from .truth_inventory import build_truth_inventory
 from .truth_stubs import find_replay_files
@@ -71,7 +73,7 @@ def build_missing_result_data_backlog(
 
         manifest_candidates = sorted(Path(directory_row["directory"]).glob("replayManifest-*.txt"))
         manifest = parse_replay_manifest(str(manifest_candidates[0])).to_dict() if manifest_candidates else None
-        safe = decode_match(str(replay_file)).to_dict()
+        safe = cached_payload("decoder_v2", str(replay_file), lambda: decode_match(str(replay_file)).to_dict())
 
         if directory_row["has_manifest"]:
             source_type = "manifest_only"
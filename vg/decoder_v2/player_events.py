@@ -1,19 +1,38 @@
-"""Generic player-event parsing for decoder_v2."""
+"""Generic player-event parsing for decoder_v2.
+
+Player events are located by the shared entity-event extractor
+(`vg.core.entity_events.extract_entity_events` with `tracked=` players) and
+kept as a `PlayerEventTable` of offsets into the frame buffers. Iterating yields
+`PlayerEvent` views whose payload is a `memoryview` into the frame; payload
+fields are decoded on access and hex is only produced by `payload_hex` /
+`to_dict()` / `to_record()` at export time.
+"""
 
 from __future__ import annotations
 
 import struct
 from collections import defaultdict
-from typing import Dict, Iterable, List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
+from vg.core.entity_events import extract_entity_events
+from vg.core.event_table import HAS_NUMPY, EventTable, np
+from vg.core.frame_store import Buffer
 from vg.core.vgr_parser import VGRParser
 
 from .completeness import load_frames
 from .models import PlayerEventRecord
+from .replay_context import ReplayContext
 
 
 EVENT_RECORD_SIZE = 37
 PAYLOAD_SIZE = 32
+PAYLOAD_OFFSET = 5
+
+_U16_LE = struct.Struct("<H")
+_U16_BE = struct.Struct(">H")
+_U32_LE = struct.Struct("<I")
+_F32_LE = struct.Struct("<f")
+_F32_BE = struct.Struct(">f")
 
 
 def _load_player_entities_le(replay_file: str) -> Dict[int, str]:
@@ -27,30 +46,149 @@ def _load_player_entities_le(replay_file: str) -> Dict[int, str]:
     }
 
 
-def iter_player_events(replay_file: str) -> Iterable[PlayerEventRecord]:
-    """Yield raw player event records from the LE event stream."""
-    player_entities = _load_player_entities_le(replay_file)
-    for frame_idx, data in load_frames(replay_file):
-        idx = 0
-        while idx < len(data) - 5:
-            if data[idx + 2:idx + 4] == b"\x00\x00":
-                entity_id_le = struct.unpack("<H", data[idx:idx + 2])[0]
-                if entity_id_le in player_entities and idx + 5 + PAYLOAD_SIZE <= len(data):
-                    payload = data[idx + 5:idx + 5 + PAYLOAD_SIZE]
-                    yield PlayerEventRecord(
-                        frame_idx=frame_idx,
-                        entity_id_le=entity_id_le,
-                        action=data[idx + 4],
-                        payload_hex=payload.hex(),
-                    )
-                    idx += EVENT_RECORD_SIZE
-                    continue
-            idx += 1
-
-
-def collect_player_events_by_entity(replay_file: str) -> Dict[int, List[PlayerEventRecord]]:
+class PlayerEvent:
+    """Lazy view of one player event; the payload stays in the frame buffer."""
+
+    __slots__ = ("frame_idx", "entity_id_le", "action", "offset", "_buffer")
+
+    def __init__(self, frame_idx: int, entity_id_le: int, action: int,
+                 offset: int, buffer: Buffer):
+        self.frame_idx = frame_idx
+        self.entity_id_le = entity_id_le
+        self.action = action
+        self.offset = offset
+        self._buffer = buffer
+
+    @property
+    def payload(self) -> memoryview:
+        start = self.offset + PAYLOAD_OFFSET
+        return memoryview(self._buffer)[start:start + PAYLOAD_SIZE]
+
+    @property
+    def payload_hex(self) -> str:
+        return self.payload.hex()
+
+    def u8(self, pos: int) -> int:
+        return self._buffer[self.offset + PAYLOAD_OFFSET + pos]
+
+    def u16_le(self, pos: int) -> int:
+        return _U16_LE.unpack_from(self._buffer, self.offset + PAYLOAD_OFFSET + pos)[0]
+
+    def u16_be(self, pos: int) -> int:
+        return _U16_BE.unpack_from(self._buffer, self.offset + PAYLOAD_OFFSET + pos)[0]
+
+    def u32_le(self, pos: int) -> int:
+        return _U32_LE.unpack_from(self._buffer, self.offset + PAYLOAD_OFFSET + pos)[0]
+
+    def f32_le(self, pos: int) -> float:
+        return _F32_LE.unpack_from(self._buffer, self.offset + PAYLOAD_OFFSET + pos)[0]
+
+    def f32_be(self, pos: int) -> float:
+        return _F32_BE.unpack_from(self._buffer, self.offset + PAYLOAD_OFFSET + pos)[0]
+
+    def to_record(self) -> PlayerEventRecord:
+        return PlayerEventRecord(
+            frame_idx=self.frame_idx,
+            entity_id_le=self.entity_id_le,
+            action=self.action,
+            payload_hex=self.payload_hex,
+        )
+
+    def to_dict(self) -> Dict[str, object]:
+        return self.to_record().to_dict()
+
+    def __repr__(self) -> str:
+        return (
+            f"PlayerEvent(frame_idx={self.frame_idx}, entity_id_le={self.entity_id_le:#06x}, "
+            f"action={self.action:#04x}, offset={self.offset})"
+        )
+
+
+class PlayerEventTable(EventTable):
+    """Player events as columns plus the frame buffers their payloads live in."""
+
+    COLUMNS = (
+        ("frame_idx", "I"),
+        ("offset", "I"),
+        ("entity_id_le", "H"),
+        ("action", "B"),
+    )
+
+    def __init__(self, frames: Sequence[Tuple[int, Buffer]] = ()):
+        super().__init__()
+        self.buffers: Dict[int, Buffer] = dict(frames)
+
+    def payload(self, index: int) -> memoryview:
+        start = self.column("offset")[index] + PAYLOAD_OFFSET
+        buffer = self.buffers[self.column("frame_idx")[index]]
+        return memoryview(buffer)[start:start + PAYLOAD_SIZE]
+
+    def event(self, index: int) -> PlayerEvent:
+        frame_idx, offset, entity_id_le, action = self.row(index)
+        return PlayerEvent(frame_idx, entity_id_le, action, offset, self.buffers[frame_idx])
+
+    def __iter__(self) -> Iterator[PlayerEvent]:
+        buffers = self.buffers
+        for frame_idx, offset, entity_id_le, action in self.rows():
+            yield PlayerEvent(frame_idx, entity_id_le, action, offset, buffers[frame_idx])
+
+    def payload_matrix(self) -> "np.ndarray":
+        """All payloads as an `(n, 32)` uint8 array (requires NumPy)."""
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for PlayerEventTable.payload_matrix()")
+        columns = self.to_numpy()
+        matrix = np.empty((len(self), PAYLOAD_SIZE), dtype=np.uint8)
+        frame_column = columns["frame_idx"]
+        span = np.arange(PAYLOAD_OFFSET, PAYLOAD_OFFSET + PAYLOAD_SIZE)
+        for frame_idx, buffer in self.buffers.items():
+            rows = np.nonzero(frame_column == frame_idx)[0]
+            if rows.size:
+                frame = np.frombuffer(buffer, dtype=np.uint8)
+                matrix[rows] = frame[columns["offset"][rows, None] + span]
+        return matrix
+
+
+def _scan_player_events(
+    frames: Sequence[Tuple[int, Buffer]],
+    player_entities: Dict[int, str],
+) -> PlayerEventTable:
+    table = PlayerEventTable(frames)
+    tracked = list(player_entities)
+    for frame_idx, data in frames:
+        offsets, entity_ids, actions = extract_entity_events(
+            data, skip=EVENT_RECORD_SIZE, tail=EVENT_RECORD_SIZE - 1, tracked=tracked,
+        )
+        table.extend([frame_idx] * len(offsets), offsets, entity_ids, actions)
+    return table
+
+
+def player_event_table(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> PlayerEventTable:
+    """Columnar player events for a replay."""
+    if context is None:
+        return _scan_player_events(load_frames(replay_file), _load_player_entities_le(replay_file))
+    return context.memo(
+        "player_event_table",
+        lambda: _scan_player_events(context.frames, context.player_entities_le),
+    )
+
+
+def iter_player_events(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> Iterator[PlayerEvent]:
+    """Yield lazy player event views from the LE event stream."""
+    return iter(player_event_table(replay_file, context=context))
+
+
+def collect_player_events_by_entity(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> Dict[int, List[PlayerEvent]]:
     """Collect player events grouped by LE entity id."""
-    grouped: Dict[int, List[PlayerEventRecord]] = defaultdict(list)
-    for event in iter_player_events(replay_file):
+    grouped: Dict[int, List[PlayerEvent]] = defaultdict(list)
+    for event in iter_player_events(replay_file, context=context):
         grouped[event.entity_id_le].append(event)
     return grouped
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+
 from .models import ClaimStatus, DecoderFieldStatus, EventHeaderClaim, OffsetClaim, ValidationEvidence
 
 
@@ -183,3 +186,34 @@ DECODER_FIELD_STATUSES = [
         rationale="Current conservative gate correctly separates all 11 tournament fixtures, but broader replay coverage is still limited.",
     ),
 ]
+
+# Bump when record extraction changes meaning; invalidates `.vgidx` event indexes.
+EVENT_INDEX_VERSION = 1
+
+
+def event_index_version() -> str:
+    """Version key for cached event indexes: index revision plus event claim layout."""
+    layout = [
+        [
+            claim.claim_id,
+            claim.header_hex,
+            claim.entity_offset,
+            claim.entity_endian,
+            claim.timestamp_offset,
+            claim.timestamp_endian,
+        ]
+        for claim in EVENT_HEADER_CLAIMS
+    ]
+    digest = hashlib.sha1(json.dumps(layout).encode("utf-8")).hexdigest()[:12]
+    return f"{EVENT_INDEX_VERSION}:{digest}"
+
+
+def registry_version() -> str:
+    """Digest of every claim and field status; changes whenever the registry does."""
+    state = {
+        "offset_claims": [claim.to_dict() for claim in OFFSET_CLAIMS],
+        "event_header_claims": [claim.to_dict() for claim in EVENT_HEADER_CLAIMS],
+        "field_statuses": [status.to_dict() for status in DECODER_FIELD_STATUSES],
+        "event_index": event_index_version(),
+    }
+    return hashlib.sha1(json.dumps(state, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:12]
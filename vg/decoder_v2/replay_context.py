@@ -0,0 +1,139 @@
+"""Shared per-replay decode state for decoder_v2."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+
+from vg.core.entity_events import scan_entity_lifecycle
+from vg.core.event_index import default_index_dir, load_entity_lifecycle, load_frame_records
+from vg.core.frame_store import Buffer
+from vg.core.kda_detector import KDADetector
+from vg.core.record_scanner import FrameRecords
+from vg.core.unified_decoder import _le_to_be
+from vg.core.vgr_parser import VGRParser
+
+
+T = TypeVar("T")
+
+
+class ReplayContext:
+    """
+    Parse a replay, load its frames and run the KDA scan at most once.
+
+    Every decoder_v2 entry point accepts an optional `context`. Passing the
+    same context to several entry points lets them share the parsed player
+    blocks, the frame bytes and the detector results instead of re-reading
+    and re-scanning the replay. All state is built lazily on first access.
+
+    Usage:
+        context = ReplayContext("/path/to/replay.0.vgr")
+        kda = decode_kda_from_replay(context.replay_file, context=context)
+        winner = decode_winner_from_replay(context.replay_file, context=context)
+    """
+
+    def __init__(
+        self,
+        replay_file: str,
+        parsed: Optional[Dict[str, object]] = None,
+        frames: Optional[List[Tuple[int, Buffer]]] = None,
+        use_index: bool = True,
+    ):
+        """
+        Args:
+            replay_file: Path to the `.0.vgr` replay file.
+            parsed: Optional preloaded `VGRParser.parse()` output.
+            frames: Optional preloaded `(frame_index, buffer)` tuples.
+            use_index: Serve scanned records from the `.vgidx` sidecar when
+                VG_EVENT_INDEX is set and the sidecar is fresh. Caller
+                supplied frames are always scanned directly.
+        """
+        self.replay_file = replay_file
+        self._parsed = parsed
+        self._frames = frames
+        self._caller_frames = frames is not None
+        self.use_index = use_index
+        self._frame_records: Optional[List[Tuple[int, FrameRecords]]] = None
+        self._kda_detector: Optional[KDADetector] = None
+        self._memo: Dict[str, object] = {}
+
+    @property
+    def parsed(self) -> Dict[str, object]:
+        """`VGRParser.parse()` output for the replay (truth lookup disabled)."""
+        if self._parsed is None:
+            self._parsed = VGRParser(self.replay_file, auto_truth=False).parse()
+        return self._parsed
+
+    @property
+    def frames(self) -> List[Tuple[int, Buffer]]:
+        """Replay frames (caller supplied, or `(frame_index, bytes)` copies loaded once)."""
+        if self._frames is None:
+            from .completeness import load_frames
+
+            self._frames = load_frames(self.replay_file)
+        return self._frames
+
+    def _replay_location(self) -> Tuple[Path, str]:
+        """Frame directory and replay name (without the `.N.vgr` suffix)."""
+        replay_path = Path(self.replay_file)
+        return replay_path.parent, replay_path.stem.rsplit(".", 1)[0]
+
+    def _indexed(self) -> bool:
+        """Whether scans are served from the `.vgidx` sidecar instead of `frames`."""
+        return self.use_index and not self._caller_frames and default_index_dir() is not None
+
+    @property
+    def frame_records(self) -> List[Tuple[int, FrameRecords]]:
+        """Kill/death/credit/item-acquire record streams per frame, scanned once."""
+        if self._frame_records is None:
+            self._frame_records = load_frame_records(
+                *self._replay_location(),
+                None if self._indexed() else self.frames,
+                use_index=self.use_index,
+            )
+        return self._frame_records
+
+    def iter_players(self) -> List[Dict[str, object]]:
+        """Parsed players in left-then-right team order."""
+        return [
+            player
+            for team_label in ("left", "right")
+            for player in self.parsed["teams"][team_label]
+        ]
+
+    @property
+    def player_entities_le(self) -> Dict[int, str]:
+        """Map of LE player entity id to player name."""
+        return {
+            player["entity_id"]: player["name"]
+            for player in self.iter_players()
+            if player.get("entity_id")
+        }
+
+    @property
+    def player_entities_be(self) -> Dict[int, str]:
+        """Map of BE player entity id to player name."""
+        return {_le_to_be(eid): name for eid, name in self.player_entities_le.items()}
+
+    @property
+    def kda_detector(self) -> KDADetector:
+        """KDADetector fed with every frame of the replay, shared by all callers."""
+        if self._kda_detector is None:
+            detector = KDADetector(set(self.player_entities_be))
+            for (frame_idx, data), (_, records) in zip(self.frames, self.frame_records):
+                detector.process_frame(frame_idx, data, records)
+            self._kda_detector = detector
+        return self._kda_detector
+
+    @property
+    def entity_lifecycle(self) -> Dict[int, Dict]:
+        """Infrastructure entity lifecycle from the 37-byte entity events, scanned once."""
+        if self._indexed():
+            return self.memo("entity_lifecycle", lambda: load_entity_lifecycle(*self._replay_location()))
+        return self.memo("entity_lifecycle", lambda: scan_entity_lifecycle(self.frames))
+
+    def memo(self, key: str, factory: Callable[[], T]) -> T:
+        """Return a cached derived result, computing it with `factory` on first use."""
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
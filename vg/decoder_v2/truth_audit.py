@@ -8,6 +8,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from vg.core.result_cache import cached_payload
+
 from .decode_match import decode_match
 
 
@@ -51,7 +53,8 @@ def audit_truth(
     for replay_name in replay_names:
         truth_match = truth_matches[replay_name]
         ocr_match = ocr_matches[replay_name]
-        safe = decode_match(truth_match["replay_file"]).to_dict()
+        replay_file = truth_match["replay_file"]
+        safe = cached_payload("decoder_v2", replay_file, lambda: decode_match(replay_file).to_dict())
 
         if (
             truth_match.get("match_info", {}).get("score_left") != ocr_match.get("match_info", {}).get("score_left")
@@ -7,6 +7,8 @@ import json
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from vg.core.result_cache import cached_payload
+
 from .decode_match import decode_match
 from .manifest import parse_replay_manifest
 from .truth_inventory import build_truth_inventory
@@ -23,7 +25,7 @@ def find_replay_files(directory: str) -> List[Path]:
 
 def build_truth_stub_for_replay(replay_file: str, manifest_path: Optional[str] = None) -> Dict[str, object]:
     """Build a prefilled truth stub for a replay."""
-    safe = decode_match(replay_file).to_dict()
+    safe = cached_payload("decoder_v2", replay_file, lambda: decode_match(replay_file).to_dict())
     manifest = parse_replay_manifest(manifest_path).to_dict() if manifest_path else None
 
     players = {}
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from .kda import decode_kda_from_replay
 from .models import WinnerExtractionResult
+from .replay_context import ReplayContext
 
 
-def decode_winner_from_replay(replay_file: str) -> WinnerExtractionResult:
+def decode_winner_from_replay(
+    replay_file: str,
+    context: Optional[ReplayContext] = None,
+) -> WinnerExtractionResult:
     """Decode winner conservatively from gated K/D/A output."""
-    kda_result = decode_kda_from_replay(replay_file)
+    kda_result = decode_kda_from_replay(replay_file, context=context)
     if not kda_result.accepted:
         return WinnerExtractionResult(
             accepted=False,
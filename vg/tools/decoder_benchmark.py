@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Decoder Benchmark - time the replay decoding hot paths over a corpus.
+
+Runs each stage over every replay of a corpus (synthetic by default, see
+`synthetic_replay.py`, or an existing replay directory) and reports JSON:
+
+  stages.<name>.seconds          best wall time over --repeat runs
+  stages.<name>.replays_per_s    corpus replays / seconds
+  stages.<name>.mb_per_s         corpus frame bytes / seconds
+  stages.<name>.peak_traced_mb   tracemalloc peak of one extra run
+                                 (in-process allocations only; batch stages
+                                 with --workers > 1 allocate in the workers)
+
+Stages:
+  vgr_parser               VGRParser.parse (player blocks, frame 0)
+  kda_detector             KDADetector.process_frame over all frames
+  unified_decoder          UnifiedDecoder.decode without the .vgidx index
+  unified_decoder_indexed  UnifiedDecoder.decode with a warm .vgidx index
+                           (sidecars kept in the scratch directory)
+  decode_match             decoder_v2.decode_match
+  batch_decode             decoder_v2.batch_decode.decode_replay_batch
+  replay_batch_parser      tools.replay_batch_parser.batch_parse
+  export_matches           core.export_matches.decode_batch
+
+The batch_decode and export_matches stages run with VG_DECODE_CACHE unset
+so a configured result cache cannot turn them into cache-hit timings.
+
+Save one JSON per commit and pass the older one as --baseline to get the
+per-stage speedup next to each measurement.
+
+Usage:
+    python vg/tools/decoder_benchmark.py --count 20 --team-size 5 -o bench.json
+    python vg/tools/decoder_benchmark.py --corpus /path/to/replays --stages unified_decoder
+    python vg/tools/decoder_benchmark.py --baseline before.json -o after.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    from vg.core.export_matches import decode_batch
+    from vg.core.event_index import INDEX_ENV
+    from vg.core.frame_store import find_frame_files, frame_file_index
+    from vg.core.kda_detector import KDADetector
+    from vg.core.result_cache import CACHE_ENV
+    from vg.core.unified_decoder import UnifiedDecoder, _le_to_be
+    from vg.core.vgr_parser import VGRParser
+    from vg.decoder_v2.batch_decode import decode_replay_batch, find_replays
+    from vg.decoder_v2.decode_match import decode_match
+    from vg.tools.replay_batch_parser import batch_parse
+    from vg.tools.synthetic_replay import SyntheticReplaySpec, generate_corpus
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+    from vg.core.export_matches import decode_batch
+    from vg.core.event_index import INDEX_ENV
+    from vg.core.frame_store import find_frame_files, frame_file_index
+    from vg.core.kda_detector import KDADetector
+    from vg.core.result_cache import CACHE_ENV
+    from vg.core.unified_decoder import UnifiedDecoder, _le_to_be
+    from vg.core.vgr_parser import VGRParser
+    from vg.decoder_v2.batch_decode import decode_replay_batch, find_replays
+    from vg.decoder_v2.decode_match import decode_match
+    from vg.tools.replay_batch_parser import batch_parse
+    from vg.tools.synthetic_replay import SyntheticReplaySpec, generate_corpus
+
+
+PER_REPLAY_STAGES = (
+    "vgr_parser",
+    "kda_detector",
+    "unified_decoder",
+    "unified_decoder_indexed",
+    "decode_match",
+)
+BATCH_STAGES = ("batch_decode", "replay_batch_parser", "export_matches")
+ALL_STAGES = PER_REPLAY_STAGES + BATCH_STAGES
+
+
+def _frame_paths(replay: Path) -> List[Path]:
+    return find_frame_files(replay.parent, replay.name.rsplit('.', 2)[0])
+
+
+def _player_eids(replay: Path) -> List[int]:
+    parsed = VGRParser(str(replay), auto_truth=False).parse()
+    return [
+        _le_to_be(player["entity_id"])
+        for team in ("left", "right")
+        for player in parsed["teams"][team]
+        if player.get("entity_id") is not None
+    ]
+
+
+def _run_kda(replay: Path, eids: List[int]) -> None:
+    detector = KDADetector(set(eids))
+    for path in _frame_paths(replay):
+        detector.process_frame(frame_file_index(path), path.read_bytes())
+    detector.get_results()
+
+
+def _with_env(key: str, value: str, run: Callable[[], None]) -> Callable[[], None]:
+    """Wrap `run` so it sees `key=value` in the environment."""
+    def wrapped():
+        previous = os.environ.get(key)
+        os.environ[key] = value
+        try:
+            return run()
+        finally:
+            if previous is None:
+                del os.environ[key]
+            else:
+                os.environ[key] = previous
+    return wrapped
+
+
+def _build_stage(
+    name: str,
+    corpus_dir: Path,
+    replays: List[Path],
+    workers: int,
+    scratch_dir: Path,
+) -> Callable[[], None]:
+    """Return a zero-argument callable running one stage over the corpus."""
+    if name == "vgr_parser":
+        return lambda: [VGRParser(str(replay), auto_truth=False).parse() for replay in replays]
+    if name == "kda_detector":
+        eids = {replay: _player_eids(replay) for replay in replays}
+        return lambda: [_run_kda(replay, eids[replay]) for replay in replays]
+    if name == "unified_decoder":
+        return lambda: [UnifiedDecoder(str(replay), use_index=False).decode() for replay in replays]
+    if name == "unified_decoder_indexed":
+        run = _with_env(
+            INDEX_ENV, str(scratch_dir / "vgidx"),
+            lambda: [UnifiedDecoder(str(replay)).decode() for replay in replays],
+        )
+        run()  # warm the .vgidx sidecars
+        return run
+    if name == "decode_match":
+        return lambda: [decode_match(str(replay)) for replay in replays]
+    # The batch decoders go through the result cache; time the decode, not cache hits
+    if name == "batch_decode":
+        return _with_env(CACHE_ENV, "", lambda: decode_replay_batch(str(corpus_dir), workers=workers))
+    if name == "replay_batch_parser":
+        return lambda: batch_parse(corpus_dir, workers=workers)
+    if name == "export_matches":
+        return _with_env(
+            CACHE_ENV, "",
+            lambda: decode_batch(str(corpus_dir), output_dir=str(scratch_dir), workers=workers),
+        )
+    raise ValueError(f"Unknown stage: {name}")
+
+
+def _time_stage(run: Callable[[], None], repeat: int, measure_memory: bool) -> Dict[str, Optional[float]]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run()
+        timings.append(time.perf_counter() - started)
+
+    peak_mb = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run()
+            peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        finally:
+            tracemalloc.stop()
+    return {"seconds": min(timings), "all_seconds": timings, "peak_traced_mb": peak_mb}
+
+
+def _max_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    usage = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmark(
+    corpus_dir: str,
+    stages: Optional[List[str]] = None,
+    repeat: int = 3,
+    workers: int = 1,
+    measure_memory: bool = True,
+    baseline: Optional[Dict] = None,
+) -> Dict:
+    """
+    Benchmark the selected stages over every replay under `corpus_dir`.
+
+    Args:
+        corpus_dir: Directory tree of `.0.vgr` replays.
+        stages: Stage names (default: all).
+        repeat: Timed runs per stage; the fastest is reported.
+        workers: Worker processes for the batch stages.
+        measure_memory: Run each stage once more under tracemalloc.
+        baseline: An earlier report; adds `speedup` per stage.
+    """
+    corpus = Path(corpus_dir)
+    replays = find_replays(str(corpus))
+    if not replays:
+        raise FileNotFoundError(f"No .0.vgr files found in {corpus_dir}")
+    total_bytes = sum(path.stat().st_size for replay in replays for path in _frame_paths(replay))
+    total_mb = total_bytes / (1024 * 1024)
+
+    report: Dict = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": {
+            "path": str(corpus),
+            "replays": len(replays),
+            "frames": sum(len(_frame_paths(replay)) for replay in replays),
+            "bytes": total_bytes,
+        },
+        "repeat": repeat,
+        "workers": workers,
+        "stages": {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix="vg_bench_out_") as scratch_dir:
+        for name in stages or list(ALL_STAGES):
+            run = _build_stage(name, corpus, replays, workers, Path(scratch_dir))
+            stage = _time_stage(run, repeat, measure_memory)
+            seconds = stage["seconds"]
+            stage["replays_per_s"] = len(replays) / seconds if seconds else None
+            stage["mb_per_s"] = total_mb / seconds if seconds else None
+            if baseline:
+                before = baseline.get("stages", {}).get(name, {}).get("seconds")
+                stage["speedup"] = before / seconds if before and seconds else None
+            report["stages"][name] = stage
+
+    report["max_rss_mb"] = _max_rss_mb()
+    return report
+
+
+def format_report(report: Dict) -> str:
+    """Human-readable table of a benchmark report."""
+    corpus = report["corpus"]
+    lines = [
+        f"Corpus: {corpus['replays']} replays, {corpus['frames']} frames, "
+        f"{corpus['bytes'] / (1024 * 1024):.1f} MB (commit {report.get('commit') or '?'})",
+        f"{'stage':<26}{'seconds':>10}{'replays/s':>12}{'MB/s':>10}{'peak MB':>10}{'speedup':>10}",
+    ]
+    for name, stage in report["stages"].items():
+        peak = stage.get("peak_traced_mb")
+        speedup = stage.get("speedup")
+        lines.append(
+            f"{name:<26}{stage['seconds']:>10.3f}{stage['replays_per_s']:>12.2f}{stage['mb_per_s']:>10.2f}"
+            f"{(f'{peak:.1f}' if peak is not None else '-'):>10}"
+            f"{(f'{speedup:.2f}x' if speedup else '-'):>10}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the replay decoding hot paths")
+    parser.add_argument("--corpus", help="Existing replay directory (default: generate a synthetic corpus)")
+    parser.add_argument("--count", type=int, default=10, help="Synthetic replays to generate (default: 10)")
+    parser.add_argument("--team-size", type=int, choices=[3, 5], default=3, help="Synthetic 3v3 or 5v5 (default: 3)")
+    parser.add_argument("--duration", type=float, default=1200.0, help="Synthetic match length in seconds (default: 1200)")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic corpus seed (default: 0)")
+    parser.add_argument("--stages", nargs="+", choices=ALL_STAGES, help="Stages to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per stage (default: 3)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for batch stages (default: 1)")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc peak memory run")
+    parser.add_argument("--baseline", help="Earlier benchmark JSON to compare against")
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    with contextlib.ExitStack() as stack:
+        corpus_dir = args.corpus
+        spec = None
+        if corpus_dir is None:
+            corpus_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="vg_bench_"))
+            spec = SyntheticReplaySpec(team_size=args.team_size, duration_s=args.duration, seed=args.seed)
+            generate_corpus(corpus_dir, args.count, spec)
+
+        report = run_benchmark(
+            corpus_dir,
+            stages=args.stages,
+            repeat=args.repeat,
+            workers=args.workers,
+            measure_memory=not args.no_memory,
+            baseline=baseline,
+        )
+        if spec is not None:
+            report["corpus"]["synthetic_spec"] = vars(spec)
+
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nSaved: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
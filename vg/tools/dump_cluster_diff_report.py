@@ -8,11 +8,12 @@ from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List
 
-from .dump_string_cluster_report import classify_string_value, extract_strings_with_offsets
+from .dump_string_cluster_report import classify_string_value
+from .dump_string_inventory import load_string_inventory
 
 
 def _summarize_windows(path: str, window_size: int) -> Dict[int, Dict[str, object]]:
-    strings = extract_strings_with_offsets(Path(path).read_bytes())
+    strings = load_string_inventory(path).rows()
     windows: Dict[int, Dict[str, object]] = defaultdict(lambda: {"class_counts": Counter(), "sample_strings": []})
     for row in strings:
         window_index = int(row["offset"]) // window_size
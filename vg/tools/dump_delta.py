@@ -0,0 +1,244 @@
+"""Find the memory pages that changed between two dumps of one process.
+
+Most pages are identical between replay phases. This module hashes each
+dump in fixed 4 KiB pages, laid out from the start of every memory range
+(`parse_memory_ranges`; a file that is not a minidump is one range at VA 0),
+and matches pages by virtual address. Consecutive changed pages merge into
+regions, so string and numeric-token diffs only decode the bytes that moved.
+Region slices are widened to the surrounding string boundaries before
+strings are extracted, so a string crossing a page edge is reported whole.
+
+Region statuses:
+    changed  page exists in both dumps with different contents
+    added    page only captured in the after dump
+    removed  page only captured in the before dump
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from vg.core.frame_store import Buffer, map_file
+
+from .dump_string_inventory import StringInventory
+from .minidump_parser import parse_memory_ranges
+
+
+PAGE_SIZE = 4096
+_PRINTABLE = range(0x20, 0x7F)
+
+# page VA -> (file offset, size, digest)
+PageMap = Dict[int, Tuple[int, int, bytes]]
+
+
+def dump_page_layout(data: Buffer) -> List[Tuple[int, int, int]]:
+    """(virtual address, file offset, size) of every captured range."""
+    try:
+        ranges = parse_memory_ranges(data)
+    except ValueError:
+        ranges = []
+    if not ranges:
+        return [(0, 0, len(data))]
+    layout = []
+    for row in ranges:
+        file_rva = int(row["file_rva"])
+        size = min(int(row["size"]), max(0, len(data) - file_rva))
+        if size:
+            layout.append((int(row["virtual_address"]), file_rva, size))
+    return layout
+
+
+def hash_pages(data: Buffer, page_size: int = PAGE_SIZE) -> PageMap:
+    pages: PageMap = {}
+    for virtual_address, file_offset, size in dump_page_layout(data):
+        for delta in range(0, size, page_size):
+            length = min(page_size, size - delta)
+            start = file_offset + delta
+            digest = hashlib.blake2b(data[start:start + length], digest_size=16).digest()
+            pages[virtual_address + delta] = (start, length, digest)
+    return pages
+
+
+def _page_entries(before: PageMap, after: PageMap) -> List[Tuple[int, str, Optional[int], Optional[int], int]]:
+    """(va, status, before offset, after offset, size) of each differing page, by VA."""
+    entries = []
+    for va, (offset, size, digest) in after.items():
+        previous = before.get(va)
+        if previous is None:
+            entries.append((va, "added", None, offset, size))
+        elif previous[1:] != (size, digest):
+            entries.append((va, "changed", previous[0], offset, size))
+    for va, (offset, size, _) in before.items():
+        if va not in after:
+            entries.append((va, "removed", offset, None, size))
+    entries.sort(key=lambda entry: (entry[0], entry[1]))
+    return entries
+
+
+def diff_page_maps(before: PageMap, after: PageMap) -> List[Dict[str, object]]:
+    """Merge differing pages into regions contiguous in VA and in both files."""
+    regions: List[Dict[str, object]] = []
+    for va, status, before_offset, after_offset, size in _page_entries(before, after):
+        last = regions[-1] if regions else None
+        if (
+            last is not None
+            and last["status"] == status
+            and last["va_end"] == va
+            and (before_offset is None or last["before_file_end"] == before_offset)
+            and (after_offset is None or last["after_file_end"] == after_offset)
+        ):
+            last["va_end"] = va + size
+            last["page_count"] += 1
+            if before_offset is not None:
+                last["before_file_end"] = before_offset + size
+            if after_offset is not None:
+                last["after_file_end"] = after_offset + size
+            continue
+        regions.append(
+            {
+                "status": status,
+                "va_start": va,
+                "va_end": va + size,
+                "page_count": 1,
+                "before_file_start": before_offset,
+                "before_file_end": None if before_offset is None else before_offset + size,
+                "after_file_start": after_offset,
+                "after_file_end": None if after_offset is None else after_offset + size,
+            }
+        )
+    return regions
+
+
+def _delta_summary(before_path: str, after_path: str, before: PageMap, after: PageMap,
+                   regions: List[Dict[str, object]], page_size: int) -> Dict[str, object]:
+    pages = {"changed": 0, "added": 0, "removed": 0}
+    changed_bytes = 0
+    for region in regions:
+        pages[str(region["status"])] += int(region["page_count"])
+        changed_bytes += int(region["va_end"]) - int(region["va_start"])
+    return {
+        "before_path": str(Path(before_path).resolve()),
+        "after_path": str(Path(after_path).resolve()),
+        "page_size": page_size,
+        "before_page_count": len(before),
+        "after_page_count": len(after),
+        "changed_page_count": pages["changed"],
+        "added_page_count": pages["added"],
+        "removed_page_count": pages["removed"],
+        "changed_bytes": changed_bytes,
+        "region_count": len(regions),
+        "regions": regions,
+    }
+
+
+def build_dump_delta_report(before_path: str, after_path: str, *, page_size: int = PAGE_SIZE) -> Dict[str, object]:
+    report, _, _ = changed_region_strings(before_path, after_path, page_size=page_size, with_strings=False)
+    return report
+
+
+def _is_string_byte(data: Buffer, pos: int) -> bool:
+    """Printable ASCII, or the zero high byte of a printable UTF-16LE char."""
+    return data[pos] in _PRINTABLE or (data[pos] == 0 and pos > 0 and data[pos - 1] in _PRINTABLE)
+
+
+def widen_to_strings(data: Buffer, start: int, end: int) -> Tuple[int, int]:
+    """Extend [start, end) back and forward over the strings crossing its edges."""
+    while start > 0 and _is_string_byte(data, start - 1):
+        start -= 1
+    while end < len(data) and _is_string_byte(data, end):
+        end += 1
+    return start, end
+
+
+def _region_rows(data: Buffer, start: int, end: int) -> List[Dict[str, object]]:
+    """Whole strings overlapping [start, end), with offsets in the dump file."""
+    slice_start, slice_end = widen_to_strings(data, start, end)
+    rows = []
+    for row in StringInventory.build(data[slice_start:slice_end]).rows():
+        offset = int(row["offset"]) + slice_start
+        width = 2 if row["encoding"] == "utf16le" else 1
+        # Widening can step over a separator into a neighbouring string
+        if offset < end and offset + len(str(row["value"])) * width > start:
+            row["offset"] = offset
+            rows.append(row)
+    return rows
+
+
+def changed_region_strings(
+    before_path: str,
+    after_path: str,
+    *,
+    page_size: int = PAGE_SIZE,
+    with_strings: bool = True,
+) -> Tuple[Dict[str, object], List[Dict[str, object]], List[Dict[str, object]]]:
+    """
+    Delta report plus the strings overlapping changed regions of each dump.
+
+    String rows carry the file offset within their own dump. Before-side
+    rows of "changed" regions also carry `after_offset`, the same VA's file
+    offset in the after dump (clamped to the region start for strings that
+    begin before it), so both sides can share after-dump windows.
+    """
+    before_data = map_file(Path(before_path))
+    after_data = map_file(Path(after_path))
+    try:
+        before_pages = hash_pages(before_data, page_size)
+        after_pages = hash_pages(after_data, page_size)
+        regions = diff_page_maps(before_pages, after_pages)
+        before_rows: List[Dict[str, object]] = []
+        after_rows: List[Dict[str, object]] = []
+        if with_strings:
+            for region in regions:
+                if region["before_file_start"] is not None:
+                    start = int(region["before_file_start"])
+                    shift = None if region["after_file_start"] is None else int(region["after_file_start"]) - start
+                    for row in _region_rows(before_data, start, int(region["before_file_end"])):
+                        if shift is not None:
+                            row["after_offset"] = max(int(row["offset"]), start) + shift
+                        before_rows.append(row)
+                if region["after_file_start"] is not None:
+                    after_rows.extend(
+                        _region_rows(after_data, int(region["after_file_start"]), int(region["after_file_end"]))
+                    )
+    finally:
+        for data in (before_data, after_data):
+            if hasattr(data, "close"):
+                data.close()
+    report = _delta_summary(before_path, after_path, before_pages, after_pages, regions, page_size)
+    return report, before_rows, after_rows
+
+
+def load_changed_regions(delta_path: str) -> List[Tuple[int, int]]:
+    """After-dump file spans [start, end) of changed/added regions in a delta report."""
+    report = json.loads(Path(delta_path).read_text(encoding="utf-8"))
+    return [
+        (int(region["after_file_start"]), int(region["after_file_end"]))
+        for region in report["regions"]
+        if region["after_file_start"] is not None
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Map the memory pages that changed between two dumps.")
+    parser.add_argument("--before", required=True, help="Before dump path")
+    parser.add_argument("--after", required=True, help="After dump path")
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE, help="Page size in bytes")
+    parser.add_argument("-o", "--output", help="Optional output JSON path")
+    args = parser.parse_args()
+
+    report = build_dump_delta_report(args.before, args.after, page_size=args.page_size)
+    payload = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        Path(args.output).write_text(payload, encoding="utf-8")
+        print(f"Dump delta report saved to {args.output}")
+    else:
+        print(payload)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
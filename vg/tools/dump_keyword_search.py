@@ -1,38 +1,77 @@
-"""Search dump files for specific keywords across common encodings."""
+"""Search dump files for specific keywords across common encodings.
+
+Every keyword x encoding needle is found in a single pass over the
+memory-mapped dump (`find_all_needles`) instead of one full scan per needle.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
+import re
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, List
+
+from vg.core.frame_store import Buffer, map_file
+
 
+def find_all_needles(data: Buffer, needles: Iterable[bytes]) -> Dict[bytes, List[int]]:
+    """
+    Offsets of every (overlapping) occurrence of each needle, in one pass.
 
-def _find_all(data: bytes, needle: bytes) -> List[int]:
-    offsets: List[int] = []
-    start = 0
+    The needles are compiled into a single regex alternation, longest
+    first, so each search stops at the earliest offset where any needle
+    starts and reports the longest one there. Shorter needles matching at
+    the same offset are exactly its prefixes, which are added from a
+    precomputed table; resuming one byte later keeps overlapping hits.
+    """
+    unique = sorted({needle for needle in needles if needle}, key=lambda n: (-len(n), n))
+    offsets: Dict[bytes, List[int]] = {needle: [] for needle in unique}
+    if not unique:
+        return offsets
+    prefixes = {
+        needle: [other for other in unique if len(other) < len(needle) and needle.startswith(other)]
+        for needle in unique
+    }
+    pattern = re.compile(b"|".join(re.escape(needle) for needle in unique))
+    pos = 0
     while True:
-        index = data.find(needle, start)
-        if index == -1:
+        match = pattern.search(data, pos)
+        if match is None:
             break
-        offsets.append(index)
-        start = index + 1
+        index = match.start()
+        needle = match.group()
+        offsets[needle].append(index)
+        for prefix in prefixes[needle]:
+            offsets[prefix].append(index)
+        pos = index + 1
     return offsets
 
 
+def keyword_needles(keyword: str) -> Dict[str, bytes]:
+    """Byte needles of a keyword per encoding (empty when not encodable)."""
+    return {
+        "ascii": keyword.encode("ascii", errors="ignore") if all(ord(ch) < 128 for ch in keyword) else b"",
+        "utf8": keyword.encode("utf-8"),
+        "utf16le": keyword.encode("utf-16-le"),
+        "utf16be": keyword.encode("utf-16-be"),
+    }
+
+
 def search_dump_keywords(dump_path: str, keywords: List[str]) -> Dict[str, object]:
     dump = Path(dump_path)
-    data = dump.read_bytes()
+    encodings_by_keyword = [(keyword, keyword_needles(keyword)) for keyword in keywords]
+    data = map_file(dump)
+    try:
+        found = find_all_needles(
+            data, (needle for _, encodings in encodings_by_keyword for needle in encodings.values())
+        )
+    finally:
+        if hasattr(data, "close"):
+            data.close()
     results = []
 
-    for keyword in keywords:
-        encodings = {
-            "ascii": keyword.encode("ascii", errors="ignore") if all(ord(ch) < 128 for ch in keyword) else b"",
-            "utf8": keyword.encode("utf-8"),
-            "utf16le": keyword.encode("utf-16-le"),
-            "utf16be": keyword.encode("utf-16-be"),
-        }
-
+    for keyword, encodings in encodings_by_keyword:
         row = {
             "keyword": keyword,
             "matches": {},
@@ -40,7 +79,7 @@ def search_dump_keywords(dump_path: str, keywords: List[str]) -> Dict[str, objec
         for encoding_name, needle in encodings.items():
             if not needle:
                 continue
-            offsets = _find_all(data, needle)
+            offsets = found[needle]
             row["matches"][encoding_name] = {
                 "count": len(offsets),
                 "offsets": offsets[:100],
@@ -1,4 +1,9 @@
-"""Compare dump windows by changes in short numeric-like string tokens."""
+"""Compare dump windows by changes in short numeric-like string tokens.
+
+By default only the pages that changed between the dumps are tokenized
+(`dump_delta`) and windows are keyed by after-dump file offset; `full=True`
+(`--full`) counts every string of both dumps by their own offsets.
+"""
 
 from __future__ import annotations
 
@@ -9,7 +14,8 @@ from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List
 
-from .dump_string_cluster_report import extract_strings_with_offsets
+from .dump_delta import changed_region_strings
+from .dump_string_inventory import load_string_inventory
 
 
 NUMERIC_TOKEN_RE = re.compile(r"(?<![A-Za-z0-9_])[0-9:/.-]{1,12}(?![A-Za-z0-9_])")
@@ -36,14 +42,21 @@ def classify_numeric_window(contexts: List[str]) -> str:
 
 
 def _numeric_windows(path: str, window_size: int) -> Dict[int, Dict[str, object]]:
-    strings = extract_strings_with_offsets(Path(path).read_bytes())
+    return _numeric_windows_from_rows(load_string_inventory(path).rows(), window_size)
+
+
+def _numeric_windows_from_rows(
+    strings: List[Dict[str, object]], window_size: int, offset_key: str = "offset"
+) -> Dict[int, Dict[str, object]]:
     windows: Dict[int, Dict[str, object]] = defaultdict(lambda: {"count": 0, "samples": [], "contexts": []})
     for row in strings:
+        if offset_key not in row:
+            continue  # removed page: no after-dump window
         value = str(row["value"])
         tokens = [token for token in NUMERIC_TOKEN_RE.findall(value) if any(ch.isdigit() for ch in token)]
         if not tokens:
             continue
-        window_index = int(row["offset"]) // window_size
+        window_index = int(row[offset_key]) // window_size
         windows[window_index]["count"] += len(tokens)
         if value not in windows[window_index]["contexts"] and len(windows[window_index]["contexts"]) < 20:
             windows[window_index]["contexts"].append(value[:160])
@@ -55,9 +68,22 @@ def _numeric_windows(path: str, window_size: int) -> Dict[int, Dict[str, object]
     return windows
 
 
-def build_dump_numeric_token_diff(before_path: str, after_path: str, *, window_size: int = 4096, top_n: int = 50) -> Dict[str, object]:
-    before = _numeric_windows(before_path, window_size)
-    after = _numeric_windows(after_path, window_size)
+def build_dump_numeric_token_diff(
+    before_path: str,
+    after_path: str,
+    *,
+    window_size: int = 4096,
+    top_n: int = 50,
+    full: bool = False,
+) -> Dict[str, object]:
+    delta_report = None
+    if full:
+        before = _numeric_windows(before_path, window_size)
+        after = _numeric_windows(after_path, window_size)
+    else:
+        delta_report, before_rows, after_rows = changed_region_strings(before_path, after_path)
+        before = _numeric_windows_from_rows(before_rows, window_size, offset_key="after_offset")
+        after = _numeric_windows_from_rows(after_rows, window_size)
     rows: List[Dict[str, object]] = []
     for window_index in sorted(set(before) | set(after)):
         before_count = int(before.get(window_index, {"count": 0})["count"])
@@ -84,6 +110,8 @@ def build_dump_numeric_token_diff(before_path: str, after_path: str, *, window_s
         "before_path": str(Path(before_path).resolve()),
         "after_path": str(Path(after_path).resolve()),
         "window_size": window_size,
+        "mode": "full" if full else "delta",
+        "changed_bytes": None if delta_report is None else delta_report["changed_bytes"],
         "window_count": len(rows),
         "top_windows": rows[:top_n],
     }
@@ -95,6 +123,7 @@ def main() -> int:
     parser.add_argument("--after", required=True, help="After dump path")
     parser.add_argument("--window-size", type=int, default=4096, help="Window size in bytes")
     parser.add_argument("--top-n", type=int, default=50, help="Top changed windows to emit")
+    parser.add_argument("--full", action="store_true", help="Tokenize every string instead of changed pages only")
     parser.add_argument("-o", "--output", help="Optional output JSON path")
     args = parser.parse_args()
 
@@ -103,6 +132,7 @@ def main() -> int:
         args.after,
         window_size=args.window_size,
         top_n=args.top_n,
+        full=args.full,
     )
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
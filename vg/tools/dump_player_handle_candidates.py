@@ -8,7 +8,7 @@ import re
 from pathlib import Path
 from typing import Dict, List
 
-from .dump_string_diff import extract_strings_from_bytes
+from .dump_string_inventory import load_string_inventory
 
 
 HANDLE_PATTERNS = [
@@ -64,7 +64,7 @@ def is_probable_handle(value: str) -> bool:
 
 def build_player_handle_candidates(dump_path: str, *, required_prefix: str | None = None) -> Dict[str, object]:
     dump = Path(dump_path)
-    strings = extract_strings_from_bytes(dump.read_bytes())
+    strings = load_string_inventory(dump_path).value_set()
     candidates = {}
     for value in strings:
         for token in re.findall(r"[A-Za-z0-9_]{4,32}", value):
@@ -10,10 +10,9 @@ from pathlib import Path
 from typing import Dict, Iterable, List
 
 from .dump_player_handle_candidates import is_probable_handle
+from .dump_string_inventory import StringInventory, load_string_inventory
 
 
-ASCII_RE = re.compile(rb"[\x20-\x7E]{4,}")
-UTF16_RE = re.compile(rb"(?:[\x20-\x7E]\x00){4,}")
 GLYPH_RE = re.compile(r"(?:cid\d{4,}|uni[0-9A-Fa-f]{3,})")
 LOCALE_RE = re.compile(
     r"(?:koreana|schinese|english|german|spanish|french|japanese|russian|vietnamese|south[- ]korea|united-states|zh-hans|zh-hant)",
@@ -27,25 +26,7 @@ CONFIG_RE = re.compile(r'(?:\\"|imagename|skinkey|experiment|limitededition|seas
 
 
 def extract_strings_with_offsets(data: bytes) -> List[Dict[str, object]]:
-    values: List[Dict[str, object]] = []
-    for match in ASCII_RE.finditer(data):
-        values.append(
-            {
-                "offset": match.start(),
-                "encoding": "ascii",
-                "value": match.group().decode("ascii", errors="ignore"),
-            }
-        )
-    for match in UTF16_RE.finditer(data):
-        values.append(
-            {
-                "offset": match.start(),
-                "encoding": "utf16le",
-                "value": match.group().decode("utf-16-le", errors="ignore"),
-            }
-        )
-    values.sort(key=lambda row: int(row["offset"]))
-    return values
+    return StringInventory.build(data).rows()
 
 
 def classify_string_value(value: str) -> str:
@@ -71,7 +52,7 @@ def build_dump_string_cluster_report(
     top_n: int = 50,
 ) -> Dict[str, object]:
     dump = Path(dump_path)
-    strings = extract_strings_with_offsets(dump.read_bytes())
+    strings = load_string_inventory(dump_path).rows()
 
     windows: Dict[int, List[Dict[str, object]]] = defaultdict(list)
     for row in strings:
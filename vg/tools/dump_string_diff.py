@@ -1,47 +1,68 @@
-"""Extract simple ASCII/UTF-16 strings from dump files and diff them."""
+"""Extract simple ASCII/UTF-16 strings from dump files and diff them.
+
+By default only the pages that changed between the dumps are compared
+(`dump_delta`); `full=True` (`--full`) diffs every string of both dumps.
+
+In full mode a string is "added" only when the before dump holds it nowhere
+(and "removed" likewise). Delta mode sees the changed pages only, so a value
+that merely moved between pages looks added on one side and removed on the
+other. It is recognised as moved (`moved_count`) only when both dumps
+already have a string inventory sidecar (`dump_string_inventory`): building
+the inventories here would extract every string of both dumps, more work
+than `--full`. Without them `moved_checked` is False and the counts are per
+changed page; build the sidecars once, or pass `--full`, when moves matter.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
-import re
 from pathlib import Path
 from typing import Dict, Iterable, List, Set
 
-
-ASCII_RE = re.compile(rb"[\x20-\x7E]{4,}")
-UTF16_RE = re.compile((rb"(?:[\x20-\x7E]\x00){4,}"))
+from .dump_delta import changed_region_strings
+from .dump_string_inventory import StringInventory, cached_string_inventory, load_string_inventory
 
 
 def extract_strings_from_bytes(data: bytes) -> Set[str]:
-    values: Set[str] = set()
-    for match in ASCII_RE.findall(data):
-        try:
-            values.add(match.decode("ascii"))
-        except Exception:
-            pass
-    for match in UTF16_RE.findall(data):
-        try:
-            values.add(match.decode("utf-16-le"))
-        except Exception:
-            pass
-    return values
+    return StringInventory.build(data).value_set()
 
 
-def build_dump_string_diff(before_path: str, after_path: str) -> Dict[str, object]:
-    before = Path(before_path).read_bytes()
-    after = Path(after_path).read_bytes()
-    before_strings = extract_strings_from_bytes(before)
-    after_strings = extract_strings_from_bytes(after)
-    added = sorted(after_strings - before_strings)
-    removed = sorted(before_strings - after_strings)
+def build_dump_string_diff(before_path: str, after_path: str, *, full: bool = False) -> Dict[str, object]:
+    delta_report = None
+    if full:
+        before_strings = load_string_inventory(before_path).value_set()
+        after_strings = load_string_inventory(after_path).value_set()
+    else:
+        delta_report, before_rows, after_rows = changed_region_strings(before_path, after_path)
+        before_strings = {str(row["value"]) for row in before_rows}
+        after_strings = {str(row["value"]) for row in after_rows}
+    added_candidates = after_strings - before_strings
+    removed_candidates = before_strings - after_strings
+    moved_checked = full
+    if not full:
+        # Changed pages alone cannot tell a new value from one that moved;
+        # only existing inventories are cheap enough to ask
+        before_inventory = cached_string_inventory(before_path)
+        after_inventory = cached_string_inventory(after_path)
+        if before_inventory is not None and after_inventory is not None:
+            added_candidates -= before_inventory.value_set()
+            removed_candidates -= after_inventory.value_set()
+            moved_checked = True
+    added = sorted(added_candidates)
+    removed = sorted(removed_candidates)
+    moved = len(after_strings - before_strings) + len(before_strings - after_strings) - len(added) - len(removed)
     return {
         "before_path": str(Path(before_path).resolve()),
         "after_path": str(Path(after_path).resolve()),
+        "mode": "full" if full else "delta",
+        "changed_bytes": None if delta_report is None else delta_report["changed_bytes"],
         "before_strings": len(before_strings),
         "after_strings": len(after_strings),
         "added_count": len(added),
         "removed_count": len(removed),
+        "moved_count": moved,
+        "moved_checked": moved_checked,
         "added_sample": added[:200],
         "removed_sample": removed[:200],
     }
@@ -51,10 +72,11 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="Diff strings between two dump files.")
     parser.add_argument("--before", required=True, help="Before dump path")
     parser.add_argument("--after", required=True, help="After dump path")
+    parser.add_argument("--full", action="store_true", help="Diff every string instead of changed pages only")
     parser.add_argument("-o", "--output", help="Optional output JSON path")
     args = parser.parse_args()
 
-    report = build_dump_string_diff(args.before, args.after)
+    report = build_dump_string_diff(args.before, args.after, full=args.full)
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
         Path(args.output).write_text(payload, encoding="utf-8")
@@ -0,0 +1,215 @@
+"""Persistent ASCII/UTF-16 string inventory of a dump, shared by dump reports.
+
+The string-based dump reports (cluster report, cluster diff, string diff,
+player-handle candidates, numeric token diff, window profile) all need the
+same printable ASCII and UTF-16LE strings of a dump. `load_string_inventory`
+extracts them in one pass over the memory-mapped dump. It stores them in a
+compact sidecar next to the dump (`<dump>.strings.idx`), keyed by the dump's
+size and mtime, so regenerating any report only reloads the index.
+
+Sidecar layout (little-endian):
+    header   magic, version, dump size, dump mtime_ns, string count, text bytes
+    offsets  u64 per string, ascending
+    encoding u8 per string (index into ENCODINGS)
+    text     the strings joined by "\\n" (extracted strings are printable ASCII)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from vg.core.frame_store import Buffer, map_file
+
+
+ASCII_RE = re.compile(rb"[\x20-\x7E]{4,}")
+UTF16_RE = re.compile(rb"(?:[\x20-\x7E]\x00){4,}")
+ENCODINGS = ("ascii", "utf16le")
+
+SIDECAR_SUFFIX = ".strings.idx"
+_MAGIC = b"VGSI"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIQQQQ")
+
+# In-process memo: path -> (size, mtime_ns, inventory)
+_loaded: Dict[str, Tuple[int, int, "StringInventory"]] = {}
+
+
+class StringInventory:
+    """Strings of one dump ordered by offset, with window and prefix queries."""
+
+    def __init__(self, offsets: array, encodings: array, values: List[str]):
+        self.offsets = offsets
+        self.encodings = encodings
+        self.values = values
+        self._prefix_index: Optional[Tuple[List[str], List[int]]] = None
+
+    @classmethod
+    def build(cls, data: Buffer) -> "StringInventory":
+        """Extract ASCII and UTF-16LE strings (4+ printable chars) from a buffer."""
+        found = [(match.start(), 0, match.group().decode("ascii")) for match in ASCII_RE.finditer(data)]
+        found.extend((match.start(), 1, match.group().decode("utf-16-le")) for match in UTF16_RE.finditer(data))
+        found.sort(key=lambda row: row[0])  # stable: ascii before utf16le at one offset
+        return cls(
+            array("Q", (row[0] for row in found)),
+            array("B", (row[1] for row in found)),
+            [row[2] for row in found],
+        )
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def row(self, index: int) -> Dict[str, object]:
+        return {
+            "offset": self.offsets[index],
+            "encoding": ENCODINGS[self.encodings[index]],
+            "value": self.values[index],
+        }
+
+    def rows(self) -> List[Dict[str, object]]:
+        """All strings as {"offset", "encoding", "value"} rows ordered by offset."""
+        return [self.row(index) for index in range(len(self.values))]
+
+    def value_set(self) -> Set[str]:
+        return set(self.values)
+
+    def window(self, start: int, end: int) -> Iterator[Dict[str, object]]:
+        """Rows whose offset falls in [start, end)."""
+        index = bisect_left(self.offsets, start)
+        while index < len(self.offsets) and self.offsets[index] < end:
+            yield self.row(index)
+            index += 1
+
+    def with_prefix(self, prefix: str) -> Iterator[Dict[str, object]]:
+        """Rows whose value starts with `prefix`, ordered by value."""
+        if self._prefix_index is None:
+            order = sorted(range(len(self.values)), key=self.values.__getitem__)
+            self._prefix_index = ([self.values[index] for index in order], order)
+        sorted_values, order = self._prefix_index
+        position = bisect_left(sorted_values, prefix)
+        while position < len(sorted_values) and sorted_values[position].startswith(prefix):
+            yield self.row(order[position])
+            position += 1
+
+    def to_bytes(self, dump_size: int, dump_mtime_ns: int) -> bytes:
+        text = "\n".join(self.values).encode("ascii")
+        offsets = array("Q", self.offsets)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        header = _HEADER.pack(_MAGIC, _VERSION, dump_size, dump_mtime_ns, len(self.values), len(text))
+        return header + offsets.tobytes() + self.encodings.tobytes() + text
+
+    @classmethod
+    def from_bytes(cls, blob: bytes, dump_size: int, dump_mtime_ns: int) -> Optional["StringInventory"]:
+        """Inventory from a sidecar, or None when it is stale or unreadable."""
+        if len(blob) < _HEADER.size:
+            return None
+        magic, version, size, mtime_ns, count, text_len = _HEADER.unpack_from(blob, 0)
+        if (magic, version, size, mtime_ns) != (_MAGIC, _VERSION, dump_size, dump_mtime_ns):
+            return None
+        offsets_end = _HEADER.size + count * 8
+        encodings_end = offsets_end + count
+        if len(blob) != encodings_end + text_len:
+            return None
+        offsets = array("Q")
+        offsets.frombytes(blob[_HEADER.size:offsets_end])
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        encodings = array("B", blob[offsets_end:encodings_end])
+        values = blob[encodings_end:].decode("ascii").split("\n") if count else []
+        return cls(offsets, encodings, values)
+
+
+def sidecar_path(dump_path: str) -> Path:
+    return Path(f"{dump_path}{SIDECAR_SUFFIX}")
+
+
+def cached_string_inventory(dump_path: str) -> Optional[StringInventory]:
+    """The dump's inventory from memory or a fresh sidecar, or None; never extracts."""
+    path = Path(dump_path)
+    stat = path.stat()
+    cached = _loaded.get(str(path.resolve()))
+    if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+    sidecar = sidecar_path(dump_path)
+    if not sidecar.exists():
+        return None
+    return StringInventory.from_bytes(sidecar.read_bytes(), stat.st_size, stat.st_mtime_ns)
+
+
+def load_string_inventory(dump_path: str, use_sidecar: bool = True) -> StringInventory:
+    """
+    The dump's string inventory: from memory, the sidecar, or one extraction pass.
+
+    A sidecar whose recorded size/mtime no longer match the dump is rebuilt;
+    when it cannot be written (read-only directory) the inventory is still
+    returned.
+    """
+    path = Path(dump_path)
+    stat = path.stat()
+    key = str(path.resolve())
+    cached = _loaded.get(key)
+    if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+        return cached[2]
+
+    sidecar = sidecar_path(dump_path)
+    inventory = None
+    if use_sidecar and sidecar.exists():
+        inventory = StringInventory.from_bytes(sidecar.read_bytes(), stat.st_size, stat.st_mtime_ns)
+    if inventory is None:
+        data = map_file(path)
+        try:
+            inventory = StringInventory.build(data)
+        finally:
+            if hasattr(data, "close"):
+                data.close()
+        if use_sidecar:
+            _write_sidecar(sidecar, inventory.to_bytes(stat.st_size, stat.st_mtime_ns))
+    _loaded[key] = (stat.st_size, stat.st_mtime_ns, inventory)
+    return inventory
+
+
+def _write_sidecar(sidecar: Path, blob: bytes) -> None:
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(tmp_name, sidecar)
+    except OSError:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build (or refresh) the string inventory sidecar of a dump.")
+    parser.add_argument("--dump", required=True, help="Dump file path")
+    parser.add_argument("--window", nargs=2, type=lambda v: int(v, 0), metavar=("START", "END"), help="Print strings in [START, END)")
+    parser.add_argument("--prefix", help="Print strings starting with this prefix")
+    args = parser.parse_args()
+
+    inventory = load_string_inventory(args.dump)
+    if args.window:
+        rows = list(inventory.window(*args.window))
+    elif args.prefix is not None:
+        rows = list(inventory.with_prefix(args.prefix))
+    else:
+        print(f"{len(inventory)} strings indexed in {sidecar_path(args.dump)}")
+        return 0
+    print(json.dumps(rows, indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,18 @@
-"""Batch-profile unknown windows from a numeric diff report."""
+"""Batch-profile unknown windows from a numeric diff report.
+
+With a `dump_delta` report (`--delta`), only windows overlapping a changed
+region of the dump are profiled, and each window records how many of its
+bytes changed.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
+from .dump_delta import load_changed_regions
 from .dump_stride_report import build_dump_stride_report
 from .dump_window_profile import build_dump_window_profile
 
@@ -17,12 +23,24 @@ def build_unknown_window_batch_report(
     *,
     max_windows: int = 10,
     window_length: int = 4096,
+    delta_path: Optional[str] = None,
 ) -> Dict[str, object]:
     diff = json.loads(Path(numeric_diff_path).read_text(encoding="utf-8"))
     dump = Path(dump_path)
-    selected = [row for row in diff["top_windows"] if row.get("classification") == "unknown"][:max_windows]
+    regions = load_changed_regions(delta_path) if delta_path else None
+    selected = []
+    for row in diff["top_windows"]:
+        if row.get("classification") != "unknown":
+            continue
+        start = int(row["window_start"])
+        changed = _changed_bytes(regions, start, start + window_length) if regions is not None else None
+        if changed == 0:
+            continue
+        selected.append((row, changed))
+        if len(selected) >= max_windows:
+            break
     windows = []
-    for row in selected:
+    for row, changed in selected:
         start = int(row["window_start"])
         profile = build_dump_window_profile(str(dump), start, length=window_length)
         stride = build_dump_stride_report(str(dump), start, length=window_length, strides=[4, 8, 16, 32])
@@ -39,6 +57,8 @@ def build_unknown_window_batch_report(
                 "sample_strings": profile["strings"][:16],
             }
         )
+        if changed is not None:
+            windows[-1]["changed_bytes"] = changed
     return {
         "numeric_diff_path": str(Path(numeric_diff_path).resolve()),
         "dump_path": str(dump.resolve()),
@@ -47,12 +67,17 @@ def build_unknown_window_batch_report(
     }
 
 
+def _changed_bytes(regions: List[Tuple[int, int]], start: int, end: int) -> int:
+    return sum(max(0, min(end, region_end) - max(start, region_start)) for region_start, region_end in regions)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Batch-profile unknown windows from a numeric diff report.")
     parser.add_argument("--numeric-diff", required=True, help="Path to numeric diff JSON")
     parser.add_argument("--dump", required=True, help="Dump file path")
     parser.add_argument("--max-windows", type=int, default=10, help="Maximum unknown windows to profile")
     parser.add_argument("--window-length", type=int, default=4096, help="Window length")
+    parser.add_argument("--delta", help="Optional dump_delta report restricting windows to changed regions")
     parser.add_argument("-o", "--output", help="Optional output JSON path")
     args = parser.parse_args()
 
@@ -61,6 +86,7 @@ def main() -> int:
         args.dump,
         max_windows=args.max_windows,
         window_length=args.window_length,
+        delta_path=args.delta,
     )
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
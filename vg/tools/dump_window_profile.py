@@ -8,13 +8,17 @@ from collections import Counter
 from pathlib import Path
 from typing import Dict, List
 
-from .dump_string_cluster_report import extract_strings_with_offsets
+from vg.core.frame_store import map_file
+
+from .dump_string_inventory import load_string_inventory
 
 
 def build_dump_window_profile(dump_path: str, start: int, length: int = 4096) -> Dict[str, object]:
     path = Path(dump_path)
-    data = path.read_bytes()
+    data = map_file(path)
     chunk = data[start : start + length]
+    if hasattr(data, "close"):
+        data.close()
     printable_ratio = sum(32 <= b < 127 for b in chunk) / len(chunk) if chunk else 0.0
     top_bytes = [{"byte": byte, "count": count} for byte, count in Counter(chunk).most_common(16)]
     top_pairs = [
@@ -27,18 +31,16 @@ def build_dump_window_profile(dump_path: str, start: int, length: int = 4096) ->
     ]
 
     strings = []
-    for row in extract_strings_with_offsets(data):
-        offset = int(row["offset"])
-        if start <= offset < start + length:
-            strings.append(
-                {
-                    "offset": offset,
-                    "encoding": row["encoding"],
-                    "value": str(row["value"])[:160],
-                }
-            )
-            if len(strings) >= 80:
-                break
+    for row in load_string_inventory(dump_path).window(start, start + length):
+        strings.append(
+            {
+                "offset": int(row["offset"]),
+                "encoding": row["encoding"],
+                "value": str(row["value"])[:160],
+            }
+        )
+        if len(strings) >= 80:
+            break
 
     return {
         "dump_path": str(path.resolve()),
@@ -1,12 +1,21 @@
-"""Parse basic minidump headers, streams, and memory ranges."""
+"""Parse basic minidump headers, streams, and memory ranges.
+
+`MinidumpImage` memory-maps a dump (no `read_bytes()` of multi-GB files) and
+indexes its memory ranges once, sorted by file offset and by virtual
+address, so offset<->VA translation is a bisect instead of a scan over
+every range.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
 import struct
+from bisect import bisect_right
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+
+from vg.core.frame_store import Buffer, map_file
 
 
 MINIDUMP_SIGNATURE = 0x504D444D  # 'MDMP'
@@ -145,20 +154,105 @@ def map_file_offset_to_va(ranges: List[Dict[str, object]], file_offset: int) ->
     return None
 
 
+class MinidumpImage:
+    """A minidump (mapped or in memory) with its memory ranges indexed both ways."""
+
+    def __init__(self, data: Buffer):
+        self.data = data
+        self.header = parse_minidump_header(data)
+        self.streams = parse_minidump_streams(data)
+        self.ranges = parse_memory_ranges(data)
+        by_file = sorted(self.ranges, key=lambda row: int(row["file_rva"]))
+        by_va = sorted(self.ranges, key=lambda row: int(row["virtual_address"]))
+        self._file_starts = [int(row["file_rva"]) for row in by_file]
+        self._file_rows = [(int(row["size"]), int(row["virtual_address"])) for row in by_file]
+        self._va_starts = [int(row["virtual_address"]) for row in by_va]
+        self._va_rows = [(int(row["size"]), int(row["file_rva"])) for row in by_va]
+
+    @classmethod
+    def open(cls, dump_path: str) -> "MinidumpImage":
+        """Memory-map a dump file read-only."""
+        return cls(map_file(Path(dump_path)))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def file_offset_to_va(self, file_offset: int) -> Optional[int]:
+        """Virtual address stored at a file offset, or None outside every range."""
+        index = bisect_right(self._file_starts, file_offset) - 1
+        if index < 0:
+            return None
+        size, virtual_address = self._file_rows[index]
+        delta = file_offset - self._file_starts[index]
+        return virtual_address + delta if delta < size else None
+
+    def va_to_file_offset(self, virtual_address: int) -> Optional[int]:
+        """File offset holding a virtual address, or None when it was not captured."""
+        index = bisect_right(self._va_starts, virtual_address) - 1
+        if index < 0:
+            return None
+        size, file_rva = self._va_rows[index]
+        delta = virtual_address - self._va_starts[index]
+        return file_rva + delta if delta < size else None
+
+    def read_va(self, virtual_address: int, size: int) -> Optional[bytes]:
+        """
+        Read `size` bytes at a virtual address.
+
+        Reads may run across ranges that are contiguous in the address
+        space; None when any byte was not captured.
+        """
+        chunks = []
+        while size > 0:
+            index = bisect_right(self._va_starts, virtual_address) - 1
+            if index < 0:
+                return None
+            range_size, file_rva = self._va_rows[index]
+            delta = virtual_address - self._va_starts[index]
+            if delta >= range_size:
+                return None
+            take = min(size, range_size - delta)
+            start = file_rva + delta
+            chunk = self.data[start:start + take]
+            if len(chunk) != take:
+                return None  # truncated dump
+            chunks.append(chunk)
+            virtual_address += take
+            size -= take
+        return b"".join(chunks)
+
+    def find_all(self, needle: bytes) -> Iterator[int]:
+        """File offsets of every (overlapping) occurrence of `needle`."""
+        start = 0
+        while True:
+            index = self.data.find(needle, start)
+            if index == -1:
+                return
+            yield index
+            start = index + 1
+
+    def close(self) -> None:
+        if hasattr(self.data, "close"):
+            self.data.close()
+
+    def __enter__(self) -> "MinidumpImage":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 def build_minidump_layout_report(dump_path: str) -> Dict[str, object]:
     path = Path(dump_path)
-    data = path.read_bytes()
-    header = parse_minidump_header(data)
-    streams = parse_minidump_streams(data)
-    ranges = parse_memory_ranges(data)
-    return {
-        "dump_path": str(path.resolve()),
-        "size_bytes": len(data),
-        "header": header,
-        "streams": streams,
-        "memory_range_count": len(ranges),
-        "memory_ranges_sample": ranges[:50],
-    }
+    with MinidumpImage.open(dump_path) as image:
+        return {
+            "dump_path": str(path.resolve()),
+            "size_bytes": len(image),
+            "header": image.header,
+            "streams": image.streams,
+            "memory_range_count": len(image.ranges),
+            "memory_ranges_sample": image.ranges[:50],
+        }
 
 
 def main() -> int:
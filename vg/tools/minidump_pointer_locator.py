@@ -1,4 +1,13 @@
-"""Locate qword pointers to known virtual addresses inside a minidump."""
+"""Locate qword pointers to known virtual addresses inside a minidump.
+
+The default mode runs one `find()` per target over the whole file. The bulk
+mode (`--bulk`) instead reads every captured memory range once as
+little-endian qwords, aligned to 8 in VA space (all eight phases with
+`--unaligned`). It matches them against the whole target set and/or a
+`[lo, hi)` value range (`--into-range`, for reverse-pointer chasing).
+NumPy vectorizes the scan when installed; otherwise a pure-Python loop does
+the same work.
+"""
 
 from __future__ import annotations
 
@@ -6,59 +15,183 @@ import argparse
 import json
 import struct
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .minidump_parser import MinidumpImage
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+QWORD_MAX = 1 << 64
+# Qwords per scanned block (64 MB) to bound memory on large ranges
+BLOCK_QWORDS = 1 << 23
+
+
+def _block_matches(
+    data,
+    offset: int,
+    count: int,
+    targets: List[int],
+    value_range: Optional[Tuple[int, int]],
+) -> Iterator[Tuple[int, int]]:
+    """(qword index, value) of matching qwords in one block."""
+    if HAS_NUMPY:
+        values = np.frombuffer(data, dtype="<u8", count=count, offset=offset)
+        mask = np.zeros(count, dtype=bool)
+        if targets:
+            mask |= np.isin(values, np.asarray(targets, dtype=np.uint64), assume_unique=True)
+        if value_range is not None:
+            lo, hi = value_range
+            mask |= (values >= np.uint64(lo)) & (values < np.uint64(hi))
+        indices = np.flatnonzero(mask)
+        matched = values[indices].tolist()
+        del values  # release the view so the mapping can be closed
+        return iter(list(zip(indices.tolist(), matched)))
+
+    target_set = set(targets)
+    lo, hi = value_range if value_range is not None else (1, 0)
+    return (
+        (index, value)
+        for index, value in enumerate(struct.unpack_from(f"<{count}Q", data, offset))
+        if value in target_set or lo <= value < hi
+    )
+
 
-from .minidump_parser import map_file_offset_to_va, parse_memory_ranges
+def scan_qwords(
+    image: MinidumpImage,
+    targets: Iterable[int] = (),
+    value_range: Optional[Tuple[int, int]] = None,
+    unaligned: bool = False,
+    block_qwords: int = BLOCK_QWORDS,
+) -> List[Dict[str, int]]:
+    """
+    Qwords in captured memory equal to a target or inside `value_range`.
 
+    Returns hits sorted by file offset as
+    {"file_offset", "pointer_va", "value"}, where `pointer_va` is the
+    address the qword lives at.
+    """
+    target_list = sorted({int(value) for value in targets if 0 <= int(value) < QWORD_MAX})
+    if not target_list and value_range is None:
+        return []
+    data = image.data
+    hits = []
+    for row in image.ranges:
+        file_rva = int(row["file_rva"])
+        virtual_address = int(row["virtual_address"])
+        available = min(int(row["size"]), len(data) - file_rva)
+        first = (-virtual_address) % 8
+        phases = range(8) if unaligned else (first,)
+        for phase in phases:
+            start = file_rva + phase
+            remaining = (available - phase) // 8
+            while remaining > 0:
+                count = min(remaining, block_qwords)
+                for index, value in _block_matches(data, start, count, target_list, value_range):
+                    file_offset = start + index * 8
+                    hits.append(
+                        {
+                            "file_offset": file_offset,
+                            "pointer_va": virtual_address + (file_offset - file_rva),
+                            "value": value,
+                        }
+                    )
+                start += count * 8
+                remaining -= count
+    hits.sort(key=lambda hit: hit["file_offset"])
+    return hits
 
-def locate_pointers_in_minidump(dump_path: str, targets: List[Dict[str, object]]) -> Dict[str, object]:
+
+def locate_pointers_in_minidump(
+    dump_path: str,
+    targets: List[Dict[str, object]],
+    bulk: bool = False,
+    unaligned: bool = False,
+) -> Dict[str, object]:
     path = Path(dump_path)
-    data = path.read_bytes()
-    ranges = parse_memory_ranges(data)
-
-    rows = []
-    for target in targets:
-        label = str(target["label"])
-        va = int(target["virtual_address"])
-        needle = struct.pack("<Q", va)
-        hits = []
-        start = 0
-        while True:
-            idx = data.find(needle, start)
-            if idx == -1:
-                break
-            hits.append(
+    with MinidumpImage.open(dump_path) as image:
+        by_value: Dict[int, List[Dict[str, int]]] = {}
+        if bulk:
+            for hit in scan_qwords(image, (int(t["virtual_address"]) for t in targets), unaligned=unaligned):
+                by_value.setdefault(hit["value"], []).append(
+                    {"file_offset": hit["file_offset"], "pointer_va": hit["pointer_va"]}
+                )
+        rows = []
+        for target in targets:
+            label = str(target["label"])
+            va = int(target["virtual_address"])
+            if bulk:
+                hits = by_value.get(va, [])
+            else:
+                needle = struct.pack("<Q", va)
+                hits = [
+                    {
+                        "file_offset": idx,
+                        "pointer_va": image.file_offset_to_va(idx),
+                    }
+                    for idx in image.find_all(needle)
+                ]
+            rows.append(
                 {
-                    "file_offset": idx,
-                    "pointer_va": map_file_offset_to_va(ranges, idx),
+                    "label": label,
+                    "virtual_address": va,
+                    "pointer_hit_count": len(hits),
+                    "pointer_hits": hits[:200],
                 }
             )
-            start = idx + 1
-        rows.append(
-            {
-                "label": label,
-                "virtual_address": va,
-                "pointer_hit_count": len(hits),
-                "pointer_hits": hits[:200],
-            }
-        )
+        range_count = len(image.ranges)
 
     return {
         "dump_path": str(path.resolve()),
-        "memory_range_count": len(ranges),
+        "memory_range_count": range_count,
         "targets": rows,
     }
 
 
+def locate_pointers_into_range(
+    dump_path: str,
+    lo: int,
+    hi: int,
+    unaligned: bool = False,
+    limit: int = 1000,
+) -> Dict[str, object]:
+    """Every captured qword pointing into [lo, hi) (reverse-pointer chasing)."""
+    path = Path(dump_path)
+    with MinidumpImage.open(dump_path) as image:
+        hits = scan_qwords(image, value_range=(lo, hi), unaligned=unaligned)
+        range_count = len(image.ranges)
+    return {
+        "dump_path": str(path.resolve()),
+        "memory_range_count": range_count,
+        "range": {"lo": lo, "hi": hi},
+        "pointer_hit_count": len(hits),
+        "pointer_hits": hits[:limit],
+    }
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Locate qword pointers to known VAs in a minidump.")
     parser.add_argument("--dump", required=True, help="Minidump path")
-    parser.add_argument("--targets-json", required=True, help="JSON file containing [{'label', 'virtual_address'}]")
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument("--targets-json", help="JSON file containing [{'label', 'virtual_address'}]")
+    query.add_argument(
+        "--into-range", nargs=2, metavar=("LO", "HI"), type=lambda v: int(v, 0),
+        help="Report qwords pointing into [LO, HI) (accepts 0x...)",
+    )
+    parser.add_argument("--bulk", action="store_true", help="Scan captured memory once for all targets")
+    parser.add_argument("--unaligned", action="store_true", help="Also check qwords not 8-byte aligned in VA")
     parser.add_argument("-o", "--output", help="Optional output JSON path")
     args = parser.parse_args()
 
-    targets = json.loads(Path(args.targets_json).read_text(encoding="utf-8"))
-    report = locate_pointers_in_minidump(args.dump, targets)
+    if args.into_range:
+        report = locate_pointers_into_range(args.dump, *args.into_range, unaligned=args.unaligned)
+    else:
+        targets = json.loads(Path(args.targets_json).read_text(encoding="utf-8"))
+        report = locate_pointers_in_minidump(args.dump, targets, bulk=args.bulk, unaligned=args.unaligned)
     payload = json.dumps(report, indent=2, ensure_ascii=False)
     if args.output:
         Path(args.output).write_text(payload, encoding="utf-8")
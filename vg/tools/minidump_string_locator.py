@@ -7,29 +7,29 @@ import json
 from pathlib import Path
 from typing import Dict, List
 
-from .dump_keyword_search import _find_all
-from .minidump_parser import map_file_offset_to_va, parse_memory_ranges
+from .dump_keyword_search import find_all_needles
+from .minidump_parser import MinidumpImage
 
 
 def locate_strings_in_minidump(dump_path: str, strings: List[str]) -> Dict[str, object]:
     path = Path(dump_path)
-    data = path.read_bytes()
-    ranges = parse_memory_ranges(data)
-    rows = []
-    for value in strings:
-        needle = value.encode("utf-16-le")
-        hits = []
-        for file_offset in _find_all(data, needle):
-            hits.append(
-                {
-                    "file_offset": file_offset,
-                    "virtual_address": map_file_offset_to_va(ranges, file_offset),
-                }
-            )
-        rows.append({"value": value, "hit_count": len(hits), "hits": hits[:100]})
+    with MinidumpImage.open(dump_path) as image:
+        found = find_all_needles(image.data, (value.encode("utf-16-le") for value in strings))
+        rows = []
+        for value in strings:
+            hits = []
+            for file_offset in found.get(value.encode("utf-16-le"), []):
+                hits.append(
+                    {
+                        "file_offset": file_offset,
+                        "virtual_address": image.file_offset_to_va(file_offset),
+                    }
+                )
+            rows.append({"value": value, "hit_count": len(hits), "hits": hits[:100]})
+        range_count = len(image.ranges)
     return {
         "dump_path": str(path.resolve()),
-        "memory_range_count": len(ranges),
+        "memory_range_count": range_count,
         "strings": rows,
     }
 
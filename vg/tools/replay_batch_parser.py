@@ -1,18 +1,21 @@
 #!/usr/bin/env python3
 """
 Batch Replay Parser - Parse all VGR replays in a directory.
-Usage: python replay_batch_parser.py <replay_dir> [--output results.json]
+Usage: python replay_batch_parser.py <replay_dir> [--output results.json] [--workers N]
 """
 import argparse
 import json
 import sys
 from collections import Counter
 from pathlib import Path
+from typing import Optional
 
 try:
+    from vg.core.batch_runner import add_batch_arguments, run_batch
     from vg.core.vgr_parser import VGRParser
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+    from vg.core.batch_runner import add_batch_arguments, run_batch
     from vg.core.vgr_parser import VGRParser
 
 
@@ -49,8 +52,13 @@ def parse_replay(vgr_path: Path) -> dict:
         }
 
 
-def batch_parse(replay_dir: Path) -> dict:
-    """Parse all replays in directory."""
+def batch_parse(
+    replay_dir: Path,
+    workers: int = 1,
+    timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+) -> dict:
+    """Parse all replays in directory (optionally on a process pool)."""
     vgr_files = sorted(replay_dir.rglob("*.0.vgr"))
     print(f"Found {len(vgr_files)} replay files")
 
@@ -60,8 +68,25 @@ def batch_parse(replay_dir: Path) -> dict:
     player_set = set()
     total_success = 0
 
-    for i, vgr in enumerate(vgr_files):
-        result = parse_replay(vgr)
+    def report(_result, done: int, total: int) -> None:
+        if done % 10 == 0:
+            print(f"  Parsed {done}/{total}...")
+
+    batch = run_batch(
+        parse_replay,
+        vgr_files,
+        workers=workers,
+        timeout=timeout,
+        memory_limit_mb=memory_limit_mb,
+        on_result=report,
+    )
+    for item in batch:
+        # Timeouts and crashed workers never reach parse_replay's own handler
+        result = item.value if item.ok else {
+            "file": str(item.item),
+            "error": item.error,
+            "success": False,
+        }
         results.append(result)
         if result["success"]:
             total_success += 1
@@ -69,8 +94,6 @@ def batch_parse(replay_dir: Path) -> dict:
             for p in result["players"]:
                 hero_counter[p["hero_name"]] += 1
                 player_set.add(p["name"])
-        if (i + 1) % 10 == 0:
-            print(f"  Parsed {i+1}/{len(vgr_files)}...")
 
     summary = {
         "total_replays": len(vgr_files),
@@ -88,6 +111,7 @@ def main():
     parser = argparse.ArgumentParser(description="Batch parse VGR replay files")
     parser.add_argument("replay_dir", help="Directory containing replay files")
     parser.add_argument("--output", "-o", default=None, help="Output JSON path")
+    add_batch_arguments(parser)
     args = parser.parse_args()
 
     replay_dir = Path(args.replay_dir)
@@ -95,7 +119,12 @@ def main():
         print(f"Error: {replay_dir} not found")
         sys.exit(1)
 
-    summary = batch_parse(replay_dir)
+    summary = batch_parse(
+        replay_dir,
+        workers=args.workers,
+        timeout=args.timeout,
+        memory_limit_mb=args.memory_limit_mb,
+    )
 
     print(f"\n{'='*50}")
     print(f"Total replays: {summary['total_replays']}")
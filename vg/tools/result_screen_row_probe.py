@@ -8,6 +8,9 @@ import re
 from pathlib import Path
 from typing import Dict, List
 
+from vg.core.frame_store import Buffer, map_file
+
+from .dump_keyword_search import find_all_needles
 
 UTF16_PRINTABLE_RE = re.compile(rb"(?:[\x20-\x7E]\x00|[\x80-\xFF][\x00-\xFF]){4,}")
 KDA_RE = re.compile(r"\b\d{1,2}/\d{1,2}/\d{1,2}\b")
@@ -15,18 +18,6 @@ GOLD_RE = re.compile(r"\b\d{1,2}\.\dk\b", re.IGNORECASE)
 MINION_RE = re.compile(r"(?<![\d/])\d{1,3}(?![\d/])")
 
 
-def _find_all(data: bytes, needle: bytes) -> List[int]:
-    out = []
-    start = 0
-    while True:
-        idx = data.find(needle, start)
-        if idx == -1:
-            break
-        out.append(idx)
-        start = idx + 1
-    return out
-
-
 def _extract_utf16_strings(chunk: bytes) -> List[str]:
     values = []
     for match in UTF16_PRINTABLE_RE.finditer(chunk):
@@ -38,12 +29,26 @@ def _extract_utf16_strings(chunk: bytes) -> List[str]:
 
 
 def probe_result_screen_rows(dump_path: str, player_names: List[str], radius: int = 384) -> Dict[str, object]:
-    data = Path(dump_path).read_bytes()
+    data = map_file(Path(dump_path))
+    try:
+        rows = _probe_rows(data, player_names, radius)
+    finally:
+        if hasattr(data, "close"):
+            data.close()
+    return {
+        "dump_path": str(Path(dump_path).resolve()),
+        "radius": radius,
+        "players": rows,
+    }
+
+
+def _probe_rows(data: Buffer, player_names: List[str], radius: int) -> List[Dict[str, object]]:
+    found = find_all_needles(data, (name.encode("utf-16-le") for name in player_names))
     rows = []
     for player_name in player_names:
         needle = player_name.encode("utf-16-le")
         hits = []
-        for offset in _find_all(data, needle):
+        for offset in found.get(needle, []):
             start = max(0, offset - radius)
             end = min(len(data), offset + len(needle) + radius)
             chunk = data[start:end]
@@ -76,11 +81,7 @@ def probe_result_screen_rows(dump_path: str, player_names: List[str], radius: in
                 "hits": hits,
             }
         )
-    return {
-        "dump_path": str(Path(dump_path).resolve()),
-        "radius": radius,
-        "players": rows,
-    }
+    return rows
 
 
 def main() -> int:
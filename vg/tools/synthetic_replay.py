@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Synthetic Replay Generator - write realistic `.vgr` frame sets for benchmarks.
+
+Real tournament replays cannot be checked in, so throughput and regression
+checks run against generated matches instead. Each replay gets:
+  - frame 0 with the game mode string, player UUIDs and one player block per
+    player: `DA 03 EE` marker + name, entity id at +0xA5, hero id at +0xA9,
+    team byte at +0xD5
+  - one frame per `frame_interval_s` of match time holding the records that
+    happened in that window, padded with filler bytes:
+      kill    [18 04 1C] + post-kill credits (killer 1.0, assister gold/1.0/0.5)
+      death   [08 04 31] for the victim, plus objective / crystal deaths
+      credit  [10 04 1D] gold income (0x06), minion (0x0E), jungle (0x0D)
+      item    [10 04 3D] purchases
+  - a `replayManifest-*.txt` next to the frames
+
+Filler never contains 0x03 or 0x04, so it cannot fake a record header or a
+player block marker; the expected per-player K/D/A and minion kills are
+returned alongside the files.
+
+Usage:
+    python vg/tools/synthetic_replay.py /tmp/corpus --count 20 --team-size 5
+"""
+import argparse
+import json
+import random
+import struct
+import sys
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from vg.core.vgr_mapping import ITEM_ID_MAP
+    from vg.core.vgr_parser import BINARY_HERO_ID_MAP
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+    from vg.core.vgr_mapping import ITEM_ID_MAP
+    from vg.core.vgr_parser import BINARY_HERO_ID_MAP
+
+
+PLAYER_BLOCK_MARKER = b"\xDA\x03\xEE"
+PLAYER_BLOCK_SIZE = 0xE0
+PLAYER_EID_BASE = 1500
+CRYSTAL_EID = 2001
+OBJECTIVE_EID_BASE = 61000
+# Decoders attribute credits within this many bytes after a kill to it
+KILL_CREDIT_WINDOW = 500
+
+_GAME_MODES = {3: "GameMode_HF_Ranked", 5: "GameMode_5v5_Ranked"}
+# Filler is random bytes with 0x03/0x04 remapped away
+_FILLER_TABLE = bytes.maketrans(b"\x03\x04", b"\x05\x06")
+_STANDARD_ITEMS = sorted(item_id for item_id in ITEM_ID_MAP if 200 <= item_id <= 255)
+
+
+@dataclass
+class SyntheticReplaySpec:
+    """Shape of a generated match. Rates are per minute of match time."""
+    team_size: int = 3
+    duration_s: float = 1200.0
+    frame_interval_s: float = 5.0
+    kills_per_min: float = 1.5
+    assists_per_kill: float = 1.0
+    minion_kills_per_min: float = 4.0   # per player
+    gold_ticks_per_min: float = 6.0     # per player
+    jungle_kills_per_min: float = 0.5   # per player
+    items_per_player: int = 8
+    objectives: int = 3
+    filler_bytes_per_frame: int = 4096
+    seed: int = 0
+
+
+@dataclass
+class SyntheticPlayer:
+    """A generated player and the stats a decoder should recover."""
+    name: str
+    team: str
+    hero_id: int
+    hero_name: str
+    entity_id: int  # BE record eid
+    kills: int = 0
+    deaths: int = 0
+    assists: int = 0
+    minion_kills: int = 0
+
+
+@dataclass
+class SyntheticReplay:
+    """Files and expected results of one generated replay."""
+    replay_file: str
+    replay_name: str
+    frame_count: int
+    total_bytes: int
+    game_mode: str
+    duration_s: float
+    players: List[SyntheticPlayer] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _kill_record(eid: int, ts: float) -> bytes:
+    return (
+        struct.pack(">f", ts) + b"\x00\x00\x00"
+        + b"\x18\x04\x1C\x00\x00" + struct.pack(">H", eid)
+        + b"\xFF\xFF\xFF\xFF\x3F\x80\x00\x00\x29"
+    )
+
+
+def _death_record(eid: int, ts: float) -> bytes:
+    return b"\x08\x04\x31\x00\x00" + struct.pack(">H", eid) + b"\x00\x00" + struct.pack(">f", ts) + b"\x00\x00\x00"
+
+
+def _credit_record(eid: int, value: float, action: int, sell_flag: int = 0) -> bytes:
+    return b"\x10\x04\x1D\x00\x00" + struct.pack(">H", eid) + struct.pack(">f", value) + bytes([action, sell_flag])
+
+
+def _item_record(eid: int, item_id: int, ts: float, counter: int) -> bytes:
+    return (
+        b"\x10\x04\x3D\x00\x00" + struct.pack(">H", eid) + b"\x00\x00\x01"
+        + struct.pack("<H", item_id) + b"\x00\x00" + struct.pack(">H", counter) + b"\x00"
+        + struct.pack(">f", ts)
+    )
+
+
+def _player_block(name: str, entity_id: int, hero_id: int, team_id: int) -> bytes:
+    block = bytearray(PLAYER_BLOCK_SIZE)
+    block[0:3] = PLAYER_BLOCK_MARKER
+    block[3:3 + len(name)] = name.encode("ascii")
+    # The block stores the entity id byte-swapped relative to event records
+    block[0xA5:0xA7] = struct.pack(">H", entity_id)
+    block[0xA9:0xAB] = struct.pack("<H", hero_id)
+    block[0xD5] = team_id
+    return bytes(block)
+
+
+class _MatchBuilder:
+    def __init__(self, spec: SyntheticReplaySpec):
+        if spec.team_size not in _GAME_MODES:
+            raise ValueError(f"Unsupported team size: {spec.team_size}")
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        self.events: List[Tuple[float, bytes, int]] = []  # (ts, payload, min gap after)
+
+        heroes = self.rng.sample(sorted(BINARY_HERO_ID_MAP), spec.team_size * 2)
+        self.players: List[SyntheticPlayer] = []
+        for idx, hero_id in enumerate(heroes):
+            self.players.append(SyntheticPlayer(
+                name=f"{1000 + spec.seed % 9000}_Player{idx:02d}",
+                team="left" if idx < spec.team_size else "right",
+                hero_id=hero_id,
+                hero_name=BINARY_HERO_ID_MAP[hero_id],
+                entity_id=PLAYER_EID_BASE + idx,
+            ))
+
+    def _count(self, per_min: float) -> int:
+        return int(round(per_min * self.spec.duration_s / 60.0))
+
+    def _when(self) -> float:
+        # Leave the opening seconds and the crystal moment free of events
+        return self.rng.uniform(5.0, self.spec.duration_s - 5.0)
+
+    def _add(self, ts: float, payload: bytes, min_gap: int = 0) -> None:
+        self.events.append((ts, payload, min_gap))
+
+    def build(self) -> None:
+        spec, rng = self.spec, self.rng
+        left = [p for p in self.players if p.team == "left"]
+        right = [p for p in self.players if p.team == "right"]
+
+        for _ in range(self._count(spec.kills_per_min)):
+            ts = self._when()
+            killer = rng.choice(self.players)
+            allies = [p for p in (left if killer.team == "left" else right) if p is not killer]
+            victim = rng.choice(right if killer.team == "left" else left)
+            assist_count = min(len(allies), int(rng.expovariate(1.0 / spec.assists_per_kill)) if spec.assists_per_kill > 0 else 0)
+            assisters = rng.sample(allies, assist_count)
+
+            payload = _kill_record(killer.entity_id, ts) + _credit_record(killer.entity_id, 1.0, 0x01)
+            for assister in assisters:
+                payload += (
+                    _credit_record(assister.entity_id, float(rng.randint(40, 120)), 0x06)
+                    + _credit_record(assister.entity_id, 1.0, 0x01)
+                    + _credit_record(assister.entity_id, 0.5, 0x01)
+                )
+                assister.assists += 1
+            payload += _death_record(victim.entity_id, ts + 0.1)
+            killer.kills += 1
+            victim.deaths += 1
+            # Keep unrelated credits out of the kill's credit window
+            self._add(ts, payload, KILL_CREDIT_WINDOW)
+
+        for player in self.players:
+            for _ in range(self._count(spec.minion_kills_per_min)):
+                self._add(self._when(), _credit_record(player.entity_id, 1.0, 0x0E))
+                player.minion_kills += 1
+            for _ in range(self._count(spec.gold_ticks_per_min)):
+                self._add(self._when(), _credit_record(player.entity_id, float(rng.randint(5, 60)), 0x06))
+            for _ in range(self._count(spec.jungle_kills_per_min)):
+                self._add(self._when(), _credit_record(player.entity_id, float(rng.randint(20, 80)), 0x0D))
+            for counter, item_id in enumerate(rng.sample(_STANDARD_ITEMS, min(spec.items_per_player, len(_STANDARD_ITEMS)))):
+                ts = self._when()
+                self._add(ts, _item_record(player.entity_id, item_id, ts, counter)
+                          + _credit_record(player.entity_id, -float(rng.randint(300, 2400)), 0x06))
+
+        for objective in range(spec.objectives):
+            ts = self._when()
+            self._add(ts, _death_record(OBJECTIVE_EID_BASE + objective, ts))
+
+        self._add(spec.duration_s, _death_record(CRYSTAL_EID, spec.duration_s))
+        self.events.sort(key=lambda event: event[0])
+
+    def filler(self, size: int) -> bytes:
+        return self.rng.randbytes(size).translate(_FILLER_TABLE)
+
+    def header_frame(self, game_mode: str) -> bytes:
+        data = bytearray(self.filler(64))
+        data += game_mode.encode("ascii") + b"\x00"
+        for _ in self.players:
+            data += str(uuid.UUID(int=self.rng.getrandbits(128))).encode("ascii") + b"\x00"
+        for player in self.players:
+            team_id = 1 if player.team == "left" else 2
+            data += _player_block(player.name, player.entity_id, player.hero_id, team_id)
+        return bytes(data)
+
+    def frames(self) -> List[bytes]:
+        spec = self.spec
+        frame_count = int(spec.duration_s // spec.frame_interval_s) + 1
+        buckets: List[List[Tuple[bytes, int]]] = [[] for _ in range(frame_count)]
+        for ts, payload, min_gap in self.events:
+            buckets[min(int(ts // spec.frame_interval_s), frame_count - 1)].append((payload, min_gap))
+
+        frames = []
+        for payloads in buckets:
+            gaps = len(payloads) + 1
+            per_gap = spec.filler_bytes_per_frame // gaps
+            data = bytearray(self.filler(per_gap))
+            for payload, min_gap in payloads:
+                data += payload + self.filler(max(per_gap, min_gap))
+            frames.append(bytes(data))
+        return frames
+
+
+def generate_replay(
+    output_dir: str,
+    spec: Optional[SyntheticReplaySpec] = None,
+    replay_name: Optional[str] = None,
+) -> SyntheticReplay:
+    """
+    Write one synthetic replay (`<name>.0.vgr` ... `<name>.N.vgr` + manifest).
+
+    Args:
+        output_dir: Directory for the frame files (created if missing).
+        spec: Match shape; defaults to a 20 minute 3v3.
+        replay_name: Frame file prefix; derived from the seed when omitted.
+    """
+    spec = spec or SyntheticReplaySpec()
+    builder = _MatchBuilder(spec)
+    builder.build()
+    game_mode = _GAME_MODES[spec.team_size]
+    if replay_name is None:
+        match_uuid = uuid.UUID(int=builder.rng.getrandbits(128))
+        replay_name = f"{match_uuid}-{spec.seed:08x}"
+
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    frames = [builder.header_frame(game_mode)] + builder.frames()
+    for idx, data in enumerate(frames):
+        (out / f"{replay_name}.{idx}.vgr").write_bytes(data)
+    manifest = out / f"replayManifest-{replay_name.split('-')[0]}.txt"
+    manifest.write_text(f"{replay_name}\n", encoding="utf-8")
+
+    return SyntheticReplay(
+        replay_file=str(out / f"{replay_name}.0.vgr"),
+        replay_name=replay_name,
+        frame_count=len(frames),
+        total_bytes=sum(len(data) for data in frames),
+        game_mode=game_mode,
+        duration_s=spec.duration_s,
+        players=builder.players,
+    )
+
+
+def generate_corpus(
+    output_dir: str,
+    count: int,
+    spec: Optional[SyntheticReplaySpec] = None,
+) -> List[SyntheticReplay]:
+    """Write `count` replays, one sub-directory each, seeded `spec.seed + i`."""
+    spec = spec or SyntheticReplaySpec()
+    replays = []
+    for idx in range(count):
+        replay_spec = SyntheticReplaySpec(**{**asdict(spec), "seed": spec.seed + idx})
+        replays.append(generate_replay(str(Path(output_dir) / f"replay_{idx:04d}"), replay_spec))
+    return replays
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic .vgr replays for benchmarking")
+    parser.add_argument("output_dir", help="Corpus directory")
+    parser.add_argument("--count", type=int, default=10, help="Number of replays (default: 10)")
+    parser.add_argument("--team-size", type=int, choices=[3, 5], default=3, help="3v3 or 5v5 (default: 3)")
+    parser.add_argument("--duration", type=float, default=1200.0, help="Match length in seconds (default: 1200)")
+    parser.add_argument("--frame-interval", type=float, default=5.0, help="Seconds of match time per frame (default: 5)")
+    parser.add_argument("--kills-per-min", type=float, default=1.5, help="Hero kills per minute (default: 1.5)")
+    parser.add_argument("--filler-bytes", type=int, default=4096, help="Non-record bytes per frame (default: 4096)")
+    parser.add_argument("--seed", type=int, default=0, help="First replay seed (default: 0)")
+    parser.add_argument("--truth", help="Write the expected per-player results as JSON")
+    args = parser.parse_args()
+
+    spec = SyntheticReplaySpec(
+        team_size=args.team_size,
+        duration_s=args.duration,
+        frame_interval_s=args.frame_interval,
+        kills_per_min=args.kills_per_min,
+        filler_bytes_per_frame=args.filler_bytes,
+        seed=args.seed,
+    )
+    replays = generate_corpus(args.output_dir, args.count, spec)
+    total_mb = sum(replay.total_bytes for replay in replays) / (1024 * 1024)
+    print(f"Wrote {len(replays)} replays ({total_mb:.1f} MB) to {args.output_dir}")
+
+    if args.truth:
+        with open(args.truth, "w", encoding="utf-8") as f:
+            json.dump([replay.to_dict() for replay in replays], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()